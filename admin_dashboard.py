@@ -46,6 +46,7 @@ class AdminDashboard:
             '/solana': self.show_solana_admin,
             '/transactions': self.show_transaction_dashboard,
             '/balances': self.show_balance_management,
+            '/rtp': self.show_game_rtp,
             '/logs': self.show_system_logs,
             '/backup': self.create_system_backup,
             '/restart': self.restart_system_components
@@ -194,6 +195,29 @@ Use commands below or inline buttons"""
             logger.error(f"Error showing system stats: {e}")
             await update.message.reply_text(f"❌ İstatistikler yüklenemedi: {str(e)}")
 
+    async def show_game_rtp(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Show exact RTP of every dice payout table"""
+        try:
+            from dice_payouts import get_dice_rtp_report
+
+            text = "🎲 **DICE PAYOUT RTP** 🎲\n"
+            schedule = None
+            for row in get_dice_rtp_report():
+                if row['schedule'] != schedule:
+                    schedule = row['schedule']
+                    text += f"\n📋 **{schedule.title()} tables:**\n"
+                warning = " ⚠️" if row['rtp'] > 1 else ""
+                text += (f"• `{row['dice_type']}`: RTP {row['rtp']:.2%}{warning} "
+                         f"(edge {row['house_edge']:.2%}, hit {row['hit_frequency']:.0%}, "
+                         f"max x{row['max_multiplier']})\n")
+
+            text += "\n⚠️ = pays out more than it takes in"
+            await update.message.reply_text(text, parse_mode='Markdown')
+
+        except Exception as e:
+            logger.error(f"Error showing game RTP: {e}")
+            await update.message.reply_text(f"❌ RTP bilgisi yüklenemedi: {str(e)}")
+
     async def show_user_management(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show user management interface"""
         try:
@@ -607,7 +631,7 @@ Use buttons below for balance operations"""
                 rpc_connected = rpc_stats.get('is_connected', False)
 
                 if rpc_connected:
-                    balance_result = await self.rpc_client.get_balance(SOLANA_CONFIG['admin_wallet'])
+                    balance_result = await self.admin_wallet_manager.balance_cache.get(SOLANA_CONFIG['admin_wallet'])
                     solana_balance = balance_result.get('balance_sol', 0.0)
             except:
                 pass
@@ -1145,13 +1169,16 @@ Use buttons below for balance operations"""
                     'success_rate': 0
                 }
 
-            # Admin wallets (mock data - would need actual wallet manager integration)
-            data['wallets'] = {
-                'master': {'balance': 10.5},
-                'deposit': {'balance': 5.2},
-                'withdrawal': {'balance': 8.8},
-                'total_balance': 24.5
-            }
+            # Admin wallets - cached balances, one refresh for all outdated ones
+            wallets = self.admin_wallet_manager.wallets
+            balances = await self.admin_wallet_manager.balance_cache.get_many(list(wallets))
+            data['wallets'] = {role: {'balance': 0.0} for role in ('master', 'deposit', 'withdrawal')}
+            for address, wallet in wallets.items():
+                role_data = data['wallets'].setdefault(wallet.role.value, {'balance': 0.0})
+                role_data['balance'] += balances[address].get('balance_sol', 0.0)
+            data['wallets']['total_balance'] = sum(b.get('balance_sol', 0.0) for b in balances.values())
+            ages = [b['age_seconds'] for b in balances.values() if b.get('age_seconds') is not None]
+            data['wallets']['balance_age_seconds'] = max(ages) if ages else None
 
             # Monitoring stats
             monitor_stats = await self.transaction_monitor.get_monitoring_stats()
@@ -14,7 +14,8 @@ from typing import List
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
 from config import GAMES, ACHIEVEMENTS, SOLO_GAMES, FRIEND_CODE_CHARS
-from database_manager import DatabaseManager
+from database_manager import get_database_manager
+from solo_outcomes import encode_outcome
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +23,7 @@ class MultiplayerCasino:
     """Multiplayer casino system"""
     
     def __init__(self):
-        self.db = DatabaseManager()
+        self.db = get_database_manager()
         self.active_games = {}
         self.waiting_players = {}
         
@@ -199,21 +200,6 @@ class MultiplayerCasino:
             keyboard.append(keyboard_row)
         return InlineKeyboardMarkup(keyboard)
     
-    def save_solo_game(self, user_id: int, game_type: str, bet_amount: int, result: dict):
-        """Save solo game history and process referral commission"""
-        with self.db.get_connection() as conn:
-            conn.execute('''INSERT INTO solo_game_history 
-                (user_id, game_type, bet_amount, win_amount, multiplier, result_data) 
-                VALUES (?, ?, ?, ?, ?, ?)''',
-                (user_id, game_type, bet_amount, result['win_amount'], 
-                 result.get('multiplier', 0), json.dumps(result)))
-            conn.commit()
-            
-            # Process referral commission
-            commission = self.process_referral_commission(user_id, bet_amount, game_type)
-            if commission > 0:
-                logger.info(f"Referral commission: {commission} FC for user {user_id}'s bet of {bet_amount} FC")
-    
     def add_friend_by_code(self, user_id: int, friend_code: str) -> dict:
         """Add friend by friend code"""
         with self.db.get_connection() as conn:
@@ -399,12 +385,13 @@ class MultiplayerCasino:
             with self.db.get_connection() as conn:
                 conn.execute('''
                     INSERT INTO solo_game_history 
-                    (user_id, game_type, bet_amount, win_amount, multiplier, won, played_at)
-                    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    (user_id, game_type, bet_amount, win_amount, multiplier, won, result_data, played_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
                 ''', (user_id, game_type, bet_amount, 
                      result.get('win_amount', 0), 
                      result.get('multiplier', 0), 
-                     result.get('won', False)))
+                     result.get('won', False),
+                     encode_outcome(result['outcome']) if 'outcome' in result else None))
                 conn.commit()
                 
                 # Process referral commission
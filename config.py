@@ -459,4 +459,61 @@ SOLANA_CONFIG = {
     "requests_per_second": 5,  # Max requests per second
     "burst_limit": 10,  # Max burst requests
     "rate_limit_window": 60,  # Rate limit window in seconds
+    "max_in_flight": 8,  # Max concurrent RPC requests
+    "batch_size": 20,  # Max calls per JSON-RPC batch request
+    # Transaction scanner - busy addresses are polled at the min interval, idle ones back off to the max
+    "monitor_min_interval": 10,
+    "monitor_max_interval": 300,
+    "monitor_scan_concurrency": 4,
+    "monitor_cursor_flush_interval": 15,
+    # Websocket push mode - notifications trigger scans, polling becomes a slow safety net
+    "use_websocket": os.getenv("SOLANA_USE_WEBSOCKET", "true").lower() == "true",
+    "push_poll_interval": 600,
+    # Bulk withdrawals - transfers packed per transaction, one cached blockhash, batched status polls
+    "blockhash_ttl": 20,
+    "withdrawal_max_rounds": 3,
+    "withdrawal_poll_interval": 1.0,
+    # Admin wallet balance cache - scheduled refresh, readers get values no older than max staleness
+    "balance_refresh_interval": 60,
+    "balance_max_staleness": 120,
+    "balance_flush_interval": 10,
+    # Token cost per RPC method (anything not listed costs 1)
+    "method_weights": {
+        "getTransaction": 2,
+        "getSignaturesForAddress": 2,
+        "getMultipleAccounts": 2,
+        "sendTransaction": 1,
+        "getAccountInfo": 1,
+        "getSlot": 1,
+    },
+}
+
+# Shared HTTP client pool (CryptoBot, Helius, raw Solana JSON-RPC)
+HTTP_CLIENT_CONFIG = {
+    "pool_size": 100,  # Max open connections in total
+    "pool_size_per_host": 20,  # Max open connections per host
+    "keepalive_timeout": 30,  # Seconds an idle connection is kept
+    "dns_cache_ttl": 300,  # Seconds a DNS lookup is cached
+    "default": {"timeout": 30, "connect_timeout": 10, "max_concurrency": 20},
+    # Per-host overrides of the defaults above
+    "hosts": {
+        "pay.crypt.bot": {"timeout": 15, "max_concurrency": 10},
+        "testnet-pay.crypt.bot": {"timeout": 15, "max_concurrency": 10},
+        "api.helius.xyz": {"timeout": 20, "max_concurrency": 5},
+    },
+}
+
+# Game engine RNG (rng_service.py)
+RNG_CONFIG = {
+    "mode": "fast",  # fast: seedable PRNG blocks, crypto: os.urandom blocks
+    "seed": None,  # Fixed seed for the shared fast generator (None = OS entropy)
+    "block_size": 4096,  # 64-bit words drawn per refill of the shared buffer
+    "round_block_size": 64,  # Words per refill for per-round replay generators
+}
+
+# Provably-fair solo rounds (provably_fair.py)
+FAIR_CONFIG = {
+    "chain_length": 1000,  # Server seeds committed per chain (one per round)
+    "cache_size": 256,  # Users whose expanded chains stay in memory
+    "max_client_seed_length": 64,
 }
\ No newline at end of file
@@ -8,10 +8,11 @@ import asyncio
 import logging
 import json
 import hashlib
+import hmac
 import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
-import aiohttp
+from typing import Optional, Dict, Any, List, Callable
+from http_clients import get_http_client_registry
 
 logger = logging.getLogger(__name__)
 
@@ -22,18 +23,15 @@ class CryptoBotPaymentProcessor:
         self.api_token = api_token
         self.testnet = testnet
         self.base_url = "https://testnet-pay.crypt.bot/api" if testnet else "https://pay.crypt.bot/api"
-        self.session = None
+        self.http = get_http_client_registry()
         self.supported_assets = ['USDT', 'TON', 'BTC', 'ETH', 'TRX', 'BNB']
         
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit - the shared HTTP pool is closed on shutdown"""
             
     async def _make_request(self, method: str, endpoint: str, data: Dict = None) -> Dict:
         """Make API request to CryptoBot"""
@@ -44,10 +42,7 @@ class CryptoBotPaymentProcessor:
         }
         
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
-                
-            async with self.session.request(method, url, headers=headers, json=data) as response:
+            async with self.http.request(method, url, headers=headers, json=data) as response:
                 result = await response.json()
                 
                 if not result.get('ok'):
@@ -90,7 +85,7 @@ class CryptoBotPaymentProcessor:
         return await self._make_request('POST', 'createInvoice', data)
         
     async def get_invoices(self, asset: str = None, status: str = None, 
-                          offset: int = 0, count: int = 100) -> Dict:
+                          offset: int = 0, count: int = 100, invoice_ids: List = None) -> Dict:
         """Get list of invoices"""
         params = {
             'offset': offset,
@@ -101,6 +96,8 @@ class CryptoBotPaymentProcessor:
             params['asset'] = asset.upper()
         if status:
             params['status'] = status
+        if invoice_ids:
+            params['invoice_ids'] = ','.join(str(invoice_id) for invoice_id in invoice_ids)
             
         # Convert params to query string
         query_params = '&'.join([f"{k}={v}" for k, v in params.items()])
@@ -108,6 +105,36 @@ class CryptoBotPaymentProcessor:
         
         return await self._make_request('GET', endpoint)
         
+    async def get_invoices_by_ids(self, invoice_ids: List, status: str = None,
+                                  page_size: int = 1000) -> Dict[str, Dict]:
+        """Fetch many invoices by id - one getInvoices call per page_size ids
+
+        Returns invoice_id (as str) -> invoice. Pages are followed while the
+        API returns full pages.
+        """
+        invoice_ids = list(dict.fromkeys(str(invoice_id) for invoice_id in invoice_ids))
+        invoices = {}
+        for start in range(0, len(invoice_ids), page_size):
+            chunk = invoice_ids[start:start + page_size]
+            offset = 0
+            while True:
+                result = await self.get_invoices(status=status, offset=offset, count=page_size, invoice_ids=chunk)
+                items = result.get('items', []) if isinstance(result, dict) else result
+                for invoice in items:
+                    invoices[str(invoice['invoice_id'])] = invoice
+                if len(items) < page_size:
+                    break
+                offset += page_size
+        return invoices
+        
+    def verify_webhook_signature(self, body: bytes, signature: str) -> bool:
+        """Check the crypto-pay-api-signature header: HMAC-SHA256 of the body keyed by SHA256(token)"""
+        if not signature:
+            return False
+        secret = hashlib.sha256(self.api_token.encode()).digest()
+        expected = hmac.new(secret, body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature)
+        
     async def transfer(self, user_id: int, asset: str, amount: float, 
                       spend_id: str = None, comment: str = None) -> Dict:
         """Transfer funds to user (withdrawal)"""
@@ -572,6 +599,155 @@ class CasinoPaymentManager:
                 'error': str(e)
             }
 
+class CryptoBotInvoicePoller:
+    """Checks every pending CryptoBot deposit with one getInvoices call
+
+    Pending deposits are looked up by invoice id in a single request and the
+    paid ones are handed to `on_paid` as one batch. Young invoices are polled
+    often and older ones back off; while CryptoBot webhooks are arriving,
+    polling only runs as a slow safety net.
+    """
+    
+    def __init__(self, processor: CryptoBotPaymentProcessor, database_manager, on_paid: Callable,
+                 min_interval: float = 5, max_interval: float = 60, webhook_poll_interval: float = 300,
+                 busy_threshold: int = 20, max_age_hours: int = 1):
+        self.processor = processor
+        self.db = database_manager
+        self.on_paid = on_paid  # async callback(list of deposit rows)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.webhook_poll_interval = webhook_poll_interval
+        self.busy_threshold = busy_threshold
+        self.max_age_hours = max_age_hours
+        
+        self.last_webhook_at = 0.0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {'polls': 0, 'lookups': 0, 'paid': 0, 'webhooks': 0, 'expired': 0}
+        
+    def wake(self):
+        """Poll now - call after creating a deposit invoice"""
+        self._wakeup.set()
+        
+    def start(self):
+        """Start the poll loop on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            
+    async def _run(self):
+        while True:
+            try:
+                interval = await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"CryptoBot invoice poll error: {e}")
+                interval = self.max_interval
+                
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            
+    def _load_pending(self) -> List:
+        """Expire old deposits and return the live ones with their age in seconds"""
+        with self.db.get_connection() as conn:
+            expired = conn.execute(f'''
+                UPDATE deposits SET status = 'expired'
+                WHERE status = 'pending' AND datetime(created_at, '+{self.max_age_hours} hour') < datetime('now')
+            ''').rowcount
+            conn.commit()
+            if expired:
+                self.stats['expired'] += expired
+                logger.info(f"⏰ Marked {expired} deposits as expired")
+                
+            return conn.execute(f'''
+                SELECT *, (julianday('now') - julianday(created_at)) * 86400 AS age_seconds
+                FROM deposits
+                WHERE status = 'pending' AND invoice_id IS NOT NULL
+                AND datetime(created_at, '+{self.max_age_hours} hour') > datetime('now')
+            ''').fetchall()
+            
+    def next_interval(self, pending: List) -> float:
+        """Seconds until the next poll, from the pending count and the youngest invoice's age"""
+        if not pending:
+            interval = self.max_interval
+        elif len(pending) >= self.busy_threshold:
+            interval = self.min_interval
+        else:
+            youngest = min(row['age_seconds'] or 0 for row in pending)
+            interval = max(self.min_interval, min(self.max_interval, youngest / 10))
+            
+        if time.monotonic() - self.last_webhook_at < self.webhook_poll_interval:
+            interval = max(interval, self.webhook_poll_interval)
+        return interval
+        
+    async def poll_once(self) -> float:
+        """Check all pending invoices in one request; returns the next poll interval"""
+        pending = await asyncio.to_thread(self._load_pending)
+        self.stats['polls'] += 1
+        if pending:
+            invoices = await self.processor.get_invoices_by_ids(
+                [row['invoice_id'] for row in pending], status='paid'
+            )
+            self.stats['lookups'] += 1
+            paid = [row for row in pending if str(row['invoice_id']) in invoices]
+            if paid:
+                self.stats['paid'] += len(paid)
+                await self.on_paid(paid)
+        return self.next_interval(pending)
+        
+    async def handle_webhook_update(self, update: Dict) -> bool:
+        """Credit an invoice_paid webhook update; returns True if it was understood"""
+        if update.get('update_type') != 'invoice_paid':
+            return False
+        self.last_webhook_at = time.monotonic()
+        self.stats['webhooks'] += 1
+        
+        invoice = update.get('payload') or {}
+        invoice_id = str(invoice.get('invoice_id', ''))
+        
+        def load():
+            with self.db.get_connection() as conn:
+                return conn.execute(
+                    "SELECT * FROM deposits WHERE invoice_id = ? AND status = 'pending'", (invoice_id,)
+                ).fetchall()
+                
+        deposits = await asyncio.to_thread(load)
+        if deposits:
+            self.stats['paid'] += len(deposits)
+            await self.on_paid(deposits)
+        return True
+        
+    def get_stats(self) -> Dict:
+        return {**self.stats, 'webhook_active': time.monotonic() - self.last_webhook_at < self.webhook_poll_interval}
+
+# Global poller instance
+_invoice_poller = None
+
+def start_invoice_poller(processor: CryptoBotPaymentProcessor, database_manager,
+                         on_paid: Callable) -> CryptoBotInvoicePoller:
+    """Create and start the global invoice poller on the running loop"""
+    global _invoice_poller
+    if _invoice_poller is None:
+        _invoice_poller = CryptoBotInvoicePoller(processor, database_manager, on_paid)
+    _invoice_poller.start()
+    return _invoice_poller
+
+def get_invoice_poller() -> Optional[CryptoBotInvoicePoller]:
+    """Global invoice poller, or None before the bot started it"""
+    return _invoice_poller
+
 # Utility functions for integration
 async def create_payment_tables(db_manager):
     """Create required payment tables"""
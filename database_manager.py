@@ -3,11 +3,17 @@
 🎮 Casino Bot Veritabanı Yöneticisi
 """
 
+import random
 import sqlite3
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Her bekleyen yatırıma eklenen benzersiz lamport etiketi aralığı (en fazla 0.0001 SOL)
+DEPOSIT_TAG_RANGE = (1, 99_999)
+# Etiketli bekleyen yatırımların geçerlilik süresi - sonra etiket serbest kalır
+DEPOSIT_TAG_TTL_HOURS = 24
+
 class DatabaseManager:
     """Gelişmiş veritabanı yöneticisi"""
     
@@ -207,6 +213,7 @@ class DatabaseManager:
                 confirmed_at DATETIME,
                 fc_amount INTEGER,
                 notes TEXT,
+                expected_lamports INTEGER,
                 FOREIGN KEY (user_id) REFERENCES users (user_id)
             )''')
 
@@ -219,6 +226,29 @@ class DatabaseManager:
                            ON pending_transactions(wallet_address)''')
             conn.execute('''CREATE INDEX IF NOT EXISTS idx_pending_transactions_signature
                            ON pending_transactions(transaction_signature)''')
+            conn.execute('''CREATE INDEX IF NOT EXISTS idx_pending_transactions_match
+                           ON pending_transactions(status, wallet_address, expected_amount)''')
+
+            # Ödeme olay kutusu - tüm yatırım kaynakları buraya yazılır, tek worker kredilendirir
+            conn.execute('''CREATE TABLE IF NOT EXISTS payment_inbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source TEXT NOT NULL,
+                event_key TEXT NOT NULL UNIQUE,
+                signature TEXT,
+                from_address TEXT,
+                to_address TEXT,
+                amount REAL NOT NULL,
+                status TEXT DEFAULT 'received',
+                attempts INTEGER DEFAULT 0,
+                user_id INTEGER,
+                fc_amount INTEGER,
+                reference TEXT,
+                error TEXT,
+                received_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                processed_at DATETIME
+            )''')
+            conn.execute('''CREATE INDEX IF NOT EXISTS idx_payment_inbox_status
+                           ON payment_inbox(status, id)''')
             
             # Add missing columns to existing tables if they don't exist
             try:
@@ -246,6 +276,15 @@ class DatabaseManager:
                     conn.execute(f'ALTER TABLE referrals ADD COLUMN {column}')
                 except sqlite3.OperationalError:
                     pass  # Column already exists
+
+            # Tagged deposit amounts - one pending deposit per exact lamport amount and wallet
+            try:
+                conn.execute('ALTER TABLE pending_transactions ADD COLUMN expected_lamports INTEGER')
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+            conn.execute('''CREATE UNIQUE INDEX IF NOT EXISTS idx_pending_transactions_lamports
+                           ON pending_transactions(wallet_address, expected_lamports)
+                           WHERE status = 'pending' AND expected_lamports IS NOT NULL''')
             
             conn.commit()
         print("SUCCESS: Casino database initialized!")
@@ -319,36 +358,113 @@ class DatabaseManager:
     # Pending Transactions Methods
     def add_pending_transaction(self, user_id: int, expected_amount: float, wallet_address: str, notes: str = None) -> int:
         """Bekleyen işlem ekle"""
+        tagged = self.create_tagged_pending_transaction(user_id, expected_amount, wallet_address, notes)
+        return tagged['id'] if tagged else None
+
+    def create_tagged_pending_transaction(self, user_id: int, expected_amount: float, wallet_address: str,
+                                          notes: str = None, attempts: int = 20) -> dict:
+        """Bekleyen işlemi benzersiz lamport etiketiyle ekle
+
+        The amount the user must send is expected_amount plus a random
+        lamport tag that no other pending deposit to this wallet uses (a
+        partial unique index enforces it), so an incoming transfer resolves
+        to exactly one deposit by equality. Returns id, expected_lamports and
+        the tagged expected_amount, or None.
+
+        A user asking again for the same amount and wallet gets their open
+        tagged row back; their other open rows on that wallet are expired, as
+        are tagged rows older than DEPOSIT_TAG_TTL_HOURS.
+        """
+        base_lamports = round(expected_amount * 1_000_000_000)
+        low, high = (base_lamports + tag for tag in DEPOSIT_TAG_RANGE)
         try:
             with self.get_connection() as conn:
-                cursor = conn.execute("""
-                    INSERT INTO pending_transactions
-                    (user_id, expected_amount, wallet_address, notes)
-                    VALUES (?, ?, ?, ?)
-                """, (user_id, expected_amount, wallet_address, notes))
+                conn.execute("""
+                    UPDATE pending_transactions SET status = 'expired'
+                    WHERE status = 'pending' AND expected_lamports IS NOT NULL
+                    AND timestamp < datetime('now', ?)
+                """, (f"-{DEPOSIT_TAG_TTL_HOURS} hours",))
+
+                row = conn.execute("""
+                    SELECT id, expected_lamports FROM pending_transactions
+                    WHERE user_id = ? AND wallet_address = ? AND status = 'pending'
+                    AND expected_lamports BETWEEN ? AND ?
+                    ORDER BY id DESC LIMIT 1
+                """, (user_id, wallet_address, low, high)).fetchone()
+                conn.execute("""
+                    UPDATE pending_transactions SET status = 'expired'
+                    WHERE user_id = ? AND wallet_address = ? AND status = 'pending'
+                    AND expected_lamports IS NOT NULL AND id != ?
+                """, (user_id, wallet_address, row['id'] if row else -1))
+                if row:
+                    conn.commit()
+                    return {
+                        "id": row['id'],
+                        "expected_lamports": row['expected_lamports'],
+                        "expected_amount": row['expected_lamports'] / 1_000_000_000
+                    }
+
+                for _ in range(attempts):
+                    lamports = base_lamports + random.randint(*DEPOSIT_TAG_RANGE)
+                    try:
+                        cursor = conn.execute("""
+                            INSERT INTO pending_transactions
+                            (user_id, expected_amount, expected_lamports, wallet_address, notes)
+                            VALUES (?, ?, ?, ?, ?)
+                        """, (user_id, lamports / 1_000_000_000, lamports, wallet_address, notes))
+                    except sqlite3.IntegrityError:
+                        continue  # Tag in use by another pending deposit
+                    conn.commit()
+                    return {
+                        "id": cursor.lastrowid,
+                        "expected_lamports": lamports,
+                        "expected_amount": lamports / 1_000_000_000
+                    }
                 conn.commit()
-                return cursor.lastrowid
+            logger.error(f"No free deposit tag for {expected_amount} SOL after {attempts} attempts")
         except Exception as e:
             logger.error(f"Error adding pending transaction: {e}")
-            return None
+        return None
 
     def get_pending_transaction_by_criteria(self, wallet_address: str, amount: float, tolerance: float = 0.001):
-        """Kriterlere göre bekleyen işlem bul"""
+        """Kriterlere göre bekleyen işlem bul
+
+        Tagged deposits match by exact lamports (indexed equality). Failing
+        that, the newest legacy row within tolerance matches, and a tagged row
+        within tolerance only when it is the sole candidate (a wallet that
+        rounded the tagged amount).
+        """
         try:
             with self.get_connection() as conn:
-                cursor = conn.execute("""
+                row = conn.execute("""
+                    SELECT * FROM pending_transactions
+                    WHERE wallet_address = ?
+                    AND expected_lamports = ?
+                    AND status = 'pending'
+                """, (wallet_address, round(amount * 1_000_000_000))).fetchone()
+                if row:
+                    return row
+
+                rows = conn.execute("""
                     SELECT * FROM pending_transactions
                     WHERE wallet_address = ?
                     AND status = 'pending'
                     AND ABS(expected_amount - ?) <= ?
                     ORDER BY timestamp DESC
-                    LIMIT 1
-                """, (wallet_address, amount, tolerance))
-                return cursor.fetchone()
+                """, (wallet_address, amount, tolerance)).fetchall()
+                return self._tolerance_match(rows)
         except Exception as e:
             logger.error(f"Error getting pending transaction: {e}")
             return None
 
+    @staticmethod
+    def _tolerance_match(candidates: list):
+        """Newest legacy row, else the tagged row if it is the only one in tolerance"""
+        legacy = [row for row in candidates if row['expected_lamports'] is None]
+        if legacy:
+            return legacy[0]
+        return candidates[0] if len(candidates) == 1 else None
+
     def confirm_transaction(self, transaction_id: int, transaction_signature: str, fc_amount: int) -> bool:
         """İşlemi onayla"""
         try:
@@ -409,4 +525,280 @@ class DatabaseManager:
                 return cursor.rowcount
         except Exception as e:
             logger.error(f"Error cleaning up old transactions: {e}")
-            return 0
\ No newline at end of file
+            return 0
+
+    # Payment Inbox Methods
+    @staticmethod
+    def payment_event_key(event: dict) -> str:
+        """Olay anahtarı - imza (ve hedef cüzdan) ya da fatura numarası
+
+        The key does not include the source, so the same transfer reported by
+        a webhook and by a poller collapses into one inbox row. Solana events
+        must carry the receiving wallet: every path keys a transfer as
+        signature:wallet, and a missing wallet would give it a second key.
+        """
+        if event.get('event_key'):
+            return event['event_key']
+        if event.get('invoice_id'):
+            return f"invoice:{event['invoice_id']}"
+        if not event.get('to_address'):
+            raise ValueError(f"Payment event {event.get('signature')} has no receiving wallet")
+        return f"{event['signature']}:{event['to_address']}"
+
+    def enqueue_payment_events(self, source: str, events: list) -> int:
+        """Ödeme olaylarını kutuya yaz - aynı olay ikinci kez eklenmez
+
+        An event that arrives already attributed to a user (user_id set)
+        fills in a row that an unattributed source left without a user -
+        still 'received' (the worker has not reached it yet) or 'unmatched'.
+        Credited rows are never touched.
+        """
+        rows = [(source, self.payment_event_key(event), event.get('signature'),
+                 event.get('from_address'), event.get('to_address'), event.get('amount', 0),
+                 event.get('user_id'), event.get('fc_amount'),
+                 str(event['reference']) if event.get('reference') is not None else None)
+                for event in events]
+        if not rows:
+            return 0
+        try:
+            with self.get_connection() as conn:
+                before = conn.total_changes
+                conn.executemany("""
+                    INSERT INTO payment_inbox
+                    (source, event_key, signature, from_address, to_address, amount,
+                     user_id, fc_amount, reference)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(event_key) DO UPDATE SET
+                        source = excluded.source, user_id = excluded.user_id,
+                        fc_amount = excluded.fc_amount, reference = excluded.reference,
+                        status = 'received', attempts = 0, processed_at = NULL
+                    WHERE payment_inbox.status IN ('received', 'unmatched')
+                        AND payment_inbox.user_id IS NULL AND excluded.user_id IS NOT NULL
+                """, rows)
+                conn.commit()
+                return conn.total_changes - before
+        except Exception as e:
+            logger.error(f"Error enqueuing payment events: {e}")
+            return 0
+
+    def get_unprocessed_payment_events(self, limit: int = 100, max_attempts: int = 5):
+        """İşlenmemiş ödeme olaylarını al (en eskiden yeniye)"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.execute("""
+                    SELECT * FROM payment_inbox
+                    WHERE status = 'received' AND attempts < ?
+                    ORDER BY id
+                    LIMIT ?
+                """, (max_attempts, limit))
+                return cursor.fetchall()
+        except Exception as e:
+            logger.error(f"Error getting unprocessed payment events: {e}")
+            return []
+
+    def credit_payment_events(self, event_ids: list, sol_to_fc_rate: float = None,
+                              tolerance: float = 0.001) -> list:
+        """Ödeme olaylarını tek transaction'da kredile - her olay en fazla bir kez
+
+        The batch runs under BEGIN IMMEDIATE and only touches rows still in
+        'received', so concurrent workers or processes cannot credit twice.
+        Unattributed transfers resolve to tagged pending deposits by exact
+        lamports (indexed equality), legacy untagged rows by tolerance;
+        attributed events are credited directly. Balances are updated with
+        fun_coins = fun_coins + ?. An event whose user has no users row is
+        left 'received' with an error and retried until max_attempts, without
+        touching its pending deposit.
+        """
+        if not event_ids:
+            return []
+        credited = []
+        conn = self.get_connection()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            placeholders = ','.join('?' * len(event_ids))
+            events = conn.execute(f"""
+                SELECT * FROM payment_inbox
+                WHERE id IN ({placeholders}) AND status = 'received'
+                ORDER BY id
+            """, list(event_ids)).fetchall()
+
+            # Tagged deposits resolve by (wallet, lamports) equality on the unique index
+            unattributed = [event for event in events if event['user_id'] is None and event['to_address']]
+            tagged = {}
+            for event in unattributed:
+                key = (event['to_address'], round(event['amount'] * 1_000_000_000))
+                row = conn.execute("""
+                    SELECT id, user_id FROM pending_transactions
+                    WHERE wallet_address = ? AND expected_lamports = ? AND status = 'pending'
+                """, key).fetchone()
+                if row:
+                    tagged[key] = row
+
+            # Otherwise match by tolerance: legacy rows without a tag, or a tagged
+            # row the sender's wallet rounded when it is the only candidate
+            wallets = sorted({event['to_address'] for event in unattributed})
+            pending_by_wallet = {}
+            if wallets:
+                placeholders = ','.join('?' * len(wallets))
+                pending_rows = conn.execute(f"""
+                    SELECT id, user_id, expected_amount, expected_lamports, wallet_address
+                    FROM pending_transactions
+                    WHERE status = 'pending' AND wallet_address IN ({placeholders})
+                    ORDER BY timestamp DESC
+                """, wallets).fetchall()
+                for row in pending_rows:
+                    pending_by_wallet.setdefault(row['wallet_address'], []).append(row)
+
+            # Only credit users that exist - the balance UPDATE would silently miss
+            user_ids = {event['user_id'] for event in events}
+            user_ids |= {row['user_id'] for row in tagged.values()}
+            user_ids |= {row['user_id'] for rows in pending_by_wallet.values() for row in rows}
+            user_ids.discard(None)
+            known_users = set()
+            if user_ids:
+                placeholders = ','.join('?' * len(user_ids))
+                known_users = {row[0] for row in conn.execute(f"""
+                    SELECT user_id FROM users WHERE user_id IN ({placeholders})
+                """, sorted(user_ids))}
+
+            processed = []
+            missing_user = []
+            matched_pending = set()
+            balance_updates = []
+            activity = []
+            for event in events:
+                user_id = event['user_id']
+                pending_id = None
+
+                if user_id is None:
+                    match = tagged.pop((event['to_address'], round(event['amount'] * 1_000_000_000)), None)
+                    if match and match['id'] not in matched_pending:
+                        user_id, pending_id = match['user_id'], match['id']
+
+                if user_id is None:
+                    candidates = [row for row in pending_by_wallet.get(event['to_address'], [])
+                                  if row['id'] not in matched_pending
+                                  and abs(row['expected_amount'] - event['amount']) <= tolerance]
+                    match = self._tolerance_match(candidates)
+                    if match:
+                        user_id, pending_id = match['user_id'], match['id']
+                    if user_id is None:
+                        processed.append(('unmatched', None, None, event['id']))
+                        continue
+
+                if user_id not in known_users:
+                    logger.error(f"Payment event {event['event_key']} is for unknown user {user_id}")
+                    missing_user.append((f"User {user_id} not found", event['id']))
+                    continue
+
+                fc_amount = event['fc_amount']
+                if fc_amount is None:
+                    if sol_to_fc_rate is None:
+                        raise ValueError("SOL to FC rate required for unpriced payment events")
+                    fc_amount = int(event['amount'] * sol_to_fc_rate)
+
+                # CryptoBot: claim the deposit row; a non-pending row was already credited
+                if event['source'] == 'cryptobot' and event['reference']:
+                    claimed = conn.execute("""
+                        UPDATE deposits SET status = 'paid', paid_at = CURRENT_TIMESTAMP
+                        WHERE id = ? AND status = 'pending'
+                    """, (int(event['reference']),)).rowcount
+                    if not claimed:
+                        processed.append(('duplicate', user_id, None, event['id']))
+                        continue
+
+                if pending_id is not None:
+                    matched_pending.add(pending_id)
+                    conn.execute("""
+                        UPDATE pending_transactions
+                        SET status = 'confirmed', transaction_signature = ?,
+                            confirmed_at = CURRENT_TIMESTAMP, fc_amount = ?
+                        WHERE id = ?
+                    """, (event['signature'], fc_amount, pending_id))
+
+                balance_updates.append((fc_amount, user_id))
+                activity.append((user_id, f"{event['source']}_deposit",
+                                 f"Automatic deposit: {event['amount']} -> {fc_amount} FC ({event['signature'] or event['event_key']})"))
+                processed.append(('credited', user_id, fc_amount, event['id']))
+                credited.append({
+                    "event_key": event['event_key'],
+                    "source": event['source'],
+                    "reference": event['reference'],
+                    "user_id": user_id,
+                    "sol_amount": event['amount'],
+                    "fc_amount": fc_amount,
+                    "transaction_signature": event['signature'],
+                    "pending_transaction_id": pending_id
+                })
+
+            conn.executemany("""
+                UPDATE users SET fun_coins = fun_coins + ?, last_active = CURRENT_TIMESTAMP
+                WHERE user_id = ?
+            """, balance_updates)
+            conn.executemany("""
+                INSERT INTO user_activity (user_id, activity_type, details)
+                VALUES (?, ?, ?)
+            """, activity)
+            conn.executemany("""
+                UPDATE payment_inbox
+                SET status = ?, user_id = ?, fc_amount = ?, attempts = attempts + 1,
+                    processed_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, processed)
+            conn.executemany("""
+                UPDATE payment_inbox SET attempts = attempts + 1, error = ?
+                WHERE id = ?
+            """, missing_user)
+
+            # Return the post-credit balances for notifications
+            user_ids = sorted({item['user_id'] for item in credited})
+            if user_ids:
+                placeholders = ','.join('?' * len(user_ids))
+                balances = dict(conn.execute(f"""
+                    SELECT user_id, fun_coins FROM users WHERE user_id IN ({placeholders})
+                """, user_ids).fetchall())
+                for item in credited:
+                    item['new_balance'] = balances.get(item['user_id'], 0)
+
+            conn.commit()
+            return credited
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error crediting payment events: {e}")
+            self.mark_payment_events_failed(event_ids, str(e))
+            return []
+        finally:
+            conn.close()
+
+    def mark_payment_events_failed(self, event_ids: list, error: str):
+        """Başarısız denemeyi kaydet - max_attempts dolana kadar tekrar denenir"""
+        try:
+            with self.get_connection() as conn:
+                conn.executemany("""
+                    UPDATE payment_inbox SET attempts = attempts + 1, error = ?
+                    WHERE id = ? AND status = 'received'
+                """, [(error, event_id) for event_id in event_ids])
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Error marking payment events failed: {e}")
+
+    def get_payment_event(self, event_key: str):
+        """Olay anahtarına göre kutudaki kaydı al"""
+        try:
+            with self.get_connection() as conn:
+                return conn.execute(
+                    'SELECT * FROM payment_inbox WHERE event_key = ?', (event_key,)
+                ).fetchone()
+        except Exception as e:
+            logger.error(f"Error getting payment event: {e}")
+            return None
+
+_shared_managers = {}
+
+def get_database_manager(db_path: str = 'fun_casino.db') -> DatabaseManager:
+    """Paylaşılan DatabaseManager örneği - init_database yalnızca bir kez çalışır"""
+    manager = _shared_managers.get(db_path)
+    if manager is None:
+        manager = DatabaseManager(db_path)
+        _shared_managers[db_path] = manager
+    return manager
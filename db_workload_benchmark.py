@@ -0,0 +1,724 @@
+#!/usr/bin/env python3
+"""
+DB Workload Benchmark
+SQLite iş yükü benchmark'ı ve kilit çekişmesi profilleyicisi
+
+Replays a synthetic mix of the bot's real queries against a seeded copy of
+the casino schema, from the same kinds of concurrent clients production has:
+
+    bot       asyncio tasks (and optional threads) running DatabaseManager
+              query paths: get_user, settle (update_user_stats), history
+              insert (save_solo_game), user history and the daily leaderboard
+    payment   the payment credit worker: DatabaseManager.enqueue_payment_events
+              + credit_payment_events (BEGIN IMMEDIATE batches), on
+              connections from the run's pool
+    monitor   Solana monitor threads on raw sqlite3.connect() connections:
+              processed-signature lookups/flushes and deposit confirmations
+    admin     AdminDashboard readers on raw connections: overview and
+              transaction dashboard counts
+
+Each run uses one pool / journal_mode / synchronous combination for the
+DatabaseManager paths (the raw monitor and admin connections keep their
+defaults, as in the code). Pools:
+
+    per_call      new connection + PRAGMAs per operation (DatabaseManager today)
+    thread_local  one connection per client, reused
+    shared        --pool-size connections shared through a queue
+
+Per run the report gives throughput, transaction latency p50/p95/p99,
+busy waits and "database is locked" errors. sqlite3 does not expose the
+busy handler, so a busy wait is a statement that took at least
+--busy-threshold-ms (uncontended statements here take well under 1 ms);
+commit time, where fsync cost lands, is reported separately.
+
+    python db_workload_benchmark.py
+    python db_workload_benchmark.py --pools per_call,shared --journals wal --syncs normal,full --duration 20
+    python db_workload_benchmark.py --bot-tasks 16 --monitor-threads 4 --detail --json > db_bench.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import queue
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, redirect_stdout
+from typing import Any, Callable, Dict, List, Optional
+
+from database_manager import DatabaseManager
+from engine_benchmark import percentile
+
+POOLS = ("per_call", "thread_local", "shared")
+JOURNALS = ("wal", "delete", "truncate")
+SYNCS = ("off", "normal", "full")
+
+BOT_MIX = {
+    "get_user": 40,
+    "settle": 20,
+    "history_insert": 20,
+    "user_history": 10,
+    "leaderboard": 5,
+    "user_stats": 5,
+}
+
+GAME_TYPES = ("solo_slots", "solo_blackjack", "solo_roulette", "solo_mines", "solo_crash", "lucky_wheel")
+
+# --- Statement timing -------------------------------------------------------
+
+_current = threading.local()  # .stats of the client whose operation is running
+
+class ClientStats:
+    """Numbers for one client kind (bot, payment, monitor, admin)"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.locked = 0
+        self.statements = 0
+        self.busy_waits = 0
+        self.busy_seconds = 0.0
+        self.commit_seconds = 0.0
+        self.pool_wait_seconds = 0.0
+
+    def merge(self, other: "ClientStats"):
+        for op, values in other.latencies.items():
+            self.latencies[op].extend(values)
+        for op, count in other.errors.items():
+            self.errors[op] += count
+        for name in ("locked", "statements", "busy_waits", "busy_seconds", "commit_seconds", "pool_wait_seconds"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+class TimedConnection(sqlite3.Connection):
+    """Records statement and commit times into the running client's stats"""
+
+    def _timed(self, call, *args):
+        stats = getattr(_current, "stats", None)
+        started = time.perf_counter()
+        try:
+            return call(*args)
+        finally:
+            if stats is not None:
+                elapsed = time.perf_counter() - started
+                stats.statements += 1
+                if elapsed >= _current.busy_threshold:
+                    stats.busy_waits += 1
+                    stats.busy_seconds += elapsed
+
+    def execute(self, *args):
+        return self._timed(super().execute, *args)
+
+    def executemany(self, *args):
+        return self._timed(super().executemany, *args)
+
+    def commit(self):
+        stats = getattr(_current, "stats", None)
+        started = time.perf_counter()
+        try:
+            return super().commit()
+        finally:
+            if stats is not None:
+                stats.commit_seconds += time.perf_counter() - started
+
+# --- Connections ------------------------------------------------------------
+
+class WorkloadConfig:
+    def __init__(self, db_path: str, pool: str, journal: str, synchronous: str,
+                 pool_size: int = 8, busy_timeout: float = 30.0):
+        self.db_path = db_path
+        self.pool = pool
+        self.journal = journal
+        self.synchronous = synchronous
+        self.pool_size = pool_size
+        self.busy_timeout = busy_timeout
+
+    @property
+    def name(self) -> str:
+        return f"{self.pool}/{self.journal}/{self.synchronous}"
+
+    def connect(self) -> sqlite3.Connection:
+        """DatabaseManager.get_connection with this run's journal and synchronous settings"""
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False,
+                               factory=TimedConnection)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f'PRAGMA journal_mode={self.journal.upper()}')
+        conn.execute(f'PRAGMA synchronous={self.synchronous.upper()}')
+        conn.execute('PRAGMA cache_size=10000')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        return conn
+
+class ConnectionSource:
+    """Hands out DatabaseManager-style connections according to the pool setting"""
+
+    def __init__(self, config: WorkloadConfig):
+        self.config = config
+        self._local = threading.local()
+        self._shared: Optional[queue.Queue] = None
+        self._opened: List[sqlite3.Connection] = []
+        if config.pool == "shared":
+            self._shared = queue.Queue()
+            for _ in range(config.pool_size):
+                conn = config.connect()
+                self._opened.append(conn)
+                self._shared.put(conn)
+
+    @contextmanager
+    def connection(self, client_key: Any = None):
+        if self.config.pool == "per_call":
+            conn = self.config.connect()
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+        elif self.config.pool == "thread_local":
+            connections = getattr(self._local, "connections", None)
+            if connections is None:
+                connections = self._local.connections = {}
+            conn = connections.get(client_key)
+            if conn is None:
+                conn = connections[client_key] = self.config.connect()
+                self._opened.append(conn)
+            with conn:
+                yield conn
+        else:
+            started = time.perf_counter()
+            conn = self._shared.get()
+            stats = getattr(_current, "stats", None)
+            if stats is not None:
+                stats.pool_wait_seconds += time.perf_counter() - started
+            try:
+                with conn:
+                    yield conn
+            finally:
+                self._shared.put(conn)
+
+    def close(self):
+        for conn in self._opened:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+class _LeasedConnection:
+    """sqlite3.Connection stand-in that hands its connection back to the source on close
+
+    DatabaseManager either closes what get_connection() returned or uses it
+    as a context manager, so both end the lease.
+    """
+
+    def __init__(self, source: ConnectionSource, client_key: Any):
+        self._lease = source.connection(client_key)
+        self._conn = self._lease.__enter__()
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._release(*exc_info)
+        return False
+
+    def close(self):
+        self._release(None, None, None)
+
+    def _release(self, *exc_info):
+        lease, self._lease = self._lease, None
+        if lease is not None:
+            lease.__exit__(*exc_info)
+
+class _ConfiguredDatabase(DatabaseManager):
+    """DatabaseManager whose connections come from the run's pool (schema already exists)"""
+
+    def __init__(self, config: WorkloadConfig, source: ConnectionSource, client_key: Any):
+        self.db_path = config.db_path
+        self._source = source
+        self._client_key = client_key
+
+    def get_connection(self):
+        return _LeasedConnection(self._source, self._client_key)
+
+class _LockedLogCounter(logging.Handler):
+    """DatabaseManager methods log and swallow errors - count the lock ones too"""
+
+    def emit(self, record: logging.LogRecord):
+        stats = getattr(_current, "stats", None)
+        if stats is not None and "locked" in record.getMessage():
+            stats.locked += 1
+
+def _raw_connect(db_path: str) -> sqlite3.Connection:
+    """How the Solana monitors and AdminDashboard connect: library defaults"""
+    return sqlite3.connect(db_path, factory=TimedConnection)
+
+# --- Schema and seed data ---------------------------------------------------
+
+SOLANA_SCHEMA = """
+CREATE TABLE IF NOT EXISTS solana_deposits (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    sol_amount REAL NOT NULL,
+    fc_amount INTEGER NOT NULL,
+    transaction_hash TEXT,
+    wallet_address TEXT NOT NULL,
+    status TEXT DEFAULT 'pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    confirmed_at TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS solana_withdrawals (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    fc_amount INTEGER NOT NULL,
+    sol_amount REAL NOT NULL,
+    fee_amount REAL NOT NULL,
+    user_wallet TEXT NOT NULL,
+    status TEXT DEFAULT 'pending',
+    admin_notes TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    processed_at TIMESTAMP,
+    transaction_hash TEXT
+);
+CREATE TABLE IF NOT EXISTS processed_signatures (
+    scope TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (scope, signature)
+);
+"""
+
+def create_seed_database(path: str, users: int, history: int, deposits: int, seed: int):
+    """Casino schema (DatabaseManager.init_database + Solana tables) with synthetic rows"""
+    rng = random.Random(seed)
+    with redirect_stdout(sys.stderr):
+        DatabaseManager(path)
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(SOLANA_SCHEMA)
+        conn.executemany(
+            'INSERT INTO users (user_id, username, fun_coins, friend_code, xp, level) VALUES (?, ?, ?, ?, ?, ?)',
+            [(100_000 + i, f"user{i}", rng.randint(0, 100_000), f"FC{i:08d}", rng.randint(0, 50_000), 1)
+             for i in range(users)])
+        conn.executemany('''
+            INSERT INTO solo_game_history (user_id, game_type, bet_amount, win_amount, multiplier, won, played_at)
+            VALUES (?, ?, ?, ?, ?, ?, datetime('now', ?))
+        ''', [(100_000 + rng.randrange(users), rng.choice(GAME_TYPES), 100, rng.choice((0, 0, 150, 200)),
+               rng.choice((0.0, 1.5, 2.0)), rng.random() < 0.45, f"-{rng.randrange(14 * 24 * 60)} minutes")
+              for _ in range(history)])
+        conn.executemany('''
+            INSERT INTO solana_deposits (user_id, sol_amount, fc_amount, wallet_address, status)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [(100_000 + rng.randrange(users), 0.1, 10, f"Wallet{i % 50}", rng.choice(("pending", "confirmed")))
+              for i in range(deposits)])
+        conn.executemany('''
+            INSERT INTO solana_withdrawals (user_id, fc_amount, sol_amount, fee_amount, user_wallet, status)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', [(100_000 + rng.randrange(users), 1000, 10.0, 0.01, f"Wallet{i % 50}",
+               rng.choice(("pending", "completed"))) for i in range(deposits // 4)])
+        conn.commit()
+    finally:
+        conn.close()
+
+# --- Operations -------------------------------------------------------------
+# Bot operations replay the SQL of the DatabaseManager-based code paths.
+
+class Client:
+    def __init__(self, kind: str, key: int, source: ConnectionSource, config: WorkloadConfig,
+                 users: int, rng: random.Random):
+        self.kind = kind
+        self.key = key
+        self.source = source
+        self.config = config
+        self.users = users
+        self.rng = rng
+        self.stats = ClientStats()
+
+    def user_id(self) -> int:
+        # Skewed towards a hot set of active players
+        if self.rng.random() < 0.8:
+            return 100_000 + self.rng.randrange(max(1, self.users // 20))
+        return 100_000 + self.rng.randrange(self.users)
+
+    def connection(self):
+        return self.source.connection(self.key)
+
+def op_get_user(client: Client):
+    with client.connection() as conn:
+        conn.execute('SELECT * FROM users WHERE user_id = ?', (client.user_id(),)).fetchone()
+
+def op_settle(client: Client):
+    """MultiplayerCasino.update_user_stats + check_achievements"""
+    user_id = client.user_id()
+    bet_amount = 100
+    won = client.rng.random() < 0.45
+    won_amount = 200 if won else 0
+    with client.connection() as conn:
+        user = conn.execute('SELECT * FROM users WHERE user_id = ?', (user_id,)).fetchone()
+        new_streak = user['win_streak'] + 1 if won else 0
+        max_streak = max(user['max_streak'], new_streak)
+        new_xp = user['xp'] + (bet_amount // 10 if won else bet_amount // 20)
+        conn.execute('''UPDATE users SET
+            fun_coins = fun_coins - ? + ?,
+            total_bet = total_bet + ?,
+            total_won = total_won + ?,
+            games_count = games_count + 1,
+            win_streak = ?,
+            max_streak = ?,
+            xp = ?,
+            level = ?,
+            last_active = CURRENT_TIMESTAMP
+            WHERE user_id = ?''',
+            (bet_amount, won_amount, bet_amount, won_amount,
+             new_streak, max_streak, new_xp, new_xp // 1000 + 1, user_id))
+        conn.commit()
+    with client.connection() as conn:
+        conn.execute('SELECT achievement_id FROM user_achievements WHERE user_id = ?', (user_id,)).fetchall()
+
+def op_history_insert(client: Client):
+    """MultiplayerCasino.save_solo_game"""
+    won = client.rng.random() < 0.45
+    with client.connection() as conn:
+        conn.execute('''
+            INSERT INTO solo_game_history
+            (user_id, game_type, bet_amount, win_amount, multiplier, won, result_data, played_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ''', (client.user_id(), client.rng.choice(GAME_TYPES), 100, 200 if won else 0,
+              2.0 if won else 0.0, won, '["S",["🍒","🍋","🍊"]]'))
+        conn.commit()
+
+def op_user_history(client: Client):
+    """show_game_history"""
+    with client.connection() as conn:
+        conn.execute('''
+            SELECT game_type, bet_amount, win_amount, multiplier, won, result_data, played_at
+            FROM solo_game_history
+            WHERE user_id = ?
+            ORDER BY played_at DESC LIMIT 10
+        ''', (client.user_id(),)).fetchall()
+
+def op_leaderboard(client: Client):
+    """show_leaderboard(period="daily")"""
+    with client.connection() as conn:
+        conn.execute('''
+            SELECT u.username, u.fun_coins, u.level,
+                   COALESCE(SUM(sh.win_amount - sh.bet_amount), 0) as daily_profit
+            FROM users u
+            LEFT JOIN solo_game_history sh ON u.user_id = sh.user_id
+            AND DATE(sh.played_at) = DATE('now')
+            GROUP BY u.user_id
+            ORDER BY daily_profit DESC, u.fun_coins DESC
+            LIMIT 10
+        ''').fetchall()
+
+def op_user_stats(client: Client):
+    """Profile statistics (main.py user stats queries)"""
+    user_id = client.user_id()
+    with client.connection() as conn:
+        conn.execute('SELECT COUNT(*) FROM solo_game_history WHERE user_id = ?', (user_id,)).fetchone()
+        conn.execute('SELECT SUM(bet_amount) FROM solo_game_history WHERE user_id = ?', (user_id,)).fetchone()
+        conn.execute('SELECT SUM(win_amount) FROM solo_game_history WHERE user_id = ?', (user_id,)).fetchone()
+        conn.execute('SELECT MAX(win_amount) FROM solo_game_history WHERE user_id = ?', (user_id,)).fetchone()
+
+BOT_OPERATIONS = {
+    "get_user": op_get_user,
+    "settle": op_settle,
+    "history_insert": op_history_insert,
+    "user_history": op_user_history,
+    "leaderboard": op_leaderboard,
+    "user_stats": op_user_stats,
+}
+
+_signature_counter = itertools.count()
+
+def op_payment_credit(client: Client):
+    """Payment inbox enqueue + credit worker batch"""
+    database: DatabaseManager = client.database
+    events = [{'signature': f"bench{next(_signature_counter)}", 'to_address': 'BenchWallet',
+               'amount': 0.1, 'user_id': client.user_id(), 'fc_amount': 10}
+              for _ in range(client.rng.randint(1, 4))]
+    database.enqueue_payment_events('benchmark', events)
+    rows = database.get_unprocessed_payment_events(limit=20)
+    database.credit_payment_events([row['id'] for row in rows])
+
+def op_monitor_signatures(client: Client):
+    """ProcessedSignatureIndex.filter_new + flush, each on its own raw connection"""
+    signatures = [f"sig{next(_signature_counter)}" for _ in range(client.rng.randint(1, 10))]
+    conn = _raw_connect(client.config.db_path)
+    try:
+        placeholders = ",".join("?" * len(signatures))
+        conn.execute(f"SELECT signature FROM processed_signatures WHERE scope = ? AND signature IN ({placeholders})",
+                     ("deposits", *signatures)).fetchall()
+    finally:
+        conn.close()
+    conn = _raw_connect(client.config.db_path)
+    try:
+        conn.executemany("INSERT OR IGNORE INTO processed_signatures (scope, signature) VALUES (?, ?)",
+                         [("deposits", signature) for signature in signatures])
+        conn.commit()
+    finally:
+        conn.close()
+
+def op_monitor_confirm(client: Client):
+    """Deposit confirmation: deposit row + balance credit on a raw connection"""
+    conn = _raw_connect(client.config.db_path)
+    try:
+        row = conn.execute("SELECT id, user_id, fc_amount FROM solana_deposits WHERE status = 'pending' LIMIT 1").fetchone()
+        if row:
+            conn.execute("""UPDATE solana_deposits SET status = 'confirmed', confirmed_at = CURRENT_TIMESTAMP,
+                            transaction_hash = ? WHERE id = ?""", (f"tx{next(_signature_counter)}", row[0]))
+            conn.execute("UPDATE users SET fun_coins = fun_coins + ? WHERE user_id = ?", (row[2], row[1]))
+        else:
+            conn.execute("INSERT INTO solana_deposits (user_id, sol_amount, fc_amount, wallet_address) VALUES (?, ?, ?, ?)",
+                         (client.user_id(), 0.1, 10, "BenchWallet"))
+        conn.commit()
+    finally:
+        conn.close()
+
+def op_admin_dashboard(client: Client):
+    """AdminDashboard.get_system_overview + get_transaction_dashboard_data counts"""
+    conn = _raw_connect(client.config.db_path)
+    try:
+        cursor = conn.cursor()
+        for sql in (
+            "SELECT COUNT(*) FROM users",
+            "SELECT COUNT(*) FROM solana_deposits WHERE status = 'pending'",
+            "SELECT COUNT(*) FROM solana_withdrawals WHERE status = 'pending'",
+            "SELECT SUM(fun_coins) FROM users",
+            "SELECT SUM(sol_amount) FROM solana_deposits WHERE DATE(created_at) = DATE('now') AND status = 'confirmed'",
+            "SELECT COUNT(*), COALESCE(SUM(sol_amount), 0) FROM solana_deposits WHERE status = 'pending'",
+            "SELECT COUNT(*), COALESCE(SUM(sol_amount), 0) FROM solana_withdrawals WHERE status = 'pending'",
+            "SELECT COUNT(*) FROM solo_game_history",
+            "SELECT SUM(bet_amount) FROM solo_game_history",
+        ):
+            cursor.execute(sql)
+            cursor.fetchone()
+    finally:
+        conn.close()
+
+# --- Runner -----------------------------------------------------------------
+
+def _run_op(client: Client, name: str, operation: Callable[[Client], None]):
+    started = time.perf_counter()
+    try:
+        operation(client)
+    except sqlite3.OperationalError as e:
+        client.stats.errors[name] += 1
+        if "locked" in str(e) or "busy" in str(e):
+            client.stats.locked += 1
+        return
+    except Exception:
+        client.stats.errors[name] += 1
+        return
+    client.stats.latencies[name].append(time.perf_counter() - started)
+
+def _bind(client: Client, busy_threshold: float):
+    _current.stats = client.stats
+    _current.busy_threshold = busy_threshold
+
+def _thread_client(client: Client, operations: Dict[str, Callable], weights: Optional[List[int]],
+                   interval: float, deadline: float, busy_threshold: float):
+    names = list(operations)
+    while time.perf_counter() < deadline:
+        name = client.rng.choices(names, weights)[0] if weights else names[0]
+        _bind(client, busy_threshold)
+        _run_op(client, name, operations[name])
+        if interval:
+            time.sleep(client.rng.expovariate(1 / interval))
+
+async def _task_client(client: Client, mix: Dict[str, int], deadline: float, busy_threshold: float):
+    """Bot handlers call sqlite synchronously on the event loop, so this does too"""
+    names, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline:
+        name = client.rng.choices(names, weights)[0]
+        _bind(client, busy_threshold)
+        _run_op(client, name, BOT_OPERATIONS[name])
+        await asyncio.sleep(0)
+
+def run_workload(config: WorkloadConfig, args: argparse.Namespace) -> Dict[str, Any]:
+    """One timed run of every client kind against config.db_path"""
+    source = ConnectionSource(config)
+    rng = random.Random(args.seed)
+    keys = itertools.count()
+    busy_threshold = args.busy_threshold_ms / 1000
+
+    def client(kind: str) -> Client:
+        return Client(kind, next(keys), source, config, args.users, random.Random(rng.random()))
+
+    bot_tasks = [client("bot") for _ in range(args.bot_tasks)]
+    mix_operations = {name: BOT_OPERATIONS[name] for name in args.mix}
+    thread_specs = [(client("bot"), mix_operations, list(args.mix.values()), 0.0)
+                    for _ in range(args.bot_threads)]
+    for _ in range(args.payment_workers):
+        payment = client("payment")
+        payment.database = _ConfiguredDatabase(config, source, payment.key)
+        thread_specs.append((payment, {"payment_credit": op_payment_credit}, None, args.payment_interval_ms / 1000))
+    for _ in range(args.monitor_threads):
+        thread_specs.append((client("monitor"), {"monitor_signatures": op_monitor_signatures,
+                                                 "monitor_confirm": op_monitor_confirm},
+                             [3, 1], args.monitor_interval_ms / 1000))
+    for _ in range(args.admin_threads):
+        thread_specs.append((client("admin"), {"admin_dashboard": op_admin_dashboard}, None,
+                             args.admin_interval_ms / 1000))
+
+    started = time.perf_counter()
+    deadline = started + args.duration
+    threads = [threading.Thread(target=_thread_client, args=(c, ops, weights, interval, deadline, busy_threshold),
+                                daemon=True) for c, ops, weights, interval in thread_specs]
+    for thread in threads:
+        thread.start()
+
+    async def run_tasks():
+        await asyncio.gather(*[_task_client(c, args.mix, deadline, busy_threshold) for c in bot_tasks])
+
+    asyncio.run(run_tasks())
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    source.close()
+
+    by_kind: Dict[str, ClientStats] = defaultdict(ClientStats)
+    for c in bot_tasks + [spec[0] for spec in thread_specs]:
+        by_kind[c.kind].merge(c.stats)
+    return summarize(config, by_kind, elapsed, args.detail)
+
+def _latency_summary(latencies: List[float]) -> Dict[str, float]:
+    values = sorted(latencies)
+    return {
+        "ops": len(values),
+        "p50_ms": percentile(values, 0.50) * 1000,
+        "p95_ms": percentile(values, 0.95) * 1000,
+        "p99_ms": percentile(values, 0.99) * 1000,
+    }
+
+def summarize(config: WorkloadConfig, by_kind: Dict[str, ClientStats], elapsed: float,
+              detail: bool = False) -> Dict[str, Any]:
+    total = ClientStats()
+    for stats in by_kind.values():
+        total.merge(stats)
+    all_latencies = [value for values in total.latencies.values() for value in values]
+    result = {
+        "config": {"pool": config.pool, "journal": config.journal, "synchronous": config.synchronous,
+                   "pool_size": config.pool_size if config.pool == "shared" else None},
+        "elapsed": elapsed,
+        "ops_per_sec": len(all_latencies) / elapsed,
+        "transactions": _latency_summary(all_latencies),
+        "statements": total.statements,
+        "busy_waits": total.busy_waits,
+        "busy_wait_seconds": total.busy_seconds,
+        "commit_seconds": total.commit_seconds,
+        "pool_wait_seconds": total.pool_wait_seconds,
+        "locked_errors": total.locked,
+        "errors": sum(total.errors.values()),
+        "clients": {},
+    }
+    for kind, stats in sorted(by_kind.items()):
+        kind_latencies = [value for values in stats.latencies.values() for value in values]
+        entry = dict(_latency_summary(kind_latencies), ops_per_sec=len(kind_latencies) / elapsed,
+                     busy_waits=stats.busy_waits, busy_wait_seconds=stats.busy_seconds,
+                     locked_errors=stats.locked, errors=sum(stats.errors.values()))
+        if detail:
+            entry["operations"] = {name: dict(_latency_summary(values), errors=stats.errors.get(name, 0))
+                                   for name, values in sorted(stats.latencies.items())}
+        result["clients"][kind] = entry
+    return result
+
+def _print_report(results: List[Dict[str, Any]], detail: bool):
+    print(f"\n🗄️ SQLite workload benchmark - {len(results)} configuration(s)\n")
+    print(f"{'pool/journal/sync':<28} {'ops/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'busy':>7} {'busy s':>7} {'commit s':>8} {'pool s':>7} {'locked':>7}")
+    for result in results:
+        config, txn = result["config"], result["transactions"]
+        name = f"{config['pool']}/{config['journal']}/{config['synchronous']}"
+        print(f"{name:<28} {result['ops_per_sec']:>9,.0f} {txn['p50_ms']:>8.2f} {txn['p95_ms']:>8.2f} "
+              f"{txn['p99_ms']:>8.2f} {result['busy_waits']:>7} {result['busy_wait_seconds']:>7.2f} "
+              f"{result['commit_seconds']:>8.2f} {result['pool_wait_seconds']:>7.2f} {result['locked_errors']:>7}")
+        if detail:
+            for kind, stats in result["clients"].items():
+                print(f"    {kind:<24} {stats['ops_per_sec']:>9,.0f} {stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} "
+                      f"{stats['p99_ms']:>8.2f} {stats['busy_waits']:>7} {stats['busy_wait_seconds']:>7.2f} "
+                      f"{'':>8} {'':>7} {stats['locked_errors']:>7}")
+                for op, op_stats in stats.get("operations", {}).items():
+                    print(f"      {op:<22} {op_stats['ops']:>8,}x {op_stats['p50_ms']:>8.2f} "
+                          f"{op_stats['p95_ms']:>8.2f} {op_stats['p99_ms']:>8.2f}")
+
+def _choices(text: str, allowed, parser, label: str) -> List[str]:
+    values = [value.strip().lower() for value in text.split(",") if value.strip()]
+    unknown = set(values) - set(allowed)
+    if unknown:
+        parser.error(f"unknown {label}: {', '.join(sorted(unknown))}")
+    return values
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite workload benchmark and lock contention profiler")
+    parser.add_argument("--pools", default="per_call,thread_local,shared", help=f"comma separated: {','.join(POOLS)}")
+    parser.add_argument("--journals", default="wal,delete", help=f"comma separated: {','.join(JOURNALS)}")
+    parser.add_argument("--syncs", default="normal,full", help=f"comma separated: {','.join(SYNCS)}")
+    parser.add_argument("--pool-size", type=int, default=8, help="connections in the shared pool")
+    parser.add_argument("--busy-timeout", type=float, default=30.0, help="sqlite3 timeout for DatabaseManager connections")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per configuration")
+    parser.add_argument("--bot-tasks", type=int, default=8, help="asyncio tasks running bot queries")
+    parser.add_argument("--bot-threads", type=int, default=0, help="extra threads running bot queries")
+    parser.add_argument("--payment-workers", type=int, default=1)
+    parser.add_argument("--payment-interval-ms", type=float, default=200.0)
+    parser.add_argument("--monitor-threads", type=int, default=2)
+    parser.add_argument("--monitor-interval-ms", type=float, default=50.0)
+    parser.add_argument("--admin-threads", type=int, default=1)
+    parser.add_argument("--admin-interval-ms", type=float, default=500.0)
+    parser.add_argument("--mix", default=None, help="bot operation=weight,... (default: built-in mix)")
+    parser.add_argument("--users", type=int, default=5000, help="seeded users")
+    parser.add_argument("--history", type=int, default=50000, help="seeded solo_game_history rows")
+    parser.add_argument("--deposits", type=int, default=2000, help="seeded Solana deposits")
+    parser.add_argument("--busy-threshold-ms", type=float, default=5.0,
+                        help="statements at least this slow count as busy waits")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--detail", action="store_true", help="per client kind and operation breakdown")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    pools = _choices(args.pools, POOLS, parser, "pools")
+    journals = _choices(args.journals, JOURNALS, parser, "journal modes")
+    syncs = _choices(args.syncs, SYNCS, parser, "synchronous settings")
+    if args.mix:
+        args.mix = {name: int(weight or 1) for name, _, weight in
+                    (item.partition("=") for item in args.mix.split(","))}
+        unknown = set(args.mix) - set(BOT_OPERATIONS)
+        if unknown:
+            parser.error(f"unknown operations: {', '.join(sorted(unknown))}")
+    else:
+        args.mix = dict(BOT_MIX)
+
+    logging.getLogger("database_manager").addHandler(_LockedLogCounter())
+    directory = tempfile.mkdtemp(prefix="casino_dbbench_")
+    results = []
+    try:
+        template = os.path.join(directory, "template.db")
+        create_seed_database(template, args.users, args.history, args.deposits, args.seed)
+        for pool, journal, synchronous in itertools.product(pools, journals, syncs):
+            path = os.path.join(directory, f"{pool}_{journal}_{synchronous}.db")
+            shutil.copyfile(template, path)
+            conn = sqlite3.connect(path)
+            conn.execute(f"PRAGMA journal_mode={journal.upper()}")
+            conn.close()
+            config = WorkloadConfig(path, pool, journal, synchronous, args.pool_size, args.busy_timeout)
+            if not args.json:
+                print(f"⏳ {config.name} ...", file=sys.stderr)
+            results.append(run_workload(config, args))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps({"args": {key: value for key, value in vars(args).items() if key != "json"},
+                          "results": results}, indent=2, ensure_ascii=False))
+    else:
+        _print_report(results, args.detail)
+
+if __name__ == "__main__":
+    main()
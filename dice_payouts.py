@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Dice Payout Tables
+Telegram zar oyunları için önceden derlenmiş ödeme tabloları ve kesin RTP hesabı
+
+Payouts are declared once in DICE_PAYOUT_SPEC as ordered rules (first match
+wins, unmatched values lose). At import the rules are compiled into tuples
+indexed by dice value, so a roll is paid with one lookup:
+
+    PAYOUT_TABLES[schedule][dice_type][value]
+
+Telegram dice values are uniform over 1-6 (1-5 for basketball and football,
+1-64 for the slot machine), so each table's RTP is computed exactly from the
+same spec at load time.
+
+Schedules:
+    standard - dice_games.TelegramDiceGames (visual_assets.calculate_dice_payout)
+    group    - main.handle_group_dice_game
+"""
+
+from fractions import Fraction
+from typing import Dict, List, Tuple
+
+# Number of equally likely values each Telegram dice emoji can return
+DICE_VALUE_COUNTS = {
+    'classic_dice': 6,
+    'classic': 6,
+    'darts': 6,
+    'basketball': 5,
+    'football': 5,
+    'bowling': 6,
+    'slot_machine': 64
+}
+
+# (values, multiplier, tier) - ilk eşleşen kural geçerli
+DICE_PAYOUT_SPEC = {
+    'standard': {
+        'slot_machine': [
+            ([64], 8, 'jackpot'),             # 777
+            ([1, 22, 43], 4, 'special'),      # Special jackpot combinations
+            (range(50, 64), 1.5, 'high'),
+            (range(30, 50), 1.1, 'medium'),
+            (range(15, 30), 0.8, 'low'),
+        ],
+        'darts': [
+            ([6], 1.8, 'jackpot'),            # Bullseye
+            ([4, 5], 1.1, 'good'),            # Close to center
+            ([2, 3], 0.4, 'hit'),             # Hit dartboard
+        ],
+        'basketball': [
+            ([4, 5], 1.4, 'jackpot'),         # Successful shots
+            ([3], 0.3, 'close'),              # Close miss
+        ],
+        'football': [
+            ([4, 5], 1.4, 'jackpot'),         # Goal scored
+            ([3], 0.3, 'close'),              # Hit goalpost
+        ],
+        'bowling': [
+            ([6], 1.8, 'jackpot'),            # Strike
+            ([4, 5], 1.0, 'good'),            # Many pins
+            ([3], 0.4, 'some'),               # Some pins
+        ],
+        'classic_dice': [
+            ([6], 1.8, 'jackpot'),
+            ([4, 5], 1.0, 'good'),
+            ([3], 0.4, 'average'),
+        ],
+    },
+    'group': {
+        'classic': [
+            ([6], 6, 'jackpot'),
+            ([4, 5], 2, 'good'),
+            ([3], 1, 'average'),
+        ],
+        'darts': [
+            ([6], 10, 'jackpot'),
+            ([4, 5], 3, 'good'),
+            ([2, 3], 1, 'hit'),
+        ],
+        'basketball': [
+            ([4, 5], 5, 'jackpot'),
+            ([3], 1, 'close'),
+        ],
+        'football': [
+            ([4, 5], 5, 'jackpot'),
+            ([3], 1, 'close'),
+        ],
+        'bowling': [
+            ([6], 6, 'jackpot'),
+            ([4, 5], 2, 'good'),
+            ([3], 1, 'some'),
+        ],
+        'slot_machine': [
+            ([64], 100, 'jackpot'),
+            ([1, 22, 43], 50, 'special'),
+            (range(50, 64), 10, 'high'),
+            (range(30, 50), 5, 'medium'),
+            (range(15, 30), 2, 'low'),
+        ],
+    }
+}
+
+def _compile(dice_type: str, rules: List) -> Tuple[Tuple, Tuple]:
+    """Rules -> (multiplier by value, tier by value); index 0 is unused"""
+    count = DICE_VALUE_COUNTS[dice_type]
+    multipliers = [0] * (count + 1)
+    tiers = ['lose'] * (count + 1)
+    assigned = set()
+    for values, multiplier, tier in rules:
+        for value in values:
+            if not 1 <= value <= count:
+                raise ValueError(f"{dice_type}: value {value} outside 1-{count}")
+            if value not in assigned:
+                assigned.add(value)
+                multipliers[value] = multiplier
+                tiers[value] = tier
+    return tuple(multipliers), tuple(tiers)
+
+def _exact_rtp(multipliers: Tuple) -> Fraction:
+    """Expected return per unit bet with every value equally likely"""
+    values = multipliers[1:]
+    return sum((Fraction(str(multiplier)) for multiplier in values), Fraction(0)) / len(values)
+
+PAYOUT_TABLES: Dict[str, Dict[str, Tuple]] = {}
+TIER_TABLES: Dict[str, Dict[str, Tuple]] = {}
+DICE_RTP: Dict[str, Dict[str, Fraction]] = {}
+
+for _schedule, _games in DICE_PAYOUT_SPEC.items():
+    PAYOUT_TABLES[_schedule], TIER_TABLES[_schedule], DICE_RTP[_schedule] = {}, {}, {}
+    for _dice_type, _rules in _games.items():
+        _multipliers, _tiers = _compile(_dice_type, _rules)
+        PAYOUT_TABLES[_schedule][_dice_type] = _multipliers
+        TIER_TABLES[_schedule][_dice_type] = _tiers
+        DICE_RTP[_schedule][_dice_type] = _exact_rtp(_multipliers)
+
+def get_dice_multiplier(dice_type: str, value: int, schedule: str = 'standard'):
+    """Payout multiplier for a roll; 0 for values outside the table"""
+    table = PAYOUT_TABLES[schedule].get(dice_type)
+    if table is None or not 0 < value < len(table):
+        return 0
+    return table[value]
+
+def get_dice_tier(dice_type: str, value: int, schedule: str = 'standard') -> str:
+    """Outcome tier ('jackpot', 'good', ..., 'lose') for result texts"""
+    tiers = TIER_TABLES[schedule].get(dice_type)
+    if tiers is None or not 0 < value < len(tiers):
+        return 'lose'
+    return tiers[value]
+
+def get_dice_rtp_report() -> List[Dict]:
+    """Exact RTP, house edge and hit frequency of every dice table"""
+    report = []
+    for schedule, tables in PAYOUT_TABLES.items():
+        for dice_type, multipliers in tables.items():
+            values = multipliers[1:]
+            rtp = DICE_RTP[schedule][dice_type]
+            report.append({
+                'schedule': schedule,
+                'dice_type': dice_type,
+                'rtp': float(rtp),
+                'rtp_exact': f"{rtp.numerator}/{rtp.denominator}",
+                'house_edge': float(1 - rtp),
+                'hit_frequency': sum(1 for multiplier in values if multiplier > 0) / len(values),
+                'max_multiplier': max(values)
+            })
+    return report
@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+Engine Benchmark
+Oyun motorları, callback yönlendirme ve metin üretimi için mikro-benchmark paketi
+
+Measures, per benchmark, operations per second (median of --repeat runs):
+
+    solo.<game>.play / .outcome   SoloGameEngine rounds through the game registry
+    duel.*                        GameEngine duel and tournament rounds
+    visual.*                      visual_assets dice helpers over every
+                                  TELEGRAM_DICE type and value; dice_payout.<type>
+                                  goes through the compiled payout tables
+    render.<game>                 solo_render.render_result for pre-drawn outcomes
+    i18n.*                        languages.get_text / get_texts lookups
+    keyboard.*                    MultiplayerCasino.create_keyboard
+    dispatch.<callback>           button_callback with fake Update objects,
+                                  with p50/p95/p99 latency per callback
+
+keyboard and dispatch need python-telegram-bot and are skipped without it.
+They run against a throw-away database, never fun_casino.db.
+
+Results can be written as JSON and compared against a stored baseline; the
+run fails when a benchmark drops more than --threshold below it. Numbers
+only compare on the same machine and Python, so no baseline is committed:
+record one on the machine that runs the comparison, then run the changed
+tree against it.
+
+The suite imports game_registry, rng_service and solo_render, so it only runs
+on revisions that already contain engine_benchmark.py; trees from before it
+was added cannot be measured with it. Take the baseline from the commit that
+added the suite (or any later base) and keep the file outside the work tree:
+
+    git checkout <suite-commit> && python engine_benchmark.py --save-baseline /tmp/bench_baseline.json
+    git checkout - && python engine_benchmark.py --baseline /tmp/bench_baseline.json
+    python engine_benchmark.py --baseline bench_baseline.json --threshold 0.25
+    python engine_benchmark.py --groups solo,render --duration 1 --json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from config import RNG_CONFIG
+from game_engine import GameEngine
+from game_registry import get_game_registry
+from languages import get_text, get_texts
+from rng_service import RNGService
+from solo_games import SoloGameEngine
+from solo_render import render_result
+import visual_assets
+
+try:
+    import telegram  # noqa: F401
+    TELEGRAM_AVAILABLE = True
+except ImportError:
+    TELEGRAM_AVAILABLE = False
+
+GROUPS = ("solo", "duel", "visual", "render", "i18n", "keyboard", "dispatch")
+DEFAULT_THRESHOLD = 0.20
+BENCH_BET = 100
+
+# Callback mix for dispatch.*: menus, game option screens and played rounds
+DISPATCH_CALLBACKS = (
+    "main_menu",
+    "solo_games",
+    "solo_slots",
+    "profile",
+    "play_solo_slots_100",
+    "play_solo_blackjack_100",
+    "play_game_mines_100",
+    "play_new_game_lucky_wheel_100",
+)
+
+@dataclass
+class Benchmark:
+    name: str
+    group: str
+    func: Callable[[], Any]
+    is_async: bool = False  # func returns a coroutine; latency is recorded per call
+
+# --- Measurement ------------------------------------------------------------
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def _measure(func: Callable[[], Any], duration: float, repeat: int) -> Dict[str, float]:
+    """Run func in batches for `duration` seconds split over `repeat` runs"""
+    func()  # warm up caches and lazy imports
+    per_run = duration / repeat
+    rates = []
+    for _ in range(repeat):
+        calls, batch = 0, 1
+        started = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < per_run:
+            for _ in range(batch):
+                func()
+            calls += batch
+            elapsed = time.perf_counter() - started
+            batch = min(batch * 2, 1024)
+        rates.append(calls / elapsed)
+    ops = statistics.median(rates)
+    return {"ops_per_sec": ops, "us_per_op": 1e6 / ops, "best_ops_per_sec": max(rates)}
+
+async def _measure_async(func: Callable[[], Any], duration: float, repeat: int) -> Dict[str, float]:
+    """Like _measure, but awaits one call at a time and keeps per-call latencies"""
+    await func()
+    per_run = duration / repeat
+    rates, latencies = [], []
+    for _ in range(repeat):
+        calls = 0
+        started = time.perf_counter()
+        while time.perf_counter() - started < per_run:
+            call_started = time.perf_counter()
+            await func()
+            latencies.append(time.perf_counter() - call_started)
+            calls += 1
+        rates.append(calls / (time.perf_counter() - started))
+    latencies.sort()
+    ops = statistics.median(rates)
+    return {
+        "ops_per_sec": ops,
+        "us_per_op": 1e6 / ops,
+        "best_ops_per_sec": max(rates),
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+# --- Benchmarks -------------------------------------------------------------
+
+def _seeded_rng(seed: Optional[int]):
+    return RNGService(dict(RNG_CONFIG, seed=seed)).shared
+
+def _solo_benchmarks(seed: Optional[int]) -> List[Benchmark]:
+    registry = get_game_registry()
+    engine = SoloGameEngine(_seeded_rng(seed))
+    benchmarks = []
+    for game_id in registry.game_ids():
+        definition = registry.get(game_id)
+        benchmarks.append(Benchmark(f"solo.{game_id}.play", "solo",
+                                    lambda d=definition: d.play(engine, BENCH_BET)))
+        benchmarks.append(Benchmark(f"solo.{game_id}.outcome", "solo",
+                                    lambda d=definition: d.outcome(engine, BENCH_BET)))
+    return benchmarks
+
+def _duel_benchmarks(seed: Optional[int]) -> List[Benchmark]:
+    engine = GameEngine(_seeded_rng(seed))
+    players = list(range(1, 9))
+    return [
+        Benchmark("duel.coinflip", "duel", lambda: engine.play_duel_coinflip("heads", "tails")),
+        Benchmark("duel.dice", "duel", engine.play_duel_dice),
+        Benchmark("duel.dice_basketball", "duel", lambda: engine.play_duel_dice_with_type("basketball")),
+        Benchmark("duel.rockpaper", "duel", lambda: engine.play_duel_rockpaper("rock", "scissors")),
+        Benchmark("duel.tournament_round_8", "duel", lambda: engine.play_tournament_round(players, "dice")),
+    ]
+
+def _dice_rolls(dice_type: str) -> List[int]:
+    config = visual_assets.TELEGRAM_DICE[dice_type]
+    return list(range(config['min_value'], config['max_value'] + 1))
+
+def _visual_benchmarks() -> List[Benchmark]:
+    rolls = itertools.cycle([(dice_type, value) for dice_type in visual_assets.TELEGRAM_DICE
+                             for value in _dice_rolls(dice_type)])
+    benchmarks = [
+        Benchmark("visual.dice_result_message", "visual",
+                  lambda: visual_assets.get_dice_result_message(*next(rolls))),
+        Benchmark("visual.dice_celebration", "visual",
+                  lambda: visual_assets.get_dice_celebration(*next(rolls))),
+        Benchmark("visual.win_sticker", "visual", lambda: visual_assets.get_win_sticker(BENCH_BET * 12, BENCH_BET)),
+    ]
+    for dice_type in visual_assets.TELEGRAM_DICE:
+        values = itertools.cycle(_dice_rolls(dice_type))
+        benchmarks.append(Benchmark(f"visual.dice_payout.{dice_type}", "visual",
+                                    lambda t=dice_type, v=values: visual_assets.calculate_dice_payout(t, next(v), BENCH_BET)))
+    return benchmarks
+
+def _render_benchmarks(seed: Optional[int]) -> List[Benchmark]:
+    registry = get_game_registry()
+    engine = SoloGameEngine(_seeded_rng(seed))
+    benchmarks = []
+    for game_id in registry.game_ids():
+        definition = registry.get(game_id)
+        # A fixed pool of outcomes so wins, losses and special cases all get rendered
+        outcomes = itertools.cycle([definition.outcome(engine, BENCH_BET) for _ in range(256)])
+        benchmarks.append(Benchmark(f"render.{game_id}", "render",
+                                    lambda o=outcomes: render_result(next(o), rng=engine.rng)))
+    return benchmarks
+
+def _i18n_benchmarks() -> List[Benchmark]:
+    keys = ["main_menu.title", "main_menu.balance", "main_menu.level", "main_menu.games", "main_menu.xp"]
+    return [
+        Benchmark("i18n.get_text", "i18n", lambda: get_text("en", "main_menu.title")),
+        Benchmark("i18n.get_text_template", "i18n", lambda: get_text("en", "main_menu.best_streak", best_streak=7)),
+        Benchmark("i18n.get_text_ru", "i18n", lambda: get_text("ru", "main_menu.title")),
+        Benchmark("i18n.get_text_missing", "i18n", lambda: get_text("en", "bench.missing_key", "fallback")),
+        Benchmark("i18n.get_texts_5", "i18n", lambda: get_texts("en", keys, balance=1000, level=3)),
+    ]
+
+def _keyboard_benchmarks(casino) -> List[Benchmark]:
+    menu = [
+        [("🎰 Slots", "solo_slots"), ("🔴 Roulette", "solo_roulette")],
+        [("♠️ Blackjack", "solo_blackjack"), ("🚀 Crash", "solo_crash")],
+        [("🌐 Site", "https://t.me"), ("🏠 Main Menu", "main_menu")],
+    ]
+    bets = [[(f"{amount} 🐻", f"play_solo_slots_{amount}") for amount in row]
+            for row in ((10, 25, 50), (100, 250, 500), (1000, 2500, 5000))]
+    return [
+        Benchmark("keyboard.menu_3x2", "keyboard", lambda: casino.create_keyboard(menu)),
+        Benchmark("keyboard.bets_3x3", "keyboard", lambda: casino.create_keyboard(bets)),
+    ]
+
+# --- Fake Telegram objects for dispatch --------------------------------------
+
+class _FakeUser:
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.username = f"bench{user_id}"
+        self.first_name = "Bench"
+        self.last_name = None
+        self.language_code = "en"
+        self.is_bot = False
+
+class _FakeChat:
+    def __init__(self, chat_id: int, chat_type: str = "private"):
+        self.id = chat_id
+        self.type = chat_type
+        self.title = None
+
+class _FakeMessage:
+    _ids = itertools.count(1)
+
+    def __init__(self, chat: _FakeChat, user: _FakeUser, text: str = ""):
+        self.message_id = next(self._ids)
+        self.chat = chat
+        self.chat_id = chat.id
+        self.from_user = user
+        self.text = text
+        self.dice = None
+
+    async def reply_text(self, text, **kwargs):
+        return _FakeMessage(self.chat, self.from_user, text)
+
+    async def edit_text(self, text, **kwargs):
+        self.text = text
+        return self
+
+    async def reply_dice(self, **kwargs):
+        return _FakeMessage(self.chat, self.from_user)
+
+    async def delete(self):
+        return True
+
+class _FakeCallbackQuery:
+    def __init__(self, data: str, user: _FakeUser, chat: _FakeChat):
+        self.id = str(next(_FakeMessage._ids))
+        self.data = data
+        self.from_user = user
+        self.message = _FakeMessage(chat, user)
+
+    async def answer(self, text=None, show_alert=False, **kwargs):
+        return True
+
+    async def edit_message_text(self, text, reply_markup=None, parse_mode=None, **kwargs):
+        self.message.text = text
+        return self.message
+
+    async def edit_message_reply_markup(self, reply_markup=None, **kwargs):
+        return self.message
+
+class _FakeUpdate:
+    def __init__(self, query: _FakeCallbackQuery):
+        self.callback_query = query
+        self.effective_user = query.from_user
+        self.effective_chat = query.message.chat
+        self.effective_message = query.message
+        self.message = None
+
+class _FakeBot:
+    async def send_message(self, chat_id, text, **kwargs):
+        return _FakeMessage(_FakeChat(chat_id), _FakeUser(0), text)
+
+    async def edit_message_text(self, text, chat_id=None, message_id=None, **kwargs):
+        return True
+
+    async def send_dice(self, chat_id, **kwargs):
+        return _FakeMessage(_FakeChat(chat_id), _FakeUser(0))
+
+    async def answer_callback_query(self, callback_query_id, **kwargs):
+        return True
+
+class _FakeContext:
+    def __init__(self):
+        self.bot = _FakeBot()
+        self.user_data = {}
+        self.chat_data = {}
+        self.bot_data = {}
+        self.args = []
+
+def _dispatch_benchmarks(bot_main) -> List[Benchmark]:
+    user = _FakeUser(900_000_001)
+    chat = _FakeChat(user.id)
+    context = _FakeContext()
+    bot_main.bot.casino.get_user(user.id, user.username)
+
+    def topped_up_call(data: str):
+        async def call():
+            # Keep the balance high enough that every round is actually played
+            with bot_main.bot.casino.db.get_connection() as conn:
+                conn.execute('UPDATE users SET fun_coins = ? WHERE user_id = ?', (10 ** 12, user.id))
+                conn.commit()
+            await bot_main.button_callback(_FakeUpdate(_FakeCallbackQuery(data, user, chat)), context)
+        return call
+
+    return [Benchmark(f"dispatch.{data}", "dispatch", topped_up_call(data), is_async=True)
+            for data in DISPATCH_CALLBACKS]
+
+class IsolatedDatabase:
+    """Point get_database_manager() at a temporary database for the bot benchmarks"""
+
+    def __enter__(self):
+        import database_manager
+
+        self.directory = tempfile.mkdtemp(prefix="casino_bench_")
+        self.previous = dict(database_manager._shared_managers)
+        database_manager._shared_managers['fun_casino.db'] = database_manager.DatabaseManager(
+            os.path.join(self.directory, "bench.db"))
+        return self
+
+    def __exit__(self, *exc):
+        import database_manager
+
+        database_manager._shared_managers.clear()
+        database_manager._shared_managers.update(self.previous)
+        shutil.rmtree(self.directory, ignore_errors=True)
+        return False
+
+# --- Runner -----------------------------------------------------------------
+
+def _run_group(benchmarks: List[Benchmark], name_filter: Optional[str], duration: float,
+               repeat: int, results: Dict[str, Dict]):
+    for benchmark in benchmarks:
+        if name_filter and name_filter not in benchmark.name:
+            continue
+        try:
+            if benchmark.is_async:
+                stats = asyncio.run(_measure_async(benchmark.func, duration, repeat))
+            else:
+                stats = _measure(benchmark.func, duration, repeat)
+        except Exception as e:
+            results[benchmark.name] = {"group": benchmark.group, "error": str(e)}
+            continue
+        results[benchmark.name] = dict(group=benchmark.group, **stats)
+
+def run_benchmarks(groups: List[str], name_filter: Optional[str] = None, duration: float = 0.5,
+                   repeat: int = 5, seed: Optional[int] = 1234) -> Dict[str, Any]:
+    """Run the selected groups; returns {"results": {...}, "skipped": {group: reason}}"""
+    results: Dict[str, Dict] = {}
+    skipped: Dict[str, str] = {}
+    builders = {
+        "solo": lambda: _solo_benchmarks(seed),
+        "duel": lambda: _duel_benchmarks(seed),
+        "visual": _visual_benchmarks,
+        "render": lambda: _render_benchmarks(seed),
+        "i18n": _i18n_benchmarks,
+    }
+    for group in groups:
+        if group in builders:
+            _run_group(builders[group](), name_filter, duration, repeat, results)
+
+    bot_groups = [group for group in groups if group in ("keyboard", "dispatch")]
+    if bot_groups and not TELEGRAM_AVAILABLE:
+        for group in bot_groups:
+            skipped[group] = "python-telegram-bot is not installed"
+    elif bot_groups:
+        with IsolatedDatabase():
+            import main as bot_main
+
+            bot_main.bot = bot_main.EnhancedCasinoBot()
+            if "keyboard" in bot_groups:
+                _run_group(_keyboard_benchmarks(bot_main.bot.casino), name_filter, duration, repeat, results)
+            if "dispatch" in bot_groups:
+                _run_group(_dispatch_benchmarks(bot_main), name_filter, duration, repeat, results)
+    return {"results": results, "skipped": skipped}
+
+def compare_to_baseline(results: Dict[str, Dict], baseline: Dict[str, Dict],
+                        threshold: float = DEFAULT_THRESHOLD) -> Dict[str, Dict]:
+    """Per benchmark present in both: ratio to the baseline and whether it regressed"""
+    comparison = {}
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous or "ops_per_sec" not in current or "ops_per_sec" not in previous:
+            continue
+        ratio = current["ops_per_sec"] / previous["ops_per_sec"]
+        regressed = ratio < 1 - threshold
+        if "p95_ms" in current and "p95_ms" in previous and previous["p95_ms"] > 0:
+            regressed = regressed or current["p95_ms"] > previous["p95_ms"] * (1 + threshold)
+        comparison[name] = {"ratio": ratio, "regressed": regressed}
+    return comparison
+
+def _print_report(report: Dict[str, Any], comparison: Optional[Dict[str, Dict]]):
+    print(f"\n⏱️ Engine benchmark - Python {platform.python_version()} on {platform.machine()}\n")
+    print(f"{'benchmark':<42} {'ops/s':>12} {'µs/op':>10} {'p95 ms':>9} {'vs base':>9}")
+    for name, stats in report["results"].items():
+        if "error" in stats:
+            print(f"❌ {name:<40} error: {stats['error']}")
+            continue
+        p95 = f"{stats['p95_ms']:.2f}" if "p95_ms" in stats else ""
+        change = ""
+        if comparison and name in comparison:
+            change = f"{comparison[name]['ratio'] - 1:+.1%}" + (" ❌" if comparison[name]["regressed"] else "")
+        print(f"{name:<42} {stats['ops_per_sec']:>12,.0f} {stats['us_per_op']:>10.2f} {p95:>9} {change:>9}")
+    for group, reason in report["skipped"].items():
+        print(f"⏭️ {group}: skipped ({reason})")
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for game engines, dispatch and rendering")
+    parser.add_argument("--groups", default="all", help=f"comma separated: {','.join(GROUPS)}")
+    parser.add_argument("--filter", default=None, help="only benchmarks whose name contains this text")
+    parser.add_argument("--duration", type=float, default=0.5, help="seconds per benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark; the median is reported")
+    parser.add_argument("--seed", type=int, default=1234, help="RNG seed for the engine benchmarks")
+    parser.add_argument("--output", default=None, help="write results JSON to this file")
+    parser.add_argument("--baseline", default=None, help="compare against a stored results JSON")
+    parser.add_argument("--save-baseline", default=None, metavar="FILE", help="store these results as a baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before a benchmark counts as regressed (default: 0.20)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    groups = list(GROUPS) if args.groups == "all" else args.groups.split(",")
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"unknown groups: {', '.join(sorted(unknown))}")
+
+    report = run_benchmarks(groups, args.filter, args.duration, args.repeat, args.seed)
+    report["meta"] = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "duration": args.duration,
+        "repeat": args.repeat,
+    }
+
+    comparison = None
+    if args.baseline:
+        if not os.path.exists(args.baseline):
+            parser.error(f"baseline {args.baseline} not found - record one with --save-baseline {args.baseline}")
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        comparison = compare_to_baseline(report["results"], baseline.get("results", {}), args.threshold)
+        report["comparison"] = comparison
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        _print_report(report, comparison)
+
+    errors = [name for name, stats in report["results"].items() if "error" in stats]
+    regressions = [name for name, check in (comparison or {}).items() if check["regressed"]]
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+    if errors or regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
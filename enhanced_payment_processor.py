@@ -64,8 +64,8 @@ class EnhancedPaymentProcessor:
     async def find_matching_pending_transaction(self, wallet_address: str, sol_amount: float) -> Optional[Dict]:
         """Eşleşen pending transaction bul"""
         try:
-            from database_manager import DatabaseManager
-            db = DatabaseManager()
+            from database_manager import get_database_manager
+            db = get_database_manager()
 
             # Wallet adresi ve miktar ile pending transaction ara
             pending_tx = db.get_pending_transaction_by_criteria(
@@ -92,53 +92,34 @@ class EnhancedPaymentProcessor:
             logger.error(f"Error finding matching pending transaction: {e}")
             return None
 
-    async def add_game_credits(self, user_id: int, fc_amount: int, transaction_signature: str) -> bool:
-        """Kullanıcıya oyun parası ekle"""
+    async def add_game_credits(self, user_id: int, fc_amount: int, transaction_signature: str,
+                               wallet_address: str) -> bool:
+        """Kullanıcıya oyun parası ekle - imza başına yalnızca bir kez
+
+        wallet_address is the deposit wallet that received the transfer; it is
+        part of the inbox key, so it must match what the webhooks report.
+        """
         try:
-            from database_manager import DatabaseManager
-            db = DatabaseManager()
+            from payment_credit_worker import get_credit_worker
 
-            with db.get_connection() as conn:
-                # Mevcut bakiyeyi al
-                cursor = conn.execute("SELECT fun_coins FROM users WHERE user_id = ?", (user_id,))
-                user_row = cursor.fetchone()
-
-                if not user_row:
-                    logger.error(f"User {user_id} not found in database")
-                    return False
-
-                old_balance = user_row[0]
-                new_balance = old_balance + fc_amount
-
-                # Bakiyeyi güncelle
-                conn.execute("""
-                    UPDATE users
-                    SET fun_coins = ?, last_active = CURRENT_TIMESTAMP
-                    WHERE user_id = ?
-                """, (new_balance, user_id))
-
-                # İşlem geçmişi kaydet
-                conn.execute("""
-                    INSERT INTO deposits
-                    (user_id, amount, status, transaction_id, timestamp, method)
-                    VALUES (?, ?, 'completed', ?, CURRENT_TIMESTAMP, 'SOL_AUTO_ENHANCED')
-                """, (user_id, fc_amount, transaction_signature))
-
-                # Aktivite kaydet
-                conn.execute("""
-                    INSERT INTO user_activity
-                    (user_id, activity_type, details, timestamp)
-                    VALUES (?, 'enhanced_auto_deposit', ?, CURRENT_TIMESTAMP)
-                """, (user_id, f"Enhanced auto deposit: {fc_amount} FC via {transaction_signature[:16]}..."))
-
-                conn.commit()
-
-                logger.info(f"✅ GAME CREDITS ADDED: User {user_id}")
-                logger.info(f"   Amount: {fc_amount} FC")
-                logger.info(f"   Balance: {old_balance} → {new_balance}")
-                logger.info(f"   TX: {transaction_signature}")
-
-                return True
+            credited = await get_credit_worker().credit_now('enhanced', [{
+                "signature": transaction_signature,
+                "to_address": wallet_address,
+                "amount": 0,
+                "user_id": user_id,
+                "fc_amount": fc_amount
+            }])
+
+            if not credited:
+                logger.warning(f"Transaction {transaction_signature} was already credited")
+                return False
+
+            logger.info(f"✅ GAME CREDITS ADDED: User {user_id}")
+            logger.info(f"   Amount: {fc_amount} FC")
+            logger.info(f"   Balance: {credited[0]['new_balance']}")
+            logger.info(f"   TX: {transaction_signature}")
+
+            return True
 
         except Exception as e:
             logger.error(f"Error adding game credits: {e}")
@@ -217,57 +198,24 @@ class EnhancedPaymentProcessor:
 
             logger.info(f"💰 Converted amount: {transaction_data.lamports} lamports = {sol_amount} SOL")
 
-            # 2. Eşleşen pending transaction bul
-            pending_tx = await self.find_matching_pending_transaction(
-                wallet_address=transaction_data.to_wallet,
-                sol_amount=sol_amount
-            )
-
-            if not pending_tx:
-                logger.warning("No matching pending transaction found")
-                return None
-
-            # 3. Gönderen wallet adresi ve miktar kontrolü
-            if not self.validate_transaction_amount(sol_amount, pending_tx['expected_amount']):
-                logger.error("Transaction amount validation failed")
-                return None
-
-            # 4. SOL'u FC'ye dönüştür
-            from solana_payment import get_solana_payment
-            solana_system = get_solana_payment()
-            current_rate = solana_system.get_sol_to_fc_rate()
-            fc_amount = int(sol_amount * current_rate)
-
-            if fc_amount <= 0:
-                logger.error("Invalid FC amount after conversion")
-                return None
-
-            logger.info(f"💱 Conversion: {sol_amount} SOL → {fc_amount} FC (rate: {current_rate})")
-
-            # 5. Pending transaction'ı onayla
-            from database_manager import DatabaseManager
-            db = DatabaseManager()
-
-            success = db.confirm_transaction(
-                transaction_id=pending_tx['id'],
-                transaction_signature=transaction_data.signature,
-                fc_amount=fc_amount
-            )
-
-            if not success:
-                logger.error("Failed to confirm transaction in database")
+            # 2-6. Eşleştirme, onay ve kredilendirme tek transaction'da (inbox üzerinden)
+            from payment_credit_worker import get_credit_worker
+            credited = await get_credit_worker().credit_now('enhanced', [{
+                "signature": transaction_data.signature,
+                "from_address": transaction_data.from_wallet,
+                "to_address": transaction_data.to_wallet,
+                "amount": sol_amount
+            }])
+
+            if not credited:
+                logger.warning("No matching pending transaction found (or already credited)")
                 return None
 
-            # 6. Oyun parası ekle
-            credits_added = await self.add_game_credits(
-                user_id=pending_tx['user_id'],
-                fc_amount=fc_amount,
-                transaction_signature=transaction_data.signature
-            )
+            credit = credited[0]
+            fc_amount = credit['fc_amount']
+            pending_tx = {'id': credit['pending_transaction_id'], 'user_id': credit['user_id']}
 
-            if not credits_added:
-                logger.error("Failed to add game credits")
-                return None
+            logger.info(f"💱 Conversion: {sol_amount} SOL → {fc_amount} FC")
 
             # 7. Telegram onay mesajı gönder
             await self.send_payment_confirmation(
@@ -306,8 +254,8 @@ class EnhancedPaymentProcessor:
     async def get_payment_statistics(self, user_id: Optional[int] = None, days: int = 30) -> Dict:
         """Ödeme istatistikleri al"""
         try:
-            from database_manager import DatabaseManager
-            db = DatabaseManager()
+            from database_manager import get_database_manager
+            db = get_database_manager()
 
             with db.get_connection() as conn:
                 # Total payments
@@ -3,20 +3,22 @@
 🎮 Casino Bot Oyun Motoru
 """
 
-import random
 import time
 
+from rng_service import BufferedRandom, get_rng
+
 class GameEngine:
     """Eğlence odaklı oyun motoru"""
+
+    def __init__(self, rng: BufferedRandom = None):
+        self.rng = rng or get_rng()
     
-    @staticmethod
-    def generate_game_id() -> str:
-        return f"GAME_{int(time.time())}_{random.randint(1000, 9999)}"
+    def generate_game_id(self) -> str:
+        return f"GAME_{int(time.time())}_{self.rng.randint(1000, 9999)}"
     
-    @staticmethod
-    def play_duel_coinflip(player1_choice: str, player2_choice: str) -> dict:
+    def play_duel_coinflip(self, player1_choice: str, player2_choice: str) -> dict:
         """İki oyuncu coin flip düellosu"""
-        result = random.choice(['heads', 'tails'])
+        result = self.rng.choice(['heads', 'tails'])
         
         p1_wins = (player1_choice == result)
         p2_wins = (player2_choice == result)
@@ -35,11 +37,10 @@ class GameEngine:
             'player2_correct': p2_wins
         }
     
-    @staticmethod
-    def play_duel_dice() -> dict:
+    def play_duel_dice(self) -> dict:
         """İki oyuncu zar savaşı"""
-        dice1 = random.randint(1, 6)
-        dice2 = random.randint(1, 6)
+        dice1 = self.rng.randint(1, 6)
+        dice2 = self.rng.randint(1, 6)
         
         if dice1 > dice2:
             winner = 1
@@ -54,8 +55,7 @@ class GameEngine:
             'winner': winner
         }
     
-    @staticmethod
-    def play_duel_dice_with_type(dice_type: str) -> dict:
+    def play_duel_dice_with_type(self, dice_type: str) -> dict:
         """Belirli zar türü ile düello"""
         # Dice type to emoji mapping
         dice_emojis = {
@@ -69,11 +69,11 @@ class GameEngine:
         
         # Get dice values (1-6 for all types except slot which is 1-64)
         if dice_type == 'slot_machine':
-            dice1 = random.randint(1, 64)
-            dice2 = random.randint(1, 64)
+            dice1 = self.rng.randint(1, 64)
+            dice2 = self.rng.randint(1, 64)
         else:
-            dice1 = random.randint(1, 6)
-            dice2 = random.randint(1, 6)
+            dice1 = self.rng.randint(1, 6)
+            dice2 = self.rng.randint(1, 6)
         
         if dice1 > dice2:
             winner = 1
@@ -109,10 +109,9 @@ class GameEngine:
             return base_xp * 2
         return base_xp
 
-    @staticmethod
-    def play_tournament_round(players: list, game_type: str) -> list:
+    def play_tournament_round(self, players: list, game_type: str) -> list:
         """Turnuva round simülasyonu"""
-        scores = {p: random.randint(1, 100) for p in players}
+        scores = {p: self.rng.randint(1, 100) for p in players}
         sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
         winners = [p[0] for p in sorted_scores[:len(players)//2]]
         return winners
\ No newline at end of file
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Game Registry
+Solo oyunların tek noktadan kaydı ve çalıştırılması
+
+Each game is registered once with its id, parameter schema, default
+parameters, bet limits and engine function. Solo handlers validate bets with
+`check_bet()` before a round is played. Handlers play any game through
+`get_game_registry().play(game_id, bet_amount, user_id, **params)` - one
+dict lookup instead of a per-handler if/elif ladder. Adding a game means
+adding one `register()` call below.
+
+Engine functions are registered unbound and run on the registry's engine,
+or on a fresh engine when `play()` gets an `rng` (seeded or provably-fair
+rounds). `outcome()` runs the game's outcome function instead and returns
+the compact record without rendering any text, for batch callers.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from config import SOLO_GAMES
+from rng_service import BufferedRandom
+from solo_games import SoloGameEngine
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class GameDefinition:
+    """One playable game"""
+    game_id: str
+    engine_function: Callable  # engine_function(engine, bet_amount, **params, user_id=...) -> result dict
+    param_schema: Dict[str, type] = field(default_factory=dict)  # name -> accepted type (None always allowed)
+    defaults: Dict[str, Any] = field(default_factory=dict)
+    min_bet: int = 1
+    max_bet: Optional[int] = None
+    name: str = ""
+    outcome_function: Optional[Callable] = None  # same signature, returns a solo_outcomes record
+
+    def resolve_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Defaults overlaid with params, checked against the schema"""
+        unknown = set(params) - set(self.param_schema)
+        if unknown:
+            raise ValueError(f"{self.game_id}: unknown parameters {', '.join(sorted(unknown))}")
+        resolved = {**self.defaults, **params}
+        for name, value in resolved.items():
+            expected = self.param_schema[name]
+            if value is not None and not isinstance(value, expected):
+                accepted = '/'.join(t.__name__ for t in expected) if isinstance(expected, tuple) else expected.__name__
+                raise ValueError(f"{self.game_id}: {name} must be {accepted}, got {type(value).__name__}")
+        return resolved
+
+    def check_bet(self, bet_amount: int) -> Optional[str]:
+        """Error message when the bet is outside this game's limits, else None"""
+        if bet_amount < self.min_bet:
+            return f"Minimum bahis: {self.min_bet:,} 🐻"
+        if self.max_bet is not None and bet_amount > self.max_bet:
+            return f"Maksimum bahis: {self.max_bet:,} 🐻"
+        return None
+
+    def play(self, engine: SoloGameEngine, bet_amount: int, user_id: int = None, **params) -> dict:
+        return self.engine_function(engine, bet_amount, **self.resolve_params(params), user_id=user_id)
+
+    def outcome(self, engine: SoloGameEngine, bet_amount: int, user_id: int = None, **params):
+        return self.outcome_function(engine, bet_amount, **self.resolve_params(params), user_id=user_id)
+
+class GameRegistry:
+    """game_id -> GameDefinition"""
+
+    def __init__(self, engine: SoloGameEngine = None):
+        self.engine = engine or SoloGameEngine()
+        self._games: Dict[str, GameDefinition] = {}
+
+    def register(self, game_id: str, engine_function: Callable, outcome_function: Callable,
+                 param_schema: Dict[str, type] = None, defaults: Dict[str, Any] = None) -> GameDefinition:
+        """Register a game; name and bet limits come from config.SOLO_GAMES"""
+        if game_id in self._games:
+            raise ValueError(f"Game already registered: {game_id}")
+        config = SOLO_GAMES.get(game_id, {})
+        definition = GameDefinition(
+            game_id=game_id,
+            engine_function=engine_function,
+            param_schema=param_schema or {},
+            defaults=defaults or {},
+            min_bet=config.get('min_bet', 1),
+            max_bet=config.get('max_bet'),
+            name=config.get('name', game_id.replace('_', ' ').title()),
+            outcome_function=outcome_function
+        )
+        definition.resolve_params({})  # defaults must satisfy the schema
+        self._games[game_id] = definition
+        return definition
+
+    def get(self, game_id: str) -> Optional[GameDefinition]:
+        return self._games.get(game_id)
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self._games
+
+    def game_ids(self) -> List[str]:
+        return list(self._games)
+
+    def check_bet(self, game_id: str, bet_amount: int) -> Optional[str]:
+        """The game's bet limit error for this bet, else None (also for unknown games)"""
+        definition = self._games.get(game_id)
+        return definition.check_bet(bet_amount) if definition else None
+
+    def _lookup(self, game_id: str, rng: Optional[BufferedRandom], lang: Optional[str] = None):
+        """(definition, engine) for a round, or (None, None) for an unknown game"""
+        definition = self._games.get(game_id)
+        if definition is None:
+            logger.warning(f"Unknown game type: {game_id}")
+            return None, None
+        if rng is None and lang is None:
+            return definition, self.engine
+        return definition, SoloGameEngine(rng if rng is not None else self.engine.rng,
+                                          lang or self.engine.lang)
+
+    def play(self, game_id: str, bet_amount: int, user_id: int = None, rng: BufferedRandom = None,
+             lang: str = None, **params) -> Optional[dict]:
+        """Play one round, drawing from `rng` when given and rendering in `lang`; None for an unknown game"""
+        definition, engine = self._lookup(game_id, rng, lang)
+        return definition.play(engine, bet_amount, user_id, **params) if definition else None
+
+    def outcome(self, game_id: str, bet_amount: int, user_id: int = None, rng: BufferedRandom = None,
+                **params):
+        """Outcome record of one round without rendering; None for an unknown game"""
+        definition, engine = self._lookup(game_id, rng)
+        return definition.outcome(engine, bet_amount, user_id, **params) if definition else None
+
+def _build_registry() -> GameRegistry:
+    registry = GameRegistry()
+    engine = SoloGameEngine
+
+    registry.register("solo_slots", engine.play_solo_slots, engine.slots_outcome)
+    registry.register("solo_roulette", engine.play_solo_roulette, engine.roulette_outcome,
+                      {"bet_type": str, "bet_value": str}, {"bet_type": "color", "bet_value": "red"})
+    registry.register("solo_blackjack", engine.play_solo_blackjack, engine.blackjack_outcome)
+    registry.register("solo_crash", engine.play_solo_crash, engine.crash_outcome,
+                      {"cashout_multiplier": (int, float)}, {"cashout_multiplier": 2.0})
+    registry.register("solo_mines", engine.play_solo_mines, engine.mines_outcome,
+                      {"mines_count": int, "picks": int}, {"mines_count": 3, "picks": 3})
+    registry.register("solo_baccarat", engine.play_solo_baccarat, engine.baccarat_outcome,
+                      {"bet_on": str}, {"bet_on": "player"})
+    registry.register("solo_keno", engine.play_solo_keno, engine.keno_outcome,
+                      {"numbers_chosen": list}, {"numbers_chosen": None})
+    registry.register("solo_dice", engine.play_solo_dice, engine.dice_outcome, {"target": int}, {"target": 4})
+    registry.register("rock_paper_scissors", engine.play_rock_paper_scissors, engine.rock_paper_scissors_outcome,
+                      {"player_choice": str}, {"player_choice": None})
+    registry.register("number_guess", engine.play_number_guess, engine.number_guess_outcome,
+                      {"player_guess": int}, {"player_guess": None})
+    registry.register("lucky_wheel", engine.play_lucky_wheel, engine.lucky_wheel_outcome)
+    return registry
+
+# Global instance
+_game_registry = None
+
+def get_game_registry() -> GameRegistry:
+    """Get global game registry instance"""
+    global _game_registry
+    if _game_registry is None:
+        _game_registry = _build_registry()
+    return _game_registry
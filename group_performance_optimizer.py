@@ -25,6 +25,141 @@ class GroupStats:
     response_time_avg: float
     load_factor: float
 
+MEMBER_STATUSES = ('member', 'administrator', 'creator')
+
+class GroupMembershipService:
+    """Cached group membership lookups with request coalescing
+
+    Results (positive and negative) are cached per (group, user) pair.
+    Concurrent checks for the same pair share one Bot API call, refreshes
+    run in parallel under a concurrency cap, and chat_member updates keep
+    the cache current without any API call.
+    """
+
+    def __init__(self, positive_ttl: float = 600, negative_ttl: float = 60,
+                 max_concurrency: int = 10, max_entries: int = 50000):
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._cache: Dict[tuple, tuple] = {}  # (group, user) -> (is_member, expires_at)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.hits = 0
+        self.misses = 0
+        self.api_calls = 0
+        self.api_errors = 0
+
+    def get_cached(self, group_id, user_id) -> Optional[bool]:
+        """Return the cached membership or None if unknown/expired"""
+        entry = self._cache.get((group_id, user_id))
+        if entry is None:
+            return None
+        if entry[1] < time.time():
+            del self._cache[(group_id, user_id)]
+            return None
+        return entry[0]
+
+    def _store(self, group_id, user_id, is_member: bool):
+        """Cache a membership result with the TTL for its polarity"""
+        if len(self._cache) >= self.max_entries:
+            self._purge_expired()
+        ttl = self.positive_ttl if is_member else self.negative_ttl
+        self._cache[(group_id, user_id)] = (is_member, time.time() + ttl)
+
+    def _purge_expired(self):
+        """Drop expired entries; fall back to clearing the oldest half if still full"""
+        now = time.time()
+        for key in [key for key, entry in self._cache.items() if entry[1] < now]:
+            del self._cache[key]
+        if len(self._cache) >= self.max_entries:
+            for key in list(self._cache)[:len(self._cache) // 2]:
+                del self._cache[key]
+
+    def invalidate(self, group_id, user_id=None):
+        """Forget one pair, or every cached user of a group"""
+        if user_id is not None:
+            self._cache.pop((group_id, user_id), None)
+            return
+        for key in [key for key in self._cache if key[0] == group_id]:
+            del self._cache[key]
+
+    def record_status(self, group_id, user_id, status: str):
+        """Update the cache from a chat_member event status"""
+        self._store(group_id, user_id, status in MEMBER_STATUSES)
+
+    async def is_member(self, bot, group_id, user_id, force_refresh: bool = False) -> bool:
+        """Check membership, hitting the Bot API only on a cache miss
+
+        force_refresh (e.g. the user pressed "I joined") skips the cache and
+        does not reuse a lookup already in flight, which may predate the join -
+        it waits for that one to finish and then asks the API again.
+        """
+        key = (group_id, user_id)
+        if not force_refresh:
+            cached = self.get_cached(group_id, user_id)
+            if cached is not None:
+                self.hits += 1
+                return cached
+
+        # Coalesce with an identical lookup already in flight
+        pending = self._inflight.get(key)
+        if pending is not None:
+            if not force_refresh:
+                self.hits += 1
+                return await asyncio.shield(pending)
+            await asyncio.shield(pending)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._fetch(bot, group_id, user_id)
+            future.set_result(result)
+            return result
+        except BaseException:
+            # Leader was cancelled - release waiters with the uncached error result
+            future.set_result(False)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def check_many(self, bot, group_id, user_ids: List[int]) -> Dict[int, bool]:
+        """Check many users of one group in parallel under the concurrency cap"""
+        unique_ids = list(dict.fromkeys(user_ids))
+        results = await asyncio.gather(
+            *(self.is_member(bot, group_id, user_id) for user_id in unique_ids),
+            return_exceptions=True
+        )
+        return {user_id: (result if isinstance(result, bool) else False)
+                for user_id, result in zip(unique_ids, results)}
+
+    async def _fetch(self, bot, group_id, user_id) -> bool:
+        """Single Bot API lookup; errors are reported as non-member but not cached"""
+        async with self._semaphore:
+            self.api_calls += 1
+            try:
+                member = await bot.get_chat_member(group_id, user_id)
+            except Exception as e:
+                self.api_errors += 1
+                logger.error(f"Error checking member {user_id} in group {group_id}: {e}")
+                return False
+        is_member = member.status in MEMBER_STATUSES
+        self._store(group_id, user_id, is_member)
+        return is_member
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache and API usage counters"""
+        lookups = self.hits + self.misses
+        return {
+            "cached_pairs": len(self._cache),
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "api_calls": self.api_calls,
+            "api_errors": self.api_errors,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
 class GroupPerformanceManager:
     """High-performance group management system"""
 
@@ -44,6 +179,9 @@ class GroupPerformanceManager:
         self.rate_limits: Dict[int, deque] = defaultdict(lambda: deque(maxlen=100))
         self.rate_limit_window = 60  # seconds
 
+        # Cached, coalesced membership checks
+        self.membership = GroupMembershipService()
+
         logger.info("Group Performance Manager initialized")
 
     async def get_cached_member_count(self, bot, group_id: int) -> int:
@@ -147,19 +285,18 @@ class GroupPerformanceManager:
         return None
 
     async def _process_batch(self, operation: str) -> List[Any]:
-        """Process a batch of operations"""
+        """Process a batch of operations concurrently"""
         batch = self.batch_operations[operation][:self.batch_size]
         self.batch_operations[operation] = self.batch_operations[operation][self.batch_size:]
 
-        results = []
-        for item in batch:
-            try:
-                # Process each item in the batch
-                result = await self._process_single_operation(operation, item)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error processing batch item {item}: {e}")
-                results.append(None)
+        results = await asyncio.gather(
+            *(self._process_single_operation(operation, item) for item in batch),
+            return_exceptions=True
+        )
+        for index, (item, result) in enumerate(zip(batch, results)):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing batch item {item}: {result}")
+                results[index] = None
 
         return results
 
@@ -171,12 +308,7 @@ class GroupPerformanceManager:
             user_id = data.get('user_id')
 
             if bot and group_id and user_id:
-                try:
-                    member = await bot.get_chat_member(group_id, user_id)
-                    return member.status in ['member', 'administrator', 'creator']
-                except Exception as e:
-                    logger.error(f"Error checking member {user_id} in group {group_id}: {e}")
-                    return False
+                return await self.membership.is_member(bot, group_id, user_id)
 
         return None
 
@@ -194,7 +326,8 @@ class GroupPerformanceManager:
             "batch_queue_sizes": {op: len(queue) for op, queue in self.batch_operations.items()},
             "rate_limited_users": len([q for q in self.rate_limits.values() if len(q) >= 10]),
             "uptime": current_time - self.last_cleanup,
-            "cache_hit_rate": self._calculate_cache_hit_rate()
+            "cache_hit_rate": self._calculate_cache_hit_rate(),
+            "membership": self.membership.get_stats()
         }
 
     def _calculate_cache_hit_rate(self) -> float:
@@ -247,23 +380,10 @@ class OptimizedGroupHandler:
             logger.error(f"Error in optimized group handler: {e}")
             return None
 
-    async def check_member_optimized(self, bot, group_id: int, user_id: int) -> bool:
-        """Optimized member check with caching and batching"""
+    async def check_member_optimized(self, bot, group_id: int, user_id: int, force_refresh: bool = False) -> bool:
+        """Optimized member check through the shared membership cache"""
         try:
-            # Use batch operation for member checks
-            result = await self.perf_manager.batch_operation("member_check", {
-                'bot': bot,
-                'group_id': group_id,
-                'user_id': user_id
-            })
-
-            if result is not None:
-                return result
-
-            # Fallback to direct check
-            member = await bot.get_chat_member(group_id, user_id)
-            return member.status in ['member', 'administrator', 'creator']
-
+            return await self.perf_manager.membership.is_member(bot, group_id, user_id, force_refresh)
         except Exception as e:
             logger.error(f"Optimized member check failed for {user_id} in {group_id}: {e}")
             return False
@@ -292,6 +412,10 @@ def group_performance_manager():
         _performance_manager = GroupPerformanceManager()
     return _performance_manager
 
+def group_membership_service():
+    """Get the shared membership service"""
+    return group_performance_manager().membership
+
 def optimized_group_handler():
     """Get the global optimized handler instance"""
     global _optimized_handler
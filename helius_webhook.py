@@ -7,11 +7,12 @@ Otomatik ödeme doğrulama sistemi
 import json
 import logging
 import asyncio
-import aiohttp
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 from dataclasses import dataclass
 
+from http_clients import get_http_client_registry
+
 logger = logging.getLogger(__name__)
 
 # Helius API Configuration
@@ -36,15 +37,14 @@ class HeliusWebhookManager:
     def __init__(self, api_key: str = HELIUS_API_KEY):
         self.api_key = api_key
         self.webhook_id = None
-        self.session = None
+        self.http = get_http_client_registry()
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # The shared HTTP pool is closed on shutdown
+        pass
 
     async def create_webhook(self, webhook_url: str, wallet_addresses: List[str]) -> Optional[str]:
         """Helius webhook oluştur"""
@@ -61,10 +61,8 @@ class HeliusWebhookManager:
                 "webhookType": "enhanced"
             }
 
-            if not self.session:
-                self.session = aiohttp.ClientSession()
-
-            async with self.session.post(
+            async with self.http.request(
+                "POST",
                 f"{HELIUS_WEBHOOK_URL}?api-key={self.api_key}",
                 headers=headers,
                 json=webhook_data
@@ -86,11 +84,8 @@ class HeliusWebhookManager:
     async def get_webhook_info(self, webhook_id: str) -> Optional[Dict]:
         """Webhook bilgilerini al"""
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
-
-            async with self.session.get(
-                f"{HELIUS_WEBHOOK_URL}/{webhook_id}?api-key={self.api_key}"
+            async with self.http.request(
+                "GET", f"{HELIUS_WEBHOOK_URL}/{webhook_id}?api-key={self.api_key}"
             ) as response:
                 if response.status == 200:
                     return await response.json()
@@ -105,11 +100,8 @@ class HeliusWebhookManager:
     async def delete_webhook(self, webhook_id: str) -> bool:
         """Webhook sil"""
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
-
-            async with self.session.delete(
-                f"{HELIUS_WEBHOOK_URL}/{webhook_id}?api-key={self.api_key}"
+            async with self.http.request(
+                "DELETE", f"{HELIUS_WEBHOOK_URL}/{webhook_id}?api-key={self.api_key}"
             ) as response:
                 if response.status == 200:
                     logger.info(f"Webhook deleted: {webhook_id}")
@@ -165,116 +157,46 @@ class HeliusPaymentMonitor:
         self.webhook_manager = webhook_manager
         self.pending_payments = {}  # signature -> user_data
 
-    async def add_pending_payment(self, user_id: int, expected_amount: float, wallet_address: str):
-        """Bekleyen ödeme ekle"""
-        payment_data = {
-            "user_id": user_id,
-            "expected_amount": expected_amount,
-            "wallet_address": wallet_address,
-            "timestamp": datetime.utcnow(),
-            "confirmed": False
-        }
-
-        # Store in database
-        from database_manager import DatabaseManager
-        db = DatabaseManager()
-        try:
-            db.cursor.execute("""
-                INSERT INTO pending_transactions
-                (user_id, expected_amount, wallet_address, timestamp, status)
-                VALUES (?, ?, ?, ?, 'pending')
-            """, (user_id, expected_amount, wallet_address, payment_data["timestamp"]))
-            db.conn.commit()
-            logger.info(f"Added pending payment for user {user_id}: {expected_amount} SOL")
-        except Exception as e:
-            logger.error(f"Error adding pending payment: {e}")
+    async def add_pending_payment(self, user_id: int, expected_amount: float, wallet_address: str,
+                                  notes: str = None) -> Optional[Dict]:
+        """Bekleyen ödeme ekle - benzersiz lamport etiketiyle
+
+        Returns the pending row's id, expected_lamports and tagged
+        expected_amount; the user must send exactly that amount. Asking again
+        for the same amount and wallet returns the user's open row.
+        """
+        from database_manager import get_database_manager
+        tagged = await asyncio.to_thread(
+            get_database_manager().create_tagged_pending_transaction,
+            user_id, expected_amount, wallet_address, notes
+        )
+        if tagged:
+            logger.info(f"Added pending payment for user {user_id}: {tagged['expected_amount']:.9f} SOL")
+        return tagged
 
     async def process_webhook_payment(self, transaction_data: TransactionData) -> Optional[Dict]:
-        """Webhook'tan gelen ödemeyi işle - Otomatik oyun parası verme sistemi"""
-        try:
-            from database_manager import DatabaseManager
-            db = DatabaseManager()
-
-            # Bekleyen işlemi bul
-            pending_transaction = db.get_pending_transaction_by_criteria(
-                wallet_address=transaction_data.to_address,
-                amount=transaction_data.amount,
-                tolerance=0.001
-            )
-
-            if not pending_transaction:
-                logger.warning(f"No matching pending transaction found for {transaction_data.signature}")
-                return None
-
-            transaction_id = pending_transaction[0]
-            user_id = pending_transaction[1]
-
-            # SOL -> FC dönüşüm hesabı
-            from solana_payment import get_solana_payment
-            solana_system = get_solana_payment()
-            current_rate = solana_system.get_sol_to_fc_rate()
-            fc_amount = int(transaction_data.amount * current_rate)
-
-            # İşlemi onayla
-            success = db.confirm_transaction(
-                transaction_id=transaction_id,
-                transaction_signature=transaction_data.signature,
-                fc_amount=fc_amount
-            )
+        """Webhook'tan gelen ödemeyi işle - Otomatik oyun parası verme sistemi
 
-            if not success:
-                logger.error(f"Failed to confirm transaction {transaction_id}")
+        The transfer goes through the payment inbox like webhook batches do,
+        so a replayed signature is never credited twice.
+        """
+        try:
+            from payment_credit_worker import get_credit_worker
+            credited = await get_credit_worker().credit_now('helius', [{
+                "signature": transaction_data.signature,
+                "from_address": transaction_data.from_address,
+                "to_address": transaction_data.to_address,
+                "amount": transaction_data.amount
+            }])
+            if not credited:
+                logger.warning(f"No creditable pending transaction for {transaction_data.signature} (unmatched or already processed)")
                 return None
 
-            # Kullanıcı bakiyesini güncelle - OTOMATIK OYUN PARASI VERME
-            with db.get_connection() as conn:
-                # Mevcut bakiyeyi kontrol et
-                cursor = conn.execute("SELECT fun_coins FROM users WHERE user_id = ?", (user_id,))
-                user_row = cursor.fetchone()
-
-                if user_row:
-                    old_balance = user_row[0]
-                    new_balance = old_balance + fc_amount
-
-                    # Bakiyeyi güncelle
-                    conn.execute("""
-                        UPDATE users
-                        SET fun_coins = ?, last_active = CURRENT_TIMESTAMP
-                        WHERE user_id = ?
-                    """, (new_balance, user_id))
-
-                    # İşlem geçmişi kaydet
-                    conn.execute("""
-                        INSERT INTO deposits
-                        (user_id, amount, status, transaction_id, timestamp, method)
-                        VALUES (?, ?, 'completed', ?, CURRENT_TIMESTAMP, 'SOL_AUTO')
-                    """, (user_id, fc_amount, transaction_data.signature))
-
-                    # Aktivite kaydet
-                    conn.execute("""
-                        INSERT INTO user_activity
-                        (user_id, activity_type, details, timestamp)
-                        VALUES (?, 'auto_deposit', ?, CURRENT_TIMESTAMP)
-                    """, (user_id, f"Automatic SOL deposit: {transaction_data.amount} SOL -> {fc_amount} FC"))
-
-                    conn.commit()
-
-                    logger.info(f"✅ AUTOMATIC PAYMENT PROCESSED: User {user_id} received {fc_amount} FC")
-                    logger.info(f"   SOL Amount: {transaction_data.amount}")
-                    logger.info(f"   TX: {transaction_data.signature}")
-                    logger.info(f"   Balance: {old_balance} -> {new_balance}")
-
-                    return {
-                        "user_id": user_id,
-                        "sol_amount": transaction_data.amount,
-                        "fc_amount": fc_amount,
-                        "transaction_signature": transaction_data.signature,
-                        "old_balance": old_balance,
-                        "new_balance": new_balance
-                    }
-                else:
-                    logger.error(f"User {user_id} not found in database")
-                    return None
+            result = credited[0]
+            result["old_balance"] = result["new_balance"] - result["fc_amount"]
+            logger.info(f"✅ AUTOMATIC PAYMENT PROCESSED: User {result['user_id']} received {result['fc_amount']} FC")
+            logger.info(f"   TX: {transaction_data.signature}")
+            return result
 
         except Exception as e:
             logger.error(f"Error processing webhook payment: {e}")
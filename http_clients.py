@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Clients
+Tüm dış HTTP istemcileri için süreç genelinde tek bağlantı havuzu
+
+One aiohttp session per event loop serves CryptoBot, Helius and raw Solana
+JSON-RPC traffic. Its connector keeps connections alive per host and caches
+DNS lookups. Every request goes through `request()`, which applies the host's
+timeout and concurrency cap from HTTP_CLIENT_CONFIG and records per-host
+metrics. `close_http_clients()` closes the pool on shutdown.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from config import HTTP_CLIENT_CONFIG
+
+logger = logging.getLogger(__name__)
+
+class HTTPClientRegistry:
+    """Process-wide pooled aiohttp session with per-host limits"""
+
+    def __init__(self, config: Dict[str, Any] = None):
+        self.config = config or HTTP_CLIENT_CONFIG
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._limits: Dict[str, asyncio.Semaphore] = {}  # host -> concurrency cap
+        self._timeouts: Dict[str, aiohttp.ClientTimeout] = {}
+        self.host_stats: Dict[str, Dict[str, Any]] = {}
+
+    def _host_settings(self, host: str) -> Dict[str, Any]:
+        return {**self.config["default"], **self.config.get("hosts", {}).get(host, {})}
+
+    def session(self) -> aiohttp.ClientSession:
+        """The shared session, created on first use in the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.config["pool_size"],
+                limit_per_host=self.config["pool_size_per_host"],
+                ttl_dns_cache=self.config["dns_cache_ttl"],
+                keepalive_timeout=self.config["keepalive_timeout"]
+            )
+            default = self.config["default"]
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=default["timeout"], connect=default["connect_timeout"])
+            )
+            self._loop = loop
+            # Semaphores belong to the loop that used them first
+            self._limits.clear()
+        return self._session
+
+    def _limit(self, host: str) -> asyncio.Semaphore:
+        if host not in self._limits:
+            self._limits[host] = asyncio.Semaphore(self._host_settings(host)["max_concurrency"])
+        return self._limits[host]
+
+    def _timeout(self, host: str) -> aiohttp.ClientTimeout:
+        if host not in self._timeouts:
+            settings = self._host_settings(host)
+            self._timeouts[host] = aiohttp.ClientTimeout(
+                total=settings["timeout"], connect=settings["connect_timeout"]
+            )
+        return self._timeouts[host]
+
+    def _stats(self, host: str) -> Dict[str, Any]:
+        if host not in self.host_stats:
+            self.host_stats[host] = {
+                "requests": 0, "errors": 0, "in_flight": 0, "waiting": 0,
+                "total_latency": 0.0, "status_codes": {}
+            }
+        return self.host_stats[host]
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, **kwargs):
+        """`async with registry.request("GET", url) as response:` within the host's limits
+
+        A `timeout` keyword overrides the host's configured timeout.
+        """
+        host = urlsplit(url).hostname or ""
+        stats = self._stats(host)
+        kwargs.setdefault("timeout", self._timeout(host))
+        session = self.session()
+
+        limit = self._limit(host)
+        stats["waiting"] += 1
+        try:
+            await limit.acquire()
+        finally:
+            stats["waiting"] -= 1
+
+        stats["in_flight"] += 1
+        stats["requests"] += 1
+        started = time.monotonic()
+        try:
+            async with session.request(method, url, **kwargs) as response:
+                codes = stats["status_codes"]
+                codes[response.status] = codes.get(response.status, 0) + 1
+                yield response
+        except Exception:
+            stats["errors"] += 1
+            raise
+        finally:
+            stats["in_flight"] -= 1
+            stats["total_latency"] += time.monotonic() - started
+            limit.release()
+
+    async def close(self):
+        """Close the pool - call once on shutdown"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+        self._limits.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool and per-host metrics"""
+        connector = self._session.connector if self._session and not self._session.closed else None
+        hosts = {}
+        for host, stats in self.host_stats.items():
+            hosts[host] = {
+                **stats,
+                "avg_latency": stats["total_latency"] / stats["requests"] if stats["requests"] else 0.0,
+                "max_concurrency": self._host_settings(host)["max_concurrency"]
+            }
+        return {
+            "open": connector is not None,
+            "pool_size": self.config["pool_size"],
+            "pool_size_per_host": self.config["pool_size_per_host"],
+            "in_flight": sum(stats["in_flight"] for stats in self.host_stats.values()),
+            "idle_connections": sum(len(idle) for idle in getattr(connector, "_conns", {}).values()) if connector else 0,
+            "hosts": hosts
+        }
+
+# Global instance
+_http_client_registry = None
+
+def get_http_client_registry() -> HTTPClientRegistry:
+    """Get global HTTP client registry instance"""
+    global _http_client_registry
+    if _http_client_registry is None:
+        _http_client_registry = HTTPClientRegistry()
+    return _http_client_registry
+
+async def close_http_clients():
+    """Close the shared HTTP pool"""
+    if _http_client_registry is not None:
+        await _http_client_registry.close()
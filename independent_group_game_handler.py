@@ -220,80 +220,115 @@ async def handle_independent_group_game(query, user, casino_bot, game_type: str,
         independent_game_manager.end_user_game(user['user_id'])
         raise
 
+# game_type -> (display name, intro animation text, animation seconds)
+INDEPENDENT_GAME_INTROS = {
+    "solo_slots": (
+        "🎰 Slot Makinesi",
+        "🎰 **SLOT MAKİNESİ** 🎰\n\n"
+        "💰 Bahis: {bet:,} 🐻\n\n"
+        "🎰 Makaralar döndürülüyor...\n"
+        "🔄 ▓▓▓ ▓▓▓ ▓▓▓ 🔄\n\n"
+        "⏳ Lütfen bekleyin...",
+        4.5
+    ),
+    "solo_roulette": (
+        "🎡 Rulet",
+        "🎡 **RULET** 🎡\n\n"
+        "💰 Bahis: {bet:,} 🐻\n"
+        "🔴 Renk: Kırmızı\n\n"
+        "🎡 Çark döndürülüyor...\n"
+        "⚪ ⚫ 🔴 ⚫ ⚪ 🔴 ⚫\n\n"
+        "⏳ Top durmak üzere...",
+        5.0
+    ),
+    "solo_blackjack": (
+        "🃏 Blackjack",
+        "🃏 **BLACKJACK** 🃏\n\n"
+        "💰 Bahis: {bet:,} 🐻\n\n"
+        "🃏 Kartlar dağıtılıyor...\n"
+        "📚 [?] [?] | [?] [?]\n\n"
+        "⏳ Krupye oynuyor...",
+        4.2
+    ),
+    "solo_crash": (
+        "🚀 Crash",
+        "🚀 **CRASH** 🚀\n\n"
+        "💰 Bahis: {bet:,} 🐻\n"
+        "🎯 Hedef Çarpan: x2.00\n\n"
+        "🚀 Roket fırlatılıyor...\n"
+        "📈 1.00x... 1.50x... 1.75x...\n\n"
+        "⚠️ Ne zaman patlar?",
+        4.8
+    ),
+    "solo_baccarat": (
+        "🃏 Baccarat",
+        "🃏 **BACCARAT** 🃏\n\n"
+        "💰 Bahis: {bet:,} 🐻\n"
+        "👤 Bahis: Player\n\n"
+        "🃏 Kartlar dağıtılıyor...\n"
+        "👤 [?] [?] vs 🏦 [?] [?]\n\n"
+        "⏳ Kim 9'a yakın?",
+        4.0
+    ),
+    "solo_mines": (
+        "⛏️ Mines",
+        "⛏️ **MINES** ⛏️\n\n"
+        "💰 Bahis: {bet:,} 🐻\n"
+        "💣 Mayın Sayısı: 3\n\n"
+        "⛏️ Alan tarıyor...\n"
+        "🟩 🟩 🟩\n🟩 ❓ 🟩\n🟩 🟩 🟩\n\n"
+        "⚠️ Mayına çarpmadan kaç tane?",
+        4.5
+    ),
+    "solo_keno": (
+        "🎯 Keno",
+        "🎯 **KENO** 🎯\n\n"
+        "💰 Bahis: {bet:,} 🐻\n\n"
+        "🎯 Sayılar seçiliyor...\n"
+        "🔢 [?] [?] [?] [?] [?]\n\n"
+        "⏳ Çekiliş yapılıyor...",
+        4.3
+    ),
+    "rock_paper_scissors": (
+        "✂️ Taş-Kağıt-Makas",
+        "✂️ **TAŞ-KAĞIT-MAKAS** ✂️\n\n"
+        "💰 Bahis: {bet:,} 🐻\n\n"
+        "✂️ Seçim yapılıyor...\n"
+        "🪨 📄 ✂️\n\n"
+        "⏳ Rakiple karşılaşıyor...",
+        3.8
+    ),
+    "number_guess": (
+        "🔢 Sayı Tahmin",
+        "🔢 **SAYI TAHMİN** 🔢\n\n"
+        "💰 Bahis: {bet:,} 🐻\n\n"
+        "🔢 Sayı tahmin ediliyor...\n"
+        "❓ (1-100 arası)\n\n"
+        "⏳ Şansına güven!",
+        3.5
+    ),
+    "lucky_wheel": (
+        "🎪 Şans Çarkı",
+        "🎪 **ŞANS ÇARKI** 🎪\n\n"
+        "💰 Bahis: {bet:,} 🐻\n\n"
+        "🎪 Çark döndürülüyor...\n"
+        "🔄 💰 🎁 💎 🍀 💰 🎁 💎 🔄\n\n"
+        "⏳ Çark yavaşlıyor...",
+        5.2
+    )
+}
+
 async def play_independent_game(query, user, casino_bot, game_type: str, bet_amount: int) -> Optional[dict]:
     """Bağımsız oyunu oyna"""
     try:
-        # Solo game engine'i al
-        from solo_games import SoloGameEngine
-        if not hasattr(casino_bot, 'solo_engine'):
-            casino_bot.solo_engine = SoloGameEngine()
-        
-        engine = casino_bot.solo_engine
+        from game_registry import get_game_registry
+        registry = get_game_registry()
         
         # Oyun türüne göre oyna
         result = None
         game_display_name = ""
         
-        if game_type == "solo_slots":
-            # Slots animasyonu
-            await safe_game_edit(query, 
-                "🎰 **SLOT MAKİNESİ** 🎰\n\n"
-                f"💰 Bahis: {bet_amount:,} 🐻\n\n"
-                "🎰 Makaralar döndürülüyor...\n"
-                "🔄 ▓▓▓ ▓▓▓ ▓▓▓ 🔄\n\n"
-                "⏳ Lütfen bekleyin...",
-                parse_mode='Markdown'
-            )
-            await asyncio.sleep(4.5)
-
-            result = engine.play_solo_slots(bet_amount)
-            game_display_name = "🎰 Slot Makinesi"
-            
-        elif game_type == "solo_roulette":
-            await safe_game_edit(query, 
-                "🎡 **RULET** 🎡\n\n"
-                f"💰 Bahis: {bet_amount:,} 🐻\n"
-                f"🔴 Renk: Kırmızı\n\n"
-                "🎡 Çark döndürülüyor...\n"
-                "⚪ ⚫ 🔴 ⚫ ⚪ 🔴 ⚫\n\n"
-                "⏳ Top durmak üzere...",
-                parse_mode='Markdown'
-            )
-            await asyncio.sleep(5.0)
-
-            result = engine.play_solo_roulette(bet_amount, "color", "red")
-            game_display_name = "🎡 Rulet"
-            
-        elif game_type == "solo_blackjack":
-            await safe_game_edit(query, 
-                "🃏 **BLACKJACK** 🃏\n\n"
-                f"💰 Bahis: {bet_amount:,} 🐻\n\n"
-                "🃏 Kartlar dağıtılıyor...\n"
-                "📚 [?] [?] | [?] [?]\n\n"
-                "⏳ Krupye oynuyor...",
-                parse_mode='Markdown'
-            )
-            await asyncio.sleep(4.2)
-
-            result = engine.play_solo_blackjack(bet_amount)
-            game_display_name = "🃏 Blackjack"
-            
-        elif game_type == "solo_crash":
-            await safe_game_edit(query, 
-                "🚀 **CRASH** 🚀\n\n"
-                f"💰 Bahis: {bet_amount:,} 🐻\n"
-                f"🎯 Hedef Çarpan: x2.00\n\n"
-                "🚀 Roket fırlatılıyor...\n"
-                "📈 1.00x... 1.50x... 1.75x...\n\n"
-                "⚠️ Ne zaman patlar?",
-                parse_mode='Markdown'
-            )
-            await asyncio.sleep(4.8)
-
-            result = engine.play_solo_crash(bet_amount, 2.0)
-            game_display_name = "🚀 Crash"
-            
-        elif game_type == "solo_dice" or game_type.startswith("solo_dice_"):
+        if game_type == "solo_dice" or game_type.startswith("solo_dice_"):
             # Determine dice type
             if "_" in game_type and len(game_type.split("_")) > 2:
                 dice_subtype = game_type.split("_")[-1]  # e.g., "classic" from "solo_dice_classic"
@@ -396,91 +431,17 @@ async def play_independent_game(query, user, casino_bot, game_type: str, bet_amo
             
             game_display_name = dice_name
             
-        elif game_type == "solo_baccarat":
-            await safe_game_edit(query, 
-                "🃏 **BACCARAT** 🃏\n\n"
-                f"💰 Bahis: {bet_amount:,} 🐻\n"
-                f"👤 Bahis: Player\n\n"
-                "🃏 Kartlar dağıtılıyor...\n"
-                "👤 [?] [?] vs 🏦 [?] [?]\n\n"
-                "⏳ Kim 9'a yakın?",
-                parse_mode='Markdown'
-            )
-            await asyncio.sleep(4.0)
-            
-            result = engine.play_solo_baccarat(bet_amount, "player")
-            game_display_name = "🃏 Baccarat"
-            
-        elif game_type == "solo_mines":
-            await safe_game_edit(query, 
-                "⛏️ **MINES** ⛏️\n\n"
-                f"💰 Bahis: {bet_amount:,} 🐻\n"
-                f"💣 Mayın Sayısı: 3\n\n"
-                "⛏️ Alan tarıyor...\n"
-                "🟩 🟩 🟩\n🟩 ❓ 🟩\n🟩 🟩 🟩\n\n"
-                "⚠️ Mayına çarpmadan kaç tane?",
-                parse_mode='Markdown'
-            )
-            await asyncio.sleep(4.5)
-            
-            result = engine.play_solo_mines(bet_amount, 3, 3)
-            game_display_name = "⛏️ Mines"
-            
-        elif game_type == "solo_keno":
-            await safe_game_edit(query, 
-                "🎯 **KENO** 🎯\n\n"
-                f"💰 Bahis: {bet_amount:,} 🐻\n\n"
-                "🎯 Sayılar seçiliyor...\n"
-                "🔢 [?] [?] [?] [?] [?]\n\n"
-                "⏳ Çekiliş yapılıyor...",
-                parse_mode='Markdown'
-            )
-            await asyncio.sleep(4.3)
-            
-            result = engine.play_solo_keno(bet_amount, None)
-            game_display_name = "🎯 Keno"
-            
-        elif game_type == "rock_paper_scissors":
-            await safe_game_edit(query, 
-                "✂️ **TAŞ-KAĞIT-MAKAS** ✂️\n\n"
-                f"💰 Bahis: {bet_amount:,} 🐻\n\n"
-                "✂️ Seçim yapılıyor...\n"
-                "🪨 📄 ✂️\n\n"
-                "⏳ Rakiple karşılaşıyor...",
-                parse_mode='Markdown'
-            )
-            await asyncio.sleep(3.8)
-            
-            result = engine.play_rock_paper_scissors(bet_amount, None)
-            game_display_name = "✂️ Taş-Kağıt-Makas"
-            
-        elif game_type == "number_guess":
-            await safe_game_edit(query, 
-                "🔢 **SAYI TAHMİN** 🔢\n\n"
-                f"💰 Bahis: {bet_amount:,} 🐻\n\n"
-                "🔢 Sayı tahmin ediliyor...\n"
-                "❓ (1-100 arası)\n\n"
-                "⏳ Şansına güven!",
-                parse_mode='Markdown'
-            )
-            await asyncio.sleep(3.5)
-            
-            result = engine.play_number_guess(bet_amount, None)
-            game_display_name = "🔢 Sayı Tahmin"
-            
-        elif game_type == "lucky_wheel":
-            await safe_game_edit(query, 
-                "🎪 **ŞANS ÇARKI** 🎪\n\n"
-                f"💰 Bahis: {bet_amount:,} 🐻\n\n"
-                "🎪 Çark döndürülüyor...\n"
-                "🔄 💰 🎁 💎 🍀 💰 🎁 💎 🔄\n\n"
-                "⏳ Çark yavaşlıyor...",
-                parse_mode='Markdown'
+        elif game_type in registry:
+            # Oyuna özel animasyon, sonra motor üzerinden tek tur
+            game_display_name, intro, delay = INDEPENDENT_GAME_INTROS.get(
+                game_type, (registry.get(game_type).name, "🎮 **{name}**\n\n💰 Bahis: {bet:,} 🐻\n\n⏳ Oyun başlatılıyor...", 3.0)
             )
-            await asyncio.sleep(5.2)
+            await safe_game_edit(query, intro.format(bet=bet_amount, name=registry.get(game_type).name), parse_mode='Markdown')
+            await asyncio.sleep(delay)
             
-            result = engine.play_lucky_wheel(bet_amount)
-            game_display_name = "🎪 Şans Çarkı"
+            lang = (casino_bot.db.get_user_language(user['user_id'])
+                    if hasattr(casino_bot.db, 'get_user_language') else None)
+            result = registry.play(game_type, bet_amount, lang=lang)
             
         else:
             # Varsayılan oyun
@@ -3,6 +3,11 @@
 🌍 Multi-Language Support System
 """
 
+import logging
+import string
+
+logger = logging.getLogger(__name__)
+
 LANGUAGES = {
     "en": {
         "name": "English",
@@ -402,36 +407,99 @@ LANGUAGES = {
 
 DEFAULT_LANGUAGE = "en"
 
+_FORMATTER = string.Formatter()
+
+def _flatten(data: dict, prefix: str = "", out: dict = None) -> dict:
+    """Flatten a nested language dict into dotted key paths"""
+    if out is None:
+        out = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        out[path] = value
+        if isinstance(value, dict):
+            _flatten(value, f"{path}.", out)
+    return out
+
+def _template_fields(text) -> bool:
+    """Return True if text is a str.format template with replacement fields"""
+    if not isinstance(text, str):
+        return False
+    try:
+        return any(field is not None for _, field, _, _ in _FORMATTER.parse(text))
+    except ValueError:
+        # Malformed braces - never format, return as-is like the old path
+        return False
+
+def compile_catalog(languages: dict = None, default_language: str = DEFAULT_LANGUAGE):
+    """Compile nested LANGUAGES into flat per-language dicts with English fallbacks resolved
+
+    Returns (catalog, templates): catalog maps lang -> {key_path: text}, templates
+    is the set of key paths (per language) that contain format fields.
+    """
+    if languages is None:
+        languages = LANGUAGES
+    base = _flatten(languages[default_language])
+    catalog = {}
+    templates = {}
+    for lang_code, data in languages.items():
+        flat = dict(base)
+        flat.update(_flatten(data))
+        catalog[lang_code] = flat
+        templates[lang_code] = frozenset(key for key, text in flat.items() if _template_fields(text))
+    return catalog, templates
+
+def validate_catalog(languages: dict = None, default_language: str = DEFAULT_LANGUAGE) -> dict:
+    """Report leaf keys each language is missing compared to the default language"""
+    if languages is None:
+        languages = LANGUAGES
+    base = {key for key, value in _flatten(languages[default_language]).items() if not isinstance(value, dict)}
+    missing = {}
+    for lang_code, data in languages.items():
+        if lang_code == default_language:
+            continue
+        lang_keys = _flatten(data)
+        absent = sorted(key for key in base if key not in lang_keys)
+        if absent:
+            missing[lang_code] = absent
+            logger.warning(f"Language '{lang_code}' is missing {len(absent)} keys (falling back to {default_language}): {', '.join(absent[:10])}{' ...' if len(absent) > 10 else ''}")
+    return missing
+
+_CATALOG, _TEMPLATES = compile_catalog()
+
 def get_text(lang_code: str, key_path: str, default_text: str = None, **kwargs):
     """Get translated text for given language and key path"""
-    if lang_code not in LANGUAGES:
+    catalog = _CATALOG.get(lang_code)
+    if catalog is None:
         lang_code = DEFAULT_LANGUAGE
-    
-    lang_data = LANGUAGES[lang_code]
-    
-    # Navigate through nested keys (e.g., "main_menu.welcome")
-    keys = key_path.split('.')
-    text = lang_data
-    
-    for key in keys:
-        if isinstance(text, dict) and key in text:
-            text = text[key]
-        else:
-            # Try fallback to English if key not found
-            if lang_code != DEFAULT_LANGUAGE:
-                return get_text(DEFAULT_LANGUAGE, key_path, default_text, **kwargs)
-            # If still not found, use default_text or error message
-            return default_text if default_text else f"[Missing: {key_path}]"
-    
-    # Format with provided arguments
-    if isinstance(text, str) and kwargs:
+        catalog = _CATALOG[lang_code]
+
+    text = catalog.get(key_path)
+    if text is None:
+        return default_text if default_text else f"[Missing: {key_path}]"
+
+    # Format with provided arguments (only templates that actually have fields)
+    if kwargs and key_path in _TEMPLATES[lang_code]:
         try:
             return text.format(**kwargs)
-        except:
+        except (KeyError, IndexError, ValueError, AttributeError):
             return text
-    
+
     return text
 
+def get_texts(lang_code: str, keys, **kwargs) -> list:
+    """Get several translated texts at once
+
+    Each entry in keys is either a key path or a (key_path, default_text) tuple.
+    Shared kwargs are applied to every template that uses them.
+    """
+    texts = []
+    for entry in keys:
+        if isinstance(entry, tuple):
+            texts.append(get_text(lang_code, entry[0], entry[1], **kwargs))
+        else:
+            texts.append(get_text(lang_code, entry, **kwargs))
+    return texts
+
 def get_available_languages():
     """Get list of available languages"""
     return {code: {"name": data["name"], "flag": data["flag"]} 
@@ -0,0 +1,625 @@
+#!/usr/bin/env python3
+"""
+Load Generator
+Sahte Telegram Bot API sunucusuna karşı uçtan uca yük testi
+
+Runs the real bot (main.register_handlers, the production handler set) in
+polling mode against a local fake Bot API server and drives it with
+synthetic private-chat users and group players. Each synthetic user sends
+an update, waits until the bot has finished handling it, thinks for a
+while and picks the next action from a weighted callback/command mix.
+
+The fake server answers getUpdates (long polling), sendMessage,
+editMessageText, sendDice, getChatMember and the other calls the handlers
+make. It adds configurable latency and returns 429 "retry after" errors
+when a chat or the whole bot goes over Telegram's send limits.
+
+Per action (game) the report gives throughput, p50/p95/p99 handler
+latency, queue wait (delivered by getUpdates -> handler start), first reply
+latency, Bot API calls per round by method and timeouts. Overall it adds DB
+statement timing: statements slower than --lock-wait-ms are counted as lock
+waits, and "database is locked" errors are counted separately.
+
+    python load_generator.py --users 100 --duration 60
+    python load_generator.py --users 20 --groups 5 --group-size 20 --api-latency-ms 80
+    python load_generator.py --users 200 --concurrent-updates 64 --json > load.json
+
+The bot works on a throw-away database, never fun_casino.db.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import math
+import random
+import sqlite3
+import sys
+import time
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+from engine_benchmark import IsolatedDatabase, percentile
+
+try:
+    from telegram import Update
+    from telegram.ext import Application, TypeHandler
+    from telegram.request import HTTPXRequest
+    TELEGRAM_AVAILABLE = True
+except ImportError:
+    TELEGRAM_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+FAKE_TOKEN = "123456789:LOADTESTTOKEN"
+BOT_USER = {"id": 123456789, "is_bot": True, "first_name": "Casino Bot", "username": "casino_load_bot"}
+
+# Action -> weight. Actions starting with "/" are sent as commands, the rest as callback data.
+PRIVATE_MIX = {
+    "main_menu": 12,
+    "solo_games": 10,
+    "solo_slots": 6,
+    "profile": 6,
+    "play_solo_slots_100": 18,
+    "play_solo_blackjack_100": 10,
+    "play_solo_roulette_100": 8,
+    "play_game_mines_100": 8,
+    "play_new_game_lucky_wheel_100": 6,
+}
+GROUP_MIX = {
+    "/classicdice": 25,
+    "/basketball": 10,
+    "/football": 10,
+    "/bowling": 10,
+    "/diceslots": 10,
+    "games": 15,
+    "main_menu": 10,
+    "play_solo_slots_100": 10,
+}
+
+SEND_PREFIXES = ("send", "edit", "copy", "forward")
+DICE_FACES = {"🎰": 64, "🏀": 5, "⚽": 5}
+
+def _parse_mix(text: Optional[str], default: Dict[str, int]) -> Dict[str, int]:
+    """'main_menu=10,/classicdice=5' -> {action: weight}"""
+    if not text:
+        return dict(default)
+    mix = {}
+    for item in text.split(","):
+        action, _, weight = item.partition("=")
+        mix[action.strip()] = int(weight or 1)
+    return mix
+
+def _parse_limit(text: str) -> Optional[Tuple[int, float]]:
+    """'20/60' -> (20 calls, 60 seconds); 'off' -> None"""
+    if text == "off":
+        return None
+    calls, _, period = text.partition("/")
+    return int(calls), float(period or 1)
+
+# --- DB timing --------------------------------------------------------------
+
+class DbTimer:
+    """Times every statement run through sqlite3.connect while installed"""
+
+    def __init__(self, lock_wait: float):
+        self.lock_wait = lock_wait
+        self.durations: List[float] = []
+        self.locked_errors = 0
+        self._original_connect = None
+
+    def install(self):
+        timer = self
+
+        class TimedConnection(sqlite3.Connection):
+            def execute(self, *args):
+                started = time.perf_counter()
+                try:
+                    return super().execute(*args)
+                except sqlite3.OperationalError as e:
+                    if "locked" in str(e):
+                        timer.locked_errors += 1
+                    raise
+                finally:
+                    timer.durations.append(time.perf_counter() - started)
+
+            def commit(self):
+                started = time.perf_counter()
+                try:
+                    return super().commit()
+                finally:
+                    timer.durations.append(time.perf_counter() - started)
+
+        self._original_connect = sqlite3.connect
+
+        def connect(*args, **kwargs):
+            kwargs.setdefault("factory", TimedConnection)
+            return timer._original_connect(*args, **kwargs)
+
+        sqlite3.connect = connect
+
+    def uninstall(self):
+        if self._original_connect:
+            sqlite3.connect = self._original_connect
+            self._original_connect = None
+
+    def summary(self) -> Dict[str, Any]:
+        durations = sorted(self.durations)
+        return {
+            "statements": len(durations),
+            "p50_ms": percentile(durations, 0.50) * 1000,
+            "p95_ms": percentile(durations, 0.95) * 1000,
+            "p99_ms": percentile(durations, 0.99) * 1000,
+            "lock_waits": sum(1 for d in durations if d >= self.lock_wait),
+            "lock_wait_seconds": sum(d for d in durations if d >= self.lock_wait),
+            "locked_errors": self.locked_errors,
+        }
+
+# --- Fake Bot API -----------------------------------------------------------
+
+@dataclass
+class Round:
+    """One synthetic update from sending to the end of its handling"""
+    update_id: int
+    action: str
+    chat_id: int
+    message_id: int
+    callback_id: Optional[str]
+    created: float
+    delivered: Optional[float] = None
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    first_reply: Optional[float] = None
+    api_calls: Counter = field(default_factory=Counter)
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+class _RateWindow:
+    def __init__(self, calls: int, period: float):
+        self.calls = calls
+        self.period = period
+        self.times = deque()
+
+    def retry_after(self, now: float) -> int:
+        """0 when a call fits now (and records it), otherwise seconds to wait"""
+        while self.times and now - self.times[0] >= self.period:
+            self.times.popleft()
+        if len(self.times) >= self.calls:
+            return max(1, math.ceil(self.period - (now - self.times[0])))
+        self.times.append(now)
+        return 0
+
+class FakeBotAPI:
+    """In-process Bot API server answering the calls the casino handlers make"""
+
+    def __init__(self, latency_ms: float = 40, jitter: float = 0.5, global_limit=(30, 1.0),
+                 group_limit=(20, 60.0), private_limit=(60, 60.0), seed: Optional[int] = None):
+        self.latency = latency_ms / 1000
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.global_window = _RateWindow(*global_limit) if global_limit else None
+        self.group_limit = group_limit
+        self.private_limit = private_limit
+        self.chat_windows: Dict[int, _RateWindow] = {}
+
+        self.chats: Dict[int, Dict] = {}
+        self.users: Dict[int, Dict] = {}
+        self.group_members: Dict[int, List[int]] = defaultdict(list)
+        self._update_ids = itertools.count(1)
+        self._message_ids = itertools.count(1000)
+        self._pending: deque = deque()
+        self._new_updates = asyncio.Event()
+
+        self.rounds: Dict[int, Round] = {}
+        self._by_message: Dict[Tuple[int, int], Round] = {}
+        self._by_callback: Dict[str, Round] = {}
+        self._by_private_chat: Dict[int, Round] = {}
+
+        self.method_calls: Counter = Counter()
+        self.rate_limited: Counter = Counter()
+        self.unattributed: Counter = Counter()
+
+    # Population
+
+    def add_user(self, user_id: int, chat_id: int = None, chat_title: str = None):
+        user = {"id": user_id, "is_bot": False, "first_name": f"Load{user_id}",
+                "username": f"load{user_id}", "language_code": "en"}
+        self.users[user_id] = user
+        if chat_id is None or chat_id == user_id:
+            self.chats[user_id] = {"id": user_id, "type": "private", "first_name": user["first_name"],
+                                   "username": user["username"]}
+        else:
+            self.chats.setdefault(chat_id, {"id": chat_id, "type": "supergroup", "title": chat_title})
+            self.group_members[chat_id].append(user_id)
+        return user
+
+    # Updates
+
+    def push(self, action: str, user_id: int, chat_id: int) -> Round:
+        """Queue one update for getUpdates and start tracking it"""
+        update_id = next(self._update_ids)
+        message_id = next(self._message_ids)
+        now = time.perf_counter()
+        user, chat = self.users[user_id], self.chats[chat_id]
+        if action.startswith("/"):
+            update = {"update_id": update_id, "message": {
+                "message_id": message_id, "date": int(time.time()), "chat": chat, "from": user,
+                "text": action, "entities": [{"type": "bot_command", "offset": 0, "length": len(action)}],
+            }}
+            callback_id = None
+        else:
+            callback_id = str(update_id)
+            update = {"update_id": update_id, "callback_query": {
+                "id": callback_id, "from": user, "chat_instance": str(chat_id), "data": action,
+                "message": {"message_id": message_id, "date": int(time.time()), "chat": chat,
+                            "from": BOT_USER, "text": "🎮"},
+            }}
+        round_ = Round(update_id, action, chat_id, message_id, callback_id, now)
+        self.rounds[update_id] = round_
+        self._by_message[(chat_id, message_id)] = round_
+        if callback_id:
+            self._by_callback[callback_id] = round_
+        if chat["type"] == "private":
+            self._by_private_chat[chat_id] = round_
+        self._pending.append(update)
+        self._new_updates.set()
+        return round_
+
+    def forget(self, round_: Round):
+        self.rounds.pop(round_.update_id, None)
+        self._by_message.pop((round_.chat_id, round_.message_id), None)
+        if round_.callback_id:
+            self._by_callback.pop(round_.callback_id, None)
+        if self._by_private_chat.get(round_.chat_id) is round_:
+            del self._by_private_chat[round_.chat_id]
+
+    async def _get_updates(self, params: Dict) -> List[Dict]:
+        offset = int(params.get("offset") or 0)
+        while self._pending and self._pending[0]["update_id"] < offset:
+            self._pending.popleft()  # confirmed by the offset
+        if not self._pending:
+            self._new_updates.clear()
+            try:
+                await asyncio.wait_for(self._new_updates.wait(), float(params.get("timeout") or 0))
+            except asyncio.TimeoutError:
+                return []
+        batch = list(itertools.islice(self._pending, int(params.get("limit") or 100)))
+        now = time.perf_counter()
+        for update in batch:
+            round_ = self.rounds.get(update["update_id"])
+            if round_ and round_.delivered is None:
+                round_.delivered = now
+        return batch
+
+    # Bot API calls
+
+    def _round_for(self, params: Dict) -> Optional[Round]:
+        callback_id = params.get("callback_query_id")
+        if callback_id is not None:
+            return self._by_callback.get(str(callback_id))
+        chat_id = params.get("chat_id")
+        for message_id in (params.get("message_id"), params.get("reply_to_message_id")):
+            if message_id is not None and (chat_id, message_id) in self._by_message:
+                return self._by_message[(chat_id, message_id)]
+        return self._by_private_chat.get(chat_id)
+
+    def _retry_after(self, method: str, chat_id) -> int:
+        if not method.startswith(SEND_PREFIXES):
+            return 0
+        now = time.monotonic()
+        if chat_id in self.chats:
+            limit = self.private_limit if self.chats[chat_id]["type"] == "private" else self.group_limit
+            if limit:
+                window = self.chat_windows.setdefault(chat_id, _RateWindow(*limit))
+                wait = window.retry_after(now)
+                if wait:
+                    return wait
+        return self.global_window.retry_after(now) if self.global_window else 0
+
+    def _message(self, chat_id, message_id: int = None, **fields) -> Dict:
+        chat = self.chats.get(chat_id) or {"id": chat_id, "type": "private", "first_name": "Unknown"}
+        message = {"message_id": message_id or next(self._message_ids), "date": int(time.time()),
+                   "chat": chat, "from": BOT_USER}
+        message.update({key: value for key, value in fields.items() if value is not None})
+        return message
+
+    def _result(self, method: str, params: Dict) -> Any:
+        chat_id = params.get("chat_id")
+        if method == "getMe":
+            return BOT_USER
+        if method in ("sendMessage", "sendPhoto", "sendAnimation", "sendSticker", "sendDocument"):
+            return self._message(chat_id, text=params.get("text"), caption=params.get("caption"))
+        if method == "sendDice":
+            emoji = params.get("emoji") or "🎲"
+            return self._message(chat_id, dice={"emoji": emoji, "value": self.rng.randint(1, DICE_FACES.get(emoji, 6))})
+        if method in ("editMessageText", "editMessageCaption", "editMessageReplyMarkup"):
+            if params.get("inline_message_id"):
+                return True
+            return self._message(chat_id, params.get("message_id"), text=params.get("text"))
+        if method == "getChatMember":
+            user = self.users.get(params.get("user_id")) or {"id": params.get("user_id"), "is_bot": False,
+                                                               "first_name": "Unknown"}
+            return {"status": "member", "user": user}
+        if method == "getChatMemberCount":
+            return len(self.group_members.get(chat_id, [])) or 1
+        if method == "getChat":
+            return self.chats.get(chat_id) or {"id": chat_id, "type": "private"}
+        return True  # answerCallbackQuery, deleteMessage, deleteWebhook, setMyCommands, ...
+
+    async def handle(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        params = await _request_params(request)
+
+        if method == "getUpdates":
+            return web.json_response({"ok": True, "result": await self._get_updates(params)})
+
+        if self.latency:
+            await asyncio.sleep(self.latency * (1 + self.jitter * (2 * self.rng.random() - 1)))
+
+        self.method_calls[method] += 1
+        round_ = self._round_for(params)
+        if round_ is not None:
+            round_.api_calls[method] += 1
+            if round_.first_reply is None and method != "answerCallbackQuery":
+                round_.first_reply = time.perf_counter()
+        else:
+            self.unattributed[method] += 1
+
+        retry_after = self._retry_after(method, params.get("chat_id"))
+        if retry_after:
+            self.rate_limited[method] += 1
+            return web.json_response({"ok": False, "error_code": 429,
+                                      "description": f"Too Many Requests: retry after {retry_after}",
+                                      "parameters": {"retry_after": retry_after}}, status=429)
+        return web.json_response({"ok": True, "result": self._result(method, params)})
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving; returns the base_url to give ApplicationBuilder"""
+        app = web.Application()
+        app.router.add_route("*", "/bot{token}/{method}", self.handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        return f"http://{host}:{port}/bot"
+
+    async def stop(self):
+        self._new_updates.set()
+        await self._runner.cleanup()
+
+async def _request_params(request: web.Request) -> Dict[str, Any]:
+    """Bot API parameters from the query string, a JSON body or form data
+
+    python-telegram-bot sends form fields whose values are JSON encoded
+    (numbers, objects) or plain strings (text).
+    """
+    params: Dict[str, Any] = dict(request.query)
+    if request.can_read_body:
+        if request.content_type == "application/json":
+            params.update(await request.json())
+        else:
+            params.update((key, value) for key, value in (await request.post()).items() if isinstance(value, str))
+    for key, value in params.items():
+        if isinstance(value, str) and value[:1] in "-0123456789{[tfn":
+            try:
+                params[key] = json.loads(value)
+            except ValueError:
+                pass
+    return params
+
+# --- Load test --------------------------------------------------------------
+
+class LoadTest:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.api = FakeBotAPI(args.api_latency_ms, args.api_jitter, _parse_limit(args.global_limit),
+                              _parse_limit(args.group_limit), _parse_limit(args.private_limit), args.seed)
+        self.db_timer = DbTimer(args.lock_wait_ms / 1000)
+        self.completed: List[Round] = []
+        self.timeouts: Counter = Counter()
+        self.deadline = 0.0
+
+    async def _on_update_start(self, update, context):
+        round_ = self.api.rounds.get(update.update_id)
+        if round_:
+            round_.started = time.perf_counter()
+
+    async def _on_update_end(self, update, context):
+        round_ = self.api.rounds.get(update.update_id)
+        if round_:
+            round_.finished = time.perf_counter()
+            self.completed.append(round_)
+            self.api.forget(round_)
+            round_.done.set()
+
+    def _build_application(self, bot_main, base_url: str):
+        # Same request settings as main()
+        request = HTTPXRequest(connection_pool_size=512, read_timeout=30, write_timeout=30,
+                               connect_timeout=60, pool_timeout=30, http_version="1.1")
+        builder = Application.builder().token(FAKE_TOKEN).base_url(base_url).request(request)
+        if self.args.concurrent_updates:
+            builder = builder.concurrent_updates(self.args.concurrent_updates)
+        application = builder.build()
+        application.add_handler(TypeHandler(Update, self._on_update_start), group=-1000)
+        bot_main.register_handlers(application)
+        application.add_handler(TypeHandler(Update, self._on_update_end), group=1000)
+        return application
+
+    def _population(self) -> List[Tuple[int, int, Dict[str, int]]]:
+        """(user_id, chat_id, mix) per synthetic user"""
+        private_mix = _parse_mix(self.args.private_mix, PRIVATE_MIX)
+        group_mix = _parse_mix(self.args.group_mix, GROUP_MIX)
+        population = []
+        user_ids = itertools.count(700_000_001)
+        for _ in range(self.args.users):
+            user_id = next(user_ids)
+            self.api.add_user(user_id)
+            population.append((user_id, user_id, private_mix))
+        for group in range(self.args.groups):
+            chat_id = -1_000_000_000_001 - group
+            for _ in range(self.args.group_size):
+                user_id = next(user_ids)
+                self.api.add_user(user_id, chat_id, f"Load Group {group + 1}")
+                population.append((user_id, chat_id, group_mix))
+        return population
+
+    async def _user_loop(self, user_id: int, chat_id: int, mix: Dict[str, int], start_delay: float):
+        rng = random.Random(self.rng.random())
+        actions, weights = list(mix), list(mix.values())
+        await asyncio.sleep(start_delay)
+        while time.perf_counter() < self.deadline:
+            action = rng.choices(actions, weights)[0]
+            round_ = self.api.push(action, user_id, chat_id)
+            try:
+                await asyncio.wait_for(round_.done.wait(), self.args.timeout)
+            except asyncio.TimeoutError:
+                self.timeouts[action] += 1
+                self.api.forget(round_)
+            await asyncio.sleep(rng.expovariate(1000 / self.args.think_ms) if self.args.think_ms else 0)
+
+    async def run(self) -> Dict[str, Any]:
+        base_url = await self.api.start()
+        population = self._population()
+        self.db_timer.install()
+        try:
+            with IsolatedDatabase():
+                import main as bot_main
+
+                logging.getLogger().setLevel(self.args.log_level)
+                bot_main.bot = bot_main.EnhancedCasinoBot()
+                casino = bot_main.bot.casino
+                for user_id, _, _ in population:
+                    user = self.api.users[user_id]
+                    casino.get_user(user_id, user["username"])
+                with casino.db.get_connection() as conn:
+                    conn.execute('UPDATE users SET fun_coins = ?', (10 ** 12,))
+                    conn.commit()
+
+                application = self._build_application(bot_main, base_url)
+                await application.initialize()
+                await application.updater.start_polling(poll_interval=0.0, timeout=5, drop_pending_updates=True)
+                await application.start()
+                started = time.perf_counter()
+                self.deadline = started + self.args.duration
+                try:
+                    await asyncio.gather(*[
+                        self._user_loop(user_id, chat_id, mix, self.args.ramp_up * index / max(len(population), 1))
+                        for index, (user_id, chat_id, mix) in enumerate(population)
+                    ])
+                finally:
+                    elapsed = time.perf_counter() - started
+                    await application.updater.stop()
+                    await application.stop()
+                    await application.shutdown()
+        finally:
+            self.db_timer.uninstall()
+            await self.api.stop()
+        return self.report(elapsed, len(population))
+
+    def report(self, elapsed: float, population: int) -> Dict[str, Any]:
+        by_action: Dict[str, List[Round]] = defaultdict(list)
+        for round_ in self.completed:
+            by_action[round_.action].append(round_)
+
+        def latencies(rounds, start: str, end: str) -> List[float]:
+            return sorted(getattr(r, end) - getattr(r, start) for r in rounds
+                          if getattr(r, start) is not None and getattr(r, end) is not None)
+
+        def summary(rounds: List[Round]) -> Dict[str, Any]:
+            handler = latencies(rounds, "started", "finished")
+            queue = latencies(rounds, "delivered", "started")
+            reply = latencies(rounds, "delivered", "first_reply")
+            calls = Counter()
+            for round_ in rounds:
+                calls.update(round_.api_calls)
+            return {
+                "rounds": len(rounds),
+                "rounds_per_sec": len(rounds) / elapsed,
+                "handler_p50_ms": percentile(handler, 0.50) * 1000,
+                "handler_p95_ms": percentile(handler, 0.95) * 1000,
+                "handler_p99_ms": percentile(handler, 0.99) * 1000,
+                "queue_p95_ms": percentile(queue, 0.95) * 1000,
+                "first_reply_p95_ms": percentile(reply, 0.95) * 1000,
+                "api_calls_per_round": {method: count / len(rounds) for method, count in calls.most_common()},
+            }
+
+        actions = {action: dict(summary(rounds), timeouts=self.timeouts[action])
+                   for action, rounds in sorted(by_action.items())}
+        for action, count in self.timeouts.items():
+            actions.setdefault(action, {"rounds": 0, "timeouts": count})
+        return {
+            "config": {key: value for key, value in vars(self.args).items() if key != "json"},
+            "population": population,
+            "elapsed": elapsed,
+            "total": dict(summary(self.completed) if self.completed else {"rounds": 0},
+                          timeouts=sum(self.timeouts.values())),
+            "actions": actions,
+            "bot_api": {"calls": dict(self.api.method_calls.most_common()),
+                        "rate_limited": dict(self.api.rate_limited),
+                        "unattributed": dict(self.api.unattributed)},
+            "database": self.db_timer.summary(),
+        }
+
+def _print_report(report: Dict[str, Any]):
+    total, database = report["total"], report["database"]
+    print(f"\n📈 Load test - {report['population']} users for {report['elapsed']:.1f}s, "
+          f"{total['rounds']:,} updates ({total.get('rounds_per_sec', 0):,.1f}/s), "
+          f"{total['timeouts']} timeouts\n")
+    print(f"{'action':<32} {'n':>6} {'/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'queue95':>8} {'reply95':>8} {'API/rnd':>7} {'t/o':>4}")
+    for action, stats in report["actions"].items():
+        if not stats["rounds"]:
+            print(f"{action:<32} {0:>6} {'':>7} {'':>8} {'':>8} {'':>8} {'':>8} {'':>8} {'':>7} {stats['timeouts']:>4}")
+            continue
+        api_calls = sum(stats["api_calls_per_round"].values())
+        print(f"{action:<32} {stats['rounds']:>6} {stats['rounds_per_sec']:>7.1f} {stats['handler_p50_ms']:>8.1f} "
+              f"{stats['handler_p95_ms']:>8.1f} {stats['handler_p99_ms']:>8.1f} {stats['queue_p95_ms']:>8.1f} "
+              f"{stats['first_reply_p95_ms']:>8.1f} {api_calls:>7.1f} {stats['timeouts']:>4}")
+    print(f"\n🤖 Bot API calls: {report['bot_api']['calls']}")
+    if report["bot_api"]["rate_limited"]:
+        print(f"⛔ 429 responses: {report['bot_api']['rate_limited']}")
+    print(f"🗄️ DB: {database['statements']:,} statements, p95 {database['p95_ms']:.2f} ms, "
+          f"p99 {database['p99_ms']:.2f} ms, {database['lock_waits']} lock waits "
+          f"({database['lock_wait_seconds']:.2f}s), {database['locked_errors']} 'database is locked' errors")
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end load test against a fake Telegram Bot API")
+    parser.add_argument("--users", type=int, default=50, help="private-chat users")
+    parser.add_argument("--groups", type=int, default=0, help="group chats")
+    parser.add_argument("--group-size", type=int, default=20, help="players per group chat")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of load after start")
+    parser.add_argument("--ramp-up", type=float, default=5.0, help="seconds over which users join")
+    parser.add_argument("--think-ms", type=float, default=1500.0, help="mean pause between a user's actions")
+    parser.add_argument("--timeout", type=float, default=30.0, help="seconds a user waits for an update to finish")
+    parser.add_argument("--private-mix", default=None, help="action=weight,... (default: built-in mix)")
+    parser.add_argument("--group-mix", default=None, help="action=weight,... (default: built-in mix)")
+    parser.add_argument("--api-latency-ms", type=float, default=40.0, help="mean Bot API call latency")
+    parser.add_argument("--api-jitter", type=float, default=0.5, help="latency jitter as a fraction of the mean")
+    parser.add_argument("--global-limit", default="30/1", help="send calls per seconds for the bot, or 'off'")
+    parser.add_argument("--group-limit", default="20/60", help="send calls per seconds per group, or 'off'")
+    parser.add_argument("--private-limit", default="60/60", help="send calls per seconds per private chat, or 'off'")
+    parser.add_argument("--concurrent-updates", type=int, default=0,
+                        help="handle up to N updates at once (default 0: sequential, as in production)")
+    parser.add_argument("--lock-wait-ms", type=float, default=50.0, help="DB statements at least this slow count as lock waits")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    if not TELEGRAM_AVAILABLE:
+        print("❌ python-telegram-bot is required for the load test")
+        sys.exit(1)
+
+    report = asyncio.run(LoadTest(args).run())
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        _print_report(report)
+
+if __name__ == "__main__":
+    main()
@@ -114,6 +114,16 @@ def is_group_chat(update: Update) -> bool:
     chat_type = update.effective_chat.type
     return chat_type in ['group', 'supergroup']
 
+def get_user_lang(casino_bot, user_id: int) -> str:
+    """User's language for rendered game texts, DEFAULT_LANGUAGE if unknown"""
+    from languages import DEFAULT_LANGUAGE
+    if hasattr(casino_bot.db, 'get_user_language'):
+        try:
+            return casino_bot.db.get_user_language(user_id) or DEFAULT_LANGUAGE
+        except Exception:
+            pass
+    return DEFAULT_LANGUAGE
+
 class EnhancedCasinoBot:
     """Enhanced Casino Bot with CryptoBot payments and max bet limits"""
     
@@ -188,12 +198,6 @@ class EnhancedCasinoBot:
         
         # Auto payment processing settings
         self.auto_payment_enabled = True
-        self.payment_check_interval = 30  # seconds
-        self.last_payment_check = 0
-        
-        # Transaction cache for performance - with limits
-        self.pending_transactions = {}
-        self.max_pending_transactions = 500
         
         # Bot health monitoring
         self.bot_start_time = datetime.now()
@@ -253,8 +257,8 @@ class EnhancedCasinoBot:
         """Create inline keyboard for bot messages"""
         return self.casino.create_keyboard(buttons)
     
-    def validate_bet_amount(self, user_id: int, bet_amount: int, user_balance: int) -> dict:
-        """Enhanced bet validation with VIP-based limits and balance checks"""
+    def validate_bet_amount(self, user_id: int, bet_amount: int, user_balance: int, game_type: str = None) -> dict:
+        """Enhanced bet validation with VIP-based limits, game limits and balance checks"""
         
         # Basic validation
         if bet_amount <= 0:
@@ -263,6 +267,13 @@ class EnhancedCasinoBot:
                 'reason': "ERROR: Bet amount must be positive!"
             }
         
+        # Game limits from the registry (config.SOLO_GAMES)
+        if game_type:
+            from game_registry import get_game_registry
+            bet_error = get_game_registry().check_bet(game_type, bet_amount)
+            if bet_error:
+                return {'valid': False, 'reason': f"❌ {bet_error}"}
+        
         # Basic balance check
         if bet_amount > user_balance:
             return {
@@ -404,137 +415,98 @@ class EnhancedCasinoBot:
             logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
     
     async def process_pending_payments(self):
-        """Auto-process pending payments with error handling"""
-        if not self.auto_payment_enabled or not self.crypto_handler:
-            return
-            
-        # Rate limiting - only check every 30 seconds
-        current_time = time.time()
-        if current_time - self.last_payment_check < self.payment_check_interval:
+        """Check every pending CryptoBot deposit in one batched poll"""
+        if not self.auto_payment_enabled or not self.crypto_processor:
             return
         
-        self.last_payment_check = current_time
+        from cryptobot_payment import get_invoice_poller
+        poller = get_invoice_poller()
+        if not poller:
+            return
         
         try:
-            with self.casino.db.get_connection() as conn:
-                # Check pending deposits (only recent ones)
-                pending_deposits = conn.execute(
-                    '''SELECT * FROM deposits 
-                       WHERE status = "pending" 
-                       AND datetime(created_at, '+1 hour') > datetime('now')
-                       LIMIT 20'''
-                ).fetchall()
-                
-                logger.info(f"🔍 Checking {len(pending_deposits)} pending deposits")
-                
-                # Limit processing to prevent memory overload
-                if len(pending_deposits) > 100:
-                    pending_deposits = pending_deposits[:100]
-                    logger.warning("Too many pending deposits, processing first 100 only")
-                
-                for deposit in pending_deposits:
-                    # Memory check for pending transactions
-                    if len(self.pending_transactions) >= self.max_pending_transactions:
-                        # Remove oldest transactions
-                        old_keys = list(self.pending_transactions.keys())[:100]
-                        for key in old_keys:
-                            self.pending_transactions.pop(key, None)
-                    
-                    try:
-                        # Check payment status with CryptoBot
-                        invoices = self.crypto_handler.get_invoices(
-                            asset=deposit['currency'],
-                            status='paid'
-                        )
-                        
-                        if invoices.get('ok') and invoices.get('result'):
-                            for invoice in invoices['result']:
-                                if invoice['invoice_id'] == deposit['invoice_id']:
-                                    await self.credit_user_deposit(deposit)
-                                    logger.info(f"SUCCESS: Payment confirmed for user {deposit['user_id']}: {deposit['fun_coins']} 🐻")
-                                    break
-                    except Exception as e:
-                        logger.error(f"Error checking deposit {deposit['id']}: {e}")
-                        continue
-                
-                # Mark expired deposits
-                expired_count = conn.execute(
-                    '''UPDATE deposits SET status = 'expired' 
-                       WHERE status = 'pending' AND 
-                       datetime(created_at, '+1 hour') < datetime('now')'''
-                ).rowcount
-                
-                if expired_count > 0:
-                    logger.info(f"⏰ Marked {expired_count} deposits as expired")
-                    conn.commit()
-                
+            await poller.poll_once()
         except Exception as e:
             logger.error(f"Payment processing error: {e}")
     
     async def credit_user_deposit(self, deposit):
         """Credit user account after successful payment with bonuses"""
+        await self.credit_user_deposits([deposit])
+    
+    async def credit_user_deposits(self, deposits):
+        """Credit paid deposits with bonuses - one inbox transaction for the whole batch"""
+        if not deposits:
+            return
         try:
+            user_ids = sorted({deposit['user_id'] for deposit in deposits})
+            placeholders = ','.join('?' * len(user_ids))
             with self.casino.db.get_connection() as conn:
-                # Check if already processed
-                current_status = conn.execute(
-                    'SELECT status FROM deposits WHERE id = ?',
-                    (deposit['id'],)
-                ).fetchone()
-                
-                if current_status and current_status['status'] != 'pending':
-                    return  # Already processed
-                
-                # Mark deposit as paid
-                conn.execute(
-                    'UPDATE deposits SET status = "paid", paid_at = CURRENT_TIMESTAMP WHERE id = ?',
-                    (deposit['id'],)
-                )
-                
-                # Calculate bonuses
-                deposit_count = conn.execute(
-                    'SELECT COUNT(*) FROM deposits WHERE user_id = ? AND status = "paid"',
-                    (deposit['user_id'],)
-                ).fetchone()[0]
-                
-                is_first_deposit = deposit_count == 1
+                # Paid deposit counts decide the first deposit bonus
+                paid_counts = dict(conn.execute(
+                    f'''SELECT user_id, COUNT(*) FROM deposits
+                        WHERE status = 'paid' AND user_id IN ({placeholders})
+                        GROUP BY user_id''',
+                    user_ids
+                ).fetchall())
+            
+            is_weekend = datetime.now().weekday() >= 5
+            vip_levels = {user_id: self.get_user_vip_level(user_id) for user_id in user_ids}
+            
+            events, bonuses, first_deposits, seen_users = [], {}, set(), set()
+            for deposit in deposits:
+                user_id = deposit['user_id']
                 bonus_amount = 0
                 
-                # First deposit bonus
-                if is_first_deposit:
+                # First deposit bonus - only the user's first deposit in this batch
+                if not paid_counts.get(user_id) and user_id not in seen_users:
                     bonus_amount += int(deposit['fun_coins'] * PAYMENT_SETTINGS.get('first_deposit_bonus', 0.2))
+                    first_deposits.add(deposit['id'])
+                seen_users.add(user_id)
                 
                 # Weekend bonus
-                is_weekend = datetime.now().weekday() >= 5
                 if is_weekend:
-                    weekend_bonus = int(deposit['fun_coins'] * 0.1)  # 10% weekend bonus
-                    bonus_amount += weekend_bonus
+                    bonus_amount += int(deposit['fun_coins'] * 0.1)  # 10% weekend bonus
                 
                 # VIP bonus
-                vip_level = self.get_user_vip_level(deposit['user_id'])
-                if vip_level > 0:
-                    vip_bonus = int(deposit['fun_coins'] * (vip_level * 0.05))  # 5% per VIP level
-                    bonus_amount += vip_bonus
-                
-                total_credit = deposit['fun_coins'] + bonus_amount
-                
-                # Credit user account
-                conn.execute(
-                    'UPDATE users SET fun_coins = fun_coins + ? WHERE user_id = ?',
-                    (total_credit, deposit['user_id'])
-                )
+                if vip_levels[user_id] > 0:
+                    bonus_amount += int(deposit['fun_coins'] * (vip_levels[user_id] * 0.05))  # 5% per VIP level
                 
+                bonuses[deposit['id']] = bonus_amount
+                events.append({
+                    "invoice_id": deposit['invoice_id'],
+                    "amount": deposit['amount'],
+                    "user_id": user_id,
+                    "fc_amount": deposit['fun_coins'] + bonus_amount,
+                    "reference": deposit['id']
+                })
+            
+            # Credit through the payment inbox: the invoice id is the dedup key and the
+            # worker marks each deposit paid in the same transaction as the balance update
+            from payment_credit_worker import get_credit_worker
+            credited = await get_credit_worker().credit_now('cryptobot', events)
+            
+            # Deposits already processed by another poller or the webhook produce no credit
+            by_id = {deposit['id']: deposit for deposit in deposits}
+            credited_deposits = [by_id[int(item['reference'])] for item in credited if int(item['reference']) in by_id]
+            if not credited_deposits:
+                return
+            
+            with self.casino.db.get_connection() as conn:
                 # Update daily limits
                 today = datetime.now().date().isoformat()
-                conn.execute(
+                conn.executemany(
                     '''INSERT OR REPLACE INTO daily_limits 
                        (user_id, date, deposited_amount) VALUES 
                        (?, ?, COALESCE((SELECT deposited_amount FROM daily_limits 
                                        WHERE user_id = ? AND date = ?), 0) + ?)''',
-                    (deposit['user_id'], today, deposit['user_id'], today, deposit['fun_coins'])
+                    [(deposit['user_id'], today, deposit['user_id'], today, deposit['fun_coins'])
+                     for deposit in credited_deposits]
                 )
-                
+                conn.commit()
+            
+            for deposit in credited_deposits:
                 # Award achievements
-                if is_first_deposit:
+                if deposit['id'] in first_deposits:
                     self.casino.unlock_achievement(deposit['user_id'], "first_deposit")
                 
                 if deposit['fun_coins'] >= 50000:
@@ -543,12 +515,10 @@ class EnhancedCasinoBot:
                 if deposit['fun_coins'] >= 500000:
                     self.casino.unlock_achievement(deposit['user_id'], "whale")
                 
-                conn.commit()
-                
-                logger.info(f"🐻 Credited {total_credit} 🐻 to user {deposit['user_id']} (base: {deposit['fun_coins']}, bonus: {bonus_amount})")
+                logger.info(f"🐻 Credited {deposit['fun_coins'] + bonuses[deposit['id']]} 🐻 to user {deposit['user_id']} (base: {deposit['fun_coins']}, bonus: {bonuses[deposit['id']]})")
                 
         except Exception as e:
-            logger.error(f"Error crediting deposit: {e}")
+            logger.error(f"Error crediting deposits: {e}")
     
     def get_bet_suggestion(self, user_balance: int, vip_level: int) -> list:
         """Get suggested bet amounts based on user balance and VIP level"""
@@ -612,21 +582,21 @@ async def process_referral_bonus(casino, new_user_id, referral_code):
         return {'success': False, 'error': str(e)}
 
 # Bot handlers
+def required_group_identifier():
+    """Chat id or @username of the required group, None when no group is configured"""
+    if not REQUIRED_GROUP_USERNAME:
+        return None
+    # A specific group ID wins over the username
+    return REQUIRED_GROUP_ID or f"@{REQUIRED_GROUP_USERNAME}"
+
 async def check_group_membership(context_or_bot, user_id, chat_id=None):
     """Check if user is a member of the required group"""
     try:
-        # Use the configured group username
-        if not REQUIRED_GROUP_USERNAME:
+        group_identifier = required_group_identifier()
+        if group_identifier is None:
             # If no group is configured, allow access
             return True
         
-        # Try using group username first
-        group_identifier = f"@{REQUIRED_GROUP_USERNAME}"
-        
-        # If a specific group ID is configured, use that instead
-        if REQUIRED_GROUP_ID:
-            group_identifier = REQUIRED_GROUP_ID
-        
         # Get the bot from context or directly from the bot parameter
         bot_instance = None
         
@@ -648,10 +618,11 @@ async def check_group_membership(context_or_bot, user_id, chat_id=None):
             logger.error("Bot instance is None after extraction")
             return False
             
-        member = await bot_instance.get_chat_member(group_identifier, user_id)
-        is_member = member.status in ['member', 'administrator', 'creator']
+        # Cached lookup - concurrent checks for the same user share one API call
+        from group_performance_optimizer import group_membership_service
+        is_member = await group_membership_service().is_member(bot_instance, group_identifier, user_id)
         
-        logger.info(f"Group membership check for user {user_id}: {is_member} (status: {member.status})")
+        logger.debug(f"Group membership check for user {user_id}: {is_member}")
         return is_member
         
     except Exception as e:
@@ -742,6 +713,16 @@ async def handle_group_solo_game(query, user, casino, game_type, bet_amount, gam
             )
             return
         
+        # Game bet limits
+        from game_registry import get_game_registry
+        bet_error = get_game_registry().check_bet(game_type, bet_amount)
+        if bet_error:
+            await query.edit_message_text(
+                f"❌ {bet_error}",
+                reply_markup=casino.create_keyboard([[("🔙 Geri", f"/game")]])
+            )
+            return
+        
         # Deduct bet amount
         casino.db.execute(
             "UPDATE users SET fun_coins = fun_coins - ? WHERE user_id = ?",
@@ -749,37 +730,19 @@ async def handle_group_solo_game(query, user, casino, game_type, bet_amount, gam
         )
         casino.db.commit()
         
-        # Play the game using solo engine
-        from solo_games import SoloGameEngine
-        if not hasattr(casino, 'solo_engine'):
-            casino.solo_engine = SoloGameEngine()
-        
-        # Play game based on type
-        result = None
-        if game_type == "solo_slots":
-            result = casino.solo_engine.play_solo_slots(bet_amount, user['user_id'])
-        elif game_type == "solo_roulette":
-            result = casino.solo_engine.play_solo_roulette(bet_amount, "color", "red", user['user_id'])
-        elif game_type == "solo_blackjack":
-            result = casino.solo_engine.play_solo_blackjack(bet_amount, user['user_id'])
-        elif game_type == "solo_baccarat":
-            result = casino.solo_engine.play_solo_baccarat(bet_amount, "player", user['user_id'])
-        elif game_type == "solo_crash":
-            result = casino.solo_engine.play_solo_crash(bet_amount, 2.0, user['user_id'])
-        elif game_type == "solo_mines":
-            result = casino.solo_engine.play_solo_mines(bet_amount, 3, 3, user['user_id'])
-        elif game_type == "solo_keno":
-            result = casino.solo_engine.play_solo_keno(bet_amount, None, user['user_id'])
-        elif game_type == "solo_dice":
-            result = casino.solo_engine.play_solo_dice(bet_amount, 4, user['user_id'])
-        elif game_type == "rock_paper_scissors":
-            result = casino.solo_engine.play_rock_paper_scissors(bet_amount, None, user['user_id'])
-        elif game_type == "number_guess":
-            result = casino.solo_engine.play_number_guess(bet_amount, None, user['user_id'])
-        elif game_type == "lucky_wheel":
-            result = casino.solo_engine.play_lucky_wheel(bet_amount, user['user_id'])
-        else:
-            result = {'won': False, 'win_amount': 0, 'result_text': 'Oyun bulunamadı!'}
+        # Play the game as a provably-fair round
+        from provably_fair import get_fair_service
+        result = get_fair_service().play(game_type, bet_amount, user['user_id'],
+                                         lang=get_user_lang(casino, user['user_id']))
+        if result is None:
+            # Unknown game or unrecorded round - return the bet
+            casino.db.execute(
+                "UPDATE users SET fun_coins = fun_coins + ? WHERE user_id = ?",
+                (bet_amount, user['user_id'])
+            )
+            casino.db.commit()
+            await query.edit_message_text("❌ Oyun oynanamadı, bahsiniz iade edildi.")
+            return
         
         # Add winnings if won
         if result['won'] and result.get('win_amount', 0) > 0:
@@ -972,6 +935,46 @@ async def handle_group_solo_game(query, user, casino, game_type, bet_amount, gam
             ])
         )
 
+# Result texts for group dice games by payout tier (dice_payouts 'group' schedule)
+GROUP_DICE_RESULT_TEXTS = {
+    'classic': {
+        'jackpot': "🎉 **6 GELDİ!** JACKPOT! 🎉",
+        'good': "⭐ **{value}** - İyi skor! ⭐",
+        'average': "😊 **{value}** - Ortalama skor",
+        'lose': "💔 **{value}** - Kötü şans"
+    },
+    'darts': {
+        'jackpot': "🎯 **BULLSEYE!** PERFECT! 🎯",
+        'good': "⭐ **{value}** - Hedefe yakın! ⭐",
+        'hit': "😊 **{value}** - Hedefi vurdun!",
+        'lose': "💔 **{value}** - Tahtayı kaçırdın!"
+    },
+    'basketball': {
+        'jackpot': "🏀 BASKET OLDU! 🎉",
+        'close': "😊 **{value}** - Yaklaştın!",
+        'lose': "💔 **{value}** - Kaçırdın!"
+    },
+    'football': {
+        'jackpot': "⚽ GOL OLDU! 🎉",
+        'close': "😊 **{value}** - Yaklaştın!",
+        'lose': "💔 **{value}** - Kaçırdın!"
+    },
+    'bowling': {
+        'jackpot': "🎳 **STRIKE!** Tüm pinler! 🎳",
+        'good': "⭐ **{value}** - Çok pin!",
+        'some': "😊 **{value}** - Bazı pin",
+        'lose': "💔 **{value}** - Gutter ball!"
+    },
+    'slot_machine': {
+        'jackpot': "🎰 **MEGA JACKPOT!** Üçlü 7! 💎",
+        'special': "🔥 **ÖZEL JACKPOT #{value}!** 🔥",
+        'high': "⭐ **Yüksek Kombinasyon #{value}** ⭐",
+        'medium': "😊 **Orta Kombinasyon #{value}**",
+        'low': "🍀 **Küçük Kombinasyon #{value}**",
+        'lose': "💔 **Kombinasyon #{value}** - Kaybettin!"
+    }
+}
+
 async def handle_group_dice_game(query, user, casino, dice_type, bet_amount, game_name):
     """Handle group dice games with Telegram dice API and group lock system"""
     try:
@@ -1051,78 +1054,11 @@ async def handle_group_dice_game(query, user, casino, dice_type, bet_amount, gam
             # Fallback to random value
             dice_value = random.randint(config['min'], config['max'])
         
-        # Calculate payout based on dice type and value
-        payout = 0
-        result_text = ""
-        
-        if dice_type == 'classic':
-            if dice_value == 6:
-                payout = bet_amount * 6
-                result_text = "🎉 **6 GELDİ!** JACKPOT! 🎉"
-            elif dice_value >= 4:
-                payout = bet_amount * 2
-                result_text = f"⭐ **{dice_value}** - İyi skor! ⭐"
-            elif dice_value == 3:
-                payout = bet_amount
-                result_text = f"😊 **{dice_value}** - Ortalama skor"
-            else:
-                result_text = f"💔 **{dice_value}** - Kötü şans"
-                
-        elif dice_type == 'darts':
-            if dice_value == 6:
-                payout = bet_amount * 10
-                result_text = "🎯 **BULLSEYE!** PERFECT! 🎯"
-            elif dice_value >= 4:
-                payout = bet_amount * 3
-                result_text = f"⭐ **{dice_value}** - Hedefe yakın! ⭐"
-            elif dice_value >= 2:
-                payout = bet_amount
-                result_text = f"😊 **{dice_value}** - Hedefi vurdun!"
-            else:
-                result_text = f"💔 **{dice_value}** - Tahtayı kaçırdın!"
-                
-        elif dice_type in ['basketball', 'football']:
-            sport_name = "🏀 BASKET" if dice_type == 'basketball' else "⚽ GOL"
-            if dice_value >= 4:
-                payout = bet_amount * 5
-                result_text = f"{sport_name} OLDU! 🎉"
-            elif dice_value == 3:
-                payout = bet_amount
-                result_text = f"😊 **{dice_value}** - Yaklaştın!"
-            else:
-                result_text = f"💔 **{dice_value}** - Kaçırdın!"
-                
-        elif dice_type == 'bowling':
-            if dice_value == 6:
-                payout = bet_amount * 6
-                result_text = "🎳 **STRIKE!** Tüm pinler! 🎳"
-            elif dice_value >= 4:
-                payout = bet_amount * 2
-                result_text = f"⭐ **{dice_value}** - Çok pin!"
-            elif dice_value == 3:
-                payout = bet_amount
-                result_text = f"😊 **{dice_value}** - Bazı pin"
-            else:
-                result_text = f"💔 **{dice_value}** - Gutter ball!"
-                
-        elif dice_type == 'slot_machine':
-            if dice_value == 64:
-                payout = bet_amount * 100
-                result_text = "🎰 **MEGA JACKPOT!** Üçlü 7! 💎"
-            elif dice_value in [1, 22, 43]:
-                payout = bet_amount * 50
-                result_text = f"🔥 **ÖZEL JACKPOT #{dice_value}!** 🔥"
-            elif dice_value >= 50:
-                payout = bet_amount * 10
-                result_text = f"⭐ **Yüksek Kombinasyon #{dice_value}** ⭐"
-            elif dice_value >= 30:
-                payout = bet_amount * 5
-                result_text = f"😊 **Orta Kombinasyon #{dice_value}**"
-            elif dice_value >= 15:
-                payout = bet_amount * 2
-                result_text = f"🍀 **Küçük Kombinasyon #{dice_value}**"
-            else:
-                result_text = f"💔 **Kombinasyon #{dice_value}** - Kaybettin!"
+        # Calculate payout from the compiled group payout table
+        from dice_payouts import get_dice_multiplier, get_dice_tier
+        payout = bet_amount * get_dice_multiplier(dice_type, dice_value, 'group')
+        tier = get_dice_tier(dice_type, dice_value, 'group')
+        result_text = GROUP_DICE_RESULT_TEXTS.get(dice_type, {}).get(tier, "").format(value=dice_value)
         
         # Add winnings
         if payout > 0:
@@ -1387,11 +1323,16 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
             from language_handler import show_language_selection
             await show_language_selection(query, user, bot.casino)
         elif data == "check_membership":
+            # "I joined" - drop the cached membership so the next check sees the join
+            group_identifier = required_group_identifier()
+            if group_identifier is not None:
+                from group_performance_optimizer import group_membership_service
+                group_membership_service().invalidate(group_identifier, query.from_user.id)
             # Redirect directly to main menu since group membership is no longer required
             await show_main_menu(bot.casino, query, None, is_callback=True)
         elif data == "join_group":
             # Direct link to Telegram group
-            from languages import get_text, DEFAULT_LANGUAGE
+            from languages import get_texts, DEFAULT_LANGUAGE
             username = query.from_user.username or "Player"
             user_id = query.from_user.id
 
@@ -1403,18 +1344,22 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 except:
                     user_lang = DEFAULT_LANGUAGE
 
-            group_title = get_text(user_lang, "group.our_telegram_group", "🎉 <b>Our Telegram Group!</b> 🎉")
-            hello_text = get_text(user_lang, "group.hello", "Hello {username}! 👋", username=username)
-            official_group = get_text(user_lang, "group.official_group", "🎮 <b>Our Official Telegram Group:</b> @{group_name}", group_name=REQUIRED_GROUP_USERNAME)
-            whats_in_group = get_text(user_lang, "group.whats_in_group", "📋 <b>What's in the group?</b>")
-            daily_bonuses = get_text(user_lang, "group.daily_bonuses", "• 🎉 Daily bonuses and giveaways")
-            bot_updates = get_text(user_lang, "group.bot_updates", "• 📢 Bot updates and announcements")
-            chat_players = get_text(user_lang, "group.chat_players", "• 👥 Chat with other players")
-            tournament_notifications = get_text(user_lang, "group.tournament_notifications", "• 🎯 Tournament notifications")
-            help_support = get_text(user_lang, "group.help_support", "• 🆘 Help and support")
-            join_fun = get_text(user_lang, "group.join_fun", "🚀 Join now and have more fun at the casino!")
-            join_group_btn = get_text(user_lang, "group.join_group", "👥 Join Group")
-            back_main_btn = get_text(user_lang, "group.back_main_menu", "🏠 Back to Main Menu")
+            (group_title, hello_text, official_group, whats_in_group, daily_bonuses, bot_updates,
+             chat_players, tournament_notifications, help_support, join_fun, join_group_btn,
+             back_main_btn) = get_texts(user_lang, [
+                ("group.our_telegram_group", "🎉 <b>Our Telegram Group!</b> 🎉"),
+                ("group.hello", "Hello {username}! 👋"),
+                ("group.official_group", "🎮 <b>Our Official Telegram Group:</b> @{group_name}"),
+                ("group.whats_in_group", "📋 <b>What's in the group?</b>"),
+                ("group.daily_bonuses", "• 🎉 Daily bonuses and giveaways"),
+                ("group.bot_updates", "• 📢 Bot updates and announcements"),
+                ("group.chat_players", "• 👥 Chat with other players"),
+                ("group.tournament_notifications", "• 🎯 Tournament notifications"),
+                ("group.help_support", "• 🆘 Help and support"),
+                ("group.join_fun", "🚀 Join now and have more fun at the casino!"),
+                ("group.join_group", "👥 Join Group"),
+                ("group.back_main_menu", "🏠 Back to Main Menu"),
+            ], username=username, group_name=REQUIRED_GROUP_USERNAME)
 
             await query.edit_message_text(
                 f"{group_title}\n\n"
@@ -2038,7 +1983,7 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     return
                 
                 # Enhanced bet validation
-                validation = bot.validate_bet_amount(user['user_id'], bet_amount, user['fun_coins'])
+                validation = bot.validate_bet_amount(user['user_id'], bet_amount, user['fun_coins'], game_type)
                 if not validation['valid']:
                     await query.edit_message_text(
                         validation['reason'],
@@ -2547,30 +2492,21 @@ async def show_simple_solo_game_options(query, user, game_type, casino_bot):
             reply_markup=casino_bot.create_keyboard([[("🎮 Solo Games", "solo_games")]])
         )
 
+# Solo menu games deviate from the registry defaults: more mines picks, fixed keno numbers
+SOLO_MENU_GAME_PARAMS = {
+    "solo_mines": {"picks": 5},
+    "solo_keno": {"numbers_chosen": [1, 2, 3, 4, 5]}
+}
+
 async def handle_simple_solo_game(query, user, game_type, bet_amount, casino_bot):
     """Basit solo oyun handler"""
     try:
-        # Create solo game engine
-        solo_engine = SoloGameEngine()
-        
-        # Play game based on type
-        if game_type == "solo_slots":
-            result = solo_engine.play_solo_slots(bet_amount, user['user_id'])
-        elif game_type == "solo_roulette":
-            result = solo_engine.play_solo_roulette(bet_amount, "color", "red", user['user_id'])
-        elif game_type == "solo_blackjack":
-            result = solo_engine.play_solo_blackjack(bet_amount, user['user_id'])
-        elif game_type == "solo_crash":
-            result = solo_engine.play_solo_crash(bet_amount, 2.0, user['user_id'])
-        elif game_type == "solo_mines":
-            result = solo_engine.play_solo_mines(bet_amount, 3, 5, user['user_id'])
-        elif game_type == "solo_baccarat":
-            result = solo_engine.play_solo_baccarat(bet_amount, "player", user['user_id'])
-        elif game_type == "solo_keno":
-            result = solo_engine.play_solo_keno(bet_amount, [1, 2, 3, 4, 5], user['user_id'])
-        elif game_type == "solo_dice":
-            result = solo_engine.play_solo_dice(bet_amount, 4, user['user_id'])
-        else:
+        # Play the game as a provably-fair round
+        from provably_fair import get_fair_service
+        result = get_fair_service().play(game_type, bet_amount, user['user_id'],
+                                         lang=get_user_lang(casino_bot, user['user_id']),
+                                         **SOLO_MENU_GAME_PARAMS.get(game_type, {}))
+        if result is None:
             await query.edit_message_text("❌ Unknown game type!")
             return
         
@@ -3077,6 +3013,73 @@ async def support_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         logger.error(f"Support command error: {e}")
         await update.message.reply_text("❌ Destek mesajı gönderilirken hata oluştu.")
 
+async def verify_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Provably-fair commands: /verify, /verify <tur_no>, /verify seed <client_seed>"""
+    try:
+        from provably_fair import get_fair_service
+        fair = get_fair_service()
+        user_id = update.effective_user.id
+        args = context.args or []
+
+        if len(args) >= 2 and args[0].lower() == 'seed':
+            if fair.set_client_seed(user_id, ' '.join(args[1:])):
+                await update.message.reply_text("✅ İstemci tohumu güncellendi - sonraki turdan itibaren geçerli.")
+            else:
+                await update.message.reply_text("❌ Geçersiz istemci tohumu (1-64 karakter: harf, rakam, _ veya -).")
+            return
+
+        if args:
+            if not args[0].isdigit():
+                await update.message.reply_text("❌ Kullanım: /verify <tur_no> veya /verify seed <tohum>")
+                return
+            check = fair.verify_round(int(args[0]), user_id)
+            if check is None:
+                await update.message.reply_text("❌ Tur bulunamadı!")
+                return
+            status = "✅ DOĞRULANDI" if check['verified'] else "❌ DOĞRULANAMADI"
+            text = f"""🔐 **Tur #{check['round_id']}** - {status}
+
+🎮 Oyun: `{check['game_id']}`
+💰 Bahis: {check['bet_amount']:,} 🐻 · Kazanç: {check['win_amount']:,} 🐻
+🔁 Yeniden hesaplanan kazanç: {check['replay_win_amount']:,} 🐻
+
+🔑 Sunucu tohumu: `{check['server_seed']}`
+#️⃣ Tohum hash'i: `{check['server_seed_hash']}`
+⚓ Zincir taahhüdü: `{check['anchor']}`
+🌱 İstemci tohumu: `{check['client_seed']}`
+🔢 Nonce: {check['nonce']}
+
+{'✅' if check['commitment_ok'] else '❌'} Sunucu tohumu önceden taahhüt edilmiş
+{'✅' if check['outcome_ok'] else '❌'} Sonuç tohumlardan aynen yeniden üretildi
+
+sha256 işlemini tohuma nonce + 1 kez uygulayın; sonuç zincir taahhüdünü vermelidir."""
+            await update.message.reply_text(text, parse_mode='Markdown')
+            return
+
+        state = fair.get_user_state(user_id)
+        recent = fair.get_recent_rounds(user_id)
+        rounds_text = "\n".join(
+            f"• #{r['round_id']} `{r['game_id']}`: {r['bet_amount']:,} → {r['win_amount']:,} 🐻"
+            for r in recent
+        ) or "• Henüz tur yok"
+        text = f"""🔐 **ADİL OYUN** 🔐
+
+⚓ Aktif zincir taahhüdü: `{state['anchor']}`
+⏭️ Sonraki zincir taahhüdü: `{state['next_anchor']}`
+🌱 İstemci tohumu: `{state['client_seed']}`
+🔢 Sonraki nonce: {state['nonce']} ({state['rounds_left']:,} tur kaldı)
+
+🕘 **Son turlar:**
+{rounds_text}
+
+/verify <tur_no> - bir turu doğrula
+/verify seed <tohum> - istemci tohumunu değiştir"""
+        await update.message.reply_text(text, parse_mode='Markdown')
+
+    except Exception as e:
+        logger.error(f"Verify command error: {e}")
+        await update.message.reply_text("❌ Doğrulama sırasında hata oluştu.")
+
 async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Stats command handler"""
     try:
@@ -3969,6 +3972,17 @@ async def handle_chat_member(update: Update, context: ContextTypes.DEFAULT_TYPE)
         
         old_status = result.old_chat_member.status
         new_status = result.new_chat_member.status
+
+        # Keep the membership cache in sync so later checks skip the Bot API
+        try:
+            from group_performance_optimizer import group_membership_service
+            membership = group_membership_service()
+            member_id = result.new_chat_member.user.id
+            membership.record_status(chat.id, member_id, new_status)
+            if chat.username:
+                membership.record_status(f"@{chat.username}", member_id, new_status)
+        except Exception as e:
+            logger.error(f"Failed to update membership cache: {e}")
         
         # User joined the group
         if old_status in ['left', 'kicked'] and new_status in ['member', 'administrator', 'creator']:
@@ -4078,7 +4092,8 @@ async def setup_bot_commands(bot):
             BotCommand("achievements", "🏆 Başarılarım"),
             BotCommand("friends", "👥 Arkadaşlarım"),
             BotCommand("leaderboard", "🥇 Liderlik tablosu"),
-            BotCommand("settings", "⚙️ Ayarlar")
+            BotCommand("settings", "⚙️ Ayarlar"),
+            BotCommand("verify", "🔐 Adil oyun doğrulama")
         ]
 
         # Commands for group chats - sadece support ve dice oyunları
@@ -4151,6 +4166,7 @@ async def run_main_bot():
         application.add_handler(CommandHandler("friends", friends_command))
         application.add_handler(CommandHandler("leaderboard", leaderboard_command))
         application.add_handler(CommandHandler("settings", settings_command))
+        application.add_handler(CommandHandler("verify", verify_command))
         application.add_handler(CallbackQueryHandler(button_callback))
         application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_text_message))
 
@@ -4168,6 +4184,30 @@ async def run_main_bot():
         logger.error(f"Bot run error: {e}")
         raise
 
+def register_handlers(application):
+    """Handlers of the production bot - support, dice game and /verify commands, callbacks, text and chat members
+
+    Shared by main() and load_generator.py, so load tests drive the same handler set.
+    """
+    application.add_handler(CommandHandler("support", support_command))
+    application.add_handler(CommandHandler("diceslots", diceslots_command))
+    application.add_handler(CommandHandler("dartgame", dartgame_command))
+    application.add_handler(CommandHandler("classicdice", classicdice_command))
+    application.add_handler(CommandHandler("basketball", basketball_command))
+    application.add_handler(CommandHandler("football", football_command))
+    application.add_handler(CommandHandler("bowling", bowling_command))
+    application.add_handler(CommandHandler("verify", verify_command))
+    application.add_handler(CallbackQueryHandler(button_callback))
+    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_text_message))
+
+    # Add group event handlers for automatic bot startup
+    from telegram.ext import ChatMemberHandler
+    application.add_handler(ChatMemberHandler(handle_my_chat_member, ChatMemberHandler.MY_CHAT_MEMBER))
+    application.add_handler(ChatMemberHandler(handle_chat_member, ChatMemberHandler.CHAT_MEMBER))
+
+    # Add error handler
+    application.add_error_handler(error_handler)
+
 def main():
     """Main function to run the bot with robust error handling"""
     global bot
@@ -4195,6 +4235,13 @@ def main():
 
     # Check for running instances
     pid_file = check_instance()
+
+    # Report translation keys missing per language (fallbacks are already compiled in)
+    try:
+        from languages import validate_catalog
+        validate_catalog()
+    except Exception as e:
+        logger.error(f"Translation catalog validation failed: {e}")
     
     try:
         # Initialize enhanced bot with network error handling
@@ -4259,13 +4306,8 @@ def main():
             logger.info("Starting enhanced Solana integration...")
             # Note: Full initialization should be run separately via solana_integration_init.py
 
-            # Start webhook server for automatic payments
-            try:
-                from webhook_server import start_webhook_server_thread
-                start_webhook_server_thread(host='0.0.0.0', port=8080)
-                logger.info("✅ Webhook server started for automatic payments")
-            except ImportError:
-                logger.warning("Webhook server not available")
+            # Webhook server for automatic payments is started in post_init
+            # so it shares the bot's event loop and the payment credit worker
 
             logger.info("Solana integration system ready")
         except ImportError:
@@ -4295,23 +4337,7 @@ def main():
         application = Application.builder().token(BOT_TOKEN).request(request).build()
         
         # Add handlers - Support and dice game commands only
-        application.add_handler(CommandHandler("support", support_command))
-        application.add_handler(CommandHandler("diceslots", diceslots_command))
-        application.add_handler(CommandHandler("dartgame", dartgame_command))
-        application.add_handler(CommandHandler("classicdice", classicdice_command))
-        application.add_handler(CommandHandler("basketball", basketball_command))
-        application.add_handler(CommandHandler("football", football_command))
-        application.add_handler(CommandHandler("bowling", bowling_command))
-        application.add_handler(CallbackQueryHandler(button_callback))
-        application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_text_message))
-        
-        # Add group event handlers for automatic bot startup
-        from telegram.ext import ChatMemberHandler
-        application.add_handler(ChatMemberHandler(handle_my_chat_member, ChatMemberHandler.MY_CHAT_MEMBER))
-        application.add_handler(ChatMemberHandler(handle_chat_member, ChatMemberHandler.CHAT_MEMBER))
-        
-        # Add error handler
-        application.add_error_handler(error_handler)
+        register_handlers(application)
 
         # Start the bot
         logger.info("Casino Bot is starting...")
@@ -4361,26 +4387,42 @@ def main():
             except Exception as e:
                 logger.error(f"Solana async initialization failed: {e}")
 
-        application.post_init = startup_callback
+            # Start webhook server for automatic payments on this loop
+            try:
+                from webhook_server import start_webhook_server
+                await start_webhook_server(bot=application.bot, host='0.0.0.0', port=8080)
+                logger.info("✅ Webhook server started for automatic payments")
+            except ImportError:
+                logger.warning("Webhook server not available")
+            except Exception as e:
+                logger.error(f"Webhook server start failed: {e}")
 
-        # Add handlers - Support and dice game commands only
-        application.add_handler(CommandHandler("support", support_command))
-        application.add_handler(CommandHandler("diceslots", diceslots_command))
-        application.add_handler(CommandHandler("dartgame", dartgame_command))
-        application.add_handler(CommandHandler("classicdice", classicdice_command))
-        application.add_handler(CommandHandler("basketball", basketball_command))
-        application.add_handler(CommandHandler("football", football_command))
-        application.add_handler(CommandHandler("bowling", bowling_command))
-        application.add_handler(CallbackQueryHandler(button_callback))
-        application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_text_message))
+            # Poll pending CryptoBot invoices in batches (webhook updates go to the same poller)
+            if bot.crypto_processor:
+                from cryptobot_payment import start_invoice_poller
+                start_invoice_poller(bot.crypto_processor, bot.casino.db, bot.credit_user_deposits)
 
-        # Add group event handlers for automatic bot startup
-        from telegram.ext import ChatMemberHandler
-        application.add_handler(ChatMemberHandler(handle_my_chat_member, ChatMemberHandler.MY_CHAT_MEMBER))
-        application.add_handler(ChatMemberHandler(handle_chat_member, ChatMemberHandler.CHAT_MEMBER))
+        async def shutdown_callback(application):
+            """Close the webhook server and shared HTTP connections"""
+            from cryptobot_payment import get_invoice_poller
+            poller = get_invoice_poller()
+            if poller:
+                await poller.stop()
 
-        # Add error handler
-        application.add_error_handler(error_handler)
+            try:
+                from webhook_server import stop_webhook_server
+                await stop_webhook_server()
+            except Exception as e:
+                logger.error(f"Webhook server stop failed: {e}")
+
+            from http_clients import close_http_clients
+            await close_http_clients()
+
+        application.post_init = startup_callback
+        application.post_shutdown = shutdown_callback
+
+        # Add handlers - Support and dice game commands only
+        register_handlers(application)
 
         for attempt in range(max_retries + 1):
             try:
@@ -4456,28 +4498,20 @@ async def handle_enhanced_solo_game(query, user, game_type, bet_amount, casino_b
             await query.edit_message_text(f"{frame} Oyun başlıyor...")
             await asyncio.sleep(0.3)
         
-        # Create solo game engine if not exists
-        if not hasattr(casino_bot, 'solo_engine'):
-            from solo_games import SoloGameEngine
-            casino_bot.solo_engine = SoloGameEngine()
-        
-        # Play the game based on type
-        result = None
+        # Play the game as a provably-fair round
+        from provably_fair import get_fair_service
+        result = get_fair_service().play(game_type, bet_amount, user['user_id'],
+                                         lang=get_user_lang(casino_bot, user['user_id']))
+        if result is None:
+            await query.edit_message_text(
+                "❌ Bilinmeyen oyun türü!",
+                reply_markup=casino_bot.create_keyboard([[("🎮 Solo Games", "solo_games")]])
+            )
+            return
         
-        # Safety check for solo engine
-        if not hasattr(casino_bot.solo_engine, 'play_solo_slots'):
-            raise AttributeError("Solo engine methods not available")
-            
+        # Game-specific layout
+        result_text = None
         if game_type == "solo_slots":
-            result = casino_bot.solo_engine.play_solo_slots(bet_amount)
-            if result is None:
-                # Fallback result if engine returns None
-                result = {
-                    'reels': ['❌', '❌', '❌'],
-                    'won': False,
-                    'win_amount': 0,
-                    'multiplier': 0
-                }
             result_text = f"""
 🎰 **SLOT MAKİNESİ** 🎰
 
@@ -4503,16 +4537,6 @@ async def handle_enhanced_solo_game(query, user, game_type, bet_amount, casino_b
         
         elif game_type == "solo_roulette":
             bet_choice = "red"
-            result = casino_bot.solo_engine.play_solo_roulette(bet_amount, "color", bet_choice)
-            if result is None:
-                # Fallback result if engine returns None
-                result = {
-                    'number': 0,
-                    'color': 'green',
-                    'won': False,
-                    'win_amount': 0,
-                    'multiplier': 0
-                }
             color_emoji = "🔴" if result['color'] == "red" else "⚫" if result['color'] == "black" else "🟢"
             
             result_text = f"""
@@ -4539,18 +4563,6 @@ async def handle_enhanced_solo_game(query, user, game_type, bet_amount, casino_b
 """
                 
         elif game_type == "solo_blackjack":
-            result = casino_bot.solo_engine.play_solo_blackjack(bet_amount)
-            if result is None:
-                # Fallback result if engine returns None
-                result = {
-                    'player_cards': [1, 10],
-                    'dealer_cards': [5, 10],
-                    'player_value': 21,
-                    'dealer_value': 15,
-                    'won': False,
-                    'win_amount': 0,
-                    'multiplier': 0
-                }
             card_display = lambda cards: ' '.join([{1: 'A', 11: 'J', 12: 'Q', 13: 'K'}.get(c, str(c)) for c in cards])
             
             result_text = f"""
@@ -4578,16 +4590,6 @@ async def handle_enhanced_solo_game(query, user, game_type, bet_amount, casino_b
 """
         
         elif game_type == "solo_crash":
-            result = casino_bot.solo_engine.play_solo_crash(bet_amount)
-            if result is None:
-                result = {
-                    'crash_point': 1.0,
-                    'cashout_multiplier': 2.0,
-                    'won': False,
-                    'win_amount': 0,
-                    'multiplier': 0,
-                    'result_text': 'Engine Error'
-                }
             result_text = f"""
 🚀 **CRASH GAME** 🚀
 
@@ -4613,17 +4615,6 @@ async def handle_enhanced_solo_game(query, user, game_type, bet_amount, casino_b
 """
         
         elif game_type == "solo_mines":
-            result = casino_bot.solo_engine.play_solo_mines(bet_amount)
-            if result is None:
-                result = {
-                    'mines_count': 3,
-                    'gems_found': 0,
-                    'hit_mine': True,
-                    'won': False,
-                    'win_amount': 0,
-                    'multiplier': 0,
-                    'result_text': 'Engine Error'
-                }
             result_text = f"""
 💎 **MINES GAME** 💎
 
@@ -4650,18 +4641,6 @@ async def handle_enhanced_solo_game(query, user, game_type, bet_amount, casino_b
 """
         
         elif game_type == "solo_baccarat":
-            result = casino_bot.solo_engine.play_solo_baccarat(bet_amount)
-            if result is None:
-                result = {
-                    'winner': 'banker',
-                    'player_val': 5,
-                    'banker_val': 7,
-                    'bet_on': 'player',
-                    'won': False,
-                    'win_amount': 0,
-                    'multiplier': 0,
-                    'result_text': 'Engine Error'
-                }
             result_text = f"""
 🃏 **BACCARAT** 🃏
 
@@ -4688,17 +4667,6 @@ async def handle_enhanced_solo_game(query, user, game_type, bet_amount, casino_b
 """
         
         elif game_type == "solo_keno":
-            result = casino_bot.solo_engine.play_solo_keno(bet_amount)
-            if result is None:
-                result = {
-                    'hits': 0,
-                    'numbers_chosen': list(range(1, 11)),
-                    'hit_numbers': [],
-                    'won': False,
-                    'win_amount': 0,
-                    'multiplier': 0,
-                    'result_text': 'Engine Error'
-                }
             result_text = f"""
 🎲 **KENO** 🎲
 
@@ -4724,23 +4692,20 @@ async def handle_enhanced_solo_game(query, user, game_type, bet_amount, casino_b
 🍀 Daha fazla eşleşme için şansını dene!
 """
         
-        # Fallback for unhandled game types
-        if result is None:
-            result = {
-                'won': False,
-                'win_amount': 0,
-                'multiplier': 0
-            }
+        # Games without their own layout use the rendered result text
+        if result_text is None:
             result_text = f"""
-❌ **OYUN HATASI** ❌
+{result['result_text']}
 
 🎮 **Bahis:** {bet_amount:,} 🐻
-⚠️ **Status:** Game engine error
-💸 **Loss:** -{bet_amount:,} 🐻
-
-🔄 Please try again.
+🐻 **Kazanç:** {result['win_amount']:,} 🐻
 """
         
+        # Round id for /verify (crash and mines already show it in their result text)
+        round_id = result['fair_round_id']
+        if f"/verify {round_id}" not in result_text:
+            result_text += f"\n🔐 Tur #{round_id} · /verify {round_id}"
+        
         # Update user stats and save game
         casino_bot.update_user_stats(user['user_id'], bet_amount, result['win_amount'], result['won'])
         casino_bot.save_solo_game(user['user_id'], game_type, bet_amount, result)
@@ -5930,7 +5895,7 @@ async def start_duel_game(query, game_id, user, casino_bot):
                 
                 # Use game engine for dice duel
                 from game_engine import GameEngine
-                dice_result = GameEngine.play_duel_dice_with_type(dice_type.replace('_machine', ''))
+                dice_result = GameEngine().play_duel_dice_with_type(dice_type.replace('_machine', ''))
                 
                 p1_dice = dice_result['dice1']
                 p2_dice = dice_result['dice2']
@@ -6094,9 +6059,13 @@ async def show_vip_info(query, user, bot_instance):
 async def show_game_history(query, user, casino_bot):
     """Show user's game history"""
     try:
+        from solo_outcomes import decode_outcome
+        from solo_render import describe_outcome
+
+        lang = get_user_lang(casino_bot, user['user_id'])
         with casino_bot.db.get_connection() as conn:
             games = conn.execute('''
-                SELECT game_type, bet_amount, win_amount, won, played_at
+                SELECT game_type, bet_amount, win_amount, multiplier, won, result_data, played_at
                 FROM solo_game_history 
                 WHERE user_id = ? 
                 ORDER BY played_at DESC LIMIT 10
@@ -6124,6 +6093,10 @@ async def show_game_history(query, user, casino_bot):
             for game in games:
                 status = "🏆 KAZANDIN" if game['won'] else "💸 Kaybettin"
                 game_name = game['game_type'].replace('solo_', '').title()
+                outcome = decode_outcome(game['result_data'], game['bet_amount'], game['multiplier'],
+                                         game['win_amount'], game['won'])
+                if outcome is not None:
+                    game_name += f" ({describe_outcome(outcome, lang)})"
                 text += f"• {status} - {game_name} - {game['bet_amount']:,} 🐻 → {game['win_amount']:,} 🐻\n"
             
             total_games = len(games)
@@ -6295,12 +6268,14 @@ Bahis miktarınızı seçin:
 async def handle_solo_game_play(query, user, casino_bot, game_type, bet_amount):
     """Mevcut solo oyunları oynatır"""
     try:
-        from solo_games import SoloGameEngine
-        
         # Bahis doğrulama
-        if user['fun_coins'] < bet_amount:
+        from game_registry import get_game_registry
+        full_game_type = f"solo_{game_type}"
+        bet_error = ("Yetersiz bakiye!" if user['fun_coins'] < bet_amount
+                     else get_game_registry().check_bet(full_game_type, bet_amount))
+        if bet_error:
             await query.edit_message_text(
-                "❌ Yetersiz bakiye!",
+                f"❌ {bet_error}",
                 reply_markup=casino_bot.create_keyboard([
                     [("🎮 Oyunlar", "games"), ("🏠 Ana Menü", "main_menu")]
                 ])
@@ -6308,26 +6283,11 @@ async def handle_solo_game_play(query, user, casino_bot, game_type, bet_amount):
             return
         
         # Oyunu oyna
-        solo_engine = SoloGameEngine()
-        full_game_type = f"solo_{game_type}"
-        
-        if game_type == "slots":
-            result = solo_engine.play_solo_slots(bet_amount, user['user_id'])
-        elif game_type == "roulette":
-            result = solo_engine.play_solo_roulette(bet_amount, "color", "red", user['user_id'])
-        elif game_type == "blackjack":
-            result = solo_engine.play_solo_blackjack(bet_amount, user['user_id'])
-        elif game_type == "crash":
-            result = solo_engine.play_solo_crash(bet_amount, 2.0, user['user_id'])
-        elif game_type == "mines":
-            result = solo_engine.play_solo_mines(bet_amount, 3, 5, user['user_id'])
-        elif game_type == "baccarat":
-            result = solo_engine.play_solo_baccarat(bet_amount, "player", user['user_id'])
-        elif game_type == "keno":
-            result = solo_engine.play_solo_keno(bet_amount, [1, 2, 3, 4, 5], user['user_id'])
-        elif game_type == "dice":
-            result = solo_engine.play_solo_dice(bet_amount, 4, user['user_id'])
-        else:
+        from provably_fair import get_fair_service
+        result = get_fair_service().play(full_game_type, bet_amount, user['user_id'],
+                                         lang=get_user_lang(casino_bot, user['user_id']),
+                                         **SOLO_MENU_GAME_PARAMS.get(full_game_type, {}))
+        if result is None:
             await query.edit_message_text("❌ Bilinmeyen oyun türü!")
             return
         
@@ -6591,12 +6551,13 @@ Bahis miktarınızı seçin:
 async def handle_new_solo_game_play(query, user, casino_bot, game_type, bet_amount):
     """Yeni solo oyunları oynatır"""
     try:
-        from solo_games import SoloGameEngine
-        
         # Bahis doğrulama
-        if user['fun_coins'] < bet_amount:
+        from game_registry import get_game_registry
+        bet_error = ("Yetersiz bakiye!" if user['fun_coins'] < bet_amount
+                     else get_game_registry().check_bet(game_type, bet_amount))
+        if bet_error:
             await query.edit_message_text(
-                "❌ Yetersiz bakiye!",
+                f"❌ {bet_error}",
                 reply_markup=casino_bot.create_keyboard([
                     [("🎮 Oyunlar", "games"), ("🏠 Ana Menü", "main_menu")]
                 ])
@@ -6604,15 +6565,10 @@ async def handle_new_solo_game_play(query, user, casino_bot, game_type, bet_amou
             return
         
         # Oyunu oyna
-        solo_engine = SoloGameEngine()
-        
-        if game_type == "rock_paper_scissors":
-            result = solo_engine.play_rock_paper_scissors(bet_amount, None, user['user_id'])
-        elif game_type == "number_guess":
-            result = solo_engine.play_number_guess(bet_amount, None, user['user_id'])
-        elif game_type == "lucky_wheel":
-            result = solo_engine.play_lucky_wheel(bet_amount, user['user_id'])
-        else:
+        from provably_fair import get_fair_service
+        result = get_fair_service().play(game_type, bet_amount, user['user_id'],
+                                         lang=get_user_lang(casino_bot, user['user_id']))
+        if result is None:
             await query.edit_message_text("❌ Bilinmeyen oyun türü!")
             return
         
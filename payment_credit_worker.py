@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+💳 Payment Credit Worker
+Tüm yatırım kaynakları için tek kredilendirme noktası
+
+Every deposit source (Helius webhooks, the enhanced processor, QR
+confirmations, CryptoBot invoices) writes its events to the payment_inbox
+table, keyed by transaction signature or invoice id. This worker drains the
+inbox in batches and credits each event exactly once.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from database_manager import get_database_manager
+
+logger = logging.getLogger(__name__)
+
+class PaymentCreditWorker:
+    """Single consumer of the payment inbox"""
+
+    def __init__(self, db=None, batch_size: int = 200, poll_interval: float = 5.0,
+                 result_cache_size: int = 1000):
+        self.db = db or get_database_manager()
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.result_cache_size = result_cache_size
+
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable] = []
+        # Recent results by event key, so callers can see credits made by another drain
+        self._recent_results: "OrderedDict[str, Dict]" = OrderedDict()
+        self.stats = {"enqueued": 0, "credited": 0, "batches": 0}
+
+    def add_listener(self, callback: Callable):
+        """Register an async callback(result) called for every credited event"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    async def submit(self, source: str, events: List[Dict]) -> int:
+        """Write events to the inbox and wake the worker; returns rows written"""
+        queued = await asyncio.to_thread(self.db.enqueue_payment_events, source, events)
+        self.stats["enqueued"] += queued
+        if queued:
+            self._wakeup.set()
+        return queued
+
+    async def credit_now(self, source: str, events: List[Dict]) -> List[Dict]:
+        """Submit events and drain immediately; returns the credits for these events
+
+        Events that were already credited (replays, a webhook racing a poller)
+        produce no result.
+        """
+        keys = [self.db.payment_event_key(event) for event in events]
+        await self.submit(source, events)
+        await self.drain()
+        return [self._recent_results.pop(key) for key in keys if key in self._recent_results]
+
+    async def drain(self) -> List[Dict]:
+        """Credit everything currently in the inbox, one batch per transaction"""
+        credited = []
+        async with self._lock:
+            while True:
+                events = await asyncio.to_thread(self.db.get_unprocessed_payment_events, self.batch_size)
+                if not events:
+                    break
+
+                rate = None
+                if any(event['fc_amount'] is None for event in events):
+                    from solana_payment import get_solana_payment
+                    rate = get_solana_payment().get_sol_to_fc_rate()
+
+                batch = await asyncio.to_thread(
+                    self.db.credit_payment_events, [event['id'] for event in events], rate
+                )
+                self.stats["batches"] += 1
+                self.stats["credited"] += len(batch)
+                credited.extend(batch)
+
+                for result in batch:
+                    self._remember(result)
+                    logger.info(f"✅ Credited {result['fc_amount']} FC to user {result['user_id']} ({result['source']})")
+
+                if len(events) < self.batch_size:
+                    break
+
+        for result in credited:
+            for callback in self._listeners:
+                try:
+                    await callback(result)
+                except Exception as e:
+                    logger.error(f"Payment credit listener error: {e}")
+
+        return credited
+
+    def _remember(self, result: Dict):
+        """Keep a bounded window of recent results for credit_now callers"""
+        self._recent_results[result['event_key']] = result
+        while len(self._recent_results) > self.result_cache_size:
+            self._recent_results.popitem(last=False)
+
+    def start(self):
+        """Start the background drain loop on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the background drain loop"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        """Drain whenever woken up, and on the poll interval for retries"""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.drain()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Payment credit worker error: {e}")
+
+# Global instance
+_credit_worker = None
+
+def get_credit_worker() -> PaymentCreditWorker:
+    """Global credit worker instance"""
+    global _credit_worker
+    if _credit_worker is None:
+        _credit_worker = PaymentCreditWorker()
+    return _credit_worker
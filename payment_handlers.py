@@ -15,7 +15,7 @@ from visual_assets import (
     get_random_celebration, create_animated_message
 )
 from languages import get_text, DEFAULT_LANGUAGE
-from cryptobot_payment import CryptoBotPaymentProcessor, CasinoPaymentManager, create_payment_tables
+from cryptobot_payment import CryptoBotPaymentProcessor, CasinoPaymentManager, create_payment_tables, get_invoice_poller
 from enhanced_crypto_pay_api import CryptoPayAPI, EnhancedPaymentManager
 from payment_fix_patch import safe_create_deposit_invoice, safe_process_withdrawal
 
@@ -338,6 +338,11 @@ async def handle_confirm_deposit(query, user, crypto, amount, wallet=None, casin
         result = await safe_create_deposit_invoice(casino_bot, user['user_id'], amount, crypto)
         
         if result and result.get("success"):
+            # Check the new invoice now instead of at the poller's next (possibly backed-off) tick
+            poller = get_invoice_poller()
+            if poller:
+                poller.wake()
+                
             crypto_amount = result.get("amount", 0)
             bonus_coins = result.get("bonus_coins", 0)
             total_coins = result.get("total_coins", amount)
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Provably Fair
+Solo oyunlar için doğrulanabilir adil tur sistemi
+
+Every user plays against their own chain of server seeds. A chain is created
+in one batch: a random 32-byte tail is hashed `chain_length - 1` times with
+SHA-256, and the seeds are used in reverse order, so
+
+    seeds[i] = sha256(seeds[i + 1])      anchor = sha256(seeds[0])
+
+The anchor is published (/verify) before any of the chain's rounds are
+played, and the next chain's anchor is published while the current one is
+still in use. Revealing seeds[i] proves it was committed in advance, because
+hashing it i + 1 times gives the anchor. Later seeds cannot be derived from
+it.
+
+Only the tail and the anchor are stored per chain. The chain is expanded in
+memory once, so a round does not compute any hashes while it is being played.
+
+Round outcomes are drawn from HMAC-SHA256(server_seed, "client_seed:nonce:
+counter") blocks. The nonce is the seed's index in the chain, and the user
+can change their client seed at any time. A round and the user's next nonce
+are written in one transaction, so a seed is never used for two rounds.
+`verify_round()` replays a stored round from its seeds; round data is only
+shown to the player who played it.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import re
+import secrets
+import sqlite3
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional
+
+from config import FAIR_CONFIG
+from database_manager import get_database_manager
+from rng_service import BufferedRandom
+
+logger = logging.getLogger(__name__)
+
+# İstemci tohumu /verify içinde Markdown kod bloğunda gösterilir
+CLIENT_SEED_PATTERN = re.compile(r'[A-Za-z0-9_-]+')
+
+def expand_chain(tail: bytes, length: int) -> List[bytes]:
+    """All seeds of a chain in play order - seeds[-1] is the tail"""
+    seeds = [tail]
+    for _ in range(length - 1):
+        seeds.append(hashlib.sha256(seeds[-1]).digest())
+    seeds.reverse()
+    return seeds
+
+def chain_anchor(first_seed: bytes) -> str:
+    """Published commitment of a chain"""
+    return hashlib.sha256(first_seed).hexdigest()
+
+def seed_matches_anchor(server_seed: bytes, nonce: int, anchor: str) -> bool:
+    """True when hashing the seed nonce + 1 times reaches the anchor"""
+    digest = server_seed
+    for _ in range(nonce + 1):
+        digest = hashlib.sha256(digest).digest()
+    return hmac.compare_digest(digest.hex(), anchor)
+
+def hmac_block_source(server_seed: bytes, client_seed: str, nonce: int) -> Callable[[int], bytes]:
+    """BufferedRandom block source - HMAC-SHA256(server_seed, client_seed:nonce:counter)"""
+    counter = count()
+
+    def source(size: int) -> bytes:
+        blocks = bytearray()
+        while len(blocks) < size:
+            message = f"{client_seed}:{nonce}:{next(counter)}".encode()
+            blocks += hmac.new(server_seed, message, hashlib.sha256).digest()
+        return bytes(blocks[:size])
+
+    return source
+
+def round_rng(server_seed: bytes, client_seed: str, nonce: int) -> BufferedRandom:
+    """The generator a fair round draws from - one HMAC per 4 words"""
+    return BufferedRandom(hmac_block_source(server_seed, client_seed, nonce), block_size=4)
+
+class ProvablyFairService:
+    """Per-user seed chains, fair round play and verification"""
+
+    def __init__(self, db=None, config: Dict[str, Any] = None):
+        self.db = db or get_database_manager()
+        self.config = config or FAIR_CONFIG
+        self.chain_length = self.config["chain_length"]
+        # user_id -> {client_seed, chain_no, nonce, seeds, anchor}, most recent last
+        self._states: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self.stats = {"rounds": 0, "chains_created": 0, "chain_expansions": 0, "verifications": 0}
+        self.create_tables()
+
+    def create_tables(self):
+        with self.db.get_connection() as conn:
+            conn.execute('''CREATE TABLE IF NOT EXISTS fair_clients (
+                user_id INTEGER PRIMARY KEY,
+                client_seed TEXT NOT NULL,
+                chain_no INTEGER DEFAULT 0,
+                next_nonce INTEGER DEFAULT 0
+            )''')
+            try:
+                conn.execute('ALTER TABLE fair_clients ADD COLUMN next_nonce INTEGER DEFAULT 0')
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+            # Sadece zincir ucu (32 bayt) ve yayınlanan taahhüt saklanır
+            conn.execute('''CREATE TABLE IF NOT EXISTS fair_chains (
+                user_id INTEGER NOT NULL,
+                chain_no INTEGER NOT NULL,
+                tail BLOB NOT NULL,
+                anchor TEXT NOT NULL,
+                length INTEGER NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (user_id, chain_no)
+            )''')
+            conn.execute('''CREATE TABLE IF NOT EXISTS fair_rounds (
+                round_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                chain_no INTEGER NOT NULL,
+                nonce INTEGER NOT NULL,
+                client_seed TEXT NOT NULL,
+                game_id TEXT NOT NULL,
+                params TEXT,
+                bet_amount INTEGER NOT NULL,
+                win_amount INTEGER NOT NULL,
+                won BOOLEAN NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (user_id, chain_no, nonce)
+            )''')
+            conn.commit()
+
+    # --- Chains -------------------------------------------------------------
+
+    def _create_chain(self, conn, user_id: int, chain_no: int) -> List[bytes]:
+        """Generate and store one chain; returns its expanded seeds"""
+        seeds = expand_chain(os.urandom(32), self.chain_length)
+        conn.execute(
+            'INSERT INTO fair_chains (user_id, chain_no, tail, anchor, length) VALUES (?, ?, ?, ?, ?)',
+            (user_id, chain_no, seeds[-1], chain_anchor(seeds[0]), self.chain_length)
+        )
+        self.stats["chains_created"] += 1
+        return seeds
+
+    def _load_chain(self, conn, user_id: int, chain_no: int):
+        """(seeds, anchor) of a stored chain, or None"""
+        row = conn.execute(
+            'SELECT tail, anchor, length FROM fair_chains WHERE user_id = ? AND chain_no = ?',
+            (user_id, chain_no)
+        ).fetchone()
+        if row is None:
+            return None
+        self.stats["chain_expansions"] += 1
+        return expand_chain(bytes(row['tail']), row['length']), row['anchor']
+
+    def _state(self, user_id: int) -> Dict[str, Any]:
+        """Cached fairness state of a user, created on first play"""
+        state = self._states.get(user_id)
+        if state is not None:
+            self._states.move_to_end(user_id)
+            return state
+
+        with self.db.get_connection() as conn:
+            client = conn.execute(
+                'SELECT client_seed, chain_no, next_nonce FROM fair_clients WHERE user_id = ?', (user_id,)
+            ).fetchone()
+            if client is None:
+                client_seed, chain_no, next_nonce = secrets.token_hex(8), 0, 0
+                conn.execute('INSERT INTO fair_clients (user_id, client_seed, chain_no) VALUES (?, ?, 0)',
+                             (user_id, client_seed))
+            else:
+                client_seed, chain_no = client['client_seed'], client['chain_no']
+                next_nonce = client['next_nonce'] or 0
+
+            chain = self._load_chain(conn, user_id, chain_no)
+            if chain is None:
+                seeds = self._create_chain(conn, user_id, chain_no)
+                chain = (seeds, chain_anchor(seeds[0]))
+            # The next chain's commitment is published before it is needed
+            next_anchor = conn.execute(
+                'SELECT anchor FROM fair_chains WHERE user_id = ? AND chain_no = ?', (user_id, chain_no + 1)
+            ).fetchone()
+            if next_anchor is None:
+                next_seeds = self._create_chain(conn, user_id, chain_no + 1)
+                next_anchor = chain_anchor(next_seeds[0])
+            else:
+                next_anchor = next_anchor['anchor']
+
+            last = conn.execute(
+                'SELECT MAX(nonce) FROM fair_rounds WHERE user_id = ? AND chain_no = ?', (user_id, chain_no)
+            ).fetchone()[0]
+            conn.commit()
+
+        state = {
+            "client_seed": client_seed,
+            "chain_no": chain_no,
+            "nonce": next_nonce if last is None else max(next_nonce, last + 1),
+            "seeds": chain[0],
+            "anchor": chain[1],
+            "next_anchor": next_anchor
+        }
+        self._states[user_id] = state
+        while len(self._states) > self.config["cache_size"]:
+            self._states.popitem(last=False)
+        return state
+
+    def _rotate(self, user_id: int, state: Dict[str, Any]):
+        """Switch to the pre-committed next chain and commit the one after it"""
+        chain_no = state["chain_no"] + 1
+        with self.db.get_connection() as conn:
+            seeds, anchor = self._load_chain(conn, user_id, chain_no)
+            next_seeds = self._create_chain(conn, user_id, chain_no + 1)
+            conn.execute('UPDATE fair_clients SET chain_no = ?, next_nonce = 0 WHERE user_id = ?',
+                         (chain_no, user_id))
+            conn.commit()
+        state.update(chain_no=chain_no, nonce=0, seeds=seeds, anchor=anchor,
+                     next_anchor=chain_anchor(next_seeds[0]))
+        logger.info(f"Fair seed chain rotated for user {user_id}: chain {chain_no}")
+
+    # --- Play -----------------------------------------------------------------
+
+    def play(self, game_id: str, bet_amount: int, user_id: int, lang: str = None,
+             **params) -> Optional[dict]:
+        """Play a registry game as a committed round, rendered in `lang`
+
+        The result gains 'fair_round_id', 'nonce' and 'server_seed_hash'.
+        None for an unknown game, or when the round could not be recorded -
+        the caller must not settle it then.
+        """
+        from game_registry import get_game_registry
+
+        registry = get_game_registry()
+        definition = registry.get(game_id)
+        if definition is None:
+            return registry.play(game_id, bet_amount, user_id, lang=lang, **params)
+        params = definition.resolve_params(params)
+
+        state = self._state(user_id)
+        if state["nonce"] >= len(state["seeds"]):
+            self._rotate(user_id, state)
+        nonce = state["nonce"]
+        server_seed = state["seeds"][nonce]
+
+        result = registry.play(game_id, bet_amount, user_id,
+                               rng=round_rng(server_seed, state["client_seed"], nonce), lang=lang, **params)
+
+        # The round and the next nonce are committed together
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.execute('''
+                    INSERT INTO fair_rounds
+                    (user_id, chain_no, nonce, client_seed, game_id, params, bet_amount, win_amount, won)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (user_id, state["chain_no"], nonce, state["client_seed"], game_id,
+                      json.dumps(params), bet_amount, result['win_amount'], bool(result['won'])))
+                conn.execute('UPDATE fair_clients SET next_nonce = ? WHERE user_id = ?', (nonce + 1, user_id))
+                conn.commit()
+                round_id = cursor.lastrowid
+        except Exception as e:
+            logger.error(f"Error recording fair round: {e}")
+            # Reload from the database next time instead of trusting the cached nonce
+            self._states.pop(user_id, None)
+            return None
+        state["nonce"] = nonce + 1
+
+        self.stats["rounds"] += 1
+        result['fair_round_id'] = round_id
+        result['nonce'] = nonce
+        result['server_seed_hash'] = hashlib.sha256(server_seed).hexdigest()
+        if 'result_text' in result:
+            result['result_text'] += f"\n🔐 Tur #{round_id} · /verify {round_id}"
+        return result
+
+    # --- Verification ---------------------------------------------------------
+
+    def verify_round(self, round_id: int, user_id: int) -> Optional[Dict[str, Any]]:
+        """Recompute one of the user's stored rounds from its seeds
+
+        None when the round does not exist or belongs to another user.
+        """
+        from game_registry import get_game_registry
+
+        with self.db.get_connection() as conn:
+            row = conn.execute('SELECT * FROM fair_rounds WHERE round_id = ? AND user_id = ?',
+                               (round_id, user_id)).fetchone()
+            if row is None:
+                return None
+            seeds, anchor = self._load_chain(conn, row['user_id'], row['chain_no'])
+
+        server_seed = seeds[row['nonce']]
+        replay = get_game_registry().outcome(
+            row['game_id'], row['bet_amount'], row['user_id'],
+            rng=round_rng(server_seed, row['client_seed'], row['nonce']),
+            **json.loads(row['params'] or '{}')
+        )
+        self.stats["verifications"] += 1
+
+        commitment_ok = seed_matches_anchor(server_seed, row['nonce'], anchor)
+        outcome_ok = (replay is not None and replay.win_amount == row['win_amount']
+                      and bool(replay.won) == bool(row['won']))
+        return {
+            "round_id": round_id,
+            "user_id": row['user_id'],
+            "game_id": row['game_id'],
+            "bet_amount": row['bet_amount'],
+            "win_amount": row['win_amount'],
+            "won": bool(row['won']),
+            "server_seed": server_seed.hex(),
+            "server_seed_hash": hashlib.sha256(server_seed).hexdigest(),
+            "anchor": anchor,
+            "client_seed": row['client_seed'],
+            "nonce": row['nonce'],
+            "replay_win_amount": replay.win_amount if replay else None,
+            "commitment_ok": commitment_ok,
+            "outcome_ok": outcome_ok,
+            "verified": commitment_ok and outcome_ok
+        }
+
+    # --- User settings --------------------------------------------------------
+
+    def get_user_state(self, user_id: int) -> Dict[str, Any]:
+        """Public commitments and seeds of a user"""
+        state = self._state(user_id)
+        return {
+            "client_seed": state["client_seed"],
+            "chain_no": state["chain_no"],
+            "nonce": state["nonce"],
+            "rounds_left": len(state["seeds"]) - state["nonce"],
+            "anchor": state["anchor"],
+            "next_anchor": state["next_anchor"]
+        }
+
+    def set_client_seed(self, user_id: int, client_seed: str) -> bool:
+        """Change the client seed used from the next round on
+
+        Seeds are 1 to max_client_seed_length letters, digits, '_' or '-'.
+        """
+        client_seed = client_seed.strip()
+        if (len(client_seed) > self.config["max_client_seed_length"]
+                or not CLIENT_SEED_PATTERN.fullmatch(client_seed)):
+            return False
+        state = self._state(user_id)
+        try:
+            with self.db.get_connection() as conn:
+                conn.execute('UPDATE fair_clients SET client_seed = ? WHERE user_id = ?', (client_seed, user_id))
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Error setting client seed: {e}")
+            return False
+        state["client_seed"] = client_seed
+        return True
+
+    def get_recent_rounds(self, user_id: int, limit: int = 5) -> List[Dict[str, Any]]:
+        try:
+            with self.db.get_connection() as conn:
+                rows = conn.execute('''
+                    SELECT round_id, game_id, bet_amount, win_amount, won, nonce FROM fair_rounds
+                    WHERE user_id = ? ORDER BY round_id DESC LIMIT ?
+                ''', (user_id, limit)).fetchall()
+                return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error getting fair rounds: {e}")
+            return []
+
+# Global instance
+_fair_service = None
+
+def get_fair_service() -> ProvablyFairService:
+    """Get global provably-fair service instance"""
+    global _fair_service
+    if _fair_service is None:
+        _fair_service = ProvablyFairService()
+    return _fair_service
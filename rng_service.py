@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+RNG Service
+Oyun motorları için tamponlu, tohumlanabilir rastgele sayı servisi
+
+Random words are drawn in bulk blocks (NumPy PCG64, random.Random or
+os.urandom) into a buffer, and BufferedRandom hands out random-module style
+draws (random, randint, choice, choices, sample, uniform, shuffle) from it
+without a generator call per draw. Integer draws use rejection sampling, so
+they are unbiased in every mode.
+
+RNG_CONFIG['mode'] selects the shared generator:
+    fast   - seedable PRNG blocks (NumPy when installed)
+    crypto - os.urandom blocks
+
+`for_round(seed)` returns an independent deterministic generator, so a round
+played with the same seed replays identically.
+"""
+
+import hashlib
+import logging
+import os
+import random
+import sys
+from array import array
+from bisect import bisect
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from config import RNG_CONFIG
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+WORD_RANGE = 1 << 64
+FLOAT_SCALE = 2.0 ** -53
+
+def seed_to_int(seed: Any) -> int:
+    """Stable integer seed from an int, str or bytes round seed"""
+    if isinstance(seed, int):
+        return seed
+    if isinstance(seed, str):
+        seed = seed.encode()
+    return int.from_bytes(hashlib.sha256(seed).digest()[:16], 'big')
+
+def seeded_block_source(seed: Optional[int] = None) -> Callable[[int], bytes]:
+    """PRNG byte source - NumPy PCG64 when available, else random.Random"""
+    if NUMPY_AVAILABLE:
+        return np.random.default_rng(seed).bytes
+    return random.Random(seed).randbytes
+
+class BufferedRandom:
+    """random.Random-style draws served from a buffer of 64-bit words"""
+
+    def __init__(self, block_source: Callable[[int], bytes], block_size: int = 4096):
+        self._source = block_source  # block_source(n) -> n random bytes
+        self.block_size = block_size
+        self._words: List[int] = []
+        self.stats = {"blocks": 0, "words": 0}
+
+    def _refill(self):
+        words = array('Q')
+        words.frombytes(self._source(self.block_size * 8))
+        if sys.byteorder == 'big':
+            words.byteswap()
+        words = words.tolist()
+        words.reverse()  # pop() from the end hands words out in source order
+        self._words = words
+        self.stats["blocks"] += 1
+        self.stats["words"] += self.block_size
+
+    def word(self) -> int:
+        """Next uniform 64-bit integer"""
+        try:
+            return self._words.pop()
+        except IndexError:
+            self._refill()
+            return self._words.pop()
+
+    def random(self) -> float:
+        """Float in [0.0, 1.0) with 53 random bits"""
+        return (self.word() >> 11) * FLOAT_SCALE
+
+    def randbelow(self, n: int) -> int:
+        """Unbiased integer in [0, n)"""
+        if not 0 < n <= WORD_RANGE:
+            raise ValueError(f"randbelow range out of bounds: {n}")
+        limit = WORD_RANGE - WORD_RANGE % n
+        while True:
+            word = self.word()
+            if word < limit:
+                return word % n
+
+    def randint(self, a: int, b: int) -> int:
+        return a + self.randbelow(b - a + 1)
+
+    def randrange(self, start: int, stop: int = None) -> int:
+        if stop is None:
+            start, stop = 0, start
+        return start + self.randbelow(stop - start)
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.random()
+
+    def choice(self, seq: Sequence):
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[self.randbelow(len(seq))]
+
+    def choices(self, population: Sequence, weights: Sequence = None, k: int = 1) -> list:
+        n = len(population)
+        if weights is None:
+            return [population[self.randbelow(n)] for _ in range(k)]
+        cum_weights = list(accumulate(weights))
+        if len(cum_weights) != n:
+            raise ValueError("The number of weights does not match the population")
+        total = cum_weights[-1]
+        return [population[bisect(cum_weights, self.random() * total, 0, n - 1)] for _ in range(k)]
+
+    def sample(self, population: Sequence, k: int) -> list:
+        """k distinct elements - partial Fisher-Yates"""
+        pool = list(population)
+        n = len(pool)
+        if not 0 <= k <= n:
+            raise ValueError("Sample larger than population or is negative")
+        for i in range(k):
+            j = i + self.randbelow(n - i)
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
+    def shuffle(self, items: list):
+        for i in range(len(items) - 1, 0, -1):
+            j = self.randbelow(i + 1)
+            items[i], items[j] = items[j], items[i]
+
+class RNGService:
+    """Shared buffered generator plus per-round replayable generators"""
+
+    def __init__(self, config: Dict[str, Any] = None):
+        self.config = config or RNG_CONFIG
+        self.mode = self.config.get("mode", "fast")
+        if self.mode not in ("fast", "crypto"):
+            raise ValueError(f"Unknown RNG mode: {self.mode}")
+
+        source = os.urandom if self.mode == "crypto" else seeded_block_source(self.config.get("seed"))
+        self.shared = BufferedRandom(source, self.config.get("block_size", 4096))
+        self.rounds_seeded = 0
+        logger.info(f"RNG service ready: mode={self.mode}, numpy={NUMPY_AVAILABLE}")
+
+    def for_round(self, seed: Any) -> BufferedRandom:
+        """Deterministic generator for one round - the same seed replays the same draws"""
+        self.rounds_seeded += 1
+        return BufferedRandom(seeded_block_source(seed_to_int(seed)),
+                              self.config.get("round_block_size", 64))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "numpy": NUMPY_AVAILABLE,
+            "buffered_words": len(self.shared._words),
+            "rounds_seeded": self.rounds_seeded,
+            **self.shared.stats
+        }
+
+# Global instance
+_rng_service = None
+
+def get_rng_service() -> RNGService:
+    """Get global RNG service instance"""
+    global _rng_service
+    if _rng_service is None:
+        _rng_service = RNGService()
+    return _rng_service
+
+def get_rng() -> BufferedRandom:
+    """The shared generator used by game engines by default"""
+    return get_rng_service().shared
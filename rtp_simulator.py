@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""
+RTP Simulator
+SoloGameEngine oyunlarının oyuncuya dönüş (RTP) oranlarını ölçen Monte Carlo simülatörü
+
+Each game's outcome distribution is reproduced in NumPy array form, so a
+chunk of a million rounds costs a handful of vector operations instead of a
+million engine calls. Payouts follow the engine exactly: the same multiplier
+tables, the same int() truncation of win amounts and the same
+_apply_admin_bonus adjustments for the chosen user profile.
+
+For every game and bet type the report gives RTP, variance, hit frequency
+and the player's maximum drawdown in bets. `--cross-check` plays a sample
+through the scalar engine and fails when the two disagree beyond sampling
+error, so the simulator cannot silently drift from the real games.
+
+    python rtp_simulator.py --rounds 100000000 --workers 8
+    python rtp_simulator.py --games crash,mines --profile admin --json
+    python rtp_simulator.py --rounds 1000000 --cross-check 200000
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from rng_service import get_rng_service
+from solo_games import SoloGameEngine
+
+PROFILES = ("none", "player", "admin")  # no user_id, regular user, admin user
+
+# --- Vectorised games -------------------------------------------------------
+# Every simulator takes (rng, n, bet, **params) and returns (win_amount, won)
+# arrays with the engine's own `won` flag, before the admin bonus step.
+
+SLOT_WEIGHTS = np.array([20, 18, 15, 15, 12, 8, 6, 4, 2], dtype=float)
+# 🍒 🍋 🍊 🍇 🔔 💎 🎰 ⭐ 🌟
+SLOT_TRIPLE_MULTIPLIERS = np.array([1.8, 1.8, 1.8, 1.8, 2.0, 6.0, 4.0, 2.5, 10.0])
+SLOT_DIAMOND, SLOT_STAR, SLOT_MEGA = 5, 7, 8
+
+RED_NUMBERS = np.zeros(37, dtype=bool)
+RED_NUMBERS[[1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36]] = True
+
+KENO_PAYOUTS = np.array([0, 0, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 25.0, 100.0, 1000.0])
+
+WHEEL_MULTIPLIERS = np.array([50.0, 25.0, 10.0, 7.5, 5.0, 3.0, 2.0, 1.5, 1.0])
+WHEEL_WEIGHTS = np.array([1, 2, 5, 8, 12, 15, 20, 25, 12], dtype=float)
+
+def _win_amount(bet: int, multiplier: np.ndarray) -> np.ndarray:
+    """int(bet_amount * multiplier) - truncation toward zero as in the engine"""
+    return np.trunc(bet * multiplier)
+
+def simulate_slots(rng: np.random.Generator, n: int, bet: int) -> Tuple[np.ndarray, np.ndarray]:
+    reels = rng.choice(len(SLOT_WEIGHTS), size=(n, 3), p=SLOT_WEIGHTS / SLOT_WEIGHTS.sum())
+    bonus = rng.random(n)
+    reels[bonus < 0.008] = SLOT_DIAMOND
+    reels[bonus < 0.003] = SLOT_MEGA
+
+    a, b, c = reels[:, 0], reels[:, 1], reels[:, 2]
+    triple = (a == b) & (b == c)
+    pair = ~triple & ((a == b) | (b == c) | (a == c))
+    special = ((reels == SLOT_DIAMOND) | (reels == SLOT_STAR) | (reels == SLOT_MEGA)).any(axis=1)
+
+    multiplier = np.where(triple, SLOT_TRIPLE_MULTIPLIERS[a],
+                          np.where(pair, 0.8, np.where(special, 0.05, 0.0)))
+    return _win_amount(bet, multiplier), multiplier > 0
+
+def simulate_roulette(rng: np.random.Generator, n: int, bet: int,
+                      bet_type: str = "color", bet_value: str = "red") -> Tuple[np.ndarray, np.ndarray]:
+    number = rng.integers(0, 37, size=n)
+    nonzero = number != 0
+
+    if bet_type == "number":
+        won = number == int(bet_value)
+        multiplier = np.where(won, 15.0, 0.0)
+    else:
+        if bet_type == "color":
+            won = nonzero & (RED_NUMBERS[number] if bet_value == "red" else ~RED_NUMBERS[number]) \
+                if bet_value in ("red", "black") else np.zeros(n, dtype=bool)
+        elif bet_type == "even_odd":
+            won = (nonzero & (number % 2 == 0)) if bet_value == "even" else \
+                (number % 2 == 1) if bet_value == "odd" else np.zeros(n, dtype=bool)
+        elif bet_type == "high_low":
+            won = (number >= 19) if bet_value == "high" else \
+                (nonzero & (number <= 18)) if bet_value == "low" else np.zeros(n, dtype=bool)
+        else:
+            won = np.zeros(n, dtype=bool)
+        multiplier = np.where(won, 1.3, 0.0)
+
+    # Zero consolation for losing bets
+    multiplier = np.where(~nonzero & ~won, 0.1, multiplier)
+    return _win_amount(bet, multiplier), won | (multiplier > 0)
+
+def _hand_totals(hard: np.ndarray, aces: np.ndarray) -> np.ndarray:
+    """Blackjack total - one ace counts 11 when it does not bust"""
+    return np.where((aces > 0) & (hard + 10 <= 21), hard + 10, hard)
+
+def simulate_blackjack(rng: np.random.Generator, n: int, bet: int) -> Tuple[np.ndarray, np.ndarray]:
+    cards = rng.integers(1, 14, size=(n, 4))
+    player, dealer = cards[:, :2], cards[:, 2:]
+    player_value = _hand_totals(np.minimum(player, 10).sum(axis=1), (player == 1).sum(axis=1))
+    dealer_hard = np.minimum(dealer, 10).sum(axis=1)
+    dealer_aces = (dealer == 1).sum(axis=1)
+    dealer_value = _hand_totals(dealer_hard, dealer_aces)
+
+    player_blackjack = player_value == 21
+    dealer_blackjack = dealer_value == 21
+
+    # Dealer draws to 17 unless the player has blackjack
+    drawing = ~player_blackjack & (dealer_value < 17)
+    while drawing.any():
+        index = np.flatnonzero(drawing)
+        card = rng.integers(1, 14, size=index.size)
+        dealer_hard[index] += np.minimum(card, 10)
+        dealer_aces[index] += card == 1
+        dealer_value[index] = _hand_totals(dealer_hard[index], dealer_aces[index])
+        drawing[index] = dealer_value[index] < 17
+
+    multiplier = np.select(
+        [player_blackjack & dealer_blackjack,
+         player_blackjack,
+         player_value > 21,
+         dealer_value > 21,
+         player_value > dealer_value,
+         player_value == dealer_value],
+        [1.0, 2.2, 0.0, 1.8, 1.8, 1.0],
+        default=0.0
+    )
+    return _win_amount(bet, multiplier), multiplier > 1
+
+def simulate_crash(rng: np.random.Generator, n: int, bet: int,
+                   cashout_multiplier: float = 2.0) -> Tuple[np.ndarray, np.ndarray]:
+    band = rng.random(n)
+    low = np.select([band < 0.33, band < 0.66, band < 0.90], [1.0, 2.0, 5.0], default=20.0)
+    high = np.select([band < 0.33, band < 0.66, band < 0.90], [2.0, 5.0, 20.0], default=100.0)
+    crash_point = low + (high - low) * rng.random(n)
+
+    won = crash_point >= cashout_multiplier
+    multiplier = np.where(won, cashout_multiplier, 0.0)
+    return _win_amount(bet, multiplier), won
+
+def simulate_mines(rng: np.random.Generator, n: int, bet: int,
+                   mines_count: int = 3, picks: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+    # Mines and picks are independent random subsets of 25 cells, so the
+    # number of mines hit is hypergeometric
+    hit_mines = rng.hypergeometric(mines_count, 25 - mines_count, picks, size=n)
+    won = hit_mines == 0
+    multiplier = np.where(won, 0.8 + mines_count * 0.2 + picks * 0.25, 0.0)
+    return _win_amount(bet, multiplier), won
+
+def simulate_baccarat(rng: np.random.Generator, n: int, bet: int,
+                      bet_on: str = "player") -> Tuple[np.ndarray, np.ndarray]:
+    points = np.minimum(rng.integers(1, 14, size=(n, 6)), 10)
+    player_value = points[:, :2].sum(axis=1) % 10
+    banker_value = points[:, 2:4].sum(axis=1) % 10
+
+    # Simplified third card rules: player draws on 0-5; banker draws on 0-5 only if the player stood
+    naturals = (player_value >= 8) | (banker_value >= 8)
+    player_draws = ~naturals & (player_value <= 5)
+    banker_draws = ~naturals & ~player_draws & (banker_value <= 5)
+    player_value = np.where(player_draws, (player_value + points[:, 4]) % 10, player_value)
+    banker_value = np.where(banker_draws, (banker_value + points[:, 5]) % 10, banker_value)
+
+    if bet_on == "player":
+        won, payout = player_value > banker_value, 1.8
+    elif bet_on == "banker":
+        won, payout = banker_value > player_value, 1.8
+    elif bet_on == "tie":
+        won, payout = player_value == banker_value, 6.0
+    else:
+        won, payout = np.zeros(n, dtype=bool), 0.0
+
+    multiplier = np.where(won, payout, 0.0)
+    return _win_amount(bet, multiplier), multiplier > 0
+
+def simulate_keno(rng: np.random.Generator, n: int, bet: int, picks: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+    # Hits among `picks` distinct numbers when 20 of 80 are drawn
+    hits = rng.hypergeometric(20, 60, min(picks, 10), size=n)
+    return _win_amount(bet, KENO_PAYOUTS[hits]), hits >= 2
+
+def simulate_lucky_wheel(rng: np.random.Generator, n: int, bet: int) -> Tuple[np.ndarray, np.ndarray]:
+    sector = rng.choice(len(WHEEL_WEIGHTS), size=n, p=WHEEL_WEIGHTS / WHEEL_WEIGHTS.sum())
+    multiplier = WHEEL_MULTIPLIERS[sector]
+    return _win_amount(bet, multiplier), multiplier >= 1.0
+
+def simulate_dice(rng: np.random.Generator, n: int, bet: int, target: int = 4) -> Tuple[np.ndarray, np.ndarray]:
+    if target < 1 or target > 6:
+        target = 4
+    roll = rng.integers(1, 7, size=n)
+    multiplier = np.select(
+        [roll == target, np.abs(roll - target) == 1, roll == 6],
+        [6.0, 2.5, 2.0],
+        default=0.2
+    )
+    return _win_amount(bet, multiplier), multiplier > 0.5
+
+def apply_admin_bonus(rng: np.random.Generator, win_amount: np.ndarray, won: np.ndarray,
+                      bet: int, profile: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorised SoloGameEngine._apply_admin_bonus"""
+    if profile == "none":
+        return win_amount, won
+    chance = rng.random(win_amount.size)
+    if profile == "admin":
+        rescued = ~won & (chance < 0.3)
+        win_amount = np.where(won, np.trunc(win_amount * 1.5),
+                              np.where(rescued, math.trunc(bet * 1.5), win_amount))
+        return win_amount, won | rescued
+    return np.where(won & (chance < 0.15), np.trunc(win_amount * 0.7), win_amount), won
+
+# --- Game table -------------------------------------------------------------
+
+@dataclass
+class GameVariant:
+    """One game with fixed bet parameters"""
+    game: str
+    bet_type: str
+    simulate: Callable
+    play: Callable  # scalar engine call: play(engine, bet, user_id) -> outcome record
+    params: Dict
+
+    @property
+    def key(self) -> str:
+        return f"{self.game}/{self.bet_type}"
+
+def _variants() -> List[GameVariant]:
+    variants = [
+        GameVariant("slots", "spin", simulate_slots,
+                    lambda engine, bet, uid: engine.slots_outcome(bet, uid), {}),
+        GameVariant("blackjack", "hand", simulate_blackjack,
+                    lambda engine, bet, uid: engine.blackjack_outcome(bet, uid), {}),
+        GameVariant("lucky_wheel", "spin", simulate_lucky_wheel,
+                    lambda engine, bet, uid: engine.lucky_wheel_outcome(bet, uid), {}),
+    ]
+    for bet_type, bet_value in [("color", "red"), ("color", "black"), ("even_odd", "even"),
+                                ("even_odd", "odd"), ("high_low", "high"), ("high_low", "low"),
+                                ("number", "0"), ("number", "17")]:
+        variants.append(GameVariant(
+            "roulette", f"{bet_type}:{bet_value}", simulate_roulette,
+            lambda engine, bet, uid, t=bet_type, v=bet_value: engine.roulette_outcome(bet, t, v, uid),
+            {"bet_type": bet_type, "bet_value": bet_value}
+        ))
+    for cashout in (1.5, 2.0, 3.0, 5.0, 10.0, 50.0):
+        variants.append(GameVariant(
+            "crash", f"cashout:{cashout:g}x", simulate_crash,
+            lambda engine, bet, uid, c=cashout: engine.crash_outcome(bet, c, uid),
+            {"cashout_multiplier": cashout}
+        ))
+    for mines_count in (1, 3, 5, 10):
+        for picks in (1, 3, 5):
+            variants.append(GameVariant(
+                "mines", f"mines:{mines_count}/picks:{picks}", simulate_mines,
+                lambda engine, bet, uid, m=mines_count, p=picks: engine.mines_outcome(bet, m, p, uid),
+                {"mines_count": mines_count, "picks": picks}
+            ))
+    for bet_on in ("player", "banker", "tie"):
+        variants.append(GameVariant(
+            "baccarat", bet_on, simulate_baccarat,
+            lambda engine, bet, uid, b=bet_on: engine.baccarat_outcome(bet, b, uid),
+            {"bet_on": bet_on}
+        ))
+    for picks in (1, 2, 5, 10):
+        variants.append(GameVariant(
+            "keno", f"picks:{picks}", simulate_keno,
+            lambda engine, bet, uid, p=picks: engine.keno_outcome(bet, engine.rng.sample(range(1, 81), p), uid),
+            {"picks": picks}
+        ))
+    for target in range(1, 7):
+        variants.append(GameVariant(
+            "dice", f"target:{target}", simulate_dice,
+            lambda engine, bet, uid, t=target: engine.dice_outcome(bet, t, uid),
+            {"target": target}
+        ))
+    return variants
+
+GAME_VARIANTS = _variants()
+GAMES = sorted({variant.game for variant in GAME_VARIANTS})
+
+# --- Statistics -------------------------------------------------------------
+
+@dataclass
+class RunStats:
+    """Mergeable summary of a sequence of rounds (returns in units of the bet)"""
+    rounds: int = 0
+    total_return: float = 0.0
+    total_return_sq: float = 0.0
+    hits: int = 0        # rounds paying anything
+    wins: int = 0        # rounds the engine flags as won
+    max_return: float = 0.0
+    net: float = 0.0     # cumulative player profit
+    max_prefix: float = 0.0
+    min_prefix: float = 0.0
+    max_drawdown: float = 0.0
+
+    @classmethod
+    def from_chunk(cls, returns: np.ndarray, won: np.ndarray) -> "RunStats":
+        cumulative = np.cumsum(returns - 1.0)
+        peak = np.maximum(np.maximum.accumulate(cumulative), 0.0)
+        return cls(
+            rounds=returns.size,
+            total_return=float(returns.sum()),
+            total_return_sq=float(np.dot(returns, returns)),
+            hits=int(np.count_nonzero(returns)),
+            wins=int(np.count_nonzero(won)),
+            max_return=float(returns.max()),
+            net=float(cumulative[-1]),
+            max_prefix=max(0.0, float(cumulative.max())),
+            min_prefix=min(0.0, float(cumulative.min())),
+            max_drawdown=float((peak - cumulative).max())
+        )
+
+    def merge(self, later: "RunStats") -> "RunStats":
+        """Stats of this sequence followed by `later`"""
+        if not self.rounds:
+            return later
+        if not later.rounds:
+            return self
+        return RunStats(
+            rounds=self.rounds + later.rounds,
+            total_return=self.total_return + later.total_return,
+            total_return_sq=self.total_return_sq + later.total_return_sq,
+            hits=self.hits + later.hits,
+            wins=self.wins + later.wins,
+            max_return=max(self.max_return, later.max_return),
+            net=self.net + later.net,
+            max_prefix=max(self.max_prefix, self.net + later.max_prefix),
+            min_prefix=min(self.min_prefix, self.net + later.min_prefix),
+            max_drawdown=max(self.max_drawdown, later.max_drawdown,
+                             self.max_prefix - (self.net + later.min_prefix))
+        )
+
+    @property
+    def rtp(self) -> float:
+        return self.total_return / self.rounds if self.rounds else 0.0
+
+    @property
+    def variance(self) -> float:
+        if self.rounds < 2:
+            return 0.0
+        mean = self.rtp
+        return max(0.0, (self.total_return_sq - self.rounds * mean * mean) / (self.rounds - 1))
+
+    @property
+    def standard_error(self) -> float:
+        return math.sqrt(self.variance / self.rounds) if self.rounds else 0.0
+
+    def summary(self) -> Dict:
+        return {
+            "rounds": self.rounds,
+            "rtp": self.rtp,
+            "rtp_standard_error": self.standard_error,
+            "house_edge": 1.0 - self.rtp,
+            "variance": self.variance,
+            "std_dev": math.sqrt(self.variance),
+            "hit_frequency": self.hits / self.rounds if self.rounds else 0.0,
+            "win_frequency": self.wins / self.rounds if self.rounds else 0.0,
+            "max_return": self.max_return,
+            "max_drawdown": self.max_drawdown,
+            "final_net": self.net
+        }
+
+# --- Runner -----------------------------------------------------------------
+
+def _variant(key: str) -> GameVariant:
+    return next(variant for variant in GAME_VARIANTS if variant.key == key)
+
+def simulate_variant(key: str, rounds: int, seed, profile: str = "player",
+                     bet: int = 100, chunk_size: int = 1_000_000) -> RunStats:
+    """Simulate `rounds` rounds of one game variant in chunks"""
+    variant = _variant(key)
+    rng = np.random.default_rng(seed)
+    stats = RunStats()
+    remaining = rounds
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        win_amount, won = variant.simulate(rng, n, bet, **variant.params)
+        win_amount, won = apply_admin_bonus(rng, win_amount, won, bet, profile)
+        stats = stats.merge(RunStats.from_chunk(win_amount / bet, won))
+        remaining -= n
+    return stats
+
+def run_simulation(keys: List[str], rounds: int, profile: str = "player", bet: int = 100,
+                   chunk_size: int = 1_000_000, seed: Optional[int] = None,
+                   workers: int = 1) -> Dict[str, RunStats]:
+    """Simulate every variant; with workers > 1 each variant's rounds are split
+    into independent streams and the partial stats merged in order"""
+    root = np.random.SeedSequence(seed)
+    streams = max(1, workers)
+    jobs = []
+    for key, variant_seed in zip(keys, root.spawn(len(keys))):
+        share, extra = divmod(rounds, streams)
+        for index, stream_seed in enumerate(variant_seed.spawn(streams)):
+            count = share + (1 if index < extra else 0)
+            if count:
+                jobs.append((key, count, stream_seed, profile, bet, chunk_size))
+
+    if streams == 1:
+        partials = [simulate_variant(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = list(pool.map(simulate_variant, *zip(*jobs)))
+
+    results = {key: RunStats() for key in keys}
+    for job, partial in zip(jobs, partials):
+        results[job[0]] = results[job[0]].merge(partial)
+    return results
+
+def _profile_user_id(profile: str) -> Optional[int]:
+    """A user id that makes the scalar engine apply the profile's bonus rules"""
+    if profile == "none":
+        return None
+    try:
+        from config import ADMIN_USER_IDS
+    except ImportError:
+        ADMIN_USER_IDS = []
+    if profile == "admin":
+        if not ADMIN_USER_IDS:
+            raise ValueError("No ADMIN_USER_IDS configured for the admin profile")
+        return ADMIN_USER_IDS[0]
+    return max(ADMIN_USER_IDS, default=0) + 1
+
+def cross_check(keys: List[str], rounds: int, profile: str = "player", bet: int = 100,
+                seed: Optional[int] = None, tolerance: float = 4.0) -> Dict[str, Dict]:
+    """Compare the vectorised simulator with the scalar engine on `rounds` rounds each
+
+    A variant passes when RTP and win frequency agree within `tolerance`
+    combined standard errors.
+    """
+    user_id = _profile_user_id(profile)
+    engine = SoloGameEngine(get_rng_service().for_round(seed) if seed is not None else None)
+    vector = run_simulation(keys, rounds, profile, bet, seed=seed)
+    report = {}
+    for key in keys:
+        play = _variant(key).play
+        returns = np.empty(rounds)
+        won = np.empty(rounds, dtype=bool)
+        for i in range(rounds):
+            result = play(engine, bet, user_id)
+            returns[i] = result.win_amount / bet
+            won[i] = result.won
+        scalar = RunStats.from_chunk(returns, won)
+
+        rtp_error = math.hypot(scalar.standard_error, vector[key].standard_error) or 1e-12
+        p_scalar, p_vector = scalar.wins / rounds, vector[key].wins / rounds
+        win_error = math.sqrt((p_scalar * (1 - p_scalar) + p_vector * (1 - p_vector)) / rounds) or 1e-12
+        rtp_z = abs(scalar.rtp - vector[key].rtp) / rtp_error
+        win_z = abs(p_scalar - p_vector) / win_error
+        report[key] = {
+            "scalar_rtp": scalar.rtp,
+            "vector_rtp": vector[key].rtp,
+            "rtp_z": rtp_z,
+            "scalar_win_frequency": p_scalar,
+            "vector_win_frequency": p_vector,
+            "win_z": win_z,
+            "passed": rtp_z <= tolerance and win_z <= tolerance
+        }
+    return report
+
+def _print_report(results: Dict[str, Dict], profile: str, elapsed: float):
+    total = sum(summary["rounds"] for summary in results.values())
+    print(f"\n🎰 RTP simulation - profile: {profile}, {total:,} rounds in {elapsed:.1f}s "
+          f"({total / max(elapsed, 1e-9):,.0f} rounds/s)\n")
+    print(f"{'game/bet_type':<30} {'RTP':>9} {'±':>8} {'variance':>10} {'hit %':>7} {'win %':>7} {'max DD':>10}")
+    for key, summary in results.items():
+        print(f"{key:<30} {summary['rtp']:>9.4%} {summary['rtp_standard_error']:>8.4%} "
+              f"{summary['variance']:>10.3f} {summary['hit_frequency']:>7.2%} "
+              f"{summary['win_frequency']:>7.2%} {summary['max_drawdown']:>10,.0f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo RTP simulator for SoloGameEngine games")
+    parser.add_argument("--games", default="all", help=f"comma separated: {','.join(GAMES)}")
+    parser.add_argument("--rounds", type=float, default=1e6, help="rounds per game/bet_type")
+    parser.add_argument("--profile", choices=PROFILES, default="player",
+                        help="admin bonus rules to apply (default: regular user)")
+    parser.add_argument("--bet", type=int, default=100)
+    parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--cross-check", type=int, default=0, metavar="ROUNDS",
+                        help="also play ROUNDS rounds per variant through the scalar engine and compare")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    games = GAMES if args.games == "all" else args.games.split(",")
+    unknown = set(games) - set(GAMES)
+    if unknown:
+        parser.error(f"unknown games: {', '.join(sorted(unknown))}")
+    keys = [variant.key for variant in GAME_VARIANTS if variant.game in games]
+
+    started = time.perf_counter()
+    stats = run_simulation(keys, int(args.rounds), args.profile, args.bet,
+                           args.chunk_size, args.seed, args.workers)
+    elapsed = time.perf_counter() - started
+    results = {key: stats[key].summary() for key in keys}
+
+    checks = cross_check(keys, args.cross_check, args.profile, args.bet, args.seed) if args.cross_check else None
+
+    if args.json:
+        print(json.dumps({"profile": args.profile, "elapsed": elapsed, "results": results,
+                          "cross_check": checks}, indent=2))
+    else:
+        _print_report(results, args.profile, elapsed)
+        if checks:
+            print(f"\n🔍 Cross-check against the scalar engine ({args.cross_check:,} rounds each)\n")
+            for key, check in checks.items():
+                print(f"{'✅' if check['passed'] else '❌'} {key:<30} scalar {check['scalar_rtp']:.4%} "
+                      f"vector {check['vector_rtp']:.4%} (z={check['rtp_z']:.2f}, win z={check['win_z']:.2f})")
+
+    if checks and not all(check["passed"] for check in checks.values()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -20,8 +20,10 @@ from solders.system_program import transfer
 from solders.transaction import Transaction
 from solders.signature import Signature
 
-from solana_rpc_client import get_solana_rpc_client
+from solana_rpc_client import get_solana_rpc_client, RPCPriority
 from solana_transaction_monitor import get_transaction_monitor, TransactionType
+from solana_withdrawal_pipeline import WithdrawalPipeline, WithdrawalTransfer
+from solana_balance_cache import get_balance_cache
 from config import SOLANA_CONFIG, ADMIN_USER_IDS
 
 logger = logging.getLogger(__name__)
@@ -65,6 +67,8 @@ class SolanaAdminWalletManager:
         self.db_path = db_path
         self.rpc_client = get_solana_rpc_client()
         self.transaction_monitor = get_transaction_monitor()
+        self.balance_cache = get_balance_cache()
+        self.balance_cache.add_listener(self._persist_balances)
         self.config = SOLANA_CONFIG
 
         # Wallet instances
@@ -76,10 +80,12 @@ class SolanaAdminWalletManager:
         self.min_withdrawal_balance = 1.0  # SOL
         self.max_single_transaction = 100.0  # SOL
         self.daily_transaction_limit = 1000.0  # SOL
+        self.withdrawal_balance_max_age = 10  # seconds - balance checks before sending
+        self.pending_withdrawal_expiry = 300  # seconds - an unseen pending withdrawal is dropped after this
 
         # Transaction tracking
         self.daily_transactions = {}  # date -> amount
-        self.pending_transactions = {}  # signature -> transaction_info
+        self.pending_transactions = {}  # signature -> {"date", "amount_sol"} of in-doubt withdrawals
 
         # Initialize database and load wallets
         self.init_wallet_tables()
@@ -131,6 +137,23 @@ class SolanaAdminWalletManager:
                 )
             """)
 
+            # Balance history - one row per observed balance change
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS admin_wallet_balance_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    wallet_address TEXT NOT NULL,
+                    balance_lamports INTEGER NOT NULL,
+                    balance_sol REAL NOT NULL,
+                    slot INTEGER,
+                    source TEXT,
+                    recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_admin_wallet_balance_history
+                ON admin_wallet_balance_history (wallet_address, recorded_at)
+            """)
+
             # Wallet settings table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS admin_wallet_settings (
@@ -196,6 +219,7 @@ class SolanaAdminWalletManager:
                 )
 
                 self.wallets[wallet.address] = wallet
+                self.balance_cache.watch(wallet.address)
 
                 # Load keypair if private key exists
                 if wallet.private_key_encrypted:
@@ -211,8 +235,9 @@ class SolanaAdminWalletManager:
             conn.close()
             logger.info(f"Loaded {len(self.wallets)} admin wallets")
 
-            # Start monitoring wallets
+            # Start monitoring wallets and the scheduled balance refresh
             await self.start_wallet_monitoring()
+            self.balance_cache.start()
 
         except Exception as e:
             logger.error(f"Error loading wallets: {e}")
@@ -243,7 +268,8 @@ class SolanaAdminWalletManager:
                 return {"error": f"Generated invalid address: {validation['error']}"}
 
             # Get initial balance
-            balance_info = await self.rpc_client.get_balance(address)
+            self.balance_cache.watch(address)
+            balance_info = await self.balance_cache.get(address, max_age=0)
             balance_sol = balance_info.get("balance_sol", 0.0)
             balance_lamports = balance_info.get("balance_lamports", 0)
 
@@ -316,14 +342,11 @@ class SolanaAdminWalletManager:
 
         wallet = self.wallets[address]
 
-        # Get current balance
-        balance_info = await self.rpc_client.get_balance(address)
-
-        # Update wallet balance
+        # Cached balance - refreshed first only when older than the staleness bound
+        balance_info = await self.balance_cache.get(address)
         if not balance_info.get("error"):
             wallet.balance_sol = balance_info["balance_sol"]
             wallet.balance_lamports = balance_info["balance_lamports"]
-            await self.update_wallet_balance(address, wallet.balance_sol, wallet.balance_lamports)
 
         return {
             "address": wallet.address,
@@ -338,13 +361,18 @@ class SolanaAdminWalletManager:
             "total_received": wallet.total_received,
             "total_sent": wallet.total_sent,
             "description": wallet.description,
-            "has_private_key": address in self.keypairs
+            "has_private_key": address in self.keypairs,
+            "balance_age_seconds": balance_info.get("age_seconds"),
+            "balance_stale": balance_info.get("stale", True)
         }
 
     async def list_wallets(self, role: WalletRole = None) -> List[Dict[str, Any]]:
         """List all admin wallets"""
         wallets_info = []
 
+        # One refresh for every outdated balance instead of one per wallet
+        await self.balance_cache.get_many(list(self.wallets))
+
         for address, wallet in self.wallets.items():
             if role is None or wallet.role == role:
                 wallet_info = await self.get_wallet_info(address)
@@ -380,7 +408,9 @@ class SolanaAdminWalletManager:
 
             # Check wallet balance
             wallet = self.wallets[from_address]
-            balance_info = await self.rpc_client.get_balance(from_address)
+            balance_info = await self.balance_cache.get(
+                from_address, self.withdrawal_balance_max_age, RPCPriority.WITHDRAWAL
+            )
             current_balance = balance_info.get("balance_sol", 0.0)
 
             if current_balance < amount_sol + 0.001:  # +0.001 for transaction fee
@@ -391,6 +421,7 @@ class SolanaAdminWalletManager:
 
             if result.get("success"):
                 # Update tracking
+                self.balance_cache.invalidate(from_address)
                 self.daily_transactions[today] = daily_total + amount_sol
                 wallet.last_used = datetime.now()
                 wallet.transaction_count += 1
@@ -414,11 +445,20 @@ class SolanaAdminWalletManager:
             return {"error": str(e)}
 
     async def bulk_withdrawal(self, transactions: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Process multiple withdrawals in batch"""
+        """Process multiple withdrawals in batch
+
+        Transfers are packed into multi-transfer transactions, submitted
+        concurrently and confirmed with batched status polls; only the
+        transfers that failed are retried. Transfers still unconfirmed at the
+        deadline are stored as 'pending' rows and count against the daily
+        limit until resolve_pending_withdrawals() settles them.
+        """
         results = []
         total_amount = 0.0
 
         try:
+            await self.resolve_pending_withdrawals()
+
             # Validate all transactions first
             for tx in transactions:
                 if not all(key in tx for key in ["to_address", "amount_sol"]):
@@ -432,49 +472,114 @@ class SolanaAdminWalletManager:
             if daily_total + total_amount > self.daily_transaction_limit:
                 return {"error": f"Bulk transaction would exceed daily limit"}
 
-            # Find best wallet for withdrawals
-            withdrawal_wallet = None
-            for address, wallet in self.wallets.items():
+            # Find best wallet for withdrawals - all candidate balances in one request
+            candidates = [
+                address for address, wallet in self.wallets.items()
                 if (wallet.role == WalletRole.WITHDRAWAL and
                     wallet.status == WalletStatus.ACTIVE and
-                    address in self.keypairs):
-                    balance_info = await self.rpc_client.get_balance(address)
-                    if balance_info.get("balance_sol", 0.0) >= total_amount + 0.01:  # +0.01 for fees
-                        withdrawal_wallet = address
-                        break
+                    address in self.keypairs)
+            ]
+            balances = await self.balance_cache.get_many(
+                candidates, self.withdrawal_balance_max_age, RPCPriority.WITHDRAWAL
+            )
+            withdrawal_wallet = None
+            for address in candidates:
+                if balances.get(address, {}).get("balance_sol", 0.0) >= total_amount + 0.01:  # +0.01 for fees
+                    withdrawal_wallet = address
+                    break
 
             if not withdrawal_wallet:
                 return {"error": "No suitable withdrawal wallet found"}
 
-            # Process transactions
-            successful_count = 0
-            total_sent = 0.0
-
-            for tx in transactions:
-                result = await self.send_sol(
-                    withdrawal_wallet,
-                    tx["to_address"],
-                    tx["amount_sol"],
-                    tx.get("memo", f"Bulk withdrawal {len(results)+1}")
+            # Per-transfer checks - a bad entry fails alone, the rest still go out
+            transfers = []
+            for index, tx in enumerate(transactions):
+                transfer = WithdrawalTransfer(
+                    index=index,
+                    to_address=tx["to_address"],
+                    lamports=int(round(tx["amount_sol"] * 1_000_000_000)),
+                    memo=tx.get("memo")
                 )
-
+                validation = self.rpc_client.validate_wallet_address(tx["to_address"])
+                if not validation["is_valid"]:
+                    transfer.error = f"Invalid destination address: {validation['error']}"
+                elif tx["amount_sol"] > self.max_single_transaction:
+                    transfer.error = f"Amount exceeds single transaction limit ({self.max_single_transaction} SOL)"
+                elif transfer.lamports <= 0:
+                    transfer.error = "Amount must be greater than 0"
+                transfers.append(transfer)
+
+            pipeline = WithdrawalPipeline(self.keypairs[withdrawal_wallet], self.rpc_client)
+            await pipeline.run(transfers)
+            self.balance_cache.invalidate(withdrawal_wallet)
+
+            # Process results
+            successful = [transfer for transfer in transfers if transfer.confirmed]
+            in_doubt = [transfer for transfer in transfers if transfer.in_doubt]
+            total_sent = sum(transfer.amount_sol for transfer in successful)
+            total_pending = sum(transfer.amount_sol for transfer in in_doubt)
+
+            for transfer in transfers:
+                if transfer.confirmed:
+                    result = {
+                        "success": True,
+                        "signature": transfer.signature,
+                        "from_address": withdrawal_wallet,
+                        "to_address": transfer.to_address,
+                        "amount_sol": transfer.amount_sol,
+                        "amount_lamports": transfer.lamports,
+                        "memo": transfer.memo
+                    }
+                else:
+                    result = {"error": transfer.error, "signature": transfer.signature,
+                              "in_doubt": transfer.in_doubt}
                 results.append({
-                    "to_address": tx["to_address"],
-                    "amount_sol": tx["amount_sol"],
+                    "to_address": transfer.to_address,
+                    "amount_sol": transactions[transfer.index]["amount_sol"],
                     "result": result
                 })
 
-                if result.get("success"):
-                    successful_count += 1
-                    total_sent += tx["amount_sol"]
-
-                # Small delay between transactions
-                await asyncio.sleep(0.5)
+            if successful:
+                # Update tracking once for the whole batch
+                self.daily_transactions[today] = self.daily_transactions.get(today, 0.0) + total_sent
+                wallet = self.wallets[withdrawal_wallet]
+                wallet.last_used = datetime.now()
+                wallet.transaction_count += len(successful)
+                wallet.total_sent += total_sent
+
+                await self.store_wallet_transactions([
+                    (withdrawal_wallet, transfer.signature, "withdrawal", transfer.amount_sol,
+                     withdrawal_wallet, transfer.to_address, transfer.memo)
+                    for transfer in successful
+                ])
+                await self.update_wallet_stats(withdrawal_wallet)
+
+            if in_doubt:
+                # These may still land - keep them on the books so nobody resends them
+                self.daily_transactions[today] = self.daily_transactions.get(today, 0.0) + total_pending
+                for transfer in in_doubt:
+                    entry = self.pending_transactions.setdefault(transfer.signature, {"date": today, "amount_sol": 0.0})
+                    entry["amount_sol"] += transfer.amount_sol
+                await self.store_wallet_transactions([
+                    (withdrawal_wallet, transfer.signature, "withdrawal", transfer.amount_sol,
+                     withdrawal_wallet, transfer.to_address, transfer.memo)
+                    for transfer in in_doubt
+                ], status='pending')
+                logger.warning(f"Bulk withdrawal from {withdrawal_wallet}: {len(in_doubt)} transfers "
+                               f"({total_pending} SOL) unconfirmed, stored as pending")
+
+            logger.info(
+                f"Bulk withdrawal from {withdrawal_wallet}: {len(successful)}/{len(transactions)} sent, "
+                f"{total_sent} SOL, pipeline stats {pipeline.get_stats()}"
+            )
 
             return {
                 "total_transactions": len(transactions),
-                "successful_transactions": successful_count,
+                "successful_transactions": len(successful),
+                "pending_transactions": len(in_doubt),
                 "total_amount_sent": total_sent,
+                "total_amount_pending": total_pending,
+                "onchain_transactions": pipeline.stats["transactions"],
                 "results": results
             }
 
@@ -482,6 +587,77 @@ class SolanaAdminWalletManager:
             logger.error(f"Error in bulk withdrawal: {e}")
             return {"error": str(e)}
 
+    async def resolve_pending_withdrawals(self) -> Dict[str, int]:
+        """Settle 'pending' withdrawal rows with one signature status lookup
+
+        Landed signatures become 'confirmed' and count as sent; failed ones,
+        and ones the cluster still has not seen after pending_withdrawal_expiry
+        (their blockhash is long gone), become 'failed' and are released from
+        the daily limit. Anything else stays pending.
+        """
+        resolved = {"confirmed": 0, "failed": 0}
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                rows = conn.execute("""
+                    SELECT signature, wallet_address, COUNT(*), SUM(amount_sol),
+                           MIN(created_at) < datetime('now', ?)
+                    FROM admin_wallet_transactions
+                    WHERE status = 'pending' AND transaction_type = 'withdrawal'
+                    GROUP BY signature, wallet_address
+                """, (f"-{self.pending_withdrawal_expiry} seconds",)).fetchall()
+            finally:
+                conn.close()
+            if not rows:
+                return resolved
+
+            result = await self.rpc_client.get_signature_statuses(
+                [row[0] for row in rows], RPCPriority.WITHDRAWAL, search_history=True
+            )
+            statuses = result["statuses"]
+
+            updates = []
+            for signature, wallet_address, count, amount_sol, expired in rows:
+                if signature not in statuses:
+                    continue  # lookup failed - try again next time
+                status = statuses[signature]
+                if status and not status.get("err") and status.get("confirmationStatus") in ("confirmed", "finalized"):
+                    updates.append(("confirmed", signature))
+                    resolved["confirmed"] += count
+                    wallet = self.wallets.get(wallet_address)
+                    if wallet:
+                        wallet.transaction_count += count
+                        wallet.total_sent += amount_sol
+                        wallet.last_used = datetime.now()
+                    self.pending_transactions.pop(signature, None)
+                elif (status and status.get("err")) or (status is None and expired):
+                    updates.append(("failed", signature))
+                    resolved["failed"] += count
+                    entry = self.pending_transactions.pop(signature, None)
+                    if entry:
+                        self.daily_transactions[entry["date"]] = max(
+                            0.0, self.daily_transactions.get(entry["date"], 0.0) - entry["amount_sol"]
+                        )
+
+            if updates:
+                conn = sqlite3.connect(self.db_path)
+                try:
+                    conn.executemany("""
+                        UPDATE admin_wallet_transactions
+                        SET status = ?, confirmed_at = CASE WHEN ? = 'confirmed' THEN CURRENT_TIMESTAMP END
+                        WHERE signature = ? AND status = 'pending'
+                    """, [(status, status, signature) for status, signature in updates])
+                    conn.commit()
+                finally:
+                    conn.close()
+                for wallet_address in {row[1] for row in rows}:
+                    await self.update_wallet_stats(wallet_address)
+                logger.info(f"Resolved pending withdrawals: {resolved}")
+
+        except Exception as e:
+            logger.error(f"Error resolving pending withdrawals: {e}")
+        return resolved
+
     async def _wallet_transaction_callback(self, address: str, transaction):
         """Callback for wallet transaction monitoring"""
         try:
@@ -490,6 +666,10 @@ class SolanaAdminWalletManager:
 
             wallet = self.wallets[address]
 
+            # The transaction carries the wallet's new balance - no RPC call needed
+            if transaction.post_balances:
+                self.balance_cache.observe(address, transaction.slot, transaction.post_balances.get(address))
+
             # Store transaction
             await self.store_wallet_transaction(
                 address, transaction.signature, transaction.transaction_type.value,
@@ -535,25 +715,81 @@ class SolanaAdminWalletManager:
         finally:
             conn.close()
 
+    async def store_wallet_transactions(self, rows: List[tuple], status: str = 'confirmed'):
+        """Store many wallet transactions in one database transaction
+
+        Each row is (wallet_address, signature, transaction_type, amount_sol,
+        from_address, to_address, memo); every row gets `status`.
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+
+            cursor.executemany("""
+                INSERT INTO admin_wallet_transactions
+                (wallet_address, signature, transaction_type, amount_sol, amount_lamports,
+                 from_address, to_address, status, memo)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (wallet_address, signature, transaction_type, amount_sol,
+                 int(round(amount_sol * 1_000_000_000)), from_address, to_address, status, memo)
+                for wallet_address, signature, transaction_type, amount_sol, from_address, to_address, memo in rows
+            ])
+
+            conn.commit()
+
+        except Exception as e:
+            logger.error(f"Error storing wallet transactions: {e}")
+        finally:
+            conn.close()
+
     async def update_wallet_balance(self, address: str, balance_sol: float, balance_lamports: int):
         """Update wallet balance in database"""
+        await self.update_wallet_balances([(address, balance_lamports, None, "manual")])
+
+    async def update_wallet_balances(self, rows: List[tuple]):
+        """Update many wallet balances and append their history in one transaction
+
+        Each row is (address, balance_lamports, slot, source).
+        """
+        if not rows:
+            return
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
 
-            cursor.execute("""
+            cursor.executemany("""
                 UPDATE admin_wallets
                 SET balance_sol = ?, balance_lamports = ?
                 WHERE address = ?
-            """, (balance_sol, balance_lamports, address))
+            """, [(lamports / 1_000_000_000, lamports, address) for address, lamports, _, _ in rows])
+
+            cursor.executemany("""
+                INSERT INTO admin_wallet_balance_history
+                (wallet_address, balance_lamports, balance_sol, slot, source)
+                VALUES (?, ?, ?, ?, ?)
+            """, [(address, lamports, lamports / 1_000_000_000, slot, source) for address, lamports, slot, source in rows])
 
             conn.commit()
 
         except Exception as e:
-            logger.error(f"Error updating wallet balance: {e}")
+            logger.error(f"Error updating wallet balances: {e}")
         finally:
             conn.close()
 
+    async def _persist_balances(self, entries: List[Dict[str, Any]]):
+        """Balance cache listener - mirror changed balances into memory and the database"""
+        for entry in entries:
+            wallet = self.wallets.get(entry["address"])
+            if wallet:
+                wallet.balance_lamports = entry["balance_lamports"]
+                wallet.balance_sol = entry["balance_lamports"] / 1_000_000_000
+
+        await self.update_wallet_balances([
+            (entry["address"], entry["balance_lamports"], entry["slot"], entry["source"])
+            for entry in entries
+        ])
+
     async def update_wallet_stats(self, address: str):
         """Update wallet statistics in database"""
         try:
@@ -702,6 +938,7 @@ class SolanaAdminWalletManager:
                 "recent_transactions": recent_transactions,
                 "daily_stats": daily_stats,
                 "settings": settings,
+                "balance_cache": self.balance_cache.get_stats(),
                 "daily_limits": {
                     "used": self.daily_transactions.get(datetime.now().date(), 0.0),
                     "limit": self.daily_transaction_limit
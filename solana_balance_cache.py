@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Solana Wallet Balance Cache
+İzlenen cüzdan bakiyelerini tek getMultipleAccounts çağrısıyla tazeleyen önbellek
+
+Every watched address is refreshed by one getMultipleAccounts batch on a
+schedule. Transactions seen by the monitor update an entry at once from
+their post-transaction balance, ordered by slot so a late notification
+never overwrites a newer value. Readers get the cached value together with
+its age; anything older than the staleness bound they ask for is refreshed
+first, and concurrent readers share that one refresh.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from solana_rpc_client import get_solana_rpc_client, RPCPriority
+from config import SOLANA_CONFIG
+
+logger = logging.getLogger(__name__)
+
+class WalletBalanceCache:
+    """Shared, slot-ordered balance cache for watched wallets"""
+
+    def __init__(self, rpc_client=None, refresh_interval: float = None,
+                 max_staleness: float = None, flush_interval: float = None):
+        self.rpc_client = rpc_client or get_solana_rpc_client()
+        self.refresh_interval = refresh_interval or SOLANA_CONFIG.get("balance_refresh_interval", 60)
+        self.max_staleness = max_staleness or SOLANA_CONFIG.get("balance_max_staleness", 120)
+        self.flush_interval = flush_interval or SOLANA_CONFIG.get("balance_flush_interval", 10)
+
+        self._entries: Dict[str, Dict[str, Any]] = {}  # address -> cached balance
+        self._watched = set()
+        self._changed: Dict[str, Dict[str, Any]] = {}  # address -> entry not yet handed to listeners
+        self._listeners: List[Callable] = []
+        self._refresh_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._last_refresh = 0.0
+        self.stats = {"refreshes": 0, "refresh_errors": 0, "hits": 0, "misses": 0, "observed": 0}
+
+    def add_listener(self, callback: Callable):
+        """Register an async callback(entries) receiving changed balances in batches"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def watch(self, address: str):
+        """Include an address in every scheduled refresh"""
+        self._watched.add(address)
+
+    def unwatch(self, address: str):
+        self._watched.discard(address)
+        self._entries.pop(address, None)
+
+    def invalidate(self, address: str):
+        """Force the next read of this address to refresh"""
+        entry = self._entries.get(address)
+        if entry:
+            entry["updated_at"] = 0.0
+
+    def start(self):
+        """Start the scheduled refresh on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._flush()
+
+    async def _run(self):
+        """Refresh on schedule and hand changed balances to listeners"""
+        while True:
+            due = self._last_refresh + self.refresh_interval - time.monotonic()
+            await asyncio.sleep(max(0.0, min(due, self.flush_interval)))
+
+            try:
+                if time.monotonic() >= self._last_refresh + self.refresh_interval:
+                    await self.refresh(priority=RPCPriority.BACKGROUND)
+                await self._flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Balance cache loop error: {e}")
+
+    def _view(self, entry: Dict[str, Any], max_age: float) -> Dict[str, Any]:
+        """Copy of an entry with its age and staleness for callers"""
+        age = time.monotonic() - entry["updated_at"]
+        return {
+            "address": entry["address"],
+            "balance_lamports": entry["balance_lamports"],
+            "balance_sol": entry["balance_lamports"] / 1_000_000_000,
+            "exists": entry["exists"],
+            "slot": entry["slot"],
+            "source": entry["source"],
+            "updated_at": entry["fetched_at"].isoformat(),
+            "age_seconds": age,
+            "stale": age > max_age
+        }
+
+    def _store(self, address: str, lamports: int, slot: Optional[int], source: str, exists: bool = True) -> bool:
+        """Keep the newer value by slot; returns True when the entry changed"""
+        entry = self._entries.get(address)
+        if entry and slot is not None and entry["slot"] is not None and slot < entry["slot"]:
+            # Ours is already newer than this read - it still counts as checked now
+            entry["updated_at"] = time.monotonic()
+            return False
+
+        changed = entry is None or entry["balance_lamports"] != lamports
+        self._entries[address] = entry = {
+            "address": address,
+            "balance_lamports": lamports,
+            "exists": exists,
+            "slot": slot if slot is not None else (entry or {}).get("slot"),
+            "source": source,
+            "updated_at": time.monotonic(),
+            "fetched_at": datetime.now()
+        }
+        if changed:
+            self._changed[address] = entry
+        return changed
+
+    async def refresh(self, addresses: List[str] = None, priority: int = RPCPriority.ADMIN,
+                      max_age: float = None):
+        """Refresh every watched address (plus `addresses`) with one getMultipleAccounts batch
+
+        When max_age is given, a refresh that finished while waiting for the
+        lock satisfies the request and no new call is made.
+        """
+        requested = list(addresses or [])
+        async with self._refresh_lock:
+            now = time.monotonic()
+            if max_age is not None and all(
+                address in self._entries and now - self._entries[address]["updated_at"] <= max_age
+                for address in requested
+            ):
+                return
+
+            targets = list(dict.fromkeys(requested + list(self._watched)))
+            if not targets:
+                return
+
+            balances = await self.rpc_client.get_balances(targets, priority)
+            self.stats["refreshes"] += 1
+            self._last_refresh = time.monotonic()
+            for address, balance in balances.items():
+                if "error" in balance:
+                    self.stats["refresh_errors"] += 1
+                    continue
+                self._store(address, balance["balance_lamports"], balance.get("slot"), "rpc", balance["exists"])
+
+    async def get(self, address: str, max_age: float = None,
+                  priority: int = RPCPriority.ADMIN) -> Dict[str, Any]:
+        """Cached balance no older than max_age seconds (default: the staleness bound)
+
+        Returns the get_balance fields plus slot, age_seconds and stale. If a
+        needed refresh fails, the last known value comes back marked stale.
+        """
+        return (await self.get_many([address], max_age, priority))[address]
+
+    async def get_many(self, addresses: List[str], max_age: float = None,
+                       priority: int = RPCPriority.ADMIN) -> Dict[str, Dict[str, Any]]:
+        """Balances for many addresses - at most one refresh for all of them"""
+        max_age = self.max_staleness if max_age is None else max_age
+        now = time.monotonic()
+        outdated = [
+            address for address in addresses
+            if address not in self._entries or now - self._entries[address]["updated_at"] > max_age
+        ]
+        self.stats["hits"] += len(addresses) - len(outdated)
+        self.stats["misses"] += len(outdated)
+
+        if outdated:
+            try:
+                await self.refresh(outdated, priority, max_age)
+            except Exception as e:
+                logger.error(f"Balance refresh failed: {e}")
+
+        results = {}
+        for address in addresses:
+            entry = self._entries.get(address)
+            if entry:
+                results[address] = self._view(entry, max_age)
+            else:
+                results[address] = {
+                    "address": address, "error": "Balance unavailable",
+                    "balance_lamports": 0, "balance_sol": 0.0, "stale": True
+                }
+        return results
+
+    def observe(self, address: str, slot: int, balance_lamports: Optional[int]):
+        """Apply a balance seen in a confirmed transaction"""
+        if balance_lamports is None or address not in self._watched:
+            return
+        self.stats["observed"] += 1
+        # A refresh read at the same slot may already include later transactions
+        entry = self._entries.get(address)
+        if entry and entry["source"] == "rpc" and entry["slot"] is not None and slot <= entry["slot"]:
+            return
+        self._store(address, balance_lamports, slot, "transaction")
+
+    async def _flush(self):
+        """Hand changed balances to listeners as one batch"""
+        if not self._changed:
+            return
+        entries = list(self._changed.values())
+        self._changed.clear()
+        for callback in self._listeners:
+            try:
+                await callback(entries)
+            except Exception as e:
+                logger.error(f"Balance cache listener error: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        ages = [now - entry["updated_at"] for entry in self._entries.values()]
+        return {
+            **self.stats,
+            "watched": len(self._watched),
+            "cached": len(self._entries),
+            "oldest_age_seconds": max(ages) if ages else None,
+            "max_staleness": self.max_staleness
+        }
+
+# Global instance
+_balance_cache = None
+
+def get_balance_cache() -> WalletBalanceCache:
+    """Get global wallet balance cache instance"""
+    global _balance_cache
+    if _balance_cache is None:
+        _balance_cache = WalletBalanceCache()
+    return _balance_cache
@@ -21,12 +21,15 @@ async def start_automatic_deposit_detection(query, context, user, casino_bot, so
         # Kullanıcının bekleyen işlemlerini kontrol et
         pending_transactions = db.get_user_pending_transactions(user_id)
 
-        # En son sol_amount ile eşleşen işlemi bul
-        matching_transaction = None
-        for tx in pending_transactions:
-            if abs(float(tx[2]) - float(sol_amount)) < 0.001:  # expected_amount comparison
-                matching_transaction = tx
-                break
+        # Etiketli tutarla birebir eşleşen işlemi bul, yoksa en son yakın tutarlıyı
+        expected_lamports = round(float(sol_amount) * 1_000_000_000)
+        matching_transaction = next(
+            (tx for tx in pending_transactions if tx['expected_lamports'] == expected_lamports), None)
+        if not matching_transaction:
+            for tx in pending_transactions:
+                if abs(float(tx[2]) - float(sol_amount)) < 0.001:  # expected_amount comparison
+                    matching_transaction = tx
+                    break
 
         if not matching_transaction:
             await safe_edit_message(
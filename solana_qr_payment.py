@@ -5,23 +5,212 @@ QR code generation, transaction confirmation and automatic balance updates
 """
 
 import asyncio
+import bisect
 import logging
 import json
 import qrcode
 import io
 import base64
 import sqlite3
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from PIL import Image, ImageDraw, ImageFont
 import os
 
 from solana_rpc_client import get_solana_rpc_client
 from solana_payment import get_solana_payment
+from solana_transaction_monitor import get_signature_index
+from solana_subscriptions import get_subscription_manager
 from config import SOLANA_CONFIG
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class PendingConfirmation:
+    """A payment waiting for its on-chain transfer"""
+    confirmation_id: int
+    user_id: int
+    expected_amount: float
+    expected_lamports: int
+    wallet_address: str
+    created_at: datetime
+    timeout_at: datetime
+    deposit_id: Optional[int] = None
+    withdrawal_id: Optional[int] = None
+
+class WalletConfirmationMatcher:
+    """Resolves every open confirmation of one wallet from a single scan
+
+    Open confirmations are kept sorted by expected lamports, so each incoming
+    transfer finds its candidate with a bisect over the tolerance window.
+    The wallet's signatures are fetched once per interval, however many
+    payments are waiting.
+    """
+
+    def __init__(self, system: "SolanaQRPaymentSystem", wallet_address: str,
+                 tolerance_lamports: int = 1_000_000, page_size: int = 25):
+        self.system = system
+        self.wallet_address = wallet_address
+        self.tolerance_lamports = tolerance_lamports  # 0.001 SOL for fees and rounding
+        self.page_size = page_size
+
+        self._by_amount: List[Tuple[int, int]] = []  # sorted (expected_lamports, confirmation_id)
+        self._pending: Dict[int, PendingConfirmation] = {}
+        self._last_signature: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self.stats = {"scans": 0, "matched": 0, "timed_out": 0}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, pending: PendingConfirmation):
+        """Start waiting for a payment; starts the scan loop if idle"""
+        self._pending[pending.confirmation_id] = pending
+        bisect.insort(self._by_amount, (pending.expected_lamports, pending.confirmation_id))
+        if self._task is None or self._task.done():
+            # A fresh loop scans the latest page first instead of paging back
+            # through everything since it last went idle
+            self._last_signature = None
+            self._task = asyncio.create_task(self._run())
+
+    def wake(self):
+        """Scan now instead of at the next interval (websocket notification)"""
+        self._wakeup.set()
+
+    def remove(self, confirmation_id: int) -> Optional[PendingConfirmation]:
+        """Stop waiting for a payment"""
+        pending = self._pending.pop(confirmation_id, None)
+        if pending:
+            index = bisect.bisect_left(self._by_amount, (pending.expected_lamports, confirmation_id))
+            del self._by_amount[index]
+        return pending
+
+    def find(self, lamports: int, block_time: Optional[int] = None) -> Optional[PendingConfirmation]:
+        """Closest open confirmation within the tolerance window, oldest on ties
+
+        Transfers older than a confirmation (minus a minute of clock skew)
+        cannot pay it.
+        """
+        best = None
+        index = bisect.bisect_left(self._by_amount, (lamports - self.tolerance_lamports,))
+        while index < len(self._by_amount):
+            expected, confirmation_id = self._by_amount[index]
+            if expected > lamports + self.tolerance_lamports:
+                break
+            index += 1
+
+            pending = self._pending[confirmation_id]
+            if block_time and block_time < pending.created_at.timestamp() - 60:
+                continue
+            distance = abs(expected - lamports)
+            if best is None or distance < best[0]:
+                best = (distance, pending)
+
+        return best[1] if best else None
+
+    async def _run(self):
+        """Scan the wallet until no confirmation is waiting"""
+        logger.info(f"Confirmation matcher started for {self.wallet_address}")
+        while self._pending:
+            self._wakeup.clear()
+            try:
+                await self._expire()
+                if not self._pending:
+                    break
+                await self.scan()
+            except Exception as e:
+                logger.error(f"Error in confirmation matcher for {self.wallet_address}: {e}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.system.current_check_interval())
+            except asyncio.TimeoutError:
+                pass
+
+    async def _expire(self):
+        """Time out confirmations past their deadline"""
+        now = datetime.now()
+        for pending in [p for p in self._pending.values() if now > p.timeout_at]:
+            self.remove(pending.confirmation_id)
+            self.stats["timed_out"] += 1
+            await self.system._update_confirmation_status(
+                pending.confirmation_id, "timeout",
+                error_message="Transaction confirmation timed out"
+            )
+            logger.info(f"Transaction confirmation timed out: {pending.confirmation_id}")
+
+    async def _fetch_new_signatures(self) -> Optional[List[Dict[str, Any]]]:
+        """Signatures newer than the last scan, newest first; None on RPC error"""
+        signatures = []
+        before = None
+        while True:
+            result = await self.system.rpc_client.get_signatures_for_address(
+                self.wallet_address, limit=self.page_size, before=before, until=self._last_signature
+            )
+            if result.get("error"):
+                logger.error(f"Error getting signatures: {result['error']}")
+                return None
+
+            page = result.get("signatures", [])
+            signatures.extend(page)
+            if not self._last_signature or len(page) < self.page_size:
+                return signatures
+            before = page[-1]["signature"]
+
+    async def scan(self):
+        """Fetch new transfers once and resolve every confirmation they pay"""
+        signatures = await self._fetch_new_signatures()
+        if not signatures:
+            return
+        self.stats["scans"] += 1
+
+        # Skip failed and already claimed transactions, fetch the rest in one batch
+        candidates = [sig["signature"] for sig in signatures if not sig.get("err")]
+        unclaimed = self.system.processed_signatures.filter_new(candidates)
+        details = await self.system.rpc_client.get_transactions_batch(unclaimed)
+
+        complete = True
+        for signature in reversed(unclaimed):  # oldest first
+            tx_details = details.get(signature, {})
+            if tx_details.get("retry"):
+                complete = False
+                continue
+            if tx_details.get("error") or not tx_details.get("success"):
+                continue
+
+            for balance_change in tx_details.get("balance_changes", []):
+                if balance_change["account"] != self.wallet_address or balance_change["change_lamports"] <= 0:
+                    continue  # Only incoming transfers
+
+                lamports = balance_change["change_lamports"]
+                pending = self.find(lamports, tx_details.get("block_time"))
+                if pending:
+                    logger.info(f"Found matching transaction: {signature}")
+                    await self._resolve(pending, {
+                        "signature": signature,
+                        "amount_sol": lamports / 1_000_000_000,
+                        "amount_lamports": lamports,
+                        "slot": tx_details.get("slot"),
+                        "block_time": tx_details.get("block_time"),
+                        "confirmations": tx_details.get("confirmations", "finalized")
+                    })
+                break
+
+        # On partial RPC failure rescan the same range next time
+        if complete:
+            self._last_signature = signatures[0]["signature"]
+
+    async def _resolve(self, pending: PendingConfirmation, transaction: Dict[str, Any]):
+        """Hand a matched transfer to the payment system"""
+        self.remove(pending.confirmation_id)
+        self.stats["matched"] += 1
+        await self.system._process_confirmed_transaction(
+            pending.confirmation_id, transaction, pending.user_id,
+            pending.deposit_id, pending.withdrawal_id, pending.expected_amount,
+            wallet_address=self.wallet_address
+        )
+
 class SolanaQRPaymentSystem:
     """Enhanced Solana payment system with QR codes and confirmations"""
 
@@ -39,6 +228,17 @@ class SolanaQRPaymentSystem:
         self.confirmation_timeout = 600  # 10 minutes
         self.check_interval = 15  # 15 seconds
 
+        # Signatures that already confirmed a payment - never match them twice
+        self.processed_signatures = get_signature_index("qr", db_path)
+
+        # One matcher per receiving wallet, shared by all its open confirmations
+        self._matchers: Dict[str, WalletConfirmationMatcher] = {}
+
+        # Websocket push wakes matchers; polling then only runs as a safety net
+        self.push_check_interval = 60
+        self._push = None
+        self._push_registered = False
+
         # Initialize database
         self.init_qr_payment_tables()
 
@@ -307,7 +507,8 @@ class SolanaQRPaymentSystem:
             cursor = conn.cursor()
 
             # Create confirmation record
-            timeout_at = datetime.now() + timedelta(seconds=self.confirmation_timeout)
+            created_at = datetime.now()
+            timeout_at = created_at + timedelta(seconds=self.confirmation_timeout)
 
             cursor.execute("""
                 INSERT INTO transaction_confirmations
@@ -319,8 +520,22 @@ class SolanaQRPaymentSystem:
             conn.commit()
             conn.close()
 
-            # Start monitoring task
-            asyncio.create_task(self._monitor_transaction_confirmation(confirmation_id))
+            # Wait for it in the wallet's shared matcher
+            matcher = self._matchers.get(wallet_address)
+            if matcher is None:
+                matcher = self._matchers[wallet_address] = WalletConfirmationMatcher(self, wallet_address)
+                self._watch(wallet_address)
+            matcher.add(PendingConfirmation(
+                confirmation_id=confirmation_id,
+                user_id=user_id,
+                expected_amount=expected_amount,
+                expected_lamports=round(expected_amount * 1_000_000_000),
+                wallet_address=wallet_address,
+                created_at=created_at,
+                timeout_at=timeout_at,
+                deposit_id=deposit_id,
+                withdrawal_id=withdrawal_id
+            ))
 
             logger.info(f"Started transaction confirmation monitoring: ID {confirmation_id}")
 
@@ -335,123 +550,38 @@ class SolanaQRPaymentSystem:
             logger.error(f"Error starting transaction confirmation: {e}")
             return {"success": False, "error": str(e)}
 
-    async def _monitor_transaction_confirmation(self, confirmation_id: int):
-        """Monitor specific transaction for confirmation"""
-        try:
-            logger.info(f"Starting transaction monitoring for confirmation ID: {confirmation_id}")
-
-            while True:
-                # Get confirmation details
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-
-                cursor.execute("""
-                    SELECT user_id, deposit_id, withdrawal_id, expected_amount,
-                           wallet_address, status, timeout_at
-                    FROM transaction_confirmations
-                    WHERE id = ?
-                """, (confirmation_id,))
-
-                result = cursor.fetchone()
-                conn.close()
-
-                if not result:
-                    logger.warning(f"Confirmation record not found: {confirmation_id}")
-                    break
-
-                user_id, deposit_id, withdrawal_id, expected_amount, wallet_address, status, timeout_at = result
-
-                # Check if timed out
-                if datetime.now() > datetime.fromisoformat(timeout_at):
-                    await self._update_confirmation_status(
-                        confirmation_id, "timeout",
-                        error_message="Transaction confirmation timed out"
-                    )
-                    logger.info(f"Transaction confirmation timed out: {confirmation_id}")
-                    break
-
-                # Check if already completed
-                if status in ['confirmed', 'failed', 'timeout']:
-                    break
-
-                # Check for new transactions
-                found_transaction = await self._check_for_transaction(
-                    wallet_address, expected_amount, confirmation_id
-                )
-
-                if found_transaction:
-                    # Transaction found and confirmed
-                    await self._process_confirmed_transaction(
-                        confirmation_id, found_transaction, user_id,
-                        deposit_id, withdrawal_id, expected_amount
-                    )
-                    break
-
-                # Wait before next check
-                await asyncio.sleep(self.check_interval)
-
-        except Exception as e:
-            logger.error(f"Error in transaction confirmation monitoring: {e}")
-            await self._update_confirmation_status(
-                confirmation_id, "failed",
-                error_message=f"Monitoring error: {str(e)}"
-            )
-
-    async def _check_for_transaction(self, wallet_address: str,
-                                   expected_amount: float,
-                                   confirmation_id: int) -> Optional[Dict[str, Any]]:
-        """Check for matching transaction"""
-        try:
-            # Get recent transactions for the wallet
-            signatures_result = await self.rpc_client.get_signatures_for_address(
-                wallet_address, limit=10
-            )
-
-            if signatures_result.get("error"):
-                logger.error(f"Error getting signatures: {signatures_result['error']}")
-                return None
-
-            # Check each recent transaction
-            for sig_info in signatures_result.get("signatures", []):
-                if sig_info.get("err"):
-                    continue  # Skip failed transactions
-
-                # Get transaction details
-                tx_details = await self.rpc_client.get_transaction_details(sig_info["signature"])
-
-                if tx_details.get("error") or not tx_details.get("success"):
-                    continue
-
-                # Check balance changes for matching amount
-                for balance_change in tx_details.get("balance_changes", []):
-                    if (balance_change["account"] == wallet_address and
-                        balance_change["change_lamports"] > 0):  # Incoming transaction
-
-                        received_sol = balance_change["change_lamports"] / 1_000_000_000
-
-                        # Allow small tolerance for fees and rounding
-                        tolerance = 0.001  # 0.001 SOL tolerance
-                        if abs(received_sol - expected_amount) <= tolerance:
-                            logger.info(f"Found matching transaction: {sig_info['signature']}")
-                            return {
-                                "signature": sig_info["signature"],
-                                "amount_sol": received_sol,
-                                "amount_lamports": balance_change["change_lamports"],
-                                "slot": tx_details.get("slot"),
-                                "block_time": tx_details.get("block_time"),
-                                "confirmations": tx_details.get("confirmations", "finalized")
-                            }
-
-            return None
-
-        except Exception as e:
-            logger.error(f"Error checking for transaction: {e}")
-            return None
+    def _watch(self, wallet_address: str):
+        """Subscribe a receiving wallet for websocket notifications"""
+        if not self._push_registered:
+            self._push_registered = True
+            self._push = get_subscription_manager()
+            if self._push:
+                self._push.add_listener(self._on_push_notification)
+                self._push.add_state_listener(self._on_push_state)
+        if self._push:
+            self._push.watch(wallet_address)
+
+    def current_check_interval(self) -> float:
+        """Polling interval - slower while websocket notifications arrive"""
+        if self._push and self._push.connected:
+            return self.push_check_interval
+        return self.check_interval
+
+    async def _on_push_notification(self, address: str, signature: str):
+        matcher = self._matchers.get(address)
+        if matcher:
+            matcher.wake()
+
+    async def _on_push_state(self, connected: bool):
+        # Rescan after a reconnect (backfill) and when falling back to polling
+        for matcher in self._matchers.values():
+            matcher.wake()
 
     async def _process_confirmed_transaction(self, confirmation_id: int,
                                            transaction: Dict[str, Any],
                                            user_id: int, deposit_id: int,
-                                           withdrawal_id: int, expected_amount: float):
+                                           withdrawal_id: int, expected_amount: float,
+                                           wallet_address: str):
         """Process confirmed transaction and update balances"""
         try:
             signature = transaction["signature"]
@@ -470,7 +600,8 @@ class SolanaQRPaymentSystem:
             if deposit_id:
                 # It's a deposit - update user balance
                 await self._process_confirmed_deposit(
-                    user_id, deposit_id, signature, amount_sol
+                    user_id, deposit_id, signature, amount_sol,
+                    wallet_address=wallet_address
                 )
             elif withdrawal_id:
                 # It's a withdrawal - mark as completed
@@ -478,6 +609,9 @@ class SolanaQRPaymentSystem:
                     withdrawal_id, signature
                 )
 
+            self.processed_signatures.add(signature)
+            self.processed_signatures.flush()
+
             logger.info(f"Successfully processed confirmed transaction: {signature}")
 
         except Exception as e:
@@ -488,20 +622,61 @@ class SolanaQRPaymentSystem:
             )
 
     async def _process_confirmed_deposit(self, user_id: int, deposit_id: int,
-                                       signature: str, amount_sol: float):
-        """Process confirmed deposit transaction"""
+                                       signature: str, amount_sol: float,
+                                       wallet_address: str):
+        """Process confirmed deposit transaction
+
+        The deposit row is confirmed only once the inbox row for the transfer
+        is 'credited': by the credit listener when this event is credited
+        (now or on a later worker retry), or here when a webhook got there first.
+        """
         try:
             # Calculate FC amount
             current_rate = self.payment_system.get_sol_to_fc_rate()
             fc_amount = int(amount_sol * current_rate)
 
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            # Credit through the payment inbox - a signature is credited only once
+            from payment_credit_worker import get_credit_worker
+            worker = get_credit_worker()
+            worker.add_listener(self._on_deposit_credited)
+            event = {
+                "signature": signature,
+                "to_address": wallet_address,
+                "amount": amount_sol,
+                "user_id": user_id,
+                "fc_amount": fc_amount,
+                "reference": deposit_id
+            }
+            credited = await worker.credit_now('qr', [event])
+            if credited:
+                logger.info(f"Processed deposit: User {user_id} received {fc_amount} FC from {amount_sol} SOL")
+                return
+
+            inbox_row = await asyncio.to_thread(worker.db.get_payment_event, worker.db.payment_event_key(event))
+            if inbox_row and inbox_row['status'] == 'credited':
+                self._confirm_deposit(deposit_id, signature)
+                logger.info(f"Deposit {deposit_id} transaction {signature} was already credited")
+            else:
+                status = inbox_row['status'] if inbox_row else 'missing'
+                logger.warning(f"Deposit {deposit_id} transaction {signature} not credited yet (inbox: {status})")
 
-            # Get current user balance
-            cursor.execute("SELECT fun_coins FROM users WHERE user_id = ?", (user_id,))
-            result = cursor.fetchone()
-            old_balance = result[0] if result else 0
+        except Exception as e:
+            logger.error(f"Error processing confirmed deposit: {e}")
+            raise
+
+    async def _on_deposit_credited(self, result: Dict[str, Any]):
+        """Credit worker listener - confirm the QR deposit row an inbox credit belongs to"""
+        if result['source'] != 'qr' or not result['reference']:
+            return
+        self._confirm_deposit(int(result['reference']), result['transaction_signature'],
+                              result['user_id'], result['fc_amount'], result['new_balance'])
+
+    def _confirm_deposit(self, deposit_id: int, signature: str, user_id: int = None,
+                         fc_amount: int = None, new_balance: int = None):
+        """Mark a deposit confirmed; log the balance change when this system credited it"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
 
             # Update deposit status
             cursor.execute("""
@@ -510,30 +685,19 @@ class SolanaQRPaymentSystem:
                 WHERE id = ?
             """, (signature, deposit_id))
 
-            # Update user balance
-            new_balance = old_balance + fc_amount
-            cursor.execute("""
-                UPDATE users SET fun_coins = ?
-                WHERE user_id = ?
-            """, (new_balance, user_id))
-
             # Log balance update
-            cursor.execute("""
-                INSERT INTO balance_updates
-                (user_id, transaction_type, amount_change, old_balance, new_balance,
-                 transaction_hash, source)
-                VALUES (?, 'deposit', ?, ?, ?, ?, 'automatic_confirmation')
-            """, (user_id, fc_amount, old_balance, new_balance, signature))
+            if new_balance is not None:
+                cursor.execute("""
+                    INSERT INTO balance_updates
+                    (user_id, transaction_type, amount_change, old_balance, new_balance,
+                     transaction_hash, source)
+                    VALUES (?, 'deposit', ?, ?, ?, ?, 'automatic_confirmation')
+                """, (user_id, fc_amount, new_balance - fc_amount, new_balance, signature))
 
             conn.commit()
+        finally:
             conn.close()
 
-            logger.info(f"Processed deposit: User {user_id} received {fc_amount} FC from {amount_sol} SOL")
-
-        except Exception as e:
-            logger.error(f"Error processing confirmed deposit: {e}")
-            raise
-
     async def _process_confirmed_withdrawal(self, withdrawal_id: int, signature: str):
         """Process confirmed withdrawal transaction"""
         try:
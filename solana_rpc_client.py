@@ -5,8 +5,12 @@ Comprehensive Solana RPC connection with wallet validation and transaction monit
 """
 
 import asyncio
+import base64
+import heapq
+import itertools
 import logging
 import json
+import random
 import time
 import base58
 from datetime import datetime, timedelta
@@ -16,6 +20,8 @@ import websockets
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Commitment
 from solana.rpc.types import TxOpts
+from solders.hash import Hash
+from solders.instruction import Instruction
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey as PublicKey
 from solders.system_program import transfer, TransferParams
@@ -25,9 +31,102 @@ from solders.system_program import ID as SYSTEM_PROGRAM_ID
 import requests
 
 from config import SOLANA_CONFIG
+from http_clients import get_http_client_registry
 
 logger = logging.getLogger(__name__)
 
+MEMO_PROGRAM_ID = PublicKey.from_string("MemoSq4gqABAXKb96qnH8TyNcc5mJx8jzjJ3ZAvE4qZ")  # SPL Memo v2
+
+class RPCPriority:
+    """Priority classes for RPC requests - lower value is served first"""
+    WITHDRAWAL = 0
+    INTERACTIVE = 1
+    ADMIN = 2
+    BACKGROUND = 3
+
+class RPCRateLimitError(Exception):
+    """Raised when an RPC request is still rate limited after all retries"""
+
+class TokenBucketRateLimiter:
+    """Token bucket shared by every RPC consumer
+
+    Tokens refill at `rate` per second up to `burst`. Each request takes a
+    weight in tokens; waiters are served strictly by priority, then FIFO.
+    A 429 pauses the whole bucket until the server's Retry-After passes.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self._waiters = []  # heap of (priority, seq, weight, future)
+        self._seq = itertools.count()
+        self._timer = None
+        self.stats = {"granted": 0, "waited": 0, "pauses": 0}
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self, weight: float = 1, priority: int = RPCPriority.INTERACTIVE):
+        """Wait until `weight` tokens are available for this priority class"""
+        weight = min(weight, self.burst)
+        now = time.monotonic()
+        self._refill(now)
+        if not self._waiters and now >= self.paused_until and self.tokens >= weight:
+            self.tokens -= weight
+            self.stats["granted"] += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), weight, future))
+        self.stats["waited"] += 1
+        self._dispatch()
+        await future
+
+    def pause(self, seconds: float):
+        """Stop granting tokens for `seconds` (server asked us to back off)"""
+        resume_at = time.monotonic() + seconds
+        if resume_at > self.paused_until:
+            self.paused_until = resume_at
+            self.tokens = 0
+            self.stats["pauses"] += 1
+
+    def _dispatch(self):
+        """Grant tokens to waiters in priority order, then schedule the next wakeup"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        now = time.monotonic()
+        self._refill(now)
+        while self._waiters:
+            priority, seq, weight, future = self._waiters[0]
+            if future.cancelled():
+                heapq.heappop(self._waiters)
+                continue
+            if now < self.paused_until or self.tokens < weight:
+                break
+            heapq.heappop(self._waiters)
+            self.tokens -= weight
+            self.stats["granted"] += 1
+            future.set_result(None)
+
+        if self._waiters:
+            delay = max(self.paused_until - now, (self._waiters[0][2] - self.tokens) / self.rate, 0.001)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Current bucket state"""
+        return {
+            **self.stats,
+            "tokens": round(self.tokens, 2),
+            "queued": len(self._waiters),
+            "paused_for": max(0.0, self.paused_until - time.monotonic())
+        }
+
 class SolanaRPCClient:
     """Enhanced Solana RPC Client with comprehensive blockchain integration"""
 
@@ -40,14 +139,23 @@ class SolanaRPCClient:
         self.max_retries = self.config["max_retries"]
         self.retry_delay = self.config["retry_delay"]
 
-        # Rate limiting
-        self.request_interval = 1.0  # Minimum seconds between requests
-        self.last_request_time = 0
+        # Rate limiting - one token bucket shared by all consumers
+        self.rate_limiter = TokenBucketRateLimiter(
+            rate=self.config.get("requests_per_second", 5),
+            burst=self.config.get("burst_limit", 10)
+        )
+        self.method_weights = self.config.get("method_weights", {})
+        self.in_flight = asyncio.Semaphore(self.config.get("max_in_flight", 8))
+        self.batch_size = self.config.get("batch_size", 20)
+        self.blockhash_ttl = self.config.get("blockhash_ttl", 20)
+        self._blockhash_cache: Optional[Dict[str, Any]] = None
+        self._blockhash_lock = asyncio.Lock()
         self.rate_limit_backoff = 1.0
         self.max_backoff = 60.0
 
         # Initialize clients
         self.client = None
+        self.http = get_http_client_registry()
         self.websocket = None
         self.is_connected = False
         self.last_health_check = 0
@@ -139,7 +247,7 @@ class SolanaRPCClient:
                 return False
 
             # Use get_slot as health check instead of get_health (which doesn't exist in newer API)
-            response = await self.client.get_slot()
+            response = await self._request("getSlot", lambda: self.client.get_slot())
             self.last_health_check = time.time()
             self.connection_stats["successful_requests"] += 1
             return response is not None and response.value is not None
@@ -204,7 +312,7 @@ class SolanaRPCClient:
 
         return result
 
-    async def get_account_info(self, address: str) -> Dict[str, Any]:
+    async def get_account_info(self, address: str, priority: int = RPCPriority.INTERACTIVE) -> Dict[str, Any]:
         """Get detailed account information with rate limiting"""
         if not await self.ensure_connection():
             return {"error": "Connection failed", "balance": 0}
@@ -213,14 +321,13 @@ class SolanaRPCClient:
         if not validation["is_valid"]:
             return {"error": validation["error"], "balance": 0}
 
-        # Apply rate limiting
-        await self._apply_rate_limiting()
-
         try:
             self.connection_stats["total_requests"] += 1
 
             pubkey = PublicKey.from_string(address)
-            account_info = await self.client.get_account_info(pubkey)
+            account_info = await self._request(
+                "getAccountInfo", lambda: self.client.get_account_info(pubkey), priority
+            )
 
             result = {
                 "address": address,
@@ -249,9 +356,9 @@ class SolanaRPCClient:
             self.connection_stats["last_error"] = str(e)
             return {"error": str(e), "balance": 0}
 
-    async def get_balance(self, address: str) -> Dict[str, Any]:
+    async def get_balance(self, address: str, priority: int = RPCPriority.INTERACTIVE) -> Dict[str, Any]:
         """Get SOL balance for address"""
-        account_info = await self.get_account_info(address)
+        account_info = await self.get_account_info(address, priority)
 
         if "error" in account_info:
             return account_info
@@ -265,36 +372,83 @@ class SolanaRPCClient:
             "exists": account_info["exists"]
         }
 
-    async def _apply_rate_limiting(self):
-        """Apply rate limiting between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-
-        if time_since_last < self.request_interval:
-            wait_time = self.request_interval - time_since_last
-            await asyncio.sleep(wait_time)
-
-        self.last_request_time = time.time()
-
-    async def _handle_rate_limit_error(self):
-        """Handle rate limiting with exponential backoff"""
+    async def _apply_rate_limiting(self, method: str = None, priority: int = RPCPriority.INTERACTIVE,
+                                   weight: float = None):
+        """Take this method's weight from the shared token bucket"""
+        if weight is None:
+            weight = self.method_weights.get(method, 1)
+        await self.rate_limiter.acquire(weight, priority)
+
+    @staticmethod
+    def _is_rate_limit_error(error: Exception) -> bool:
+        message = str(error).lower()
+        return any(keyword in message for keyword in ["429", "rate limit", "too many requests"])
+
+    @staticmethod
+    def _is_unavailable_error(error: Exception) -> bool:
+        message = str(error).lower()
+        return any(keyword in message for keyword in ["503", "service unavailable", "server error"])
+
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """Read Retry-After (seconds) from an HTTP error response, if any"""
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or getattr(error, "headers", None)
+        if not headers:
+            return None
+        try:
+            return float(headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            return None
+
+    async def _request(self, method: str, call, priority: int = RPCPriority.INTERACTIVE,
+                       weight: float = None):
+        """Run one RPC call within the shared budget, retrying 429/503 with backoff
+
+        `call` is a zero-argument function returning a fresh awaitable. Many
+        callers run concurrently; only the token bucket and the in-flight cap
+        limit them.
+        """
+        for attempt in range(self.max_retries):
+            await self._apply_rate_limiting(method, priority, weight)
+            try:
+                async with self.in_flight:
+                    result = await call()
+                await self._reset_rate_limit_backoff()
+                return result
+            except Exception as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                if self._is_rate_limit_error(e):
+                    await self._handle_rate_limit_error(self._retry_after(e))
+                elif self._is_unavailable_error(e):
+                    await self._handle_rate_limit_error(self._retry_after(e), pause_all=False)
+                else:
+                    raise
+        raise RPCRateLimitError(f"{method} still rate limited after {self.max_retries} attempts")
+
+    async def _handle_rate_limit_error(self, retry_after: float = None, pause_all: bool = True):
+        """Back off with jittered exponential delay, honouring Retry-After"""
         self.connection_stats["rate_limited_requests"] += 1
+        delay = max(retry_after or 0, self.rate_limit_backoff)
+        delay = min(delay, self.max_backoff) * random.uniform(1.0, 1.5)
         self.rate_limit_backoff = min(self.rate_limit_backoff * 2, self.max_backoff)
-        logger.warning(f"Rate limited, backing off for {self.rate_limit_backoff} seconds")
-        await asyncio.sleep(self.rate_limit_backoff)
+        logger.warning(f"Rate limited, backing off for {delay:.1f} seconds")
+        if pause_all:
+            # The limit applies to our whole IP - stop every consumer, not just this one
+            self.rate_limiter.pause(delay)
+        await asyncio.sleep(delay)
 
     async def _reset_rate_limit_backoff(self):
         """Reset rate limit backoff on successful request"""
         self.rate_limit_backoff = 1.0
 
-    async def get_transaction_details(self, signature: str) -> Dict[str, Any]:
+    async def get_transaction_details(self, signature: str,
+                                      priority: int = RPCPriority.INTERACTIVE) -> Dict[str, Any]:
         """Get detailed transaction information with improved error handling"""
         if not await self.ensure_connection():
             return {"error": "Connection failed"}
 
-        # Apply rate limiting
-        await self._apply_rate_limiting()
-
         try:
             self.connection_stats["total_requests"] += 1
 
@@ -305,7 +459,7 @@ class SolanaRPCClient:
                 return {"error": f"Invalid signature format: {str(e)}"}
 
             # Get transaction details with timeout
-            tx_info = await asyncio.wait_for(
+            tx_info = await self._request("getTransaction", lambda: asyncio.wait_for(
                 self.client.get_transaction(
                     sig,
                     encoding="json",
@@ -313,7 +467,7 @@ class SolanaRPCClient:
                     max_supported_transaction_version=0
                 ),
                 timeout=self.timeout
-            )
+            ), priority)
 
             if not tx_info.value:
                 logger.warning(f"Transaction not found: {signature}")
@@ -382,14 +536,13 @@ class SolanaRPCClient:
             error_msg = str(e) if str(e) else f"Unknown error of type {type(e).__name__}"
 
             # Enhanced error handling for common Solana RPC errors
+            # (429/503 were already retried with backoff inside _request)
             if any(keyword in error_msg.lower() for keyword in ["503", "service unavailable", "server error"]):
                 logger.warning(f"Solana RPC temporarily unavailable for {signature}")
-                await asyncio.sleep(5)  # Wait before retry
                 return {"error": "RPC temporarily unavailable", "retry": True}
 
             elif any(keyword in error_msg.lower() for keyword in ["429", "rate limit", "too many requests"]):
                 logger.warning(f"Rate limited for transaction {signature}")
-                await self._handle_rate_limit_error()
                 return {"error": "Rate limited", "retry": True}
 
             elif any(keyword in error_msg.lower() for keyword in ["not found", "404", "does not exist"]):
@@ -410,7 +563,233 @@ class SolanaRPCClient:
             self.connection_stats["last_error"] = error_msg
             return {"error": error_msg, "retry": False}
 
-    async def get_signatures_for_address(self, address: str, limit: int = 10, before: str = None) -> Dict[str, Any]:
+    async def _rpc_batch(self, calls: List[tuple], priority: int = RPCPriority.INTERACTIVE) -> List[Dict[str, Any]]:
+        """Send [(method, params), ...] as one JSON-RPC batch
+
+        Returns one response object per call, in call order. Calls the server
+        did not answer get an error entry instead of failing the whole batch.
+        """
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        weight = sum(self.method_weights.get(method, 1) for method, _ in calls)
+
+        async def post():
+            async with self.http.request("POST", self.rpc_url, json=payload,
+                                         timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+
+        data = await self._request("batch", post, priority, weight=weight)
+        if isinstance(data, dict):
+            data = [data]  # whole-batch error answered as a single object
+
+        by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+        missing = {"error": {"code": -32000, "message": "No response for batch item"}}
+        return [by_id.get(i, missing) for i in range(len(calls))]
+
+    @staticmethod
+    def _batch_item_error(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Per-item JSON-RPC error as {"error", "retry"}; invalid params are not retried"""
+        error = item.get("error")
+        if not error:
+            return None
+        return {"error": error.get("message", str(error)), "retry": error.get("code") != -32602}
+
+    @staticmethod
+    def _parse_transaction_json(signature: str, tx_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the get_transaction_details result from a JSON-encoded getTransaction"""
+        meta = tx_data.get("meta") or {}
+        message = (tx_data.get("transaction") or {}).get("message") or {}
+
+        accounts = list(message.get("accountKeys") or [])
+        loaded = meta.get("loadedAddresses") or {}
+        accounts += loaded.get("writable", []) + loaded.get("readonly", [])
+
+        result = {
+            "signature": signature,
+            "slot": tx_data.get("slot"),
+            "block_time": tx_data.get("blockTime"),
+            "confirmations": "finalized",
+            "fee": meta.get("fee", 0),
+            "success": bool(meta) and not meta.get("err"),
+            "error": str(meta["err"]) if meta.get("err") else None,
+            "accounts": accounts,
+            "instructions": [],
+            "balance_changes": []
+        }
+
+        pre_balances = meta.get("preBalances") or []
+        post_balances = meta.get("postBalances") or []
+        for i, account in enumerate(accounts):
+            if i < len(pre_balances) and i < len(post_balances):
+                change = post_balances[i] - pre_balances[i]
+                if change != 0:
+                    result["balance_changes"].append({
+                        "account": account,
+                        "pre_balance": pre_balances[i],
+                        "post_balance": post_balances[i],
+                        "change_lamports": change,
+                        "change_sol": change / 1_000_000_000
+                    })
+
+        return result
+
+    async def get_transactions_batch(self, signatures: List[str],
+                                     priority: int = RPCPriority.INTERACTIVE) -> Dict[str, Dict[str, Any]]:
+        """Fetch many transactions with JSON-RPC batches of getTransaction
+
+        Returns signature -> the same dict get_transaction_details returns.
+        A failed item only fails that signature; a failed batch marks its
+        signatures {"error": ..., "retry": True}. So does a transaction the
+        node does not have yet - callers pass signatures the cluster just
+        listed, and a lagging node must not make them disappear.
+        """
+        results = {}
+        if not signatures:
+            return results
+        if not await self.ensure_connection():
+            return {signature: {"error": "Connection failed", "retry": True} for signature in signatures}
+
+        valid = []
+        for signature in dict.fromkeys(signatures):
+            try:
+                Signature.from_string(signature)
+                valid.append(signature)
+            except Exception as e:
+                results[signature] = {"error": f"Invalid signature format: {str(e)}", "retry": False}
+
+        options = {
+            "encoding": "json",
+            "commitment": self.config["commitment"],
+            "maxSupportedTransactionVersion": 0
+        }
+
+        for start in range(0, len(valid), self.batch_size):
+            chunk = valid[start:start + self.batch_size]
+            self.connection_stats["total_requests"] += 1
+            try:
+                responses = await self._rpc_batch(
+                    [("getTransaction", [signature, options]) for signature in chunk], priority
+                )
+            except Exception as e:
+                error_msg = str(e) or type(e).__name__
+                logger.warning(f"Transaction batch of {len(chunk)} failed: {error_msg}")
+                self.connection_stats["failed_requests"] += 1
+                self.connection_stats["last_error"] = error_msg
+                for signature in chunk:
+                    results[signature] = {"error": error_msg, "retry": True}
+                continue
+
+            self.connection_stats["successful_requests"] += 1
+            for signature, item in zip(chunk, responses):
+                error = self._batch_item_error(item)
+                if error:
+                    results[signature] = error
+                elif not item.get("result"):
+                    results[signature] = {"error": "Transaction not found", "signature": signature, "retry": True}
+                else:
+                    try:
+                        results[signature] = self._parse_transaction_json(signature, item["result"])
+                    except Exception as parse_error:
+                        logger.warning(f"Error parsing transaction details for {signature}: {parse_error}")
+                        results[signature] = {"error": "Data parsing error", "retry": False}
+
+        return results
+
+    async def get_multiple_accounts(self, addresses: List[str],
+                                    priority: int = RPCPriority.INTERACTIVE) -> Dict[str, Dict[str, Any]]:
+        """Fetch many accounts with getMultipleAccounts (100 per call, batched)
+
+        Returns address -> the same dict get_account_info returns, plus the
+        slot the value was read at.
+        """
+        results = {}
+        if not addresses:
+            return results
+        if not await self.ensure_connection():
+            return {address: {"error": "Connection failed", "balance": 0} for address in addresses}
+
+        valid = []
+        for address in dict.fromkeys(addresses):
+            validation = self.validate_wallet_address(address)
+            if validation["is_valid"]:
+                valid.append(address)
+            else:
+                results[address] = {"error": validation["error"], "balance": 0}
+
+        options = {"encoding": "base64", "commitment": self.config["commitment"]}
+        chunks = [valid[i:i + 100] for i in range(0, len(valid), 100)]
+        if not chunks:
+            return results
+
+        self.connection_stats["total_requests"] += 1
+        try:
+            responses = await self._rpc_batch(
+                [("getMultipleAccounts", [chunk, options]) for chunk in chunks], priority
+            )
+        except Exception as e:
+            logger.error(f"Error getting multiple accounts: {e}")
+            self.connection_stats["failed_requests"] += 1
+            self.connection_stats["last_error"] = str(e)
+            for address in valid:
+                results[address] = {"error": str(e), "balance": 0}
+            return results
+
+        self.connection_stats["successful_requests"] += 1
+        for chunk, item in zip(chunks, responses):
+            error = self._batch_item_error(item)
+            values = ((item.get("result") or {}).get("value")) or [None] * len(chunk)
+            slot = ((item.get("result") or {}).get("context") or {}).get("slot")
+            for address, account in zip(chunk, values):
+                if error:
+                    results[address] = {"error": error["error"], "balance": 0}
+                    continue
+
+                result = {
+                    "address": address,
+                    "exists": account is not None,
+                    "balance": 0,
+                    "executable": False,
+                    "owner": None,
+                    "rent_epoch": None,
+                    "slot": slot
+                }
+                if account:
+                    data = account.get("data") or []
+                    result.update({
+                        "balance": account.get("lamports", 0),
+                        "executable": account.get("executable", False),
+                        "owner": account.get("owner"),
+                        "rent_epoch": account.get("rentEpoch"),
+                        "data_size": len(base64.b64decode(data[0])) if data and data[0] else 0
+                    })
+                results[address] = result
+
+        return results
+
+    async def get_balances(self, addresses: List[str],
+                           priority: int = RPCPriority.INTERACTIVE) -> Dict[str, Dict[str, Any]]:
+        """SOL balances for many addresses - address -> get_balance result"""
+        accounts = await self.get_multiple_accounts(addresses, priority)
+        balances = {}
+        for address, account_info in accounts.items():
+            if "error" in account_info:
+                balances[address] = account_info
+            else:
+                balances[address] = {
+                    "address": address,
+                    "balance_lamports": account_info["balance"],
+                    "balance_sol": account_info["balance"] / 1_000_000_000,
+                    "exists": account_info["exists"],
+                    "slot": account_info.get("slot")
+                }
+        return balances
+
+    async def get_signatures_for_address(self, address: str, limit: int = 10, before: str = None,
+                                         priority: int = RPCPriority.INTERACTIVE,
+                                         until: str = None) -> Dict[str, Any]:
         """Get transaction signatures for address with rate limiting"""
         if not await self.ensure_connection():
             return {"error": "Connection failed", "signatures": []}
@@ -419,9 +798,6 @@ class SolanaRPCClient:
         if not validation["is_valid"]:
             return {"error": validation["error"], "signatures": []}
 
-        # Apply rate limiting
-        await self._apply_rate_limiting()
-
         try:
             self.connection_stats["total_requests"] += 1
 
@@ -434,12 +810,17 @@ class SolanaRPCClient:
                     options["before"] = Signature.from_string(before)
                 except:
                     return {"error": "Invalid 'before' signature format", "signatures": []}
+            if until:
+                try:
+                    options["until"] = Signature.from_string(until)
+                except:
+                    return {"error": "Invalid 'until' signature format", "signatures": []}
 
-            signatures_info = await self.client.get_signatures_for_address(
+            signatures_info = await self._request("getSignaturesForAddress", lambda: self.client.get_signatures_for_address(
                 pubkey,
                 commitment=self.commitment,
                 **options
-            )
+            ), priority)
 
             result = {
                 "address": address,
@@ -464,14 +845,7 @@ class SolanaRPCClient:
             return result
 
         except Exception as e:
-            error_msg = str(e)
-
-            # Handle rate limiting and network errors
-            if any(keyword in error_msg.lower() for keyword in ["429", "rate limit", "too many requests"]):
-                await self._handle_rate_limit_error()
-            elif any(keyword in error_msg.lower() for keyword in ["503", "service unavailable", "network"]):
-                await asyncio.sleep(5)
-
+            # 429/503 were already retried with backoff inside _request
             logger.error(f"Error getting signatures for address {address}: {e}")
             self.connection_stats["failed_requests"] += 1
             self.connection_stats["last_error"] = str(e)
@@ -493,7 +867,7 @@ class SolanaRPCClient:
 
         try:
             # Get initial signature to start monitoring from
-            initial_sigs = await self.get_signatures_for_address(address, limit=1)
+            initial_sigs = await self.get_signatures_for_address(address, limit=1, priority=RPCPriority.BACKGROUND)
             if initial_sigs.get("signatures"):
                 last_signature = initial_sigs["signatures"][0]["signature"]
                 logger.info(f"Starting monitoring from signature: {last_signature}")
@@ -504,14 +878,17 @@ class SolanaRPCClient:
                     new_sigs = await self.get_signatures_for_address(
                         address,
                         limit=10,
-                        before=last_signature if last_signature else None
+                        before=last_signature if last_signature else None,
+                        priority=RPCPriority.BACKGROUND
                     )
 
                     if new_sigs.get("signatures"):
                         for sig_info in reversed(new_sigs["signatures"]):  # Process oldest first
                             if sig_info["signature"] != last_signature:
                                 # Get full transaction details
-                                tx_details = await self.get_transaction_details(sig_info["signature"])
+                                tx_details = await self.get_transaction_details(
+                                    sig_info["signature"], RPCPriority.BACKGROUND
+                                )
 
                                 # Call callback if provided
                                 if callback:
@@ -558,7 +935,7 @@ class SolanaRPCClient:
                 return {"error": "Amount must be greater than 0"}
 
             # Check admin wallet balance
-            admin_balance = await self.get_balance(str(self.admin_keypair.public_key))
+            admin_balance = await self.get_balance(str(self.admin_keypair.public_key), RPCPriority.WITHDRAWAL)
             if admin_balance.get("balance_lamports", 0) < amount_lamports + 5000:  # +5000 for transaction fee
                 return {"error": "Insufficient admin wallet balance"}
 
@@ -573,7 +950,11 @@ class SolanaRPCClient:
             )
 
             # Get recent blockhash
-            recent_blockhash_resp = await self.client.get_recent_blockhash(commitment=self.commitment)
+            recent_blockhash_resp = await self._request(
+                "getRecentBlockhash",
+                lambda: self.client.get_recent_blockhash(commitment=self.commitment),
+                RPCPriority.WITHDRAWAL
+            )
             recent_blockhash = recent_blockhash_resp.value.blockhash
 
             # Build and sign transaction
@@ -584,6 +965,7 @@ class SolanaRPCClient:
             transaction.sign(self.admin_keypair)
 
             # Send transaction
+            await self._apply_rate_limiting("sendTransaction", RPCPriority.WITHDRAWAL)
             tx_response = await self.client.send_transaction(
                 transaction,
                 self.admin_keypair,
@@ -624,6 +1006,133 @@ class SolanaRPCClient:
             self.connection_stats["last_error"] = str(e)
             return {"error": str(e)}
 
+    async def get_latest_blockhash(self, priority: int = RPCPriority.WITHDRAWAL,
+                                   refresh: bool = False) -> Dict[str, Any]:
+        """Recent blockhash shared by every transaction built within blockhash_ttl seconds
+
+        Returns {"blockhash", "last_valid_block_height"}. Concurrent callers
+        wait for one getLatestBlockhash instead of each fetching their own.
+        """
+        async with self._blockhash_lock:
+            cached = self._blockhash_cache
+            if cached and not refresh and time.monotonic() - cached["fetched_at"] < self.blockhash_ttl:
+                return cached
+
+            try:
+                item = (await self._rpc_batch(
+                    [("getLatestBlockhash", [{"commitment": self.config["commitment"]}])], priority
+                ))[0]
+            except Exception as e:
+                logger.error(f"Error getting latest blockhash: {e}")
+                return {"error": str(e), "retry": True}
+
+            error = self._batch_item_error(item)
+            if error:
+                return error
+
+            value = item["result"]["value"]
+            self._blockhash_cache = {
+                "blockhash": value["blockhash"],
+                "last_valid_block_height": value["lastValidBlockHeight"],
+                "fetched_at": time.monotonic()
+            }
+            return self._blockhash_cache
+
+    @staticmethod
+    def build_transfer_transaction(keypair: Keypair, transfers: List[tuple], blockhash: str) -> Transaction:
+        """Signed legacy transaction paying [(to_address, lamports[, memo]), ...] from keypair
+
+        A transfer with a memo is followed by its own SPL Memo instruction.
+        """
+        payer = keypair.pubkey()
+        instructions = []
+        for to_address, lamports, *memo in transfers:
+            instructions.append(transfer(TransferParams(
+                from_pubkey=payer, to_pubkey=PublicKey.from_string(to_address), lamports=lamports
+            )))
+            if memo and memo[0]:
+                instructions.append(Instruction(MEMO_PROGRAM_ID, memo[0].encode(), []))
+        return Transaction.new_signed_with_payer(instructions, payer, [keypair], Hash.from_string(blockhash))
+
+    async def send_raw_transaction(self, transaction: Transaction,
+                                   priority: int = RPCPriority.WITHDRAWAL) -> Dict[str, Any]:
+        """Submit a signed transaction without waiting for confirmation
+
+        The signature is known before sending, so every result carries it.
+        A rejected transaction returns {"error", "retry"}; a transport error
+        returns {"error", "in_doubt": True} - it may still land, so only a
+        status lookup can tell whether it is safe to send again.
+        """
+        signature = str(transaction.signatures[0])
+        encoded = base64.b64encode(bytes(transaction)).decode()
+        options = {"encoding": "base64", "preflightCommitment": self.config["commitment"]}
+
+        self.connection_stats["total_requests"] += 1
+        try:
+            item = (await self._rpc_batch([("sendTransaction", [encoded, options])], priority))[0]
+        except Exception as e:
+            self.connection_stats["failed_requests"] += 1
+            self.connection_stats["last_error"] = str(e)
+            return {"signature": signature, "error": str(e), "in_doubt": True}
+
+        error = item.get("error")
+        if error:
+            self.connection_stats["failed_requests"] += 1
+            self.connection_stats["last_error"] = error.get("message", str(error))
+            # Preflight rejected it: nothing was forwarded. Only an unknown
+            # blockhash is worth another try - a failed simulation will fail again.
+            message = error.get("message", str(error))
+            return {
+                "signature": signature,
+                "error": message,
+                "retry": "blockhash not found" in message.lower() or error.get("code") != -32002
+            }
+
+        self.connection_stats["successful_requests"] += 1
+        return {"signature": item.get("result") or signature, "success": True}
+
+    async def get_signature_statuses(self, signatures: List[str],
+                                     priority: int = RPCPriority.WITHDRAWAL,
+                                     search_history: bool = False) -> Dict[str, Any]:
+        """Statuses of many signatures plus the current block height in one batch request
+
+        Returns {"statuses": {signature: status}, "block_height"}. A status is
+        None while the cluster has not seen the signature; signatures whose
+        lookup failed are left out. Without search_history only the recent
+        status cache is searched.
+        """
+        options = [{"searchTransactionHistory": True}] if search_history else []
+        calls = [
+            ("getSignatureStatuses", [signatures[start:start + 256], *options])
+            for start in range(0, len(signatures), 256)
+        ]
+        calls.append(("getBlockHeight", [{"commitment": self.config["commitment"]}]))
+
+        statuses = {}
+        block_height = None
+        for start in range(0, len(calls), self.batch_size):
+            chunk = calls[start:start + self.batch_size]
+            self.connection_stats["total_requests"] += 1
+            try:
+                responses = await self._rpc_batch(chunk, priority)
+            except Exception as e:
+                logger.warning(f"Signature status batch failed: {e}")
+                self.connection_stats["failed_requests"] += 1
+                self.connection_stats["last_error"] = str(e)
+                continue
+
+            self.connection_stats["successful_requests"] += 1
+            for (method, params), item in zip(chunk, responses):
+                if item.get("error"):
+                    continue
+                if method == "getBlockHeight":
+                    block_height = item.get("result")
+                else:
+                    values = (item.get("result") or {}).get("value") or []
+                    statuses.update(zip(params[0], values))
+
+        return {"statuses": statuses, "block_height": block_height}
+
     async def get_connection_stats(self) -> Dict[str, Any]:
         """Get connection statistics"""
         uptime = datetime.now() - self.connection_stats["uptime_start"]
@@ -643,6 +1152,8 @@ class SolanaRPCClient:
                 if self.connection_stats["total_requests"] > 0 else 0
             ),
             "reconnections": self.connection_stats["reconnections"],
+            "rate_limited_requests": self.connection_stats["rate_limited_requests"],
+            "rate_limiter": self.rate_limiter.get_stats(),
             "last_error": self.connection_stats["last_error"],
             "last_health_check": datetime.fromtimestamp(self.last_health_check) if self.last_health_check else None
         }
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Solana WebSocket Subscriptions
+Tek websocket bağlantısı üzerinden tüm izlenen cüzdanlar için anlık bildirim
+
+One connection to the RPC node carries a logsSubscribe (mentions filter)
+for every watched address. Notifications wake the transaction scanner and
+the QR confirmation matchers, which then fetch the new signatures with their
+usual cursor-based scan, so a reconnect is backfilled by the same code path.
+Polling stays on as a slower safety net and takes over while disconnected.
+"""
+
+import asyncio
+import json
+import logging
+import random
+from typing import Callable, Dict, List, Optional
+
+import websockets
+
+from config import SOLANA_CONFIG
+
+logger = logging.getLogger(__name__)
+
+class SolanaSubscriptionManager:
+    """Single websocket holding log subscriptions for all watched addresses"""
+
+    def __init__(self, websocket_url: str = None, commitment: str = None,
+                 ping_interval: float = 20, max_reconnect_delay: float = 60):
+        self.websocket_url = websocket_url or SOLANA_CONFIG["websocket_url"]
+        self.commitment = commitment or SOLANA_CONFIG["commitment"]
+        self.ping_interval = ping_interval
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self._watch_counts: Dict[str, int] = {}  # address -> number of watchers
+        self._subscriptions: Dict[int, str] = {}  # subscription id -> address
+        self._address_subscriptions: Dict[str, int] = {}  # address -> subscription id
+        self._pending_requests: Dict[int, str] = {}  # request id -> address
+        self._next_request_id = 1
+
+        self._websocket = None
+        self._task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable] = []
+        self._state_listeners: List[Callable] = []
+        self.connected = False
+        self.stats = {"notifications": 0, "reconnects": 0, "subscriptions": 0}
+
+    def add_listener(self, callback: Callable):
+        """Register an async callback(address, signature) for pushed transactions"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def add_state_listener(self, callback: Callable):
+        """Register an async callback(connected) called on connect and disconnect"""
+        if callback not in self._state_listeners:
+            self._state_listeners.append(callback)
+
+    def watch(self, address: str):
+        """Subscribe to an address (reference counted) and start the connection"""
+        self._watch_counts[address] = self._watch_counts.get(address, 0) + 1
+        if self._watch_counts[address] == 1 and self.connected:
+            asyncio.create_task(self._subscribe(address))
+        self.start()
+
+    def unwatch(self, address: str):
+        """Drop one watcher of an address; unsubscribes when none are left"""
+        count = self._watch_counts.get(address, 0) - 1
+        if count > 0:
+            self._watch_counts[address] = count
+            return
+
+        self._watch_counts.pop(address, None)
+        subscription_id = self._address_subscriptions.pop(address, None)
+        if subscription_id is not None:
+            self._subscriptions.pop(subscription_id, None)
+            if self.connected:
+                asyncio.create_task(self._send("logsUnsubscribe", [subscription_id]))
+
+    def start(self):
+        """Start the connection loop on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Close the connection and stop reconnecting"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _send(self, method: str, params: list) -> int:
+        request_id = self._next_request_id
+        self._next_request_id += 1
+        await self._websocket.send(json.dumps({
+            "jsonrpc": "2.0", "id": request_id, "method": method, "params": params
+        }))
+        return request_id
+
+    async def _subscribe(self, address: str):
+        try:
+            request_id = await self._send("logsSubscribe", [
+                {"mentions": [address]}, {"commitment": self.commitment}
+            ])
+            self._pending_requests[request_id] = address
+        except Exception as e:
+            logger.warning(f"Could not subscribe {address}: {e}")
+
+    async def _run(self):
+        """Connect, subscribe everything, read notifications; reconnect with backoff"""
+        delay = 1.0
+        while self._watch_counts:
+            try:
+                async with websockets.connect(self.websocket_url, ping_interval=self.ping_interval) as websocket:
+                    self._websocket = websocket
+                    self._subscriptions.clear()
+                    self._address_subscriptions.clear()
+                    self._pending_requests.clear()
+
+                    for address in list(self._watch_counts):
+                        await self._subscribe(address)
+
+                    self.connected = True
+                    delay = 1.0
+                    logger.info(f"Solana websocket connected, {len(self._watch_counts)} addresses subscribed")
+                    # Connected again - listeners backfill anything missed meanwhile
+                    await self._notify_state(True)
+
+                    async for message in websocket:
+                        await self._handle_message(message)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Solana websocket error: {e}")
+            finally:
+                self._websocket = None
+                if self.connected:
+                    self.connected = False
+                    self.stats["reconnects"] += 1
+                    await self._notify_state(False)
+
+            if not self._watch_counts:
+                break
+            await asyncio.sleep(delay * random.uniform(1.0, 1.5))
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _handle_message(self, message: str):
+        """Route subscription confirmations and log notifications"""
+        try:
+            data = json.loads(message)
+        except ValueError:
+            return
+
+        if "id" in data:
+            address = self._pending_requests.pop(data["id"], None)
+            if address is None:
+                return
+            if "result" in data and address in self._watch_counts:
+                self._subscriptions[data["result"]] = address
+                self._address_subscriptions[address] = data["result"]
+                self.stats["subscriptions"] += 1
+            elif "error" in data:
+                logger.warning(f"logsSubscribe failed for {address}: {data['error']}")
+            return
+
+        if data.get("method") != "logsNotification":
+            return
+
+        params = data.get("params", {})
+        address = self._subscriptions.get(params.get("subscription"))
+        value = params.get("result", {}).get("value", {})
+        if address is None or value.get("err"):
+            return
+
+        self.stats["notifications"] += 1
+        for callback in self._listeners:
+            try:
+                await callback(address, value.get("signature"))
+            except Exception as e:
+                logger.error(f"Subscription listener error: {e}")
+
+    async def _notify_state(self, connected: bool):
+        for callback in self._state_listeners:
+            try:
+                await callback(connected)
+            except Exception as e:
+                logger.error(f"Subscription state listener error: {e}")
+
+    def get_stats(self) -> Dict:
+        """Connection and subscription counters"""
+        return {
+            **self.stats,
+            "connected": self.connected,
+            "watched_addresses": len(self._watch_counts),
+            "active_subscriptions": len(self._subscriptions)
+        }
+
+# Global instance
+_subscription_manager = None
+
+def get_subscription_manager() -> Optional[SolanaSubscriptionManager]:
+    """Global subscription manager, or None when websocket mode is disabled"""
+    global _subscription_manager
+    if not SOLANA_CONFIG.get("use_websocket", True):
+        return None
+    if _subscription_manager is None:
+        _subscription_manager = SolanaSubscriptionManager()
+    return _subscription_manager
@@ -5,15 +5,19 @@ Advanced transaction monitoring with real-time detection and processing
 """
 
 import asyncio
+import heapq
 import logging
 import json
 import sqlite3
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
 
-from solana_rpc_client import get_solana_rpc_client
+from solana_rpc_client import get_solana_rpc_client, RPCPriority
+from solana_subscriptions import get_subscription_manager
 from config import SOLANA_CONFIG
 
 logger = logging.getLogger(__name__)
@@ -52,9 +56,166 @@ class MonitoredTransaction:
     user_id: Optional[int]
     casino_transaction_id: Optional[int]
     error_message: Optional[str]
+    post_balances: Optional[Dict[str, int]] = None  # account -> lamports after this transaction
+
+class ProcessedSignatureIndex:
+    """Bounded, insertion-ordered set of handled signatures backed by SQLite
+
+    Membership tests and oldest-first eviction are O(1). Added signatures are
+    buffered and written to the processed_signatures table on flush(); the
+    newest entries are loaded back on start, and filter_new() falls back to
+    the table for anything evicted from memory. At most once per
+    PRUNE_INTERVAL, flush() also deletes the scope's rows older than
+    `retention_days` - scans resume from their cursor and never page back
+    that far, and crediting is keyed by signature in the payment inbox.
+    """
+
+    PRUNE_INTERVAL = 3600.0  # seconds
+
+    def __init__(self, db_path: str, scope: str, max_size: int = 10000, retention_days: int = 30):
+        self.db_path = db_path
+        self.scope = scope
+        self.max_size = max_size
+        self.retention_days = retention_days
+        self._recent: "OrderedDict[str, None]" = OrderedDict()
+        self._pending: List[str] = []
+        self._next_prune = 0.0
+
+        self._init_table()
+        self._load_recent()
+
+    def _init_table(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS processed_signatures (
+                    scope TEXT NOT NULL,
+                    signature TEXT NOT NULL,
+                    processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (scope, signature)
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_processed_signatures_age
+                ON processed_signatures(scope, processed_at)
+            """)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _load_recent(self):
+        """Warm the in-memory window with the newest stored signatures"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute(
+                "SELECT signature FROM processed_signatures WHERE scope = ? ORDER BY rowid DESC LIMIT ?",
+                (self.scope, self.max_size)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        for (signature,) in reversed(rows):
+            self._recent[signature] = None
+
+    def __contains__(self, signature: str) -> bool:
+        return signature in self._recent
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def _remember(self, signature: str):
+        self._recent[signature] = None
+        while len(self._recent) > self.max_size:
+            self._recent.popitem(last=False)
+
+    def add(self, signature: str):
+        """Mark a signature as handled"""
+        if signature not in self._recent:
+            self._remember(signature)
+            self._pending.append(signature)
+
+    def filter_new(self, signatures: List[str]) -> List[str]:
+        """Signatures never handled before - one indexed query for memory misses"""
+        misses = [signature for signature in signatures if signature not in self._recent]
+        if not misses:
+            return []
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            placeholders = ",".join("?" * len(misses))
+            known = {row[0] for row in conn.execute(
+                f"SELECT signature FROM processed_signatures WHERE scope = ? AND signature IN ({placeholders})",
+                (self.scope, *misses)
+            )}
+        finally:
+            conn.close()
+
+        for signature in known:
+            self._remember(signature)
+        return [signature for signature in misses if signature not in known]
+
+    def flush(self, conn: sqlite3.Connection = None):
+        """Write buffered signatures; commits only when it opened the connection"""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        own_conn = conn is None
+        if own_conn:
+            conn = sqlite3.connect(self.db_path)
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO processed_signatures (scope, signature) VALUES (?, ?)",
+                [(self.scope, signature) for signature in pending]
+            )
+            if time.monotonic() >= self._next_prune:
+                self._prune(conn)
+            if own_conn:
+                conn.commit()
+        except Exception:
+            self._pending = pending + self._pending
+            raise
+        finally:
+            if own_conn:
+                conn.close()
+
+    def _prune(self, conn: sqlite3.Connection):
+        """Delete this scope's signatures older than the retention period"""
+        self._next_prune = time.monotonic() + self.PRUNE_INTERVAL
+        deleted = conn.execute(
+            "DELETE FROM processed_signatures WHERE scope = ? AND processed_at < datetime('now', ?)",
+            (self.scope, f"-{self.retention_days} days")
+        ).rowcount
+        if deleted:
+            logger.info(f"Pruned {deleted} processed signatures older than {self.retention_days} days ({self.scope})")
+
+@dataclass
+class AddressScanState:
+    """Scanner state for one monitored address"""
+    address: str
+    last_signature: Optional[str] = None
+    interval: float = 10.0
+    next_check: float = 0.0
+    cursor_dirty: bool = False
+    signatures_seen: int = 0
+    scanning: bool = False
+    wake_requested: bool = False
 
 class SolanaTransactionMonitor:
-    """Advanced Solana transaction monitoring service"""
+    """Advanced Solana transaction monitoring service
+
+    One scanner task serves every monitored address. Addresses are kept in a
+    heap ordered by their next check time; busy addresses are polled every
+    monitor_min_interval seconds and idle ones back off towards
+    monitor_max_interval, so RPC cost follows the transactions observed
+    rather than the number of addresses. With websocket push enabled a
+    notification scans its address at once and idle polling slows down to
+    push_poll_interval.
+    """
 
     def __init__(self, db_path: str = "casino_bot.db"):
         self.db_path = db_path
@@ -63,12 +224,28 @@ class SolanaTransactionMonitor:
 
         # Monitoring state
         self.monitored_addresses = {}  # address -> callback mapping
-        self.active_monitors = {}  # address -> task mapping
+        self.active_monitors: Dict[str, AddressScanState] = {}  # address -> scan state
         self.processing_callbacks = []  # List of processing callbacks
 
+        # Shared scanner
+        self.min_poll_interval = self.config.get("monitor_min_interval", 10)
+        self.max_poll_interval = self.config.get("monitor_max_interval", 300)
+        self.scan_concurrency = self.config.get("monitor_scan_concurrency", 4)
+        self.cursor_flush_interval = self.config.get("monitor_cursor_flush_interval", 15)
+        self.signature_page_size = 25
+        self._scan_queue = []  # heap of (next_check, address)
+        self._scan_wakeup = asyncio.Event()
+        self._scanner_task: Optional[asyncio.Task] = None
+        self._last_cursor_flush = time.monotonic()
+
+        # Websocket push (None when disabled)
+        self.push_poll_interval = self.config.get("push_poll_interval", 600)
+        self._push = None
+        self._push_registered = False
+
         # Transaction cache to avoid duplicates
-        self.processed_signatures = set()
         self.signature_cache_size = 10000
+        self.processed_signatures = get_signature_index("monitor", db_path, self.signature_cache_size)
 
         # Statistics
         self.stats = {
@@ -76,6 +253,9 @@ class SolanaTransactionMonitor:
             "deposits_detected": 0,
             "withdrawals_processed": 0,
             "errors": 0,
+            "scans": 0,
+            "signature_requests": 0,
+            "push_notifications": 0,
             "start_time": datetime.now()
         }
 
@@ -153,15 +333,21 @@ class SolanaTransactionMonitor:
                 logger.error(f"Cannot monitor invalid address: {validation['error']}")
                 return False
 
-            # Store in database
+            # Store in database, keeping the existing cursor
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
-                INSERT OR REPLACE INTO monitor_addresses
-                (address, label, is_active, last_check)
+                INSERT INTO monitor_addresses (address, label, is_active, last_check)
                 VALUES (?, ?, 1, CURRENT_TIMESTAMP)
+                ON CONFLICT(address) DO UPDATE SET
+                    label = excluded.label, is_active = 1, last_check = CURRENT_TIMESTAMP
             """, (address, label or f"Address {address[:8]}..."))
+            cursor.execute(
+                "SELECT last_signature FROM monitor_addresses WHERE address = ?",
+                (address,)
+            )
+            row = cursor.fetchone()
 
             conn.commit()
             conn.close()
@@ -169,10 +355,15 @@ class SolanaTransactionMonitor:
             # Add to monitoring
             self.monitored_addresses[address] = callback
 
-            # Start monitoring task if not already running
+            # Hand the address to the shared scanner
             if address not in self.active_monitors:
-                task = asyncio.create_task(self._monitor_address(address))
-                self.active_monitors[address] = task
+                self._schedule(AddressScanState(
+                    address=address,
+                    last_signature=row[0] if row else None,
+                    interval=self.min_poll_interval
+                ))
+                self._ensure_scanner()
+                self._watch(address)
                 logger.info(f"Started monitoring address: {address} ({label})")
 
             return True
@@ -184,10 +375,10 @@ class SolanaTransactionMonitor:
     async def remove_address_from_monitor(self, address: str) -> bool:
         """Remove address from monitoring"""
         try:
-            # Cancel monitoring task
-            if address in self.active_monitors:
-                self.active_monitors[address].cancel()
-                del self.active_monitors[address]
+            # Drop from the scanner; its queue entry is skipped as stale
+            state = self.active_monitors.pop(address, None)
+            if state and self._push:
+                self._push.unwatch(address)
 
             # Remove from monitoring list
             if address in self.monitored_addresses:
@@ -197,8 +388,8 @@ class SolanaTransactionMonitor:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute(
-                "UPDATE monitor_addresses SET is_active = 0 WHERE address = ?",
-                (address,)
+                "UPDATE monitor_addresses SET is_active = 0, last_signature = COALESCE(?, last_signature) WHERE address = ?",
+                (state.last_signature if state else None, address)
             )
             conn.commit()
             conn.close()
@@ -210,97 +401,197 @@ class SolanaTransactionMonitor:
             logger.error(f"Error removing address from monitor: {e}")
             return False
 
-    async def _monitor_address(self, address: str):
-        """Internal method to monitor a single address"""
-        logger.info(f"Starting transaction monitoring for {address}")
-        last_signature = None
-        poll_interval = 30  # Increased from 10 to 30 seconds for better rate limiting
+    def _schedule(self, state: AddressScanState, delay: float = 0.0):
+        """Queue an address for its next scan"""
+        state.next_check = time.monotonic() + delay
+        self.active_monitors[state.address] = state
+        heapq.heappush(self._scan_queue, (state.next_check, state.address))
+        self._scan_wakeup.set()
+
+    def _watch(self, address: str):
+        """Subscribe an address for websocket notifications"""
+        if not self._push_registered:
+            self._push_registered = True
+            self._push = get_subscription_manager()
+            if self._push:
+                self._push.add_listener(self._on_push_notification)
+                self._push.add_state_listener(self._on_push_state)
+        if self._push:
+            self._push.watch(address)
+
+    def _wake(self, state: AddressScanState):
+        """Scan an address now (or right after its running scan)"""
+        if state.scanning:
+            state.wake_requested = True
+        elif state.next_check > time.monotonic():
+            self._schedule(state)
+
+    async def _on_push_notification(self, address: str, signature: str):
+        state = self.active_monitors.get(address)
+        if state:
+            self.stats["push_notifications"] += 1
+            self._wake(state)
+
+    async def _on_push_state(self, connected: bool):
+        # Connected: backfill what was missed. Disconnected: resume normal polling.
+        for state in list(self.active_monitors.values()):
+            self._wake(state)
+
+    def _ensure_scanner(self):
+        """Start the shared scanner task if it is not running"""
+        if self._scanner_task is None or self._scanner_task.done():
+            self._scanner_task = asyncio.create_task(self._run_scanner())
+
+    def _pop_due_addresses(self, limit: int) -> List[AddressScanState]:
+        """Take up to `limit` addresses whose check time has come, earliest first"""
+        now = time.monotonic()
+        due = []
+        while self._scan_queue and len(due) < limit and self._scan_queue[0][0] <= now:
+            next_check, address = heapq.heappop(self._scan_queue)
+            state = self.active_monitors.get(address)
+            if state is None or state.next_check != next_check:
+                continue  # removed or rescheduled since it was queued
+            due.append(state)
+        return due
+
+    async def _run_scanner(self):
+        """Scan due addresses until none are monitored"""
+        logger.info("Transaction scanner started")
+        try:
+            while self.active_monitors:
+                self._scan_wakeup.clear()
+                due = self._pop_due_addresses(self.scan_concurrency)
+
+                if due:
+                    # The RPC client's token bucket is the shared budget
+                    await asyncio.gather(*(self._scan_address(state) for state in due))
+                else:
+                    timeout = self._scan_queue[0][0] - time.monotonic() if self._scan_queue else self.max_poll_interval
+                    try:
+                        await asyncio.wait_for(self._scan_wakeup.wait(), timeout=max(timeout, 0))
+                    except asyncio.TimeoutError:
+                        pass
+
+                if time.monotonic() - self._last_cursor_flush >= self.cursor_flush_interval:
+                    self._flush_cursors()
+
+        except asyncio.CancelledError:
+            logger.info("Transaction scanner cancelled")
+        except Exception as e:
+            logger.error(f"Fatal error in transaction scanner: {e}")
+        finally:
+            self._flush_cursors()
+
+    async def _fetch_new_signatures(self, state: AddressScanState) -> List[Dict[str, Any]]:
+        """Signatures newer than the address cursor, newest first"""
+        if not state.last_signature:
+            # No cursor yet - only look at the latest few, like a fresh monitor
+            limit = 5
+        else:
+            limit = self.signature_page_size
+
+        signatures = []
+        before = None
+        while True:
+            result = await self.rpc_client.get_signatures_for_address(
+                state.address,
+                limit=limit,
+                before=before,
+                until=state.last_signature,
+                priority=RPCPriority.BACKGROUND
+            )
+            self.stats["signature_requests"] += 1
+            if result.get("error"):
+                raise RuntimeError(result["error"])
+
+            page = result.get("signatures", [])
+            signatures.extend(page)
+
+            # Page back only while there may be more signatures after the cursor
+            if not state.last_signature or len(page) < limit:
+                return signatures
+            before = page[-1]["signature"]
+
+    async def _scan_address(self, state: AddressScanState):
+        """Process new transactions of one address and reschedule it"""
+        address = state.address
+        found = 0
+        state.scanning = True
+        state.wake_requested = False
+
+        try:
+            signatures = await self._fetch_new_signatures(state)
+            self.stats["scans"] += 1
+            new_transactions = []
+            unseen = self.processed_signatures.filter_new([sig["signature"] for sig in signatures])
+
+            # One JSON-RPC batch per chunk instead of one request per signature
+            details = await self.rpc_client.get_transactions_batch(unseen, RPCPriority.BACKGROUND)
+
+            # Oldest first, so the cursor only moves past processed signatures
+            for sig_info in reversed(signatures):
+                signature = sig_info["signature"]
+
+                if signature in details:
+                    tx_details = details[signature]
+                    if tx_details.get("retry"):
+                        break  # RPC busy or lagging - continue from here on the next scan
+
+                    if not tx_details.get("error"):
+                        transaction = await self._process_transaction(
+                            address, sig_info, tx_details
+                        )
+                        if transaction:
+                            new_transactions.append(transaction)
+
+                    self.processed_signatures.add(signature)
+
+                state.last_signature = signature
+                state.cursor_dirty = True
+                found += 1
+
+            # Process new transactions
+            for transaction in new_transactions:
+                await self._handle_new_transaction(address, transaction)
+
+        except Exception as e:
+            logger.error(f"Error scanning address {address}: {e}")
+            self.stats["errors"] += 1
+
+        # Adapt polling frequency to the address's activity
+        state.scanning = False
+        state.signatures_seen += found
+        max_interval = self.push_poll_interval if self._push and self._push.connected else self.max_poll_interval
+        if found:
+            state.interval = self.min_poll_interval
+        else:
+            state.interval = min(state.interval * 2, max_interval)
+
+        if self.active_monitors.get(address) is state:
+            self._schedule(state, 0 if state.wake_requested else state.interval)
+
+    def _flush_cursors(self):
+        """Persist processed signatures and changed address cursors in one transaction"""
+        self._last_cursor_flush = time.monotonic()
+        dirty = [state for state in self.active_monitors.values() if state.cursor_dirty]
+        if not dirty and not self.processed_signatures.pending_count:
+            return
 
         try:
-            # Get initial state
             conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT last_signature FROM monitor_addresses WHERE address = ?",
-                (address,)
+            self.processed_signatures.flush(conn)
+            conn.executemany(
+                "UPDATE monitor_addresses SET last_signature = ?, last_check = CURRENT_TIMESTAMP WHERE address = ?",
+                [(state.last_signature, state.address) for state in dirty]
             )
-            row = cursor.fetchone()
-            if row and row[0]:
-                last_signature = row[0]
+            conn.commit()
             conn.close()
 
-            while True:
-                try:
-                    # Get new signatures with reduced batch size
-                    signatures_result = await self.rpc_client.get_signatures_for_address(
-                        address,
-                        limit=5,  # Reduced from 20 to 5 for better rate limiting
-                        before=last_signature
-                    )
-
-                    if signatures_result.get("signatures"):
-                        new_transactions = []
-
-                        for sig_info in reversed(signatures_result["signatures"]):
-                            if sig_info["signature"] != last_signature:
-                                if sig_info["signature"] not in self.processed_signatures:
-                                    # Get detailed transaction info
-                                    tx_details = await self.rpc_client.get_transaction_details(
-                                        sig_info["signature"]
-                                    )
-
-                                    if not tx_details.get("error"):
-                                        transaction = await self._process_transaction(
-                                            address, sig_info, tx_details
-                                        )
-                                        if transaction:
-                                            new_transactions.append(transaction)
-
-                                    # Add to processed cache
-                                    self.processed_signatures.add(sig_info["signature"])
-
-                                    # Limit cache size
-                                    if len(self.processed_signatures) > self.signature_cache_size:
-                                        self.processed_signatures.pop()
-
-                        # Update last signature
-                        if signatures_result["signatures"]:
-                            last_signature = signatures_result["signatures"][0]["signature"]
-
-                            # Update database
-                            conn = sqlite3.connect(self.db_path)
-                            cursor = conn.cursor()
-                            cursor.execute(
-                                "UPDATE monitor_addresses SET last_signature = ?, last_check = CURRENT_TIMESTAMP WHERE address = ?",
-                                (last_signature, address)
-                            )
-                            conn.commit()
-                            conn.close()
-
-                        # Process new transactions
-                        for transaction in new_transactions:
-                            await self._handle_new_transaction(address, transaction)
-
-                    await asyncio.sleep(poll_interval)
-
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    if any(keyword in error_msg for keyword in ["rate limit", "429", "too many"]):
-                        logger.warning(f"Rate limited while monitoring {address}, backing off")
-                        await asyncio.sleep(poll_interval * 3)  # Longer backoff for rate limits
-                    elif any(keyword in error_msg for keyword in ["503", "service unavailable", "network"]):
-                        logger.warning(f"Service unavailable while monitoring {address}, waiting")
-                        await asyncio.sleep(poll_interval * 2)
-                    else:
-                        logger.error(f"Error in monitoring loop for {address}: {e}")
-                        await asyncio.sleep(poll_interval)
-
-                    self.stats["errors"] += 1
+            for state in dirty:
+                state.cursor_dirty = False
 
-        except asyncio.CancelledError:
-            logger.info(f"Monitoring cancelled for address: {address}")
         except Exception as e:
-            logger.error(f"Fatal error monitoring address {address}: {e}")
+            logger.error(f"Error saving monitor cursors: {e}")
 
     async def _process_transaction(self, monitored_address: str, sig_info: dict, tx_details: dict) -> Optional[MonitoredTransaction]:
         """Process and categorize a transaction"""
@@ -364,7 +655,11 @@ class SolanaTransactionMonitor:
                 processed_at=None,
                 user_id=None,
                 casino_transaction_id=None,
-                error_message=tx_details.get("error")
+                error_message=tx_details.get("error"),
+                post_balances={
+                    change["account"]: change["post_balance"]
+                    for change in tx_details.get("balance_changes", [])
+                }
             )
 
             # Store in database
@@ -518,6 +813,7 @@ class SolanaTransactionMonitor:
             return {
                 "uptime_seconds": uptime.total_seconds(),
                 "active_monitors": len(self.active_monitors),
+                "scanner_running": bool(self._scanner_task and not self._scanner_task.done()),
                 "monitored_addresses": active_addresses,
                 "total_transactions_in_db": total_tx_count,
                 "transaction_type_counts": type_counts,
@@ -534,12 +830,23 @@ class SolanaTransactionMonitor:
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
-            cursor.execute("SELECT address, label FROM monitor_addresses WHERE is_active = 1")
+            cursor.execute("SELECT address, last_signature FROM monitor_addresses WHERE is_active = 1")
             addresses = cursor.fetchall()
             conn.close()
 
-            for address, label in addresses:
-                await self.add_address_to_monitor(address, label)
+            # Stored addresses were validated when added - queue them directly
+            for address, last_signature in addresses:
+                self.monitored_addresses.setdefault(address, None)
+                if address not in self.active_monitors:
+                    self._schedule(AddressScanState(
+                        address=address,
+                        last_signature=last_signature,
+                        interval=self.min_poll_interval
+                    ))
+                    self._watch(address)
+
+            if addresses:
+                self._ensure_scanner()
 
             logger.info(f"Started monitoring {len(addresses)} addresses")
 
@@ -547,18 +854,19 @@ class SolanaTransactionMonitor:
             logger.error(f"Error starting all monitors: {e}")
 
     async def stop_all_monitors(self):
-        """Stop all monitoring tasks"""
+        """Stop the scanner and save all cursors"""
         try:
-            tasks_to_cancel = list(self.active_monitors.values())
-
-            for task in tasks_to_cancel:
-                task.cancel()
-
-            # Wait for tasks to complete
-            if tasks_to_cancel:
-                await asyncio.gather(*tasks_to_cancel, return_exceptions=True)
-
+            if self._scanner_task:
+                self._scanner_task.cancel()
+                await asyncio.gather(self._scanner_task, return_exceptions=True)
+                self._scanner_task = None
+
+            self._flush_cursors()
+            if self._push:
+                for address in self.active_monitors:
+                    self._push.unwatch(address)
             self.active_monitors.clear()
+            self._scan_queue.clear()
             self.monitored_addresses.clear()
 
             logger.info("Stopped all transaction monitors")
@@ -566,8 +874,17 @@ class SolanaTransactionMonitor:
         except Exception as e:
             logger.error(f"Error stopping monitors: {e}")
 
-# Global instance
+# Global instances
 _transaction_monitor = None
+_signature_indexes: Dict[tuple, ProcessedSignatureIndex] = {}
+
+def get_signature_index(scope: str, db_path: str = "casino_bot.db",
+                        max_size: int = 10000) -> ProcessedSignatureIndex:
+    """Shared processed-signature index for a scope (e.g. "monitor", "qr")"""
+    key = (scope, db_path)
+    if key not in _signature_indexes:
+        _signature_indexes[key] = ProcessedSignatureIndex(db_path, scope, max_size)
+    return _signature_indexes[key]
 
 def get_transaction_monitor() -> SolanaTransactionMonitor:
     """Get global transaction monitor instance"""
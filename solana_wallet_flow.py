@@ -168,8 +168,32 @@ async def handle_deposit_wallet_selection(query, context, wallet_id, sol_amount)
         # Deep link URL'sini belirle
         deep_link = wallet_info.get("ios", wallet_info.get("android", ""))
 
-        # Format SOL amount for display
-        sol_display = f"{float(sol_amount):.3f}".rstrip('0').rstrip('.')
+        # Otomatik ödeme sistemi için etiketli pending transaction ekle -
+        # kullanıcı benzersiz lamport etiketli tutarı birebir gönderir
+        exact_amount = float(sol_amount)
+        try:
+            from helius_webhook import get_payment_monitor
+
+            user_id = query.from_user.id
+            payment_monitor = await get_payment_monitor()
+            tagged = await payment_monitor.add_pending_payment(
+                user_id=user_id,
+                expected_amount=float(sol_amount),
+                wallet_address=solana_system.get_deposit_wallet(),
+                notes=f"Deposit via {wallet_info['name']}"
+            )
+
+            if tagged:
+                exact_amount = tagged['expected_amount']
+                logger.info(f"Added pending transaction {tagged['id']} for user {user_id}: {exact_amount:.9f} SOL")
+            else:
+                logger.error(f"Failed to add pending transaction for user {user_id}")
+
+        except Exception as e:
+            logger.error(f"Error adding pending transaction: {e}")
+
+        # Format SOL amount for display - every lamport of the tag matters
+        sol_display = f"{exact_amount:.9f}".rstrip('0').rstrip('.')
 
         text = f"""
 📱 **{wallet_info['name']} - YATIRIM** 📱
@@ -182,7 +206,7 @@ async def handle_deposit_wallet_selection(query, context, wallet_id, sol_amount)
 
 📋 **İşlem Adımları:**
 1. Wallet'ı açmak için butona tıklayın
-2. Yukarıdaki adrese tam {sol_amount} SOL gönderin
+2. Yukarıdaki adrese tam olarak {sol_display} SOL gönderin (küsurat dahil)
 3. 🚀 Otomatik blockchain algılama
 4. ⚡ Anında FC bakiye güncellemesi
 
@@ -207,7 +231,7 @@ async def handle_deposit_wallet_selection(query, context, wallet_id, sol_amount)
 
         # Ödeme durumu ve seçenekler
         keyboard.extend([
-            [InlineKeyboardButton("🚀 SOL Gönderildi - Otomatik Algıla", callback_data=f"start_auto_detection_{sol_amount}")],
+            [InlineKeyboardButton("🚀 SOL Gönderildi - Otomatik Algıla", callback_data=f"start_auto_detection_{sol_display}")],
             [InlineKeyboardButton("💰 Bakiye Kontrol", callback_data="check_balance")],
             [InlineKeyboardButton("🔄 Başka Wallet", callback_data=f"select_deposit_amount_{sol_amount}")],
             [InlineKeyboardButton("🔙 Geri", callback_data="solana_deposit_menu")]
@@ -221,39 +245,6 @@ async def handle_deposit_wallet_selection(query, context, wallet_id, sol_amount)
             reply_markup=reply_markup
         )
 
-        # Otomatik ödeme sistemi için pending transaction ekle
-        try:
-            from database_manager import DatabaseManager
-            from helius_webhook import get_payment_monitor
-
-            db = DatabaseManager()
-            user_id = query.from_user.id
-            admin_wallet = solana_system.get_deposit_wallet()
-
-            # Pending transaction ekle
-            transaction_id = db.add_pending_transaction(
-                user_id=user_id,
-                expected_amount=float(sol_amount),
-                wallet_address=admin_wallet,
-                notes=f"Deposit via {wallet_info['name']}"
-            )
-
-            if transaction_id:
-                logger.info(f"Added pending transaction {transaction_id} for user {user_id}: {sol_amount} SOL")
-
-                # Payment monitor'e ekle
-                payment_monitor = await get_payment_monitor()
-                await payment_monitor.add_pending_payment(
-                    user_id=user_id,
-                    expected_amount=float(sol_amount),
-                    wallet_address=admin_wallet
-                )
-            else:
-                logger.error(f"Failed to add pending transaction for user {user_id}")
-
-        except Exception as e:
-            logger.error(f"Error adding pending transaction: {e}")
-
         # Kullanıcıya bildirim
         await query.answer(f"🔗 {wallet_info['name']} seçildi! Otomatik algılama aktif.", show_alert=False)
 
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Solana Withdrawal Pipeline
+Toplu çekimleri çok transferli işlemlere paketleyip eşzamanlı gönderir
+
+Approved withdrawals are packed into legacy transactions holding as many
+system transfers as fit in one packet (a transfer's memo travels as its own
+SPL Memo instruction and takes room too), all signed against one cached recent
+blockhash and submitted concurrently under the shared RPC budget. One
+getSignatureStatuses batch per poll tracks every transaction.
+
+A transaction is only rebuilt once it can no longer land: it failed, was
+rejected before forwarding, or its blockhash expired without the signature
+ever being seen. A transfer whose transaction was sent but not confirmed by
+the deadline comes back with in_doubt set: it may still land, so it is never
+resent and the caller must record it as pending, so a withdrawal cannot be
+paid twice.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from solders.keypair import Keypair
+
+from solana_rpc_client import get_solana_rpc_client, RPCPriority
+from config import SOLANA_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Legacy transaction with one signer: signature (65) + header (3) + account keys
+# (payer, system program, one per recipient) + blockhash + 17 bytes per transfer
+MAX_TRANSACTION_SIZE = 1232
+TRANSFER_TX_BASE_SIZE = 65 + 3 + 1 + 64 + 32 + 1
+TRANSFER_SIZE = 32 + 17
+MAX_TRANSFERS_PER_TRANSACTION = (MAX_TRANSACTION_SIZE - TRANSFER_TX_BASE_SIZE) // TRANSFER_SIZE
+# Memo instructions: the memo program key once, then program index, empty
+# account list and the length-prefixed memo bytes per memo
+MEMO_PROGRAM_KEY_SIZE = 32
+
+def memo_instruction_size(memo: Optional[str]) -> int:
+    """Bytes one transfer's memo instruction adds to a transaction (0 without a memo)"""
+    if not memo:
+        return 0
+    length = len(memo.encode())
+    return 2 + (1 if length < 0x80 else 2) + length
+
+def transaction_size(transfers: List["WithdrawalTransfer"]) -> int:
+    """Serialized size of the transaction paying these transfers, memos included"""
+    size = TRANSFER_TX_BASE_SIZE + sum(TRANSFER_SIZE + memo_instruction_size(transfer.memo) for transfer in transfers)
+    if any(transfer.memo for transfer in transfers):
+        size += MEMO_PROGRAM_KEY_SIZE
+    return size
+
+@dataclass
+class WithdrawalTransfer:
+    """One withdrawal moving through the pipeline"""
+    index: int
+    to_address: str
+    lamports: int
+    memo: Optional[str] = None
+    signature: Optional[str] = None
+    error: Optional[str] = None
+    confirmed: bool = False
+    in_doubt: bool = False  # sent but unconfirmed - may still land, never resend
+    alone: bool = False  # send in its own transaction after its pack failed
+    attempts: int = 0
+
+    @property
+    def amount_sol(self) -> float:
+        return self.lamports / 1_000_000_000
+
+class WithdrawalPipeline:
+    """Pack, submit and confirm many SOL transfers from one wallet"""
+
+    def __init__(self, keypair: Keypair, rpc_client=None,
+                 transfers_per_transaction: int = MAX_TRANSFERS_PER_TRANSACTION,
+                 max_rounds: int = None, poll_interval: float = None,
+                 confirmation_timeout: float = None):
+        self.keypair = keypair
+        self.rpc_client = rpc_client or get_solana_rpc_client()
+        self.transfers_per_transaction = max(1, min(transfers_per_transaction, MAX_TRANSFERS_PER_TRANSACTION))
+        self.max_rounds = max_rounds or SOLANA_CONFIG.get("withdrawal_max_rounds", 3)
+        self.poll_interval = poll_interval or SOLANA_CONFIG.get("withdrawal_poll_interval", 1.0)
+        self.confirmation_timeout = confirmation_timeout or SOLANA_CONFIG.get("confirmation_timeout", 90)
+
+        self._used_signatures = set()
+        self.stats = {"transactions": 0, "confirmed": 0, "failed": 0, "in_doubt": 0, "retried": 0,
+                      "status_polls": 0}
+
+    async def run(self, transfers: List[WithdrawalTransfer]) -> List[WithdrawalTransfer]:
+        """Send every transfer; each comes back confirmed or with an error"""
+        pending = [transfer for transfer in transfers if not transfer.error]
+
+        for round_number in range(self.max_rounds):
+            if not pending:
+                break
+            if round_number:
+                self.stats["retried"] += len(pending)
+
+            # Retries always build on a fresh blockhash
+            blockhash = await self.rpc_client.get_latest_blockhash(RPCPriority.WITHDRAWAL, refresh=round_number > 0)
+            if "error" in blockhash:
+                for transfer in pending:
+                    transfer.error = f"Blockhash unavailable: {blockhash['error']}"
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            submitted = await asyncio.gather(*(
+                self._submit(pack, blockhash["blockhash"]) for pack in self._pack(pending)
+            ))
+            pending = [transfer for _, retry, _ in submitted for transfer in retry]
+
+            in_flight = {signature: pack for signature, _, pack in submitted if signature}
+            pending += await self._confirm(in_flight, blockhash["last_valid_block_height"])
+
+        for transfer in pending:
+            transfer.error = transfer.error or "Not confirmed"
+            self.stats["failed"] += 1
+        return transfers
+
+    def _pack(self, transfers: List[WithdrawalTransfer]) -> List[List[WithdrawalTransfer]]:
+        """Group transfers into transaction-sized packs; isolated ones go alone"""
+        packs = [[transfer] for transfer in transfers if transfer.alone]
+        pack = []
+        for transfer in transfers:
+            if transfer.alone:
+                continue
+            if pack and (len(pack) >= self.transfers_per_transaction
+                         or transaction_size(pack + [transfer]) > MAX_TRANSACTION_SIZE):
+                packs.append(pack)
+                pack = []
+            pack.append(transfer)
+        if pack:
+            packs.append(pack)
+        return packs
+
+    async def _submit(self, pack: List[WithdrawalTransfer], blockhash: str):
+        """Build, sign and send one pack - returns (signature or None, retry list, pack)"""
+        try:
+            transaction = self.rpc_client.build_transfer_transaction(
+                self.keypair, [(transfer.to_address, transfer.lamports, transfer.memo) for transfer in pack],
+                blockhash
+            )
+            if len(bytes(transaction)) > MAX_TRANSACTION_SIZE:
+                raise ValueError("Transaction too large")
+        except Exception as e:
+            logger.error(f"Error building withdrawal transaction: {e}")
+            return None, self._failed(pack, str(e)), pack
+
+        signature = str(transaction.signatures[0])
+        if signature in self._used_signatures:
+            # Same transfers on the same blockhash sign identically and the
+            # cluster would drop one as a duplicate - send it next round instead
+            return None, pack, pack
+        self._used_signatures.add(signature)
+
+        for transfer in pack:
+            transfer.attempts += 1
+            transfer.signature = signature
+            transfer.error = None
+
+        self.stats["transactions"] += 1
+        result = await self.rpc_client.send_raw_transaction(transaction, RPCPriority.WITHDRAWAL)
+        if result.get("success") or result.get("in_doubt"):
+            return signature, [], pack
+
+        if result.get("retry"):
+            for transfer in pack:
+                transfer.error = result["error"]
+            return None, pack, pack
+        return None, self._failed(pack, result["error"]), pack
+
+    def _failed(self, pack: List[WithdrawalTransfer], error: str) -> List[WithdrawalTransfer]:
+        """A pack fails as a whole - retry its transfers one by one to isolate the bad one"""
+        for transfer in pack:
+            transfer.error = error
+        if len(pack) == 1:
+            self.stats["failed"] += 1
+            return []
+        for transfer in pack:
+            transfer.alone = True
+        return pack
+
+    async def _confirm(self, in_flight: Dict[str, List[WithdrawalTransfer]],
+                       last_valid_block_height: int) -> List[WithdrawalTransfer]:
+        """Poll every in-flight signature in one batch until it lands, fails or expires
+
+        Returns the transfers that are safe to send again.
+        """
+        retry = []
+        deadline = time.monotonic() + self.confirmation_timeout
+
+        while in_flight:
+            await asyncio.sleep(self.poll_interval)
+            self.stats["status_polls"] += 1
+            result = await self.rpc_client.get_signature_statuses(list(in_flight), RPCPriority.WITHDRAWAL)
+
+            for signature, status in result["statuses"].items():
+                if not status or signature not in in_flight:
+                    continue
+                if status.get("err"):
+                    pack = in_flight.pop(signature)
+                    retry += self._failed(pack, f"Transaction failed: {status['err']}")
+                elif status.get("confirmationStatus") in ("confirmed", "finalized"):
+                    for transfer in in_flight.pop(signature):
+                        transfer.confirmed = True
+                        transfer.error = None
+                        self.stats["confirmed"] += 1
+
+            block_height = result["block_height"]
+            if block_height is not None and block_height > last_valid_block_height:
+                # Blockhash expired and these were never seen - they can no longer land
+                for signature, pack in list(in_flight.items()):
+                    if result["statuses"].get(signature, False) is None:
+                        for transfer in in_flight.pop(signature):
+                            transfer.error = "Blockhash expired"
+                            retry.append(transfer)
+
+            if in_flight and time.monotonic() > deadline:
+                for pack in in_flight.values():
+                    for transfer in pack:
+                        transfer.error = "Confirmation timed out - check the signature before resending"
+                        transfer.in_doubt = True
+                        self.stats["in_doubt"] += 1
+                break
+
+        return retry
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats)
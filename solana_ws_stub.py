@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Solana WebSocket Stub Server
+Yerel test için logsSubscribe bildirimleri üreten sahte RPC websocket sunucusu
+
+Speaks the subset of the Solana pubsub protocol used by
+SolanaSubscriptionManager (logsSubscribe with a mentions filter,
+logsUnsubscribe) and lets you push notifications over HTTP:
+
+    python solana_ws_stub.py --port 8900
+    SOLANA_WEBSOCKET_URL=ws://127.0.0.1:8900/ python main.py
+
+    curl -X POST 127.0.0.1:8900/emit -d '{"address": "<wallet>", "signature": "<sig>"}'
+    curl -X POST 127.0.0.1:8900/drop    # close every socket to exercise reconnects
+    curl 127.0.0.1:8900/status
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import secrets
+from typing import Dict, Tuple
+
+import base58
+from aiohttp import web, WSMsgType
+
+logger = logging.getLogger(__name__)
+
+class SolanaWebsocketStub:
+    """Fake pubsub endpoint - subscriptions in memory, notifications on demand"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8900):
+        self.host = host
+        self.port = port
+        self._subscription_ids = itertools.count(1)
+        self._subscriptions: Dict[int, Tuple[web.WebSocketResponse, str]] = {}  # id -> (socket, address)
+        self._sockets = set()
+        self._slot = 1000
+        self._runner = None
+
+        self.app = web.Application()
+        self.app.router.add_get('/', self.websocket_handler)
+        self.app.router.add_post('/emit', self.emit_handler)
+        self.app.router.add_post('/drop', self.drop_handler)
+        self.app.router.add_get('/status', self.status_handler)
+
+    async def start(self):
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"Solana websocket stub listening on ws://{self.host}:{self.port}/")
+
+    async def stop(self):
+        await self.drop_connections()
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def websocket_handler(self, request: web.Request) -> web.WebSocketResponse:
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        self._sockets.add(websocket)
+        try:
+            async for message in websocket:
+                if message.type == WSMsgType.TEXT:
+                    await self._handle_request(websocket, message.data)
+        finally:
+            self._sockets.discard(websocket)
+            for subscription_id in [sid for sid, (ws, _) in self._subscriptions.items() if ws is websocket]:
+                del self._subscriptions[subscription_id]
+        return websocket
+
+    async def _handle_request(self, websocket: web.WebSocketResponse, raw: str):
+        try:
+            request = json.loads(raw)
+        except ValueError:
+            return
+
+        method, params = request.get("method"), request.get("params", [])
+        response = {"jsonrpc": "2.0", "id": request.get("id")}
+
+        if method == "logsSubscribe" and params and isinstance(params[0], dict):
+            mentions = params[0].get("mentions") or []
+            if len(mentions) != 1:
+                response["error"] = {"code": -32602, "message": "Invalid Request: Only 1 address supported"}
+            else:
+                subscription_id = next(self._subscription_ids)
+                self._subscriptions[subscription_id] = (websocket, mentions[0])
+                response["result"] = subscription_id
+        elif method == "logsUnsubscribe" and params:
+            response["result"] = self._subscriptions.pop(params[0], None) is not None
+        else:
+            response["error"] = {"code": -32601, "message": "Method not found"}
+
+        await websocket.send_str(json.dumps(response))
+
+    async def emit(self, address: str, signature: str = None, err=None) -> int:
+        """Send a logsNotification to every subscription mentioning address"""
+        signature = signature or base58.b58encode(secrets.token_bytes(64)).decode()
+        self._slot += 1
+        sent = 0
+        for subscription_id, (websocket, subscribed) in list(self._subscriptions.items()):
+            if subscribed != address or websocket.closed:
+                continue
+            await websocket.send_str(json.dumps({
+                "jsonrpc": "2.0",
+                "method": "logsNotification",
+                "params": {
+                    "result": {
+                        "context": {"slot": self._slot},
+                        "value": {
+                            "signature": signature,
+                            "err": err,
+                            "logs": ["Program 11111111111111111111111111111111 invoke [1]",
+                                     "Program 11111111111111111111111111111111 success"]
+                        }
+                    },
+                    "subscription": subscription_id
+                }
+            }))
+            sent += 1
+        return sent
+
+    async def drop_connections(self):
+        """Close every client socket"""
+        for websocket in list(self._sockets):
+            await websocket.close()
+
+    async def emit_handler(self, request: web.Request) -> web.Response:
+        data = await request.json()
+        sent = await self.emit(data["address"], data.get("signature"), data.get("err"))
+        return web.json_response({"sent": sent, "slot": self._slot})
+
+    async def drop_handler(self, request: web.Request) -> web.Response:
+        dropped = len(self._sockets)
+        await self.drop_connections()
+        return web.json_response({"dropped": dropped})
+
+    async def status_handler(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            "connections": len(self._sockets),
+            "subscriptions": {str(sid): address for sid, (_, address) in self._subscriptions.items()}
+        })
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Solana pubsub stub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    args = parser.parse_args()
+
+    async def _run():
+        stub = SolanaWebsocketStub(args.host, args.port)
+        await stub.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await stub.stop()
+
+    asyncio.run(_run())
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Solo Game Outcomes
+Solo oyun turlarının kompakt sonuç kayıtları
+
+SoloGameEngine's `<game>_outcome()` methods return these records. A record
+holds only the values drawn in the round plus the payout, with no text.
+solo_render.render_result() turns a record into the full result dict
+(texts, animation frames, grids) when a message is actually sent.
+
+Every record starts with the same fields:
+    bet_amount, multiplier, win_amount, won
+and ends with `bonus`, the _apply_admin_bonus adjustment that was applied
+('rescue', 'boost', 'reduced' or None). `game` is the registry game id.
+
+encode_outcome() packs a record into the short string kept in
+solo_game_history.result_data: a one-letter record code followed by the
+game fields only, e.g. '["M",3,3,[4,9,17],[2,9,20],1,2]'. The common fields
+already have their own columns, so decode_outcome() takes them back from
+the row.
+"""
+
+import json
+from typing import NamedTuple, Optional, Tuple
+
+SLOT_SYMBOLS = ("🍒", "🍋", "🍊", "🍇", "🔔", "💎", "🎰", "⭐", "🌟")
+SLOT_WEIGHTS = (20, 18, 15, 15, 12, 8, 6, 4, 2)
+
+RED_NUMBERS = frozenset([1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36])
+
+RPS_CHOICES = ("🗿", "📄", "✂️")
+RPS_BEATS = {"🗿": "✂️", "📄": "🗿", "✂️": "📄"}
+
+KENO_PAYOUTS = (0, 0, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 25.0, 100.0, 1000.0)  # by hits
+
+# (prize, multiplier, emoji, weight)
+WHEEL_SECTORS = (
+    ("MEGA JACKPOT", 50.0, "🌟", 1),
+    ("JACKPOT", 25.0, "💎", 2),
+    ("BIG WIN", 10.0, "🎆", 5),
+    ("SUPER WIN", 7.5, "✨", 8),
+    ("GREAT WIN", 5.0, "🎉", 12),
+    ("GOOD WIN", 3.0, "🎊", 15),
+    ("WIN", 2.0, "🏆", 20),
+    ("SMALL WIN", 1.5, "🎈", 25),
+    ("LUCKY", 1.0, "🍀", 12),
+)
+WHEEL_WEIGHTS = tuple(sector[3] for sector in WHEEL_SECTORS)
+
+MINES_GRID_SIZE = 25
+
+def blackjack_value(cards) -> int:
+    """Best blackjack total - aces count 11 while that stays at or below 21"""
+    value = sum(min(card, 10) for card in cards)
+    aces = sum(1 for card in cards if card == 1)
+    while aces > 0 and value + 10 <= 21:
+        value += 10
+        aces -= 1
+    return value
+
+def baccarat_value(cards) -> int:
+    return sum(min(card, 10) for card in cards) % 10
+
+class SlotsOutcome(NamedTuple):
+    bet_amount: int
+    multiplier: float
+    win_amount: int
+    won: bool
+    reels: Tuple[str, str, str]
+    bonus: Optional[str] = None
+    game = "solo_slots"
+    code = "S"
+
+class RouletteOutcome(NamedTuple):
+    bet_amount: int
+    multiplier: float
+    win_amount: int
+    won: bool
+    number: int
+    bet_type: str
+    bet_value: str
+    hit: bool  # the bet itself won (won also covers the zero consolation)
+    bonus: Optional[str] = None
+    game = "solo_roulette"
+    code = "R"
+
+class BlackjackOutcome(NamedTuple):
+    bet_amount: int
+    multiplier: float
+    win_amount: int
+    won: bool
+    player_cards: Tuple[int, ...]
+    dealer_cards: Tuple[int, ...]
+    player_value: int
+    dealer_value: int
+    result: str  # player_blackjack, both_blackjack, dealer_bust, win, push, bust, lose
+    bonus: Optional[str] = None
+    game = "solo_blackjack"
+    code = "B"
+
+class CrashOutcome(NamedTuple):
+    bet_amount: int
+    multiplier: float
+    win_amount: int
+    won: bool
+    crash_point: float
+    cashout_multiplier: float
+    bonus: Optional[str] = None
+    game = "solo_crash"
+    code = "C"
+
+class MinesOutcome(NamedTuple):
+    bet_amount: int
+    multiplier: float
+    win_amount: int
+    won: bool
+    mines_count: int
+    picks: int
+    mine_positions: Tuple[int, ...]
+    picked_positions: Tuple[int, ...]
+    hit_mines_count: int
+    gems_found: int
+    bonus: Optional[str] = None
+    game = "solo_mines"
+    code = "M"
+
+class BaccaratOutcome(NamedTuple):
+    bet_amount: int
+    multiplier: float
+    win_amount: int
+    won: bool
+    player_hand: Tuple[int, ...]
+    banker_hand: Tuple[int, ...]
+    player_val: int
+    banker_val: int
+    winner: str  # player, banker, tie
+    bet_on: str
+    bonus: Optional[str] = None
+    game = "solo_baccarat"
+    code = "A"
+
+class KenoOutcome(NamedTuple):
+    bet_amount: int
+    multiplier: float
+    win_amount: int
+    won: bool
+    numbers_chosen: Tuple[int, ...]  # sorted
+    drawn: Tuple[int, ...]  # sorted
+    hits: int
+    bonus: Optional[str] = None
+    game = "solo_keno"
+    code = "K"
+
+class RockPaperScissorsOutcome(NamedTuple):
+    bet_amount: int
+    multiplier: float
+    win_amount: int
+    won: bool
+    player_choice: str
+    bot_choice: str
+    result: str  # win, tie, lose
+    bonus: Optional[str] = None
+    game = "rock_paper_scissors"
+    code = "P"
+
+class NumberGuessOutcome(NamedTuple):
+    bet_amount: int
+    multiplier: float
+    win_amount: int
+    won: bool
+    target_number: int
+    player_guess: int
+    bonus: Optional[str] = None
+    game = "number_guess"
+    code = "N"
+
+class LuckyWheelOutcome(NamedTuple):
+    bet_amount: int
+    multiplier: float
+    win_amount: int
+    won: bool
+    sector: int  # index into WHEEL_SECTORS
+    bonus: Optional[str] = None
+    game = "lucky_wheel"
+    code = "W"
+
+class DiceOutcome(NamedTuple):
+    bet_amount: int
+    multiplier: float
+    win_amount: int
+    won: bool
+    dice_result: int
+    target: int
+    bonus: Optional[str] = None
+    game = "solo_dice"
+    code = "D"
+
+OUTCOME_TYPES = {cls.code: cls for cls in (
+    SlotsOutcome, RouletteOutcome, BlackjackOutcome, CrashOutcome, MinesOutcome, BaccaratOutcome,
+    KenoOutcome, RockPaperScissorsOutcome, NumberGuessOutcome, LuckyWheelOutcome, DiceOutcome,
+)}
+
+def encode_outcome(outcome) -> str:
+    """Compact result_data string for an outcome record"""
+    fields = list(outcome[4:])
+    if fields[-1] is None:  # bonus
+        fields.pop()
+    return json.dumps([outcome.code] + fields, ensure_ascii=False, separators=(",", ":"))
+
+def decode_outcome(data: str, bet_amount: int, multiplier: float, win_amount: int, won: bool):
+    """Outcome record from result_data and its row; None for empty, legacy or unknown data"""
+    if not data or not data.startswith('["'):
+        return None
+    try:
+        code, *fields = json.loads(data)
+        cls = OUTCOME_TYPES[code]
+        fields = [tuple(value) if isinstance(value, list) else value for value in fields]
+        return cls(bet_amount, multiplier, win_amount, bool(won), *fields)
+    except (ValueError, KeyError, TypeError):
+        return None
@@ -0,0 +1,640 @@
+#!/usr/bin/env python3
+"""
+Solo Game Rendering
+Solo oyun sonuç kayıtlarından mesaj metinleri üretir
+
+render_result(outcome, lang) turns a solo_outcomes record into the result
+dict the handlers send: result_text, special_effect, animation_frames and
+the game-specific display fields. It runs only when a message is sent, so
+batch callers that stop at the outcome record never build any strings.
+
+Texts come from RESULT_TEMPLATES (English defaults). Any key can be
+translated by adding it under "solo_results" in languages.LANGUAGES, e.g.
+LANGUAGES["ru"]["solo_results"]["slots"]["text_lose"].
+
+Card suits and the wheel's passing sectors are cosmetic. They are drawn
+from the `rng` given to render_result (the shared generator by default).
+
+The result dict keeps the record under 'outcome', so save_solo_game can
+store it compactly. describe_outcome() gives the one-line summary shown in
+the game history.
+"""
+
+from typing import Any, Dict
+
+from languages import DEFAULT_LANGUAGE, get_text
+from rng_service import BufferedRandom, get_rng
+from solo_outcomes import RED_NUMBERS, WHEEL_SECTORS, baccarat_value
+
+SUITS = ("♠️", "♥️", "♦️", "♣️")
+CARD_FACES = {1: "A", 11: "J", 12: "Q", 13: "K"}
+DICE_EMOJIS = ("⚪", "⚀", "⚁", "⚂", "⚃", "⚄", "⚅")
+
+RESULT_TEMPLATES = {
+    "history": {
+        "solo_slots": "🎰 {reels}",
+        "solo_roulette": "🎡 {number}",
+        "solo_blackjack": "🃏 {player_value} vs {dealer_value}",
+        "solo_crash": "🚀 {cashout_multiplier:.2f}x · 💥 {crash_point:.2f}x",
+        "solo_mines": "💎 {gems_found} · 💣 {hit_mines_count}",
+        "solo_baccarat": "🎴 P {player_val} · B {banker_val}",
+        "solo_keno": "🎱 {hits}/{picked}",
+        "rock_paper_scissors": "{player_choice} vs {bot_choice}",
+        "number_guess": "🔢 {player_guess} → {target_number}",
+        "lucky_wheel": "{emoji} {prize}",
+        "solo_dice": "🎲 {dice_result} / {target}",
+    },
+    "admin": {
+        "rescue_effect": "👑 ADMIN BONUS! 👑",
+        "rescue_text": "👑 Admin şansınız devreye girdi!",
+        "boost_effect": "👑 ADMIN BOOST!",
+    },
+    "slots": {
+        "effect_mega": "🌟💥 MEGA JACKPOT! 💥🌟",
+        "effect_diamond": "💎✨ DIAMOND JACKPOT! ✨💎",
+        "effect_slot": "🎰🔥 SLOT JACKPOT! 🔥🎰",
+        "effect_star": "⭐🎉 STAR JACKPOT! 🎉⭐",
+        "effect_big": "🎊 BIG WIN! 🎊",
+        "effect_nice": "🎈 NICE WIN! 🎈",
+        "effect_lucky": "🍀 Lucky! 🍀",
+        "text_mega": "🌟💥 MEGA JACKPOT! 💥🌟\n{reels}\n\n💰 AMAZING WIN!",
+        "text_diamond": "💎✨ DIAMOND JACKPOT! ✨💎\n{reels}\n\n🔥 INCREDIBLE!",
+        "text_jackpot": "🎉 JACKPOT! 🎉\n{reels}\n\n⭐ Great win!",
+        "text_lucky": "🍀 Lucky spin! 🍀\n{reels}\n\n🎈 Small win!",
+        "text_lose": "😔 No luck this time\n{reels}\n\n🎯 Try again!",
+        "reels": "🎰 [ {r0} | {r1} | {r2} ] 🎰",
+        "frame_spin": "🎰 Spinning the reels... 🎰",
+        "frame_reel1": "🎰 [ 🎲 | ? | ? ] 🎰",
+        "frame_reel2": "🎰 [ 🎲 | 🎲 | ? ] 🎰",
+    },
+    "roulette": {
+        "win_number": "NUMBER HIT!",
+        "win_color": "COLOR WIN!",
+        "win_even": "EVEN WIN!",
+        "win_odd": "ODD WIN!",
+        "win_high": "HIGH WIN!",
+        "win_low": "LOW WIN!",
+        "win_zero": "ZERO BONUS!",
+        "effect_zero": "🟢✨ ZERO LANDED! ✨🟢",
+        "effect_win": "🎉 {win_type} 🎉",
+        "text_number": "🎆💥 STRAIGHT NUMBER WIN! 💥🎆\n\n🎯 Number: **{number}** {color_emoji}\n🏆 {win_type}\n\n💰 INCREDIBLE PAYOUT!",
+        "text_zero": "🟢✨ ZERO LANDED! ✨🟢\n\n🎯 Number: **{number}** {color_emoji}\n🎊 House number hit!\n\n{closing}",
+        "zero_bonus": "💰 Small bonus!",
+        "zero_lose": "💸 House wins!",
+        "text_win": "🎉 {win_type} 🎉\n\n🎯 Number: **{number}** {color_emoji}\n🏆 {bet_type} bet won!\n\n💰 Nice payout!",
+        "text_lose": "😔 No win this time\n\n🎯 Number: **{number}** {color_emoji}\n💸 {bet_type} bet lost\n\n🍀 Better luck next spin!",
+        "frame_bet": "🎯 Placing your bet... 🎯",
+        "frame_spin": "🎯 🔄 Spinning the wheel... 🔄 🎯",
+        "frame_slow": "🎯 ⚡ Slowing down... ⚡ 🎯",
+        "frame_number": "🎯 {color_emoji} **{number}** {color_emoji} 🎯",
+    },
+    "blackjack": {
+        "text_player_blackjack": "🎆✨ BLACKJACK! ✨🎆\n\n{hands}\n\n💰 BLACKJACK PAYOUT!",
+        "text_dealer_bust": "🎉 DEALER BUST! 🎉\n\n{hands} 💥\n\n💰 You win!",
+        "text_win": "🏆 YOU WIN! 🏆\n\n{hands}\n\n💰 Great hand!",
+        "text_push": "🤝 PUSH - TIE! 🤝\n\n{hands}\n\n💰 Bet returned!",
+        "text_bust": "💥 BUST! 💥\n\n{hands}\n\n💸 Over 21!",
+        "text_lose": "😔 DEALER WINS 😔\n\n{hands}\n\n💸 Better luck next time!",
+        "hands": "👤 **Your cards:** {player_display} = **{player_value}**\n🎲 **Dealer:** {dealer_display} = **{dealer_value}**",
+        "frame_shuffle": "🃏 Shuffling deck... 🃏",
+        "frame_deal": "🃏 Dealing initial cards... 🃏",
+        "frame_player": "👤 **You:** {player_display} = {player_value}",
+        "frame_dealer_hidden": "🎲 **Dealer:** {dealer_first} | 🂠 = ??",
+        "frame_dealer": "🎲 **Dealer reveals:** {dealer_display} = {dealer_value}",
+    },
+    "crash": {
+        "effect_moon": "🌌🚀 MOON ROCKET! 🚀🌌",
+        "effect_space": "💫✨ SPACE FLIGHT! ✨💫",
+        "effect_high": "🎆🔥 HIGH FLIGHT! 🔥🎆",
+        "effect_good": "🎈🐻 GOOD FLIGHT! 🐻🎈",
+        "text_win": "🚀💰 SUCCESSFUL CASHOUT! 💰🚀\n\n🎯 **Target:** {cashout:.1f}x\n🚀 **Crashed at:** {crash_point:.1f}x\n\n{closing}",
+        "safe_landing": "💰 Safe landing!",
+        "text_lose": "💥💸 ROCKET CRASHED! 💸💥\n\n🎯 **Target:** {cashout:.1f}x\n🚀 **Crashed at:** {crash_point:.1f}x\n\n😢 Too greedy this time!",
+        "frame_prepare": "🚀 Rocket preparing for launch... 🚀",
+        "frame_liftoff": "🚀 3... 2... 1... LIFTOFF! 🚀",
+        "frame_flying": "🚀 1.0x 🟢 FLYING... 🟢",
+        "frame_climbing": "🚀 {value:.1f}x 🟡 CLIMBING...",
+        "frame_crashing": "🚀 {value:.1f}x 🔴 CRASHING!",
+        "frame_high": "🚀 {value:.1f}x 🟠 HIGH ALTITUDE!",
+        "frame_down": "🚀 {value:.1f}x 🔴 GOING DOWN!",
+    },
+    "mines": {
+        "effect_perfect": "🎆✨ PERFECT PICKS! ✨🎆",
+        "effect_good": "🎉💎 GOOD MINING! 💎🎉",
+        "text_lose": "💣💥 MINE EXPLOSION! 💥💣\n\n⛏️ **Mines hit:** {hit_mines}/{mines_count}\n💎 **Gems found:** {gems_found}\n\n🔥 GAME OVER!",
+        "text_win": "💎✨ SUCCESSFUL MINING! ✨💎\n\n⛏️ **Mines avoided:** {mines_count}\n💎 **Gems found:** {gems_found}\n\n{closing}",
+        "safe_mining": "💰 Safe mining!",
+        "frame_setup": "⛏️ Setting up minefield... ⛏️",
+        "frame_mines": "🔍 Placing {mines_count} mines in 25 positions...",
+        "frame_picks": "💎 Starting excavation at {picks} locations...",
+    },
+    "baccarat": {
+        "winner_player": "👤 PLAYER WINS!",
+        "winner_banker": "🏦 BANKER WINS!",
+        "winner_tie": "🤝 TIE GAME!",
+        "effect_tie": "🌈✨ RARE TIE! ✨🌈",
+        "effect_natural": "🎆💫 NATURAL WIN! 💫🎆",
+        "text_tie_win": "🎆🤝 RARE TIE WIN! 🤝🎆\n\n{hands}\n🎯 **Your bet:** TIE\n\n💰 HUGE PAYOUT!",
+        "text_win": "🎉 {winner_text} 🎉\n\n{hands}\n🎯 **Your bet:** {bet_on}\n\n💰 You win!",
+        "text_lose": "😔 {winner_text} 😔\n\n{hands}\n🎯 **Your bet:** {bet_on}\n\n💸 Wrong guess!",
+        "hands": "👤 **Player:** {player_display} = {player_val}\n🏦 **Banker:** {banker_display} = {banker_val}",
+        "frame_shuffle": "🃏 Shuffling baccarat cards... 🃏",
+        "frame_deal": "🃏 Dealing initial hands... 🃏",
+        "frame_player": "👤 **Player hand:** {player_display} = {player_val}",
+        "frame_banker": "🏦 **Banker hand:** {banker_display} = {banker_val}",
+        "frame_bet": "🎯 **Your bet:** {bet_on}",
+    },
+    "keno": {
+        "effect_10": "🌟🎆 PERFECT GAME! 🎆🌟",
+        "effect_8": "💫🔥 INCREDIBLE LUCK! 🔥💫",
+        "effect_6": "🎆👏 WELL DONE! 👏🎆",
+        "effect_4": "🍀✨ Lucky picks! ✨🍀",
+        "effect_2": "🌱 Something is better than nothing!",
+        "effect_0": "🍀 Better luck next time!",
+        "text_10": "🎆💥 KENO JACKPOT! 💥🎆\n\n🎯 **Your numbers:** {chosen}\n🎲 **Drawn numbers:** {drawn_short}...\n🏆 **Perfect match:** {hits}/10\n\n💰 INCREDIBLE PAYOUT!",
+        "text_8": "🎉✨ AMAZING! {hits} HITS! ✨🎉\n\n🎯 **Your numbers:** {chosen_short}...\n🎲 **Matches:** {matches}\n🏆 **Hit rate:** {hits}/10\n\n💰 Great win!",
+        "text_4": "🎈🐻 NICE! {hits} HITS! 🐻🎈\n\n🎯 **Your numbers:** {chosen_short}...\n🎲 **Matches:** {matches}\n🏆 **Hit rate:** {hits}/10\n\n💰 Good payout!",
+        "text_2": "🙂 Small win: {hits} hits\n\n🎯 **Your numbers:** {chosen_short}...\n🎲 **Matches:** {matches}\n🏆 **Hit rate:** {hits}/10\n\n🍀 Something is better than nothing!",
+        "text_0": "😔 No luck this time\n\n🎯 **Your numbers:** {chosen_short}...\n🎲 **No matches** from drawn numbers\n🏆 **Hit rate:** {hits}/10\n\n🍀 Better luck next time!",
+        "frame_start": "🎲 Keno machine starting... 🎲",
+        "frame_picks": "🎯 **Your picks:** {chosen}",
+        "frame_draw": "💫 Drawing 20 winning numbers...",
+        "frame_drawn": "🎲 **Drawn:** {drawn_short}...",
+        "frame_matches": "✨ **Matches found:** {matches}",
+        "frame_no_matches": "😔 No matches found...",
+    },
+    "rock_paper_scissors": {
+        "name_rock": "Taş",
+        "name_paper": "Kağıt",
+        "name_scissors": "Makas",
+        "effect_win": "🏆 Mükemmel seçim! 🏆",
+        "effect_tie": "🧠 Aynı dalga boyundayız! 🧠",
+        "text_win": "🎉 KAZANDINIZ! 🎉\n\n{choices}\n\n🏆 {player_name} beats {bot_name}!\n\n💰 Perfect choice!",
+        "text_tie": "🤝 BERABERE! 🤝\n\n{choices}\n\n🧠 Great minds think alike!\n\n💰 Bet returned!",
+        "text_lose": "😔 KAYBETTİNİZ 😔\n\n{choices}\n\n💪 {bot_name} beats {player_name}\n\n🍀 Try a different strategy!",
+        "choices": "👤 **Sizin:** {player_choice} {player_name}\n🤖 **Bot:** {bot_choice} {bot_name}",
+        "frame_start": "🎮 Rock-Paper-Scissors challenge! 🎮",
+        "frame_shoot": "3... 2... 1... SHOOT! 💫",
+        "frame_player": "👤 **You chose:** {player_choice} {player_name}",
+        "frame_bot": "🤖 **Bot chose:** {bot_choice} {bot_name}",
+    },
+    "number_guess": {
+        "effect_exact": "🌟🎉 İNANILMAZ ŞANS! 🎉🌟",
+        "effect_2": "🔥 Neredeyse mükemmel! 🔥",
+        "effect_5": "⭐ İyi tahmin! ⭐",
+        "effect_10": "🍀 Şans var! 🍀",
+        "effect_20": "💫 Denemeye devam! 💫",
+        "effect_far": "🌱 Bir dahaki sefere!",
+        "text_exact": "🎆💥 JACKPOT! TAM İSABET! 💥🎆\n\n{numbers}\n\n💰 INCREDIBLE PAYOUT!",
+        "text_5": "🎉 ÇOK YAKLAŞTIN! 🎉\n\n{numbers}\n\n💰 Great payout!",
+        "text_10": "👏 YAKLAŞTIN! 👏\n\n{numbers}\n\n💰 Nice payout!",
+        "text_20": "🙂 Fena değil! 🙂\n\n{numbers}\n\n💰 Small win!",
+        "text_far": "😔 Çok uzak 😔\n\n{numbers}\n\n🍀 Try again!",
+        "numbers": "🎯 **Your guess:** {player_guess}\n🎲 **Target number:** {target_number}\n🏆 **Difference:** {difference}",
+        "frame_start": "🎯 Mystery number generator starting... 🎯",
+        "frame_select": "🎲 Selecting random number from 1-100...",
+        "frame_guess": "🤔 **Your guess:** {player_guess}",
+        "frame_target": "✨ **Target number:** {target_number}",
+        "frame_difference": "📈 **Calculating difference:** {difference}",
+    },
+    "lucky_wheel": {
+        "effect_25": "🎆🌟 INCREDIBLE LUCK! 🌟🎆",
+        "effect_10": "💫🔥 AMAZING SPIN! 🔥💫",
+        "effect_5": "🎉⭐ GREAT LUCK! ⭐🎉",
+        "text_25": "🎆{emoji} {prize}! {emoji}🎆\n\n{details}\n\n{closing}",
+        "closing_25": "🎉 Amazing luck!",
+        "text_5": "🎉{emoji} {prize}! {emoji}🎉\n\n{details}\n\n{closing}",
+        "closing_5": "👏 Great spin!",
+        "text_small": "🍀{emoji} {prize} {emoji}🍀\n\n{details}\n\n😊 Good result!",
+        "details": "🎪 **Wheel stopped at:** {prize}\n💰 **Multiplier:** {multiplier:.1f}x",
+        "frame_prepare": "🎪 Fortune wheel preparing to spin... 🎪",
+        "frame_spin": "🎪 Wheel spinning faster... 🔄",
+        "frame_pass": "🎪 Passing {emoji} {prize}...",
+        "frame_slow": "🎪 Slowing down at {emoji} {prize}...",
+        "frame_stop": "🎪 **STOPPED!** {emoji} {prize}",
+    },
+    "dice": {
+        "effect_exact": "🎆🔥 PERFECT ROLL! 🔥🎆",
+        "effect_close": "⭐ Close enough! ⭐",
+        "effect_six": "👑 Lucky six! 👑",
+        "effect_lose": "🍀 Better luck next time!",
+        "text_exact": "🎯🔥 TAM İSABET! 🔥🎯\n\n{roll}\n🏆 **Perfect match!**\n\n💰 EXCELLENT PAYOUT!",
+        "text_close": "🎈⭐ YAKLAŞTIN! ⭐🎈\n\n{roll}\n👏 **Close enough!**\n\n💰 Good payout!",
+        "text_six": "🎉👑 ALTI GELDİ! 👑🎉\n\n{roll}\n🍀 **Lucky six bonus!**\n\n💰 Bonus payout!",
+        "text_lose": "😔 {dice_emoji} = {dice_result}\n\n{roll}\n💔 **Not close enough**\n\n🍀 Better luck next time!",
+        "roll": "🎲 **Rolled:** {dice_emoji} = {dice_result}\n🎯 **Target:** {target}",
+        "frame_prepare": "🎲 Preparing dice roll...",
+        "frame_target": "🎯 **Target number:** {target}",
+        "frame_roll": "🎲 Rolling the dice... 🌪️",
+        "frame_spin": "🎲 Dice is spinning...",
+        "frame_result": "🎲 **Result:** {dice_emoji} = {dice_result}",
+    },
+}
+
+class _Texts:
+    """Template lookup for one game and language"""
+
+    def __init__(self, lang: str, section: str):
+        self.lang = lang
+        self.section = section
+        self.defaults = RESULT_TEMPLATES[section]
+
+    def __call__(self, key: str, **fields) -> str:
+        template = get_text(self.lang, f"solo_results.{self.section}.{key}", self.defaults[key])
+        return template.format(**fields) if fields else template
+
+def _card(card: int, rng: BufferedRandom) -> str:
+    return f"{CARD_FACES.get(card, card)}{rng.choice(SUITS)}"
+
+def _by_threshold(value, thresholds, texts: _Texts, default: str = "", **fields) -> str:
+    """Text of the first (threshold, key) with value >= threshold"""
+    for threshold, key in thresholds:
+        if value >= threshold:
+            return texts(key, **fields)
+    return default
+
+def _base(outcome) -> Dict[str, Any]:
+    return {
+        'multiplier': outcome.multiplier,
+        'win_amount': outcome.win_amount,
+        'won': outcome.won,
+        'bet_amount': outcome.bet_amount,
+        'outcome': outcome,
+    }
+
+def _render_slots(outcome, t: _Texts, rng: BufferedRandom) -> dict:
+    multiplier = outcome.multiplier
+    reels = t("reels", r0=outcome.reels[0], r1=outcome.reels[1], r2=outcome.reels[2])
+    special_effect = _by_threshold(multiplier, [(50, "effect_mega"), (25, "effect_diamond"), (15, "effect_slot"),
+                                                (10, "effect_star"), (5, "effect_big"), (2, "effect_nice")], t)
+    if not special_effect and multiplier > 0:
+        special_effect = t("effect_lucky")
+    result_text = _by_threshold(multiplier, [(10, "text_mega"), (6, "text_diamond"), (2, "text_jackpot")], t,
+                                reels=reels)
+    if not result_text:
+        result_text = t("text_lucky" if multiplier > 0 else "text_lose", reels=reels)
+    return {
+        'reels': list(outcome.reels),
+        **_base(outcome),
+        'special_effect': special_effect,
+        'result_text': result_text,
+        'animation_frames': [t("frame_spin"), t("frame_reel1"), t("frame_reel2"), reels, result_text]
+    }
+
+def _render_roulette(outcome, t: _Texts, rng: BufferedRandom) -> dict:
+    number = outcome.number
+    if number == 0:
+        color, color_emoji = "green", "🟢"
+    elif number in RED_NUMBERS:
+        color, color_emoji = "red", "🔴"
+    else:
+        color, color_emoji = "black", "⚫"
+
+    win_type = ""
+    if outcome.hit:
+        key = {"number": "win_number", "color": "win_color"}.get(outcome.bet_type, f"win_{outcome.bet_value}")
+        win_type = t(key)
+    elif number == 0:
+        win_type = t("win_zero")
+
+    if number == 0:
+        special_effect = t("effect_zero")
+    elif outcome.hit:
+        special_effect = t("effect_win", win_type=win_type)
+    else:
+        special_effect = ""
+
+    fields = {"number": number, "color_emoji": color_emoji, "win_type": win_type,
+              "bet_type": outcome.bet_type.upper()}
+    if outcome.hit and outcome.multiplier >= 15:
+        result_text = t("text_number", **fields)
+    elif number == 0:
+        result_text = t("text_zero", closing=t("zero_bonus" if outcome.multiplier > 0 else "zero_lose"), **fields)
+    elif outcome.hit:
+        result_text = t("text_win", **fields)
+    else:
+        result_text = t("text_lose", **fields)
+
+    return {
+        'number': number,
+        'color': color,
+        'color_emoji': color_emoji,
+        **_base(outcome),
+        'win_type': win_type,
+        'special_effect': special_effect,
+        'result_text': result_text,
+        'animation_frames': [t("frame_bet"), t("frame_spin"), t("frame_slow"),
+                             t("frame_number", color_emoji=color_emoji, number=number), result_text]
+    }
+
+def _render_blackjack(outcome, t: _Texts, rng: BufferedRandom) -> dict:
+    player_display = " | ".join(_card(card, rng) for card in outcome.player_cards)
+    dealer_display = " | ".join(_card(card, rng) for card in outcome.dealer_cards)
+    fields = {"player_display": player_display, "player_value": outcome.player_value,
+              "dealer_display": dealer_display, "dealer_value": outcome.dealer_value}
+    # Both blackjacks show as a push
+    key = "push" if outcome.result == "both_blackjack" else outcome.result
+    result_text = t(f"text_{key}", hands=t("hands", **fields))
+    return {
+        'player_cards': list(outcome.player_cards),
+        'dealer_cards': list(outcome.dealer_cards),
+        'player_value': outcome.player_value,
+        'dealer_value': outcome.dealer_value,
+        'player_display': player_display,
+        'dealer_display': dealer_display,
+        'player_blackjack': outcome.result in ("player_blackjack", "both_blackjack"),
+        'dealer_blackjack': outcome.dealer_value == 21 and len(outcome.dealer_cards) == 2,
+        'dealer_hit_cards': list(outcome.dealer_cards[2:]),
+        'result': outcome.result,
+        'result_text': result_text,
+        **_base(outcome),
+        'animation_frames': [
+            t("frame_shuffle"), t("frame_deal"), t("frame_player", **fields),
+            t("frame_dealer_hidden", dealer_first=_card(outcome.dealer_cards[0], rng)),
+            t("frame_dealer", **fields), result_text
+        ]
+    }
+
+def _render_crash(outcome, t: _Texts, rng: BufferedRandom) -> dict:
+    crash_point = outcome.crash_point
+    special_effect = _by_threshold(crash_point, [(50, "effect_moon"), (20, "effect_space"), (10, "effect_high"),
+                                                 (5, "effect_good")], t)
+    fields = {"cashout": outcome.cashout_multiplier, "crash_point": crash_point}
+    if crash_point >= outcome.cashout_multiplier:
+        result_text = t("text_win", closing=special_effect or t("safe_landing"), **fields)
+    else:
+        result_text = t("text_lose", **fields)
+    return {
+        'crash_point': round(crash_point, 1),
+        'cashout_multiplier': outcome.cashout_multiplier,
+        **_base(outcome),
+        'result_text': result_text,
+        'special_effect': special_effect,
+        'animation_frames': [
+            t("frame_prepare"), t("frame_liftoff"), t("frame_flying"),
+            t("frame_climbing" if crash_point > 2 else "frame_crashing", value=min(2.0, crash_point)),
+            t("frame_high" if crash_point > 5 else "frame_down", value=min(5.0, crash_point)),
+            result_text
+        ]
+    }
+
+def _render_mines(outcome, t: _Texts, rng: BufferedRandom) -> dict:
+    mines = set(outcome.mine_positions)
+    picked = set(outcome.picked_positions)
+    hit_mines = picked & mines
+    hit_mine = bool(outcome.hit_mines_count)
+
+    cells = []
+    for i in range(25):
+        if i in hit_mines:
+            cells.append("💣")  # Hit mine
+        elif i in picked:
+            cells.append("💎")  # Found gem
+        elif i in mines:
+            cells.append("❓")  # Hidden mine
+        else:
+            cells.append("⬜")  # Safe unknown
+    grid_display = [" ".join(cells[row * 5:row * 5 + 5]) for row in range(5)]
+    grid_text = "\n".join(grid_display)
+
+    special_effect = ""
+    if not hit_mine and outcome.gems_found >= 4:
+        special_effect = t("effect_perfect")
+    elif not hit_mine and outcome.gems_found >= 2:
+        special_effect = t("effect_good")
+
+    fields = {"mines_count": outcome.mines_count, "gems_found": outcome.gems_found}
+    if hit_mine:
+        result_text = t("text_lose", hit_mines=outcome.hit_mines_count, **fields)
+    else:
+        result_text = t("text_win", closing=special_effect or t("safe_mining"), **fields)
+
+    return {
+        'mines_count': outcome.mines_count,
+        'picks': outcome.picks,
+        'hit_mine': hit_mine,
+        'hit_mines_count': outcome.hit_mines_count,
+        'gems_found': outcome.gems_found,
+        **_base(outcome),
+        'result_text': result_text,
+        'special_effect': special_effect,
+        'grid_display': grid_display,
+        'grid_text': grid_text,
+        'mine_positions': list(outcome.mine_positions),
+        'picked_positions': list(outcome.picked_positions),
+        'animation_frames': [
+            t("frame_setup"), t("frame_mines", mines_count=outcome.mines_count),
+            t("frame_picks", picks=outcome.picks), f"\n{grid_text}\n", result_text
+        ]
+    }
+
+def _render_baccarat(outcome, t: _Texts, rng: BufferedRandom) -> dict:
+    player_display = " | ".join(_card(card, rng) for card in outcome.player_hand)
+    banker_display = " | ".join(_card(card, rng) for card in outcome.banker_hand)
+    player_natural = baccarat_value(outcome.player_hand[:2]) >= 8
+    banker_natural = baccarat_value(outcome.banker_hand[:2]) >= 8
+    winner_text = t(f"winner_{outcome.winner}")
+
+    special_effect = ""
+    if outcome.winner == 'tie':
+        special_effect = t("effect_tie")
+    elif player_natural or banker_natural:
+        special_effect = t("effect_natural")
+
+    fields = {"player_display": player_display, "player_val": outcome.player_val,
+              "banker_display": banker_display, "banker_val": outcome.banker_val}
+    hands = t("hands", **fields)
+    bet_on = outcome.bet_on.upper()
+    if outcome.bet_on == outcome.winner:
+        if outcome.winner == 'tie':
+            result_text = t("text_tie_win", hands=hands)
+        else:
+            result_text = t("text_win", winner_text=winner_text, hands=hands, bet_on=bet_on)
+    else:
+        result_text = t("text_lose", winner_text=winner_text, hands=hands, bet_on=bet_on)
+
+    return {
+        'player_hand': list(outcome.player_hand),
+        'banker_hand': list(outcome.banker_hand),
+        'player_val': outcome.player_val,
+        'banker_val': outcome.banker_val,
+        'player_display': player_display,
+        'banker_display': banker_display,
+        'winner': outcome.winner,
+        'winner_text': winner_text,
+        'player_natural': player_natural,
+        'banker_natural': banker_natural,
+        'bet_on': outcome.bet_on,
+        'result_text': result_text,
+        **_base(outcome),
+        'special_effect': special_effect,
+        'animation_frames': [
+            t("frame_shuffle"), t("frame_deal"), t("frame_player", **fields),
+            t("frame_banker", **fields), t("frame_bet", bet_on=bet_on), result_text
+        ]
+    }
+
+def _render_keno(outcome, t: _Texts, rng: BufferedRandom) -> dict:
+    hits = outcome.hits
+    hit_numbers = sorted(set(outcome.numbers_chosen).intersection(outcome.drawn))
+    fields = {
+        "hits": hits,
+        "chosen": ", ".join(map(str, outcome.numbers_chosen)),
+        "chosen_short": ", ".join(map(str, outcome.numbers_chosen[:5])),
+        "drawn_short": ", ".join(map(str, outcome.drawn[:10])),
+        "matches": ", ".join(map(str, hit_numbers)),
+    }
+    tier = next(level for level in (10, 8, 6, 4, 2, 0) if hits >= level)
+    special_effect = t(f"effect_{tier}")
+    text_tier = 4 if tier == 6 else tier
+    result_text = t(f"text_{text_tier}", **fields)
+    return {
+        'numbers_chosen': list(outcome.numbers_chosen),
+        'drawn': list(outcome.drawn),
+        'hits': hits,
+        'hit_numbers': hit_numbers,
+        **_base(outcome),
+        'result_text': result_text,
+        'special_effect': special_effect,
+        'animation_frames': [
+            t("frame_start"), t("frame_picks", **fields), t("frame_draw"), t("frame_drawn", **fields),
+            t("frame_matches", **fields) if hit_numbers else t("frame_no_matches"),
+            result_text
+        ]
+    }
+
+RPS_NAME_KEYS = {"🗿": "name_rock", "📄": "name_paper", "✂️": "name_scissors"}
+
+def _render_rock_paper_scissors(outcome, t: _Texts, rng: BufferedRandom) -> dict:
+    fields = {"player_choice": outcome.player_choice, "player_name": t(RPS_NAME_KEYS[outcome.player_choice]),
+              "bot_choice": outcome.bot_choice, "bot_name": t(RPS_NAME_KEYS[outcome.bot_choice])}
+    special_effect = t(f"effect_{outcome.result}") if outcome.result in ("win", "tie") else ""
+    result_text = t(f"text_{outcome.result}", choices=t("choices", **fields), **fields)
+    return {
+        'player_choice': outcome.player_choice,
+        'bot_choice': outcome.bot_choice,
+        'result': outcome.result,
+        **_base(outcome),
+        'result_text': result_text,
+        'special_effect': special_effect,
+        'animation_frames': [
+            t("frame_start"), t("frame_shoot"), t("frame_player", **fields), t("frame_bot", **fields), result_text
+        ]
+    }
+
+def _render_number_guess(outcome, t: _Texts, rng: BufferedRandom) -> dict:
+    difference = abs(outcome.target_number - outcome.player_guess)
+    fields = {"player_guess": outcome.player_guess, "target_number": outcome.target_number,
+              "difference": difference}
+    effect_tier = next(tier for limit, tier in ((0, "exact"), (2, "2"), (5, "5"), (10, "10"), (20, "20"),
+                                                (float("inf"), "far")) if difference <= limit)
+    text_tier = next(tier for limit, tier in ((0, "exact"), (5, "5"), (10, "10"), (20, "20"),
+                                              (float("inf"), "far")) if difference <= limit)
+    result_text = t(f"text_{text_tier}", numbers=t("numbers", **fields))
+    return {
+        'target_number': outcome.target_number,
+        'player_guess': outcome.player_guess,
+        'difference': difference,
+        **_base(outcome),
+        'result_text': result_text,
+        'special_effect': t(f"effect_{effect_tier}"),
+        'animation_frames': [
+            t("frame_start"), t("frame_select"), t("frame_guess", **fields), t("frame_target", **fields),
+            t("frame_difference", **fields), result_text
+        ]
+    }
+
+def _render_lucky_wheel(outcome, t: _Texts, rng: BufferedRandom) -> dict:
+    prize, sector_multiplier, emoji, weight = WHEEL_SECTORS[outcome.sector]
+    multiplier = outcome.multiplier
+    special_effect = _by_threshold(multiplier, [(25, "effect_25"), (10, "effect_10"), (5, "effect_5")], t)
+    details = t("details", prize=prize, multiplier=multiplier)
+    if multiplier >= 25:
+        result_text = t("text_25", emoji=emoji, prize=prize, details=details, closing=special_effect or t("closing_25"))
+    elif multiplier >= 5:
+        result_text = t("text_5", emoji=emoji, prize=prize, details=details, closing=special_effect or t("closing_5"))
+    else:
+        result_text = t("text_small", emoji=emoji, prize=prize, details=details)
+
+    # Çark döndürme animasyonu için rastgele sektörler
+    passing = [WHEEL_SECTORS[index] for index in rng.choices(range(len(WHEEL_SECTORS)), k=3)]
+    return {
+        'selected_sector': {"prize": prize, "multiplier": sector_multiplier, "emoji": emoji, "weight": weight},
+        **_base(outcome),
+        'result_text': result_text,
+        'special_effect': special_effect,
+        'animation_frames': [
+            t("frame_prepare"), t("frame_spin"),
+            t("frame_pass", emoji=passing[0][2], prize=passing[0][0]),
+            t("frame_pass", emoji=passing[1][2], prize=passing[1][0]),
+            t("frame_slow", emoji=passing[2][2], prize=passing[2][0]),
+            t("frame_stop", emoji=emoji, prize=prize),
+            result_text
+        ]
+    }
+
+def _render_dice(outcome, t: _Texts, rng: BufferedRandom) -> dict:
+    dice_result, target = outcome.dice_result, outcome.target
+    fields = {"dice_emoji": DICE_EMOJIS[dice_result], "dice_result": dice_result, "target": target}
+    if dice_result == target:
+        tier = "exact"
+    elif abs(dice_result - target) == 1:
+        tier = "close"
+    elif dice_result == 6:
+        tier = "six"
+    else:
+        tier = "lose"
+    result_text = t(f"text_{tier}", roll=t("roll", **fields), **fields)
+    return {
+        'dice_result': dice_result,
+        'target': target,
+        'dice_emoji': DICE_EMOJIS[dice_result],
+        **_base(outcome),
+        'result_text': result_text,
+        'special_effect': t(f"effect_{tier}"),
+        'animation_frames': [
+            t("frame_prepare"), t("frame_target", **fields), t("frame_roll"), t("frame_spin"),
+            t("frame_result", **fields), result_text
+        ]
+    }
+
+# game id -> (template section, renderer)
+RENDERERS: Dict[str, tuple] = {
+    "solo_slots": ("slots", _render_slots),
+    "solo_roulette": ("roulette", _render_roulette),
+    "solo_blackjack": ("blackjack", _render_blackjack),
+    "solo_crash": ("crash", _render_crash),
+    "solo_mines": ("mines", _render_mines),
+    "solo_baccarat": ("baccarat", _render_baccarat),
+    "solo_keno": ("keno", _render_keno),
+    "rock_paper_scissors": ("rock_paper_scissors", _render_rock_paper_scissors),
+    "number_guess": ("number_guess", _render_number_guess),
+    "lucky_wheel": ("lucky_wheel", _render_lucky_wheel),
+    "solo_dice": ("dice", _render_dice),
+}
+
+def render_result(outcome, lang: str = DEFAULT_LANGUAGE, rng: BufferedRandom = None) -> dict:
+    """Full result dict (texts, animation frames, display fields) for an outcome record"""
+    section, renderer = RENDERERS[outcome.game]
+    result = renderer(outcome, _Texts(lang, section), rng or get_rng())
+
+    # Admin bonus texts
+    if outcome.bonus == 'rescue':
+        admin = _Texts(lang, "admin")
+        result['special_effect'] = admin("rescue_effect")
+        result['result_text'] = admin("rescue_text")
+    elif outcome.bonus == 'boost':
+        boost = _Texts(lang, "admin")("boost_effect")
+        result['special_effect'] = f"{result['special_effect']} {boost}" if result.get('special_effect') else boost
+    return result
+
+def describe_outcome(outcome, lang: str = DEFAULT_LANGUAGE) -> str:
+    """Short one-line summary of an outcome record for history lists"""
+    fields = outcome._asdict()
+    if outcome.game == "solo_slots":
+        fields['reels'] = "".join(outcome.reels)
+    elif outcome.game == "solo_keno":
+        fields['picked'] = len(outcome.numbers_chosen)
+    elif outcome.game == "lucky_wheel":
+        fields['prize'], _, fields['emoji'], _ = WHEEL_SECTORS[outcome.sector]
+    return _Texts(lang, "history")(outcome.game, **fields)
@@ -0,0 +1,23 @@
+import os
+import sys
+
+import pytest
+
+# Modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture
+def db(tmp_path, capsys):
+    """DatabaseManager on a fresh database file"""
+    from database_manager import DatabaseManager
+    manager = DatabaseManager(str(tmp_path / "casino.db"))
+    capsys.readouterr()
+    return manager
+
+@pytest.fixture
+def user(db):
+    """A player with an empty balance; returns the user id"""
+    with db.get_connection() as conn:
+        conn.execute("INSERT INTO users (user_id, username, fun_coins) VALUES (?, ?, 0)", (1001, "player"))
+        conn.commit()
+    return 1001
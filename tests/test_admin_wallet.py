@@ -0,0 +1,95 @@
+import asyncio
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("solders")
+
+from solders.keypair import Keypair
+
+from solana_admin_wallet import AdminWallet, SolanaAdminWalletManager, WalletRole, WalletStatus
+from test_withdrawal_pipeline import CONFIRMED, FakeRPCClient
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    # The shared transaction monitor opens "casino_bot.db" relative to the cwd
+    monkeypatch.chdir(tmp_path)
+
+class FakeBalanceCache:
+    async def get_many(self, addresses, max_age=None, priority=None):
+        return {address: {"balance_sol": 1000.0} for address in addresses}
+
+    def invalidate(self, address):
+        pass
+
+def make_manager(db_path, rpc):
+    async def build():
+        manager = SolanaAdminWalletManager(str(db_path))
+        await asyncio.sleep(0)
+        return manager
+    manager = asyncio.run(build())
+    manager.rpc_client = rpc
+    manager.balance_cache = FakeBalanceCache()
+    keypair = Keypair()
+    address = str(keypair.pubkey())
+    manager.wallets[address] = AdminWallet(address, WalletRole.WITHDRAWAL, WalletStatus.ACTIVE, "hot", 0.0, 0,
+                                           None, datetime.now(), None, 0, 0.0, 0.0, "")
+    manager.keypairs[address] = keypair
+    return manager
+
+def withdrawal_rows(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT signature, status, amount_sol FROM admin_wallet_transactions ORDER BY id").fetchall()
+    finally:
+        conn.close()
+
+def test_unconfirmed_withdrawals_are_recorded_as_pending_and_resolved(tmp_path, monkeypatch):
+    monkeypatch.setitem(__import__("config").SOLANA_CONFIG, "confirmation_timeout", 0.05)
+    monkeypatch.setitem(__import__("config").SOLANA_CONFIG, "withdrawal_poll_interval", 0.001)
+    landed = set()
+    rpc = FakeRPCClient(send=lambda recipients: {"error": "timeout", "in_doubt": True},
+                        status=lambda signature, recipients: CONFIRMED if signature in landed else None)
+    manager = make_manager(tmp_path / "casino.db", rpc)
+
+    result = asyncio.run(manager.bulk_withdrawal([
+        {"to_address": str(Keypair().pubkey()), "amount_sol": 0.5},
+        {"to_address": str(Keypair().pubkey()), "amount_sol": 0.25},
+    ]))
+
+    assert result["successful_transactions"] == 0
+    assert result["pending_transactions"] == 2
+    assert all(item["result"]["in_doubt"] for item in result["results"])
+    rows = withdrawal_rows(tmp_path / "casino.db")
+    assert [status for _, status, _ in rows] == ["pending", "pending"]
+    assert manager.daily_transactions[datetime.now().date()] == pytest.approx(0.75)
+
+    # The transaction lands later - the rows settle without any resend
+    landed.add(rows[0][0])
+    assert asyncio.run(manager.resolve_pending_withdrawals()) == {"confirmed": 2, "failed": 0}
+    assert [status for _, status, _ in withdrawal_rows(tmp_path / "casino.db")] == ["confirmed", "confirmed"]
+    assert manager.daily_transactions[datetime.now().date()] == pytest.approx(0.75)
+    assert len(rpc.sent) == 1
+
+def test_failed_and_expired_pending_withdrawals_release_the_daily_limit(tmp_path):
+    rpc = FakeRPCClient(status=lambda signature, recipients: {"err": {"InstructionError": []}} if signature == "bad" else None)
+    rpc.sent = {"bad": [], "lost": [], "fresh": []}
+    manager = make_manager(tmp_path / "casino.db", rpc)
+    today = datetime.now().date()
+    manager.daily_transactions[today] = 6.0
+    conn = sqlite3.connect(tmp_path / "casino.db")
+    conn.executemany("""
+        INSERT INTO admin_wallet_transactions
+        (wallet_address, signature, transaction_type, amount_sol, amount_lamports, status, created_at)
+        VALUES ('w', ?, 'withdrawal', ?, 0, 'pending', datetime('now', ?))
+    """, [("bad", 1.0, "-1 seconds"), ("lost", 2.0, "-1 hours"), ("fresh", 3.0, "-1 seconds")])
+    conn.commit()
+    conn.close()
+    for signature, amount in (("bad", 1.0), ("lost", 2.0), ("fresh", 3.0)):
+        manager.pending_transactions[signature] = {"date": today, "amount_sol": amount}
+
+    assert asyncio.run(manager.resolve_pending_withdrawals()) == {"confirmed": 0, "failed": 2}
+    assert dict((signature, status) for signature, status, _ in withdrawal_rows(tmp_path / "casino.db")) == {
+        "bad": "failed", "lost": "failed", "fresh": "pending"}
+    assert manager.daily_transactions[today] == pytest.approx(3.0)
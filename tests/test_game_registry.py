@@ -0,0 +1,28 @@
+import pytest
+
+from config import SOLO_GAMES
+from game_registry import get_game_registry
+
+@pytest.mark.parametrize("game_id", sorted(SOLO_GAMES))
+def test_bet_limits_come_from_config(game_id):
+    registry = get_game_registry()
+    limits = SOLO_GAMES[game_id]
+    assert registry.check_bet(game_id, limits['min_bet']) is None
+    assert registry.check_bet(game_id, limits['max_bet']) is None
+    assert registry.check_bet(game_id, limits['min_bet'] - 1)
+    assert registry.check_bet(game_id, limits['max_bet'] + 1)
+
+def test_unknown_game_has_no_limits():
+    assert get_game_registry().check_bet("no_such_game", 1) is None
+
+def test_play_renders_in_the_given_language(monkeypatch):
+    import solo_games
+    seen = []
+    real_render = solo_games.render_result
+    monkeypatch.setattr(solo_games, "render_result",
+                        lambda outcome, lang, rng=None: seen.append(lang) or real_render(outcome, lang, rng=rng))
+
+    registry = get_game_registry()
+    registry.play("solo_slots", 100, lang="ru")
+    registry.play("solo_slots", 100)
+    assert seen == ["ru", registry.engine.lang]
@@ -0,0 +1,47 @@
+import asyncio
+from types import SimpleNamespace
+
+from group_performance_optimizer import GroupMembershipService
+
+class FakeBot:
+    def __init__(self, status):
+        self.status = status
+        self.calls = 0
+
+    async def get_chat_member(self, group_id, user_id):
+        self.calls += 1
+        status = self.status
+        await asyncio.sleep(0)
+        return SimpleNamespace(status=status)
+
+def test_negative_result_is_cached():
+    service = GroupMembershipService()
+    bot = FakeBot("left")
+    assert asyncio.run(service.is_member(bot, -100, 1)) is False
+    bot.status = "member"
+    assert asyncio.run(service.is_member(bot, -100, 1)) is False
+    assert bot.calls == 1
+
+def test_force_refresh_skips_negative_cache():
+    service = GroupMembershipService()
+    bot = FakeBot("left")
+    asyncio.run(service.is_member(bot, -100, 1))
+    bot.status = "member"
+    assert asyncio.run(service.is_member(bot, -100, 1, force_refresh=True)) is True
+    assert asyncio.run(service.is_member(bot, -100, 1)) is True
+    assert bot.calls == 2
+
+def test_force_refresh_does_not_join_an_inflight_lookup():
+    service = GroupMembershipService()
+    bot = FakeBot("left")
+
+    async def scenario():
+        stale = asyncio.ensure_future(service.is_member(bot, -100, 1))
+        await asyncio.sleep(0)
+        bot.status = "member"
+        fresh = await service.is_member(bot, -100, 1, force_refresh=True)
+        assert await stale is False
+        return fresh, await service.is_member(bot, -100, 1)
+
+    assert asyncio.run(scenario()) == (True, True)
+    assert bot.calls == 2
@@ -0,0 +1,139 @@
+import asyncio
+import threading
+
+import pytest
+
+from database_manager import DatabaseManager
+from payment_credit_worker import PaymentCreditWorker
+
+WALLET = "DepositWallet111"
+
+def balance(db, user_id):
+    with db.get_connection() as conn:
+        return conn.execute("SELECT fun_coins FROM users WHERE user_id = ?", (user_id,)).fetchone()[0]
+
+def inbox(db, signature):
+    return db.get_payment_event(f"{signature}:{WALLET}")
+
+def attributed(signature, user_id, fc_amount=500, reference=None):
+    """An event as the QR confirmation path reports it"""
+    return {"signature": signature, "to_address": WALLET, "amount": 0.5,
+            "user_id": user_id, "fc_amount": fc_amount, "reference": reference}
+
+def unattributed(signature):
+    """An event as a Helius webhook reports it"""
+    return {"signature": signature, "from_address": "Sender111", "to_address": WALLET, "amount": 0.5}
+
+def credit_all(db):
+    events = db.get_unprocessed_payment_events()
+    return db.credit_payment_events([event['id'] for event in events], sol_to_fc_rate=1000)
+
+def test_duplicate_enqueue_is_ignored(db, user):
+    assert db.enqueue_payment_events('qr', [attributed("sig1", user)]) == 1
+    assert db.enqueue_payment_events('qr', [attributed("sig1", user)]) == 0
+
+    assert len(credit_all(db)) == 1
+    assert db.enqueue_payment_events('qr', [attributed("sig1", user)]) == 0
+    assert credit_all(db) == []
+    assert balance(db, user) == 500
+
+def test_event_key_requires_receiving_wallet(db):
+    with pytest.raises(ValueError):
+        db.payment_event_key({"signature": "sig1", "to_address": None})
+    assert db.payment_event_key(attributed("sig1", 1)) == db.payment_event_key(unattributed("sig1"))
+
+def test_attributed_event_fills_received_row(db, user):
+    db.enqueue_payment_events('helius', [unattributed("sig1")])
+    assert db.enqueue_payment_events('qr', [attributed("sig1", user, reference=7)]) == 1
+
+    row = inbox(db, "sig1")
+    assert (row['status'], row['user_id'], row['fc_amount'], row['source']) == ('received', user, 500, 'qr')
+    assert len(credit_all(db)) == 1
+    assert inbox(db, "sig1")['status'] == 'credited'
+    assert balance(db, user) == 500
+
+def test_attributed_event_claims_unmatched_row(db, user):
+    db.enqueue_payment_events('helius', [unattributed("sig1")])
+    assert credit_all(db) == []
+    assert inbox(db, "sig1")['status'] == 'unmatched'
+
+    assert db.enqueue_payment_events('qr', [attributed("sig1", user)]) == 1
+    assert len(credit_all(db)) == 1
+    assert balance(db, user) == 500
+
+def test_attributed_event_never_reopens_credited_row(db, user):
+    db.enqueue_payment_events('qr', [attributed("sig1", user)])
+    credit_all(db)
+
+    assert db.enqueue_payment_events('qr', [attributed("sig1", user, fc_amount=900)]) == 0
+    assert credit_all(db) == []
+    assert balance(db, user) == 500
+
+def test_concurrent_credit_calls_credit_once(db, user):
+    db.enqueue_payment_events('qr', [attributed(f"sig{i}", user, fc_amount=100) for i in range(20)])
+    ids = [event['id'] for event in db.get_unprocessed_payment_events()]
+
+    barrier = threading.Barrier(2)
+    results = []
+
+    def worker():
+        manager = DatabaseManager(db.db_path)
+        barrier.wait()
+        results.append(manager.credit_payment_events(ids))
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(len(result) for result in results) == [0, 20]
+    assert balance(db, user) == 2000
+
+def test_qr_and_helius_paths_credit_once(db, user):
+    worker = PaymentCreditWorker(db=db)
+
+    async def scenario():
+        # Webhook reports the transfer before the QR matcher confirms it
+        await worker.submit('helius', [unattributed("sig1")])
+        first = await worker.credit_now('qr', [attributed("sig1", user, reference=7)])
+        # Both paths replay the same transfer
+        replay_qr = await worker.credit_now('qr', [attributed("sig1", user, reference=7)])
+        replay_helius = await worker.credit_now('helius', [unattributed("sig1")])
+        return first, replay_qr, replay_helius
+
+    first, replay_qr, replay_helius = asyncio.run(scenario())
+    assert [item['user_id'] for item in first] == [user]
+    assert first[0]['reference'] == '7'
+    assert replay_qr == [] and replay_helius == []
+    assert balance(db, user) == 500
+
+def test_qr_before_helius_credits_once(db, user):
+    worker = PaymentCreditWorker(db=db)
+
+    async def scenario():
+        first = await worker.credit_now('qr', [attributed("sig1", user)])
+        queued = await worker.submit('helius', [unattributed("sig1")])
+        return first, queued, await worker.drain()
+
+    first, queued, later = asyncio.run(scenario())
+    assert len(first) == 1
+    assert queued == 0 and later == []
+    assert balance(db, user) == 500
+
+def test_event_for_unknown_user_is_not_credited(db, user):
+    db.enqueue_payment_events('qr', [attributed("sig1", 999)])
+    assert credit_all(db) == []
+
+    row = inbox(db, "sig1")
+    assert (row['status'], row['attempts'], row['error']) == ('received', 1, "User 999 not found")
+
+def test_pending_deposit_of_unknown_user_stays_pending(db, user):
+    pending = db.create_tagged_pending_transaction(999, 0.5, WALLET)
+    db.enqueue_payment_events('helius', [dict(unattributed("sig1"), amount=pending['expected_amount'])])
+    assert credit_all(db) == []
+
+    assert inbox(db, "sig1")['status'] == 'received'
+    with db.get_connection() as conn:
+        status = conn.execute("SELECT status FROM pending_transactions WHERE id = ?", (pending['id'],)).fetchone()[0]
+    assert status == 'pending'
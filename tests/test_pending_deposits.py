@@ -0,0 +1,58 @@
+WALLET = "DepositWallet111"
+
+def pending(db, transaction_id):
+    with db.get_connection() as conn:
+        return conn.execute("SELECT * FROM pending_transactions WHERE id = ?", (transaction_id,)).fetchone()
+
+def webhook_transfer(signature, amount):
+    return {"signature": signature, "from_address": "Sender111", "to_address": WALLET, "amount": amount}
+
+def credit_all(db):
+    events = db.get_unprocessed_payment_events()
+    return db.credit_payment_events([event['id'] for event in events], sol_to_fc_rate=1000)
+
+def test_reselecting_wallet_reuses_open_tag(db, user):
+    first = db.create_tagged_pending_transaction(user, 0.5, WALLET)
+    again = db.create_tagged_pending_transaction(user, 0.5, WALLET)
+    assert again == first
+
+    other = db.create_tagged_pending_transaction(user, 1.0, WALLET)
+    assert other['id'] != first['id']
+    assert pending(db, first['id'])['status'] == 'expired'
+
+def test_stale_tags_expire(db, user):
+    stale = db.create_tagged_pending_transaction(user, 0.5, WALLET)
+    with db.get_connection() as conn:
+        conn.execute("UPDATE pending_transactions SET timestamp = datetime('now', '-2 days') WHERE id = ?",
+                     (stale['id'],))
+        conn.commit()
+
+    fresh = db.create_tagged_pending_transaction(user, 0.5, WALLET)
+    assert fresh['id'] != stale['id']
+    assert pending(db, stale['id'])['status'] == 'expired'
+
+def test_exact_tagged_amount_matches(db, user):
+    tagged = db.create_tagged_pending_transaction(user, 0.5, WALLET)
+    db.enqueue_payment_events('helius', [webhook_transfer("sig1", tagged['expected_amount'])])
+
+    credited = credit_all(db)
+    assert [(item['user_id'], item['pending_transaction_id']) for item in credited] == [(user, tagged['id'])]
+
+def test_rounded_tagged_amount_falls_back_to_tolerance(db, user):
+    tagged = db.create_tagged_pending_transaction(user, 0.5, WALLET)
+    db.enqueue_payment_events('helius', [webhook_transfer("sig1", 0.5)])
+
+    credited = credit_all(db)
+    assert [item['pending_transaction_id'] for item in credited] == [tagged['id']]
+    assert db.get_pending_transaction_by_criteria(WALLET, 0.5) is None
+
+def test_ambiguous_rounded_amount_stays_unmatched(db, user):
+    with db.get_connection() as conn:
+        conn.execute("INSERT INTO users (user_id, username, fun_coins) VALUES (1002, 'other', 0)")
+        conn.commit()
+    db.create_tagged_pending_transaction(user, 0.5, WALLET)
+    db.create_tagged_pending_transaction(1002, 0.5, WALLET)
+
+    assert db.get_pending_transaction_by_criteria(WALLET, 0.5) is None
+    db.enqueue_payment_events('helius', [webhook_transfer("sig1", 0.5)])
+    assert credit_all(db) == []
@@ -0,0 +1,50 @@
+import pytest
+
+from provably_fair import ProvablyFairService
+
+CONFIG = {"chain_length": 5, "cache_size": 16, "max_client_seed_length": 64}
+
+@pytest.fixture
+def fair(db):
+    return ProvablyFairService(db=db, config=CONFIG)
+
+def test_round_verifies_for_its_owner_only(fair, user):
+    result = fair.play("solo_slots", 100, user)
+    check = fair.verify_round(result['fair_round_id'], user)
+    assert check['verified']
+    assert fair.verify_round(result['fair_round_id'], user + 1) is None
+
+def test_nonce_survives_restart(fair, db, user):
+    fair.play("solo_slots", 100, user)
+    fair.play("solo_slots", 100, user)
+
+    restarted = ProvablyFairService(db=db, config=CONFIG)
+    assert restarted.play("solo_slots", 100, user)['nonce'] == 2
+
+def test_unrecorded_round_is_not_returned(fair, db, user):
+    played = fair.play("solo_slots", 100, user)
+    # Another process already used the next nonce
+    with db.get_connection() as conn:
+        conn.execute("""INSERT INTO fair_rounds
+            (user_id, chain_no, nonce, client_seed, game_id, bet_amount, win_amount, won)
+            VALUES (?, 0, ?, 'x', 'solo_slots', 1, 0, 0)""", (user, played['nonce'] + 1))
+        conn.commit()
+
+    assert fair.play("solo_slots", 100, user) is None
+    assert fair.play("solo_slots", 100, user)['nonce'] == played['nonce'] + 2
+
+def test_chain_rotation_resets_nonce(fair, user):
+    nonces = [fair.play("solo_slots", 100, user)['nonce'] for _ in range(CONFIG["chain_length"] + 1)]
+    assert nonces == [0, 1, 2, 3, 4, 0]
+
+@pytest.mark.parametrize("seed, accepted", [
+    ("lucky_seed-42", True),
+    ("a" * 64, True),
+    ("a" * 65, False),
+    ("back`tick", False),
+    ("bold*seed", False),
+    ("two words", False),
+    ("", False),
+])
+def test_client_seed_charset(fair, user, seed, accepted):
+    assert fair.set_client_seed(user, seed) is accepted
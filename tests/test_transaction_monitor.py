@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("solders")
+
+from solders.signature import Signature
+
+from solana_rpc_client import SolanaRPCClient
+from solana_transaction_monitor import AddressScanState, SolanaTransactionMonitor
+
+ADDRESS = "11111111111111111111111111111112"
+
+def make_monitor(db_path, signatures, transactions):
+    """Monitor on a real RPC client whose node knows only `transactions`"""
+    async def get_signatures_for_address(address, limit=None, before=None, until=None, priority=None):
+        return {"signatures": [{"signature": signature} for signature in signatures]}
+
+    async def ensure_connection():
+        return True
+
+    async def rpc_batch(calls, priority=None):
+        return [{"result": transactions.get(params[0])} for _, params in calls]
+
+    async def build():
+        monitor = SolanaTransactionMonitor(str(db_path))
+        client = SolanaRPCClient()
+        client.get_signatures_for_address = get_signatures_for_address
+        client.ensure_connection = ensure_connection
+        client._rpc_batch = rpc_batch
+        monitor.rpc_client = client
+        return monitor
+    return asyncio.run(build())
+
+def test_transaction_the_node_does_not_have_yet_is_retried(tmp_path):
+    older, newer = str(Signature.new_unique()), str(Signature.new_unique())
+    monitor = make_monitor(tmp_path / "casino.db", [newer, older], {})
+    state = AddressScanState(address=ADDRESS)
+
+    asyncio.run(monitor._scan_address(state))
+
+    assert state.last_signature is None
+    assert older not in monitor.processed_signatures
+    assert monitor.processed_signatures.filter_new([older, newer]) == [older, newer]
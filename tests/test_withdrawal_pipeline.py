@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("solders")
+
+from solders.hash import Hash
+from solders.keypair import Keypair
+
+from solana_rpc_client import MEMO_PROGRAM_ID, SolanaRPCClient
+from solana_withdrawal_pipeline import MAX_TRANSACTION_SIZE, WithdrawalPipeline, WithdrawalTransfer
+
+CONFIRMED = {"err": None, "confirmationStatus": "confirmed"}
+
+class FakeRPCClient:
+    """Builds real transactions; sends and status lookups follow the test's rules"""
+
+    build_transfer_transaction = staticmethod(SolanaRPCClient.build_transfer_transaction)
+    validate_wallet_address = SolanaRPCClient.validate_wallet_address
+
+    def __init__(self, send=None, status=None, block_height=100):
+        self.send = send or (lambda recipients: {"success": True})
+        self.status = status or (lambda signature, recipients: CONFIRMED)
+        self.block_height = block_height
+        self.sent = {}  # signature -> recipients
+        self.memos = {}  # signature -> memos in instruction order
+        self.sizes = []
+        self.blockhashes = 0
+
+    async def get_latest_blockhash(self, priority=None, refresh=False):
+        self.blockhashes += 1
+        return {"blockhash": str(Hash.new_unique()), "last_valid_block_height": 150}
+
+    async def send_raw_transaction(self, transaction, priority=None):
+        signature = str(transaction.signatures[0])
+        keys = transaction.message.account_keys
+        recipients = [str(keys[instruction.accounts[1]]) for instruction in transaction.message.instructions
+                      if len(instruction.accounts) == 2]
+        self.sent[signature] = recipients
+        self.memos[signature] = [bytes(instruction.data).decode() for instruction in transaction.message.instructions
+                                 if keys[instruction.program_id_index] == MEMO_PROGRAM_ID]
+        self.sizes.append(len(bytes(transaction)))
+        return {"signature": signature, **self.send(recipients)}
+
+    async def get_signature_statuses(self, signatures, priority=None, search_history=False):
+        return {"statuses": {signature: self.status(signature, self.sent[signature]) for signature in signatures},
+                "block_height": self.block_height}
+
+def make_transfers(count):
+    return [WithdrawalTransfer(index=index, to_address=str(Keypair().pubkey()), lamports=1_000_000 + index)
+            for index in range(count)]
+
+def run_pipeline(rpc, transfers, **options):
+    options.setdefault("poll_interval", 0.001)
+    options.setdefault("confirmation_timeout", 0.05)
+    pipeline = WithdrawalPipeline(Keypair(), rpc, **options)
+    asyncio.run(pipeline.run(transfers))
+    return pipeline
+
+def test_unconfirmed_transfers_are_in_doubt_and_not_resent():
+    rpc = FakeRPCClient(send=lambda recipients: {"error": "timeout", "in_doubt": True},
+                        status=lambda signature, recipients: None)
+    transfers = make_transfers(3)
+    pipeline = run_pipeline(rpc, transfers)
+
+    assert len(rpc.sent) == 1
+    assert all(transfer.in_doubt and not transfer.confirmed for transfer in transfers)
+    assert all(transfer.signature in rpc.sent for transfer in transfers)
+    assert pipeline.stats["in_doubt"] == 3 and pipeline.stats["failed"] == 0
+
+def test_transfers_are_packed_up_to_the_transaction_limit():
+    rpc = FakeRPCClient()
+    transfers = make_transfers(45)
+    pipeline = run_pipeline(rpc, transfers)
+
+    assert sorted(len(recipients) for recipients in rpc.sent.values()) == [3, 21, 21]
+    assert all(transfer.confirmed for transfer in transfers)
+    assert max(rpc.sizes) <= MAX_TRANSACTION_SIZE
+    assert pipeline.stats["transactions"] == 3
+
+def test_memos_go_on_chain_and_take_packing_room():
+    rpc = FakeRPCClient()
+    transfers = make_transfers(21)
+    for transfer in transfers:
+        transfer.memo = f"withdrawal #{transfer.index:04d}"
+    run_pipeline(rpc, transfers)
+
+    assert len(rpc.sent) == 2
+    assert max(rpc.sizes) <= MAX_TRANSACTION_SIZE
+    assert sorted(memo for memos in rpc.memos.values() for memo in memos) == sorted(t.memo for t in transfers)
+    for transfer in transfers:
+        assert transfer.memo in rpc.memos[transfer.signature]
+
+def test_failed_pack_is_split_and_only_the_bad_transfer_fails():
+    transfers = make_transfers(5)
+    bad = transfers[2].to_address
+    rpc = FakeRPCClient(send=lambda recipients: {"error": "rejected"} if bad in recipients else {"success": True})
+    pipeline = run_pipeline(rpc, transfers)
+
+    assert [transfer.confirmed for transfer in transfers] == [True, True, False, True, True]
+    assert transfers[2].error == "rejected" and not transfers[2].in_doubt
+    # The whole pack once, then every transfer on its own
+    assert sorted(len(recipients) for recipients in rpc.sent.values()) == [1, 1, 1, 1, 1, 5]
+    assert pipeline.stats["failed"] == 1
+
+def test_expired_blockhash_is_resent_on_a_fresh_one():
+    rpc = FakeRPCClient(block_height=200)
+    rpc.status = lambda signature, recipients: CONFIRMED if rpc.blockhashes > 1 else None
+    transfers = make_transfers(3)
+    run_pipeline(rpc, transfers)
+
+    assert rpc.blockhashes == 2
+    assert len(rpc.sent) == 2
+    assert all(transfer.confirmed and transfer.attempts == 2 for transfer in transfers)
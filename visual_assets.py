@@ -3,6 +3,8 @@ Visual Assets - Stickers, Emojis and Animations for Casino Bot
 Contains animated stickers and emoji combinations for enhanced user experience
 """
 
+from dice_payouts import PAYOUT_TABLES, get_dice_multiplier
+
 # Casino Game Stickers (Popular Telegram Sticker Sets)
 CASINO_STICKERS = {
     # Slot Machine Results
@@ -423,69 +425,11 @@ def get_dice_result_message(dice_type, value):
 
 def calculate_dice_payout(dice_type, value, bet_amount):
     """Calculate payout based on dice result (Official Telegram API behavior)"""
-    dice_config = TELEGRAM_DICE.get(dice_type, {})
-    win_values = dice_config.get('win_values', [])
-    good_values = dice_config.get('good_values', [])
-    bad_values = dice_config.get('bad_values', [])
-    neutral_values = dice_config.get('neutral_values', [])
-    
-    if dice_type == 'slot_machine':
-        # EXTREMELY BALANCED slot machine payouts - massive house edge
-        if value == 64:  # Ultimate jackpot (777) - very rare
-            return bet_amount * 8   # Drastically reduced from 20
-        elif value in [1, 22, 43]:  # Special jackpot combinations
-            return bet_amount * 4   # Drastically reduced from 12
-        elif value >= 50:  # High value combinations
-            return bet_amount * 1.5 # Drastically reduced from 3
-        elif value >= 30:  # Medium-high combinations
-            return bet_amount * 1.1 # Drastically reduced from 2
-        elif value >= 15:  # Medium combinations  
-            return bet_amount * 0.8 # Now loses money
-        else:  # Low combinations
-            return 0
-    elif dice_type == 'darts':
-        if value == 6:  # Bullseye - very rare
-            return bet_amount * 1.8 # Drastically reduced from 3
-        elif value in [4, 5]:  # Close to center
-            return bet_amount * 1.1 # Drastically reduced from 1.6
-        elif value in [2, 3]:  # Hit dartboard
-            return bet_amount * 0.4 # Drastically reduced from 0.6
-        else:  # Missed dartboard (value 1)
-            return 0
-    elif dice_type == 'basketball':
-        if value in [4, 5]:  # Successful shots
-            return bet_amount * 1.4  # Drastically reduced from 2.2
-        elif value == 3:  # Close miss
-            return bet_amount * 0.3  # Drastically reduced from 0.5
-        else:  # Complete miss
-            return 0
-    elif dice_type == 'football':
-        if value in [4, 5]:  # Goal scored
-            return bet_amount * 1.4  # Drastically reduced from 2.2
-        elif value == 3:  # Hit goalpost
-            return bet_amount * 0.3  # Drastically reduced from 0.5
-        else:  # Miss
-            return 0
-    elif dice_type == 'bowling':
-        if value == 6:  # Strike
-            return bet_amount * 1.8  # Drastically reduced from 2.8
-        elif value in [4, 5]:  # Many pins
-            return bet_amount * 1.0  # Break even only
-        elif value == 3:  # Some pins
-            return bet_amount * 0.4  # Drastically reduced from 0.6
-        else:  # Few/no pins
-            return 0
-    elif dice_type == 'classic_dice':
-        if value == 6:  # Maximum - only 16.7% chance
-            return bet_amount * 1.8  # Drastically reduced from 2.8
-        elif value in [4, 5]:  # Above average - 33.3% chance
-            return bet_amount * 1.0  # Break even only
-        elif value == 3:  # Average - 16.7% chance  
-            return bet_amount * 0.4  # Drastically reduced from 0.6
-        else:  # Below average - 33.3% chance
-            return 0
+    if dice_type in PAYOUT_TABLES['standard']:
+        return bet_amount * get_dice_multiplier(dice_type, value)
     
     # Fallback
+    bad_values = TELEGRAM_DICE.get(dice_type, {}).get('bad_values', [])
     return bet_amount if value not in bad_values else 0
 
 def get_dice_celebration(dice_type, value):
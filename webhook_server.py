@@ -2,81 +2,147 @@
 """
 Solana Payment Webhook Server
 Helius webhook'larını dinleyip otomatik ödeme işleme yapar
+
+The server runs on the bot's own asyncio event loop (aiohttp). Incoming
+webhook batches are written to the durable payment_inbox table and
+acknowledged immediately; the shared PaymentCreditWorker drains the inbox
+in batches, matching every transfer against pending deposits with one
+query and crediting them in one transaction.
 """
 
 import asyncio
-import logging
 import json
+import logging
 from datetime import datetime
-from flask import Flask, request, jsonify
-import threading
+from typing import Optional
 
-# Import existing components
-from helius_webhook import HeliusPaymentMonitor, get_payment_monitor
-from enhanced_payment_processor import process_webhook_payment
+from aiohttp import web
 
-logger = logging.getLogger(__name__)
+from helius_webhook import HeliusWebhookManager
+from http_clients import get_http_client_registry
+from payment_credit_worker import get_credit_worker
 
-app = Flask(__name__)
+logger = logging.getLogger(__name__)
 
-# Global payment monitor
-payment_monitor = None
-
-@app.route('/helius-webhook', methods=['POST'])
-async def helius_webhook_handler():
-    """Helius webhook endpoint - Otomatik ödeme işleme"""
-    try:
-        # Webhook verisini al
-        webhook_data = request.get_json()
+class HeliusWebhookServer:
+    """Asyncio-native Helius webhook receiver with inbox-backed batch crediting"""
+
+    def __init__(self, worker=None, bot=None, host: str = '0.0.0.0', port: int = 8080):
+        self.worker = worker or get_credit_worker()
+        self.bot = bot
+        self.host = host
+        self.port = port
+
+        # One parser for every request - parsing needs no HTTP session
+        self.parser = HeliusWebhookManager()
+
+        self.app = web.Application()
+        self.app.router.add_post('/helius-webhook', self.helius_webhook_handler)
+        self.app.router.add_post('/cryptobot-webhook', self.cryptobot_webhook_handler)
+        self.app.router.add_get('/webhook-status', self.webhook_status)
+
+        self._runner: Optional[web.AppRunner] = None
+        self.stats = {"received": 0, "queued": 0}
+
+    async def start(self):
+        """Start the HTTP listener and the credit worker on the running loop"""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.worker.add_listener(self._notify)
+        self.worker.start()
+        logger.info(f"Webhook server listening on {self.host}:{self.port}")
+
+    async def stop(self):
+        """Stop the credit worker and close the listener"""
+        await self.worker.stop()
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def helius_webhook_handler(self, request: web.Request) -> web.Response:
+        """Helius webhook endpoint - olayları kutuya yaz ve hemen yanıt ver"""
+        try:
+            webhook_data = await request.json()
+        except Exception:
+            return web.json_response({"error": "Invalid JSON"}, status=400)
 
         if not webhook_data:
-            return jsonify({"error": "No data received"}), 400
-
-        logger.info(f"Received webhook data: {len(webhook_data)} transactions")
-
-        # Payment monitor'u al
-        global payment_monitor
-        if not payment_monitor:
-            payment_monitor = await get_payment_monitor()
-
-        # Webhook verisini parse et
-        from helius_webhook import HeliusWebhookManager
-        webhook_manager = HeliusWebhookManager()
-        transactions = webhook_manager.parse_webhook_data(webhook_data)
-
-        # Her transaction'ı işle
-        processed_count = 0
-        for transaction_data in transactions:
-            try:
-                # Otomatik ödeme işleme
-                result = await payment_monitor.process_webhook_payment(transaction_data)
-
-                if result:
-                    processed_count += 1
-                    logger.info(f"✅ Processed payment: User {result['user_id']} received {result['fc_amount']} FC")
-
-                    # Telegram bildirim gönder
-                    await send_payment_notification(result)
-
-            except Exception as e:
-                logger.error(f"Error processing transaction {transaction_data.signature}: {e}")
-
-        return jsonify({
+            return web.json_response({"error": "No data received"}, status=400)
+
+        transactions = self.parser.parse_webhook_data(webhook_data)
+        events = [{
+            "signature": tx.signature,
+            "from_address": tx.from_address,
+            "to_address": tx.to_address,
+            "amount": tx.amount
+        } for tx in transactions]
+
+        try:
+            queued = await self.worker.submit('helius', events)
+        except Exception as e:
+            logger.error(f"Webhook enqueue error: {e}")
+            return web.json_response({"error": str(e)}, status=500)
+
+        self.stats["received"] += len(events)
+        self.stats["queued"] += queued
+
+        return web.json_response({
             "success": True,
-            "message": f"Processed {processed_count}/{len(transactions)} transactions"
-        }), 200
-
-    except Exception as e:
-        logger.error(f"Webhook handler error: {e}")
-        return jsonify({"error": str(e)}), 500
-
-async def send_payment_notification(result):
+            "message": f"Queued {queued}/{len(events)} transfers"
+        })
+
+    async def cryptobot_webhook_handler(self, request: web.Request) -> web.Response:
+        """CryptoBot invoice_paid updates - polling slows down while these arrive"""
+        from cryptobot_payment import get_invoice_poller
+        poller = get_invoice_poller()
+        if not poller:
+            return web.json_response({"error": "CryptoBot payments disabled"}, status=503)
+
+        # The signature covers the raw body, so verify before parsing
+        body = await request.read()
+        if not poller.processor.verify_webhook_signature(body, request.headers.get('crypto-pay-api-signature')):
+            return web.json_response({"error": "Invalid signature"}, status=401)
+
+        try:
+            update = json.loads(body)
+        except ValueError:
+            return web.json_response({"error": "Invalid JSON"}, status=400)
+
+        try:
+            await poller.handle_webhook_update(update)
+        except Exception as e:
+            logger.error(f"CryptoBot webhook error: {e}")
+            return web.json_response({"error": str(e)}, status=500)
+
+        return web.json_response({"success": True})
+
+    async def webhook_status(self, request: web.Request) -> web.Response:
+        """Webhook durumu kontrolü"""
+        from cryptobot_payment import get_invoice_poller
+        poller = get_invoice_poller()
+        return web.json_response({
+            "status": "active",
+            "timestamp": datetime.now().isoformat(),
+            "endpoint": "/helius-webhook",
+            "stats": {**self.stats, "worker": self.worker.stats},
+            "cryptobot_poller": poller.get_stats() if poller else None,
+            "http_pool": get_http_client_registry().get_stats()
+        })
+
+    async def _notify(self, result):
+        """Notify users credited from Helius webhook events"""
+        if result['source'] == 'helius':
+            await send_payment_notification(result, self.bot)
+
+async def send_payment_notification(result, bot=None):
     """Kullanıcıya ödeme bildirimi gönder"""
     try:
-        import telegram
-        from config import BOT_TOKEN
-
-        bot = telegram.Bot(token=BOT_TOKEN)
+        if bot is None:
+            import telegram
+            from config import BOT_TOKEN
+            bot = telegram.Bot(token=BOT_TOKEN)
 
         message = f"""✅ **ÖDEMENİZ ONAYLANDI!** ✅
 
@@ -102,31 +168,38 @@ async def send_payment_notification(result):
     except Exception as e:
         logger.error(f"Error sending notification: {e}")
 
-@app.route('/webhook-status', methods=['GET'])
-def webhook_status():
-    """Webhook durumu kontrolü"""
-    return jsonify({
-        "status": "active",
-        "timestamp": datetime.now().isoformat(),
-        "endpoint": "/helius-webhook"
-    })
+# Global server instance
+_webhook_server = None
+
+async def start_webhook_server(bot=None, host='0.0.0.0', port=8080) -> HeliusWebhookServer:
+    """Webhook server'ını mevcut event loop üzerinde başlat"""
+    global _webhook_server
+    if _webhook_server is None:
+        _webhook_server = HeliusWebhookServer(bot=bot, host=host, port=port)
+        await _webhook_server.start()
+    return _webhook_server
+
+async def stop_webhook_server():
+    """Webhook server'ını durdur"""
+    global _webhook_server
+    if _webhook_server is not None:
+        await _webhook_server.stop()
+        _webhook_server = None
 
 def run_webhook_server(host='0.0.0.0', port=8080):
-    """Webhook server'ını başlat"""
+    """Webhook server'ını tek başına çalıştır"""
+    async def _run():
+        await start_webhook_server(host=host, port=port)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await stop_webhook_server()
+            await get_http_client_registry().close()
+
     logger.info(f"Starting webhook server on {host}:{port}")
-    app.run(host=host, port=port, debug=False)
-
-def start_webhook_server_thread(host='0.0.0.0', port=8080):
-    """Webhook server'ını thread'de başlat"""
-    server_thread = threading.Thread(
-        target=run_webhook_server,
-        args=(host, port),
-        daemon=True
-    )
-    server_thread.start()
-    logger.info("Webhook server started in background thread")
-    return server_thread
+    asyncio.run(_run())
 
 if __name__ == "__main__":
     # Test için direct çalıştırma
-    run_webhook_server()
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO)
+    run_webhook_server()